@@ -0,0 +1,47 @@
+import numpy as np
+import gc
+import time
+from pandas import DataFrame
+from pandas.util.testing import rands
+import pandas.io.sql as sql
+
+N = 10000
+
+indices = np.array([rands(10) for _ in xrange(N)], dtype='O')
+indices2 = np.array([rands(10) for _ in xrange(N)], dtype='O')
+key = np.tile(indices[:8000], 10)
+key2 = np.tile(indices2[:8000], 10)
+
+left = DataFrame({'key' : key, 'key2':key2,
+                  'value' : np.random.randn(80000)})
+left['value'][::10] = np.nan
+
+# Prepare Database
+import sqlite3
+
+def insert_rows(conn):
+    # converts every row of the frame through an object ndarray
+    conn.execute(sql.get_sqlite_schema(left, 'left'))
+    conn.executemany('insert into left values (?, ?, ?)',
+                     [tuple(x) for x in left.values])
+    conn.commit()
+
+def insert_write_frame(conn):
+    sql.write_frame(left, name='left', con=conn)
+
+results = {}
+niter = 5
+for name, f in [('tuples', insert_rows), ('write_frame', insert_write_frame)]:
+    elapsed = 0
+    for _ in xrange(niter):
+        conn = sqlite3.connect(':memory:')
+        gc.disable()
+        start = time.time()
+        f(conn)
+        elapsed += time.time() - start
+        gc.enable()
+        conn.close()
+    results[name] = elapsed / niter
+
+for name, elapsed in sorted(results.items()):
+    print '%-12s %.4f' % (name, elapsed)
@@ -136,6 +136,70 @@ def factorize(values, sort=False, order=None, na_sentinel=-1):
 
     return labels, uniques, counts
 
+def factorize_multiple(arrays):
+    """
+    Encode the rows of several arrays of equal length as integer ids, equal
+    rows getting the same id. Missing values are equal to each other
+
+    Parameters
+    ----------
+    arrays : list of array-like
+
+    Returns
+    -------
+    (ids, ngroups) : (ndarray of int64 in [0, ngroups), int)
+    """
+    from pandas.core.groupby import (get_group_index, _compress_group_index,
+                                     _int64_overflow_possible)
+
+    labels = []
+    shape = []
+    for values in arrays:
+        lab, uniques, _ = factorize(values)
+        lab = com._ensure_int64(lab)
+
+        # missing values get a code of their own
+        np.putmask(lab, lab < 0, len(uniques))
+        labels.append(lab)
+        shape.append(len(uniques) + 1)
+
+    if len(labels) == 1:
+        return labels[0], shape[0]
+
+    if not _int64_overflow_possible(shape):
+        group_index = get_group_index(labels, shape)
+    else:
+        # combine one key at a time, compressing whenever the next one
+        # would overflow
+        group_index, ngroups = labels[0], shape[0]
+        for lab, size in zip(labels[1:], shape[1:]):
+            if _int64_overflow_possible([ngroups, size]):
+                group_index, obs_ids = _compress_group_index(group_index,
+                                                             sort=False)
+                ngroups = len(obs_ids)
+            group_index = group_index * size + lab
+            ngroups *= size
+
+    ids, obs_ids = _compress_group_index(group_index, sort=False)
+    return ids, len(obs_ids)
+
+def duplicated(arrays, take_last=False):
+    """
+    Mark the rows of several arrays of equal length that repeat an earlier
+    row (a later row if take_last). Missing values are equal to each other
+
+    Parameters
+    ----------
+    arrays : list of array-like
+    take_last : boolean, default False
+
+    Returns
+    -------
+    duplicated : boolean ndarray
+    """
+    ids, ngroups = factorize_multiple(arrays)
+    return lib.duplicated_int64(ids, ngroups, take_last=take_last)
+
 def value_counts(values, sort=True, ascending=False):
     """
     Compute a histogram of the counts of non-null values
@@ -553,6 +553,25 @@ def _try_sort(iterable):
 def _count_not_none(*args):
     return sum(x is not None for x in args)
 
+def _threaded_map(f, items, n_jobs=1):
+    """
+    Like map(f, items) but fans the calls out over a pool of n_jobs threads.
+    Only pays off when f spends its time in Cython kernels which release the
+    GIL (take, reindexing, rolling moments, group-by aggregation). Result
+    order matches items and the first exception raised by f propagates
+    """
+    items = list(items)
+    if n_jobs is None or n_jobs <= 1 or len(items) <= 1:
+        return [f(x) for x in items]
+
+    from multiprocessing.pool import ThreadPool
+    pool = ThreadPool(min(n_jobs, len(items)))
+    try:
+        return pool.map(f, items)
+    finally:
+        pool.close()
+        pool.join()
+
 #------------------------------------------------------------------------------
 # miscellaneous python tools
 
@@ -787,7 +806,7 @@ def _all_none(*args):
     return True
 
 
-def save(obj, path):
+def save(obj, path, format='pickle'):
     """
     Pickle (serialize) object to input file path
 
@@ -796,7 +815,17 @@ def save(obj, path):
     obj : any object
     path : string
         File path
+    format : {'pickle', 'binary'}, default 'pickle'
+        'binary' writes the raw data buffers of a Series, DataFrame or Panel
+        after a small header, which is much faster to write and read back
+        and can be memory-mapped by load
     """
+    if format == 'binary':
+        from pandas.io.binary import save_binary
+        return save_binary(obj, path)
+    elif format != 'pickle':
+        raise ValueError('Unknown format: %s' % format)
+
     f = open(path, 'wb')
     try:
         pickle.dump(obj, f, protocol=pickle.HIGHEST_PROTOCOL)
@@ -804,20 +833,27 @@ def save(obj, path):
         f.close()
 
 
-def load(path):
+def load(path, mmap=False):
     """
     Load pickled pandas object (or any other pickled object) from the specified
-    file path
+    file path. Files written with format='binary' are detected automatically
 
     Parameters
     ----------
     path : string
         File path
+    mmap : boolean, default False
+        Memory-map the data of binary files instead of reading them. The
+        arrays are then copy-on-write views of the file
 
     Returns
     -------
     unpickled : type of object stored in file
     """
+    from pandas.io.binary import is_binary_file, load_binary
+    if is_binary_file(path):
+        return load_binary(path, mmap=mmap)
+
     f = open(path, 'rb')
     try:
         return pickle.load(f)
@@ -901,6 +937,16 @@ else:
         def writerow(self, row):
             row = [x if isinstance(x, basestring) else str(x) for x in row]
             self.writer.writerow([s.encode("utf-8") for s in row])
+            self._flush()
+
+        def writerows(self, rows):
+            for row in rows:
+                row = [x if isinstance(x, basestring) else str(x)
+                       for x in row]
+                self.writer.writerow([s.encode("utf-8") for s in row])
+            self._flush()
+
+        def _flush(self):
             # Fetch UTF-8 output from the queue ...
             data = self.queue.getvalue()
             data = data.decode("utf-8")
@@ -1098,32 +1098,8 @@ class DataFrame(NDFrame):
 
         series = self._series
         if header:
-            if index:
-                # should write something for index label
-                if index_label is None:
-                    if isinstance(self.index, MultiIndex):
-                        index_label = []
-                        for i, name in enumerate(self.index.names):
-                            if name is None:
-                                name = ''
-                            index_label.append(name)
-                    else:
-                        index_label = self.index.name
-                        if index_label is None:
-                            index_label = ['']
-                        else:
-                            index_label = [index_label]
-                elif not isinstance(index_label, (list, tuple, np.ndarray)):
-                    # given a string for a DF with Index
-                    index_label = [index_label]
-
-                encoded_labels = list(index_label)
-                encoded_cols = list(cols)
-
-                writer.writerow(encoded_labels + encoded_cols)
-            else:
-                encoded_cols = list(cols)
-                writer.writerow(encoded_cols)
+            self._write_header(writer, cols, index=index,
+                               index_label=index_label)
 
         nlevels = getattr(self.index, 'nlevels', 1)
         for idx in self.index:
@@ -1142,9 +1118,74 @@ class DataFrame(NDFrame):
 
             writer.writerow(row_fields)
 
+    def _helper_csv(self, writer, na_rep='', cols=None, header=True,
+                    index=True, index_label=None, chunksize=None):
+        """
+        Write the rows in chunks, formatting each column of a chunk at once
+        rather than looking up and formatting every cell
+        """
+        if cols is None:
+            cols = self.columns
+
+        if header:
+            self._write_header(writer, cols, index=index,
+                               index_label=index_label)
+
+        nrows = len(self.index)
+        if chunksize is None:
+            chunksize = (100000 // (len(cols) or 1)) + 1
+
+        if index:
+            index_getters = _csv_index_getters(self.index, na_rep)
+        else:
+            index_getters = []
+
+        series = self._series
+        values = [series[col].values for col in cols]
+
+        for start in xrange(0, nrows, chunksize):
+            end = min(start + chunksize, nrows)
+
+            data = [getter(start, end) for getter in index_getters]
+            data.extend(_format_csv_values(v[start:end], na_rep)
+                        for v in values)
+
+            if data:
+                writer.writerows(izip(*data))
+            else:
+                writer.writerows([()] * (end - start))
+
+    def _write_header(self, writer, cols, index=True, index_label=None):
+        if index:
+            # should write something for index label
+            if index_label is None:
+                if isinstance(self.index, MultiIndex):
+                    index_label = []
+                    for i, name in enumerate(self.index.names):
+                        if name is None:
+                            name = ''
+                        index_label.append(name)
+                else:
+                    index_label = self.index.name
+                    if index_label is None:
+                        index_label = ['']
+                    else:
+                        index_label = [index_label]
+            elif not isinstance(index_label, (list, tuple, np.ndarray)):
+                # given a string for a DF with Index
+                index_label = [index_label]
+
+            encoded_labels = list(index_label)
+            encoded_cols = list(cols)
+
+            writer.writerow(encoded_labels + encoded_cols)
+        else:
+            encoded_cols = list(cols)
+            writer.writerow(encoded_cols)
+
     def to_csv(self, path_or_buf, sep=",", na_rep='', cols=None,
                header=True, index=True, index_label=None, mode='w',
-               nanRep=None, encoding=None):
+               nanRep=None, encoding=None, chunksize=None):
         """
         Write DataFrame to a comma-separated values (csv) file
 
@@ -1170,6 +1211,9 @@ class DataFrame(NDFrame):
         encoding : string, optional
             a string representing the encoding to use if the contents are
             non-ascii, for python versions prior to 3
+        chunksize : int, optional
+            Number of rows to format and write at a time. Defaults to about
+            100,000 values per chunk
         """
         if nanRep is not None:  # pragma: no cover
             import warnings
@@ -1190,9 +1234,9 @@ class DataFrame(NDFrame):
                                            delimiter=sep, encoding=encoding)
             else:
                 csvout = csv.writer(f, lineterminator='\n', delimiter=sep)
-            self._helper_csvexcel(csvout, na_rep=na_rep, cols=cols,
-                                  header=header, index=index,
-                                  index_label=index_label)
+            self._helper_csv(csvout, na_rep=na_rep, cols=cols,
+                             header=header, index=index,
+                             index_label=index_label, chunksize=chunksize)
         finally:
             if close:
                 f.close()
@@ -2094,7 +2138,7 @@ class DataFrame(NDFrame):
             return left_result, right_result
 
     def reindex(self, index=None, columns=None, method=None, level=None,
-                fill_value=np.nan, limit=None, copy=True):
+                fill_value=np.nan, limit=None, copy=True, n_jobs=1):
         """Conform DataFrame to new index with optional filling logic, placing
         NA/NaN in locations having no value in the previous index. A new object
         is produced unless the new index is equivalent to the current one and
@@ -2121,6 +2165,9 @@ class DataFrame(NDFrame):
             "compatible" value
         limit : int, default None
             Maximum size gap to forward or backward fill
+        n_jobs : int, default 1
+            Number of threads over which to spread the per-dtype blocks of a
+            mixed-type frame
 
         Examples
         --------
@@ -2140,16 +2187,16 @@ class DataFrame(NDFrame):
 
         if columns is not None:
             frame = frame._reindex_columns(columns, copy, level,
-                                           fill_value, limit)
+                                           fill_value, limit, n_jobs=n_jobs)
 
         if index is not None:
             frame = frame._reindex_index(index, method, copy, level,
-                                         fill_value, limit)
+                                         fill_value, limit, n_jobs=n_jobs)
 
         return frame
 
     def reindex_axis(self, labels, axis=0, method=None, level=None, copy=True,
-                     limit=None, fill_value=np.nan):
+                     limit=None, fill_value=np.nan, n_jobs=1):
         """Conform DataFrame to new index with optional filling logic, placing
         NA/NaN in locations having no value in the previous index. A new object
         is produced unless the new index is equivalent to the current one and
@@ -2174,6 +2221,9 @@ class DataFrame(NDFrame):
             passed MultiIndex level
         limit : int, default None
             Maximum size gap to forward or backward fill
+        n_jobs : int, default 1
+            Number of threads over which to spread the per-dtype blocks of a
+            mixed-type frame
 
         Examples
         --------
@@ -2191,11 +2241,11 @@ class DataFrame(NDFrame):
         if axis == 0:
             return self._reindex_index(labels, method, copy, level,
                                        fill_value=fill_value,
-                                       limit=limit)
+                                       limit=limit, n_jobs=n_jobs)
         elif axis == 1:
             return self._reindex_columns(labels, copy, level,
                                          fill_value=fill_value,
-                                         limit=limit)
+                                         limit=limit, n_jobs=n_jobs)
         else:  # pragma: no cover
             raise ValueError('Must specify axis=0 or 1')
 
@@ -2218,26 +2268,27 @@ class DataFrame(NDFrame):
             return self.copy() if copy else self
 
     def _reindex_index(self, new_index, method, copy, level, fill_value=np.nan,
-                       limit=None):
+                       limit=None, n_jobs=1):
         new_index, indexer = self.index.reindex(new_index, method, level,
                                                 limit=limit)
         return self._reindex_with_indexers(new_index, indexer, None, None,
-                                           copy, fill_value)
+                                           copy, fill_value, n_jobs=n_jobs)
 
     def _reindex_columns(self, new_columns, copy, level, fill_value=np.nan,
-                         limit=None):
+                         limit=None, n_jobs=1):
         new_columns, indexer = self.columns.reindex(new_columns, level=level,
                                                     limit=limit)
         return self._reindex_with_indexers(None, None, new_columns, indexer,
-                                           copy, fill_value)
+                                           copy, fill_value, n_jobs=n_jobs)
 
     def _reindex_with_indexers(self, index, row_indexer, columns, col_indexer,
-                               copy, fill_value):
+                               copy, fill_value, n_jobs=1):
         new_data = self._data
         if row_indexer is not None:
             row_indexer = com._ensure_int64(row_indexer)
             new_data = new_data.reindex_indexer(index, row_indexer, axis=1,
-                                                fill_value=fill_value)
+                                                fill_value=fill_value,
+                                                n_jobs=n_jobs)
         elif index is not None and index is not new_data.axes[1]:
             new_data = new_data.copy(deep=copy)
             new_data.axes[1] = index
@@ -2246,7 +2297,8 @@ class DataFrame(NDFrame):
             # TODO: speed up on homogeneous DataFrame objects
             col_indexer = com._ensure_int64(col_indexer)
             new_data = new_data.reindex_indexer(columns, col_indexer, axis=0,
-                                                fill_value=fill_value)
+                                                fill_value=fill_value,
+                                                n_jobs=n_jobs)
         elif columns is not None and columns is not new_data.axes[0]:
             new_data = new_data.reindex_items(columns, copy=copy,
                                               fill_value=fill_value)
@@ -2388,7 +2440,7 @@ class DataFrame(NDFrame):
 
     delevel = deprecate('delevel', reset_index)
 
-    def take(self, indices, axis=0):
+    def take(self, indices, axis=0, n_jobs=1):
         """
         Analogous to ndarray.take, return DataFrame corresponding to requested
         indices along an axis
@@ -2397,6 +2449,9 @@ class DataFrame(NDFrame):
         ----------
         indices : list / array of ints
         axis : {0, 1}
+        n_jobs : int, default 1
+            Number of threads over which to spread the per-dtype blocks of a
+            mixed-type frame
 
         Returns
         -------
@@ -2406,11 +2461,11 @@ class DataFrame(NDFrame):
             indices = np.array(indices)
         if self._data.is_mixed_dtype():
             if axis == 0:
-                new_data = self._data.take(indices, axis=1)
+                new_data = self._data.take(indices, axis=1, n_jobs=n_jobs)
                 return DataFrame(new_data)
             else:
                 new_columns = self.columns.take(indices)
-                return self.reindex(columns=new_columns)
+                return self.reindex(columns=new_columns, n_jobs=n_jobs)
         else:
             new_values = com.take_2d(self.values,
                                      com._ensure_int64(indices),
@@ -2561,17 +2616,15 @@ class DataFrame(NDFrame):
         -------
         duplicated : Series
         """
-        if cols is not None:
-            if isinstance(cols, list):
-                values = [self[x].values for x in cols]
-                keys = lib.fast_zip_fillna(values)
-            else:
-                keys = lib.fast_zip_fillna([self[cols]])
-        else:
-            values = list(self.values.T)
-            keys = lib.fast_zip_fillna(values)
+        import pandas.core.algorithms as algos
 
-        duplicated = lib.duplicated(keys, take_last=take_last)
+        if cols is None:
+            cols = list(self.columns)
+        elif not isinstance(cols, list):
+            cols = [cols]
+
+        values = [self[x].values for x in cols]
+        duplicated = algos.duplicated(values, take_last=take_last)
         return Series(duplicated, index=self.index)
 
     #----------------------------------------------------------------------
@@ -3798,7 +3851,7 @@ class DataFrame(NDFrame):
     #----------------------------------------------------------------------
     # Statistical methods, etc.
 
-    def corr(self, method='pearson'):
+    def corr(self, method='pearson', min_periods=None):
         """
         Compute pairwise correlation of columns, excluding NA/null values
 
@@ -3808,61 +3861,66 @@ class DataFrame(NDFrame):
             pearson : standard correlation coefficient
             kendall : Kendall Tau correlation coefficient
             spearman : Spearman rank correlation
+        min_periods : int, optional
+            Minimum number of observations required per pair of columns
+            to have a valid result
 
         Returns
         -------
         y : DataFrame
         """
         numeric_df = self._get_numeric_data()
-        mat = numeric_df.values.T
         cols = numeric_df.columns
+        mat = com._ensure_float64(numeric_df.values)
 
-        corrf = nanops.get_corr_func(method)
-        K = len(cols)
-        correl = np.empty((K, K), dtype=float)
-        mask = np.isfinite(mat)
-        for i, ac in enumerate(mat):
-            for j, bc  in enumerate(mat):
-                valid = mask[i] & mask[j]
-                if not valid.all():
-                    c = corrf(ac[valid], bc[valid])
-                else:
-                    c = corrf(ac, bc)
-                correl[i, j] = c
-                correl[j, i] = c
+        if method == 'pearson':
+            correl = lib.nancorr(mat, minp=min_periods)
+        elif method == 'spearman':
+            correl = lib.nancorr_spearman(mat, minp=min_periods)
+        else:
+            if min_periods is None:
+                min_periods = 1
+            mat = mat.T
+            corrf = nanops.get_corr_func(method)
+            K = len(cols)
+            correl = np.empty((K, K), dtype=float)
+            mask = np.isfinite(mat)
+            for i, ac in enumerate(mat):
+                for j, bc in enumerate(mat[:i + 1]):
+                    valid = mask[i] & mask[j]
+                    if valid.sum() < min_periods:
+                        c = np.nan
+                    elif not valid.all():
+                        c = corrf(ac[valid], bc[valid])
+                    else:
+                        c = corrf(ac, bc)
+                    correl[i, j] = c
+                    correl[j, i] = c
 
         return self._constructor(correl, index=cols, columns=cols)
 
-    def cov(self):
+    def cov(self, min_periods=None):
         """
         Compute pairwise covariance of columns, excluding NA/null values
 
+        Parameters
+        ----------
+        min_periods : int, optional
+            Minimum number of observations required per pair of columns
+            to have a valid result
+
         Returns
         -------
         y : DataFrame
         """
         numeric_df = self._get_numeric_data()
-        mat = numeric_df.values.T
         cols = numeric_df.columns
-        baseCov = np.cov(mat)
+        mat = com._ensure_float64(numeric_df.values)
 
-        for i, j, ac, bc in self._cov_helper(mat):
-            c = np.cov(ac, bc)[0, 1]
-            baseCov[i, j] = c
-            baseCov[j, i] = c
+        baseCov = lib.nancorr(mat, cov=True, minp=min_periods)
 
         return self._constructor(baseCov, index=cols, columns=cols)
 
-    def _cov_helper(self, mat):
-        # Get the covariance with items that have NaN values
-        mask = np.isfinite(mat)
-        for i, A in enumerate(mat):
-            if not mask[i].all():
-                for j, B in enumerate(mat):
-                    in_common = mask[i] & mask[j]
-                    if in_common.any():
-                        yield i, j, A[in_common], B[in_common]
-
     def corrwith(self, other, axis=0, drop=False):
         """
         Compute pairwise correlation between rows or columns of two DataFrame
@@ -4750,6 +4808,76 @@ def _is_sequence(x):
     except Exception:
         return False
 
+def _format_csv_values(values, na_rep):
+    """
+    Format a column for csv.writer the way its elements would be written one
+    at a time, substituting na_rep for null values
+    """
+    if values.dtype == np.float64:
+        return lib.format_float64_array(values, na_rep)
+    elif issubclass(values.dtype.type, np.datetime64):
+        return lib.format_datetime64_array(values.view('i8'), na_rep)
+    elif issubclass(values.dtype.type, (np.integer, np.bool_)):
+        return values.tolist()
+
+    if values.dtype.kind in ('f', 'c'):
+        # e.g. float32, whose elements are written with str
+        mask = -np.isfinite(values)
+        values = _to_object_array(values)
+    else:
+        if values.dtype != np.object_:
+            values = _to_object_array(values)
+        mask = lib.isnullobj(values)
+
+    if mask.any():
+        values = values.copy()
+        values[mask] = na_rep
+    return values
+
+def _format_csv_index(values):
+    # index labels are written as is, nulls included
+    if values.dtype == np.float64:
+        result = lib.format_float64_array(values, None)
+        mask = -np.isfinite(values)
+        if mask.any():
+            result[mask] = [repr(x) for x in values[mask]]
+        return result
+    elif issubclass(values.dtype.type, np.datetime64):
+        return lib.format_datetime64_array(values.view('i8'), 'NaT')
+    elif issubclass(values.dtype.type, (np.integer, np.bool_)):
+        return values.tolist()
+    return values
+
+def _csv_index_getters(index, na_rep=''):
+    """
+    Return a function of (start, end) for each level of the index producing
+    the formatted labels of those rows. MultiIndex labels of -1 (NA) are
+    written as na_rep
+    """
+    if isinstance(index, MultiIndex):
+        getters = []
+        for lev, lab in zip(index.levels, index.labels):
+            # label -1 takes the na_rep appended after the level values
+            formatted = _to_object_array(
+                list(_format_csv_index(_csv_index_values(lev))) + [na_rep])
+            getters.append(lambda start, end, formatted=formatted, lab=lab:
+                           formatted.take(lab[start:end]))
+        return getters
+
+    values = _csv_index_values(index)
+    return [lambda start, end: _format_csv_index(values[start:end])]
+
+def _csv_index_values(index):
+    if isinstance(index, PeriodIndex) or getattr(index, 'tz', None):
+        # boxed Period / Timestamp labels
+        return _to_object_array(list(index))
+    return index.values
+
+def _to_object_array(values):
+    result = np.empty(len(values), dtype=object)
+    result[:] = list(values)
+    return result
+
 def install_ipython_completers():  # pragma: no cover
     """Register the DataFrame type with IPython's tab completion machinery, so
     that it knows about accessing column names as attributes."""
@@ -22,12 +22,12 @@ class PandasObject(object):
     _AXIS_ALIASES = {}
     _AXIS_NAMES = dict((v, k) for k, v in _AXIS_NUMBERS.iteritems())
 
-    def save(self, path):
-        save(self, path)
+    def save(self, path, format='pickle'):
+        save(self, path, format=format)
 
     @classmethod
-    def load(cls, path):
-        return load(path)
+    def load(cls, path, mmap=False):
+        return load(path, mmap=mmap)
 
     #----------------------------------------------------------------------
     # Axis name business
@@ -89,7 +89,7 @@ class PandasObject(object):
             return default
 
     def groupby(self, by=None, axis=0, level=None, as_index=True, sort=True,
-                group_keys=True):
+                group_keys=True, n_jobs=1):
         """
         Group series using mapper (dict or key function, apply given function
         to group, return result as series) or by a series of columns
@@ -113,6 +113,9 @@ class PandasObject(object):
             Sort group keys. Get better performance by turning this off
         group_keys : boolean, default True
             When calling apply, add group keys to index to identify pieces
+        n_jobs : int, default 1
+            Number of threads to use for the Cython aggregations (sum, mean,
+            var, min, max, etc.) of DataFrame columns
 
         Examples
         --------
@@ -131,7 +134,7 @@ class PandasObject(object):
         """
         from pandas.core.groupby import groupby
         return groupby(self, by, axis=axis, level=level, as_index=as_index,
-                       sort=sort, group_keys=group_keys)
+                       sort=sort, group_keys=group_keys, n_jobs=n_jobs)
 
     def asfreq(self, freq, method=None, how=None):
         """
@@ -167,6 +170,8 @@ class PandasObject(object):
         rule : the offset string or object representing target conversion
         how : string, method for down- or re-sampling, default 'mean'
         fill_method : string, fill_method for upsampling, default None
+            'ffill' / 'pad', 'bfill' / 'backfill', or 'interpolate' to
+            interpolate linearly in time (DatetimeIndex only)
         axis : int, optional, default 0
         closed : {'right', 'left'}, default 'right'
             Which side of bin interval is closed
@@ -175,6 +180,8 @@ class PandasObject(object):
         convention : {'start', 'end', 's', 'e'}
         loffset : timedelta
             Adjust the resampled time labels
+        limit : int, default None
+            Maximum number of consecutive labels to fill when upsampling
         base : int, default 0
             For frequencies that evenly subdivide 1 day, the "origin" of the
             aggregated intervals. For example, for '5min' frequency, base could
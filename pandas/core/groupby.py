@@ -12,6 +12,7 @@ from pandas.util.decorators import cache_readonly, Appender
 import pandas.core.algorithms as algos
 import pandas.core.common as com
 import pandas._tseries as lib
+import pandas._algos as _algos
 
 
 class GroupByError(Exception):
@@ -114,7 +115,7 @@ class GroupBy(object):
 
     def __init__(self, obj, keys=None, axis=0, level=None,
                  grouper=None, exclusions=None, selection=None, as_index=True,
-                 sort=True, group_keys=True):
+                 sort=True, group_keys=True, n_jobs=1):
         self._selection = selection
 
         if isinstance(obj, NDFrame):
@@ -134,6 +135,7 @@ class GroupBy(object):
         self.keys = keys
         self.sort = sort
         self.group_keys = group_keys
+        self.n_jobs = n_jobs
 
         if grouper is None:
             grouper, exclusions = _get_grouper(obj, keys, axis=axis,
@@ -285,6 +287,29 @@ class GroupBy(object):
     def transform(self, func, *args, **kwargs):
         raise NotImplementedError
 
+    def _transform_fast(self, func, *args, **kwargs):
+        """
+        Result of transform computed by a vectorized routine, or None if func
+        has none and the groups must be visited one by one
+        """
+        if isinstance(func, basestring):
+            name = func
+        else:
+            name = _intercept_cython(func)
+            if name is None or args or kwargs:
+                return None
+
+        if name in _transform_functions:
+            return getattr(self, name)(*args, **kwargs)
+
+        if not (self._can_transform_fast and self.as_index):
+            if func is name:
+                f = lambda x: getattr(x, name)(*args, **kwargs)
+                return self.transform(f)
+            return None
+
+        return self._broadcast_aggregated(getattr(self, name)(*args, **kwargs))
+
     def mean(self):
         """
         Compute mean of groups, excluding missing values
@@ -324,6 +349,55 @@ class GroupBy(object):
             f = lambda x: x.var(ddof=ddof)
             return self._python_agg_general(f)
 
+    def median(self):
+        """
+        Compute median of groups, excluding missing values
+
+        For multiple groupings, the result index will be a MultiIndex
+        """
+        try:
+            return self._cython_agg_general('median')
+        except GroupByError:
+            raise
+        except Exception:  # pragma: no cover
+            f = lambda x: x.median(axis=self.axis)
+            return self._python_agg_general(f)
+
+    def quantile(self, q=0.5):
+        """
+        Compute value of groups at the given quantile, excluding missing
+        values, a la scoreatpercentile in scipy.stats
+
+        Parameters
+        ----------
+        q : quantile
+            0 <= q <= 1
+
+        For multiple groupings, the result index will be a MultiIndex
+        """
+        try:
+            return self._cython_agg_general('quantile', q)
+        except GroupByError:
+            raise
+        except Exception:  # pragma: no cover
+            f = lambda x: x.quantile(q)
+            return self._python_agg_general(f)
+
+    def nunique(self):
+        """
+        Compute number of distinct values in each group, excluding missing
+        values
+
+        For multiple groupings, the result index will be a MultiIndex
+        """
+        try:
+            return self._cython_agg_general('nunique')
+        except GroupByError:
+            raise
+        except Exception:  # pragma: no cover
+            f = lambda x: x.nunique()
+            return self._python_agg_general(f)
+
     def size(self):
         """
         Compute group sizes
@@ -361,13 +435,206 @@ class GroupBy(object):
             return np.nan
         return self.agg(picker)
 
-    def _cython_agg_general(self, how):
+    def cumsum(self):
+        """
+        Cumulative sum of values within each group, preserving the locations
+        of missing values. Returns a like-indexed object
+        """
+        return self._cython_transform('group_cumsum',
+                                      lambda x: x.cumsum())
+
+    def cumprod(self):
+        """
+        Cumulative product of values within each group, preserving the
+        locations of missing values. Returns a like-indexed object
+        """
+        return self._cython_transform('group_cumprod',
+                                      lambda x: x.cumprod())
+
+    def cummax(self):
+        """
+        Cumulative maximum of values within each group, preserving the
+        locations of missing values. Returns a like-indexed object
+        """
+        return self._cython_transform('group_cummax',
+                                      lambda x: x.cummax())
+
+    def cummin(self):
+        """
+        Cumulative minimum of values within each group, preserving the
+        locations of missing values. Returns a like-indexed object
+        """
+        return self._cython_transform('group_cummin',
+                                      lambda x: x.cummin())
+
+    def rank(self, ascending=True):
+        """
+        Compute numerical rank of values within each group, assigning the
+        average rank to ties. Missing values are left as NaN
+
+        Parameters
+        ----------
+        ascending : boolean, default True
+            False for ranks by high (1) to low (N)
+
+        Returns
+        -------
+        ranks : like-indexed object of floats
+        """
+        def f(out, values, labels, ngroups):
+            lib.group_rank(out, values, labels, ascending)
+        return self._cython_transform(f, lambda x: x.rank(ascending=ascending))
+
+    def shift(self, periods=1):
+        """
+        Shift values within each group by the desired number of periods,
+        introducing missing values at the group boundaries
+
+        Parameters
+        ----------
+        periods : int
+            Number of periods to move, can be positive or negative
+
+        Returns
+        -------
+        shifted : like-indexed object
+        """
+        if not self._can_transform_fast:
+            return self.transform(lambda x: x.shift(periods))
+
+        comp_ids, _, ngroups = self.grouper.group_info
+        indexer = lib.group_shift_indexer(comp_ids, ngroups, periods)
+
         output = {}
         for name, obj in self._iterate_slices():
-            if not issubclass(obj.dtype.type, (np.number, np.bool_)):
+            output[name] = com.take_1d(obj.values, indexer)
+
+        return self._wrap_transformed_output(output)
+
+    def fillna(self, method='pad', limit=None):
+        """
+        Fill missing values within each group by propagating the last (pad)
+        or next (backfill) valid observation of the same group
+
+        Parameters
+        ----------
+        method : {'backfill', 'bfill', 'pad', 'ffill'}, default 'pad'
+        limit : int, default None
+            Maximum number of consecutive missing values to fill
+
+        Returns
+        -------
+        filled : like-indexed object
+        """
+        if not self._can_transform_fast:
+            return self.transform(lambda x: x.fillna(method=method,
+                                                     limit=limit))
+
+        comp_ids, _, ngroups = self.grouper.group_info
+
+        output = {}
+        for name, obj in self._iterate_slices():
+            values = obj.values
+            mask = com.isnull(values)
+            indexer = lib.group_fillna_indexer(comp_ids, mask, ngroups,
+                                               method=method, limit=limit)
+            output[name] = com.take_1d(values, indexer)
+
+        return self._wrap_transformed_output(output)
+
+    @property
+    def _can_transform_fast(self):
+        return (self.axis == 0 and isinstance(self.obj, (Series, DataFrame))
+                and not isinstance(self.grouper, BinGrouper))
+
+    def _cython_transform(self, func, fallback):
+        """
+        func is a kernel taking (out, values, labels, ngroups), or the name
+        of one. Integers go through the int64 version of a named kernel in
+        _algos, so they are transformed exactly; other dtypes use the
+        version for their dtype if there is one, else the float64 kernel
+        """
+        if not self._can_transform_fast:
+            return self.transform(fallback)
+
+        comp_ids, _, ngroups = self.grouper.group_info
+        na_keys = comp_ids < 0
+
+        output = {}
+        for name, obj in self._iterate_slices():
+            values = obj.values
+            if not issubclass(values.dtype.type, (np.number, np.bool_)):
                 continue
 
-            result, names = self.grouper.aggregate(obj.values, how)
+            dtype = values.dtype
+            if not isinstance(func, basestring):
+                kernel = func
+                values = com._ensure_float64(values)
+            elif com.is_integer_dtype(values):
+                kernel = getattr(_algos, '%s_int64' % func)
+                values = com._ensure_int64(values)
+            else:
+                kernel = getattr(_algos, '%s_%s' % (func, dtype.name), None)
+                if kernel is None:
+                    kernel = getattr(lib, func)
+                    values = com._ensure_float64(values)
+
+            result = np.empty((len(values), 1), dtype=values.dtype)
+            kernel(result, values.reshape(-1, 1), comp_ids, ngroups)
+            result = result.ravel()
+
+            if com.is_integer_dtype(result):
+                if na_keys.any():
+                    # rows with a missing key are NA
+                    result = result.astype(np.float64)
+                    result[na_keys] = np.nan
+                else:
+                    result = result.astype(dtype)
+
+            output[name] = result
+
+        if len(output) == 0:
+            raise GroupByError('No numeric types to transform')
+
+        return self._wrap_transformed_output(output)
+
+    def _broadcast_aggregated(self, result):
+        """
+        Broadcast a group-wise aggregation back to the shape of the original
+        object using a single take. Rows having a missing key are left as in
+        the group-by-group transform: their values for a Series, NaN for a
+        DataFrame
+        """
+        comp_ids, _, ngroups = self.grouper.group_info
+
+        ids = comp_ids
+        if len(result) != ngroups:
+            # empty groups were dropped by the aggregation
+            counts = lib.group_count(comp_ids[comp_ids >= 0], ngroups)
+            mapping = (counts > 0).cumsum() - 1
+            ids = np.where(comp_ids >= 0, mapping.take(comp_ids), -1)
+        ids = com._ensure_int64(ids)
+
+        if isinstance(result, Series):
+            values = com.take_1d(result.values, ids)
+            na_keys = ids < 0
+            if isinstance(self.obj, Series) and na_keys.any():
+                values[na_keys] = self.obj.values[na_keys]
+            output = {self.name: values}
+        else:
+            output = dict((c, com.take_1d(result[c].values, ids))
+                          for c in result.columns)
+
+        return self._wrap_transformed_output(output)
+
+    def _cython_agg_general(self, how, *args):
+        output = {}
+        for name, obj in self._iterate_slices():
+            if not _can_cython_aggregate(obj.values, how):
+                continue
+
+            result, names = self.grouper.aggregate(obj.values, how,
+                                                   args=args)
             output[name] = result
 
         if len(output) == 0:
@@ -636,15 +903,18 @@ class Grouper(object):
     # Aggregation functions
 
     _cython_functions = {
-        'add' : lib.group_add,
-        'prod' : lib.group_prod,
-        'min' : lib.group_min,
-        'max' : lib.group_max,
-        'mean' : lib.group_mean,
-        'var' : lib.group_var,
-        'std' : lib.group_var,
-        'first': lambda a, b, c, d: lib.group_nth(a, b, c, d, 1),
-        'last': lib.group_last
+        'add' : 'group_add',
+        'prod' : 'group_prod',
+        'min' : 'group_min',
+        'max' : 'group_max',
+        'mean' : 'group_mean',
+        'var' : 'group_var',
+        'std' : 'group_var',
+        'first': ('group_nth', 1),
+        'last': 'group_last',
+        'median': ('group_quantile', 0.5),
+        'quantile': 'group_quantile',
+        'nunique': 'group_nunique'
     }
 
     _cython_transforms = {
@@ -659,8 +929,53 @@ class Grouper(object):
 
     _filter_empty_groups = True
 
-    def aggregate(self, values, how, axis=0):
-        values = com._ensure_float64(values)
+    def _get_aggregate_function(self, how, values, args=(),
+                                is_datetime=False):
+        """
+        Look up the Cython kernel for values' dtype. Kernels other than the
+        float64 ones in lib are generated in _algos with a dtype suffix; if
+        there is none for this dtype, signed integers are converted to int64
+        if there is an int64 kernel, other values to float64. datetime64
+        values viewed as int64 use the datetime kernels, which skip NaT. args
+        are passed to the kernel after the labels or bins
+
+        Returns
+        -------
+        (agg_func, values)
+        """
+        fname = self._cython_functions[how]
+        if isinstance(fname, tuple):
+            fname, args = fname[0], fname[1:] + tuple(args)
+
+        if how in _factorized_functions:
+            # values are already int64 codes
+            agg_func = getattr(lib, fname)
+        else:
+            dtype_str = 'datetime' if is_datetime else values.dtype.name
+            agg_func = getattr(_algos, '%s_%s' % (fname, dtype_str), None)
+            if agg_func is None and values.dtype.kind == 'i':
+                agg_func = getattr(_algos, '%s_int64' % fname, None)
+                if agg_func is not None:
+                    values = com._ensure_int64(values)
+            if agg_func is None:
+                values = com._ensure_float64(values)
+                agg_func = getattr(lib, fname)
+
+        if args:
+            f = agg_func
+            agg_func = lambda a, b, c, d: f(a, b, c, d, *args)
+
+        return agg_func, values
+
+    def aggregate(self, values, how, axis=0, n_jobs=1, args=()):
+        factorize = how in _factorized_functions
+        is_datetime = com.is_datetime64_dtype(values) and not factorize
+        if is_datetime:
+            if how not in _datetime_functions:
+                raise TypeError('%s is not defined for datetime64 values'
+                                % how)
+            values = values.view('i8')
+
         arity = self._cython_arity.get(how, 1)
 
         vdim = values.ndim
@@ -674,15 +989,33 @@ class Grouper(object):
                 raise NotImplementedError
             out_shape = (self.ngroups,) + values.shape[1:]
 
+        if factorize:
+            values = _factorize_columns(values)
+        agg_func, values = self._get_aggregate_function(
+            how, values, args, is_datetime=is_datetime)
+
         # will be filled in Cython function
-        result = np.empty(out_shape, dtype=np.float64)
+        result = np.empty(out_shape, dtype=values.dtype)
         counts = np.zeros(self.ngroups, dtype=np.int64)
 
-        result = self._aggregate(result, counts, values, how)
+        result = self._aggregate(result, counts, values, how, agg_func,
+                                 n_jobs=n_jobs)
 
         if self._filter_empty_groups:
-            result = lib.row_bool_subset(result,
-                                         (counts > 0).view(np.uint8))
+            if result.dtype == np.float64:
+                result = lib.row_bool_subset(result,
+                                             (counts > 0).view(np.uint8))
+            else:
+                result = result.compress(counts > 0, axis=0)
+        elif (com.is_integer_dtype(result) and
+              not (is_datetime or factorize) and (counts == 0).any()):
+            # integers can't hold NA, upcast for the empty groups. Empty
+            # datetime64 groups hold iNaT, which is NaT
+            result = result.astype(np.float64)
+            result[counts == 0] = np.nan
+
+        if is_datetime:
+            result = result.view('M8[ns]')
 
         if vdim == 1 and arity == 1:
             result = result[:, 0]
@@ -698,8 +1031,7 @@ class Grouper(object):
 
         return result, names
 
-    def _aggregate(self, result, counts, values, how):
-        agg_func = self._cython_functions[how]
+    def _aggregate(self, result, counts, values, how, agg_func, n_jobs=1):
         trans_func = self._cython_transforms.get(how, lambda x: x)
 
         comp_ids, _, ngroups = self.group_info
@@ -710,7 +1042,8 @@ class Grouper(object):
             for i, chunk in enumerate(values.transpose(2, 0, 1)):
                 agg_func(result[:, :, i], counts, chunk, comp_ids)
         else:
-            agg_func(result, counts, values, comp_ids)
+            _aggregate_columns(agg_func, result, counts, values, comp_ids,
+                               n_jobs)
 
         return trans_func(result)
 
@@ -823,6 +1156,31 @@ class CustomGrouper(object):
         raise NotImplementedError
 
 
+def _aggregate_columns(agg_func, result, counts, values, labels, n_jobs=1):
+    """
+    Run a Cython aggregation kernel over the columns of values, splitting the
+    columns into n_jobs chunks aggregated with com._threaded_map
+    """
+    K = values.shape[1]
+    n_jobs = min(n_jobs, K)
+
+    if n_jobs <= 1:
+        agg_func(result, counts, values, labels)
+        return
+
+    def _agg_chunk(cols):
+        lo, hi = cols[0], cols[-1] + 1
+        chunk_counts = np.zeros_like(counts)
+        agg_func(result[:, lo:hi], chunk_counts, values[:, lo:hi], labels)
+        return chunk_counts
+
+    chunks = np.array_split(np.arange(K), n_jobs)
+    chunk_counts = com._threaded_map(_agg_chunk, chunks, n_jobs)
+
+    # every chunk sees the same labels, so the group counts agree
+    counts[:] = chunk_counts[0]
+
+
 class BinGrouper(Grouper):
 
     def __init__(self, bins, binlabels, filter_empty=False):
@@ -874,16 +1232,19 @@ class BinGrouper(Grouper):
     # cython aggregation
 
     _cython_functions = {
-        'add' : lib.group_add_bin,
-        'prod' : lib.group_prod_bin,
-        'mean' : lib.group_mean_bin,
-        'min' : lib.group_min_bin,
-        'max' : lib.group_max_bin,
-        'var' : lib.group_var_bin,
-        'std' : lib.group_var_bin,
-        'ohlc' : lib.group_ohlc,
-        'first': lambda a, b, c, d: lib.group_nth_bin(a, b, c, d, 1),
-        'last': lib.group_last_bin
+        'add' : 'group_add_bin',
+        'prod' : 'group_prod_bin',
+        'mean' : 'group_mean_bin',
+        'min' : 'group_min_bin',
+        'max' : 'group_max_bin',
+        'var' : 'group_var_bin',
+        'std' : 'group_var_bin',
+        'ohlc' : 'group_ohlc',
+        'first': ('group_nth_bin', 1),
+        'last': 'group_last_bin',
+        'median': ('group_quantile_bin', 0.5),
+        'quantile': 'group_quantile_bin',
+        'nunique': 'group_nunique_bin'
     }
 
     _name_functions = {
@@ -892,8 +1253,7 @@ class BinGrouper(Grouper):
 
     _filter_empty_groups = True
 
-    def _aggregate(self, result, counts, values, how):
-        agg_func = self._cython_functions[how]
+    def _aggregate(self, result, counts, values, how, agg_func, n_jobs=1):
         trans_func = self._cython_transforms.get(how, lambda x: x)
 
         if values.ndim > 3:
@@ -903,7 +1263,8 @@ class BinGrouper(Grouper):
             for i, chunk in enumerate(values.transpose(2, 0, 1)):
                 agg_func(result[:, :, i], counts, chunk, self.bins)
         else:
-            agg_func(result, counts, values, self.bins)
+            _aggregate_columns(agg_func, result, counts, values, self.bins,
+                               n_jobs)
 
         return trans_func(result)
 
@@ -1240,6 +1601,10 @@ class SeriesGroupBy(GroupBy):
         else:
             return Series(output, index=index, name=self.name)
 
+    def _wrap_transformed_output(self, output):
+        return Series(output[self.name], index=self.obj.index,
+                      name=self.obj.name)
+
     def _wrap_applied_output(self, keys, values, not_indexed_same=False):
         if len(keys) == 0:
             return Series([])
@@ -1291,10 +1656,19 @@ class SeriesGroupBy(GroupBy):
         -------
         >>> grouped.transform(lambda x: (x - x.mean()) / x.std())
 
+        The same result is computed much faster by broadcasting cythonized
+        aggregations, which are selected by name or by the NumPy function:
+
+        >>> (series - grouped.transform('mean')) / grouped.transform('std')
+
         Returns
         -------
         transformed : Series
         """
+        fast_result = self._transform_fast(func, *args, **kwargs)
+        if fast_result is not None:
+            return fast_result
+
         result = self.obj.copy()
 
         for name, group in self:
@@ -1325,8 +1699,8 @@ class NDFrameGroupBy(GroupBy):
 
             yield val, slicer(val)
 
-    def _cython_agg_general(self, how):
-        new_blocks = self._cython_agg_blocks(how)
+    def _cython_agg_general(self, how, *args):
+        new_blocks = self._cython_agg_blocks(how, *args)
         return self._wrap_agged_blocks(new_blocks)
 
     def _wrap_agged_blocks(self, blocks):
@@ -1342,18 +1716,19 @@ class NDFrameGroupBy(GroupBy):
 
     _block_agg_axis = 0
 
-    def _cython_agg_blocks(self, how):
+    def _cython_agg_blocks(self, how, *args):
         data, agg_axis = self._get_data_to_aggregate()
 
         new_blocks = []
 
         for block in data.blocks:
             values = block.values
-            if not issubclass(values.dtype.type, (np.number, np.bool_)):
+            if not _can_cython_aggregate(values, how):
                 continue
 
-            values = com._ensure_float64(values)
-            result, names = self.grouper.aggregate(values, how, axis=agg_axis)
+            result, names = self.grouper.aggregate(values, how, axis=agg_axis,
+                                                   n_jobs=self.n_jobs,
+                                                   args=args)
             newb = make_block(result, block.items, block.ref_items)
             new_blocks.append(newb)
 
@@ -1620,9 +1995,18 @@ class NDFrameGroupBy(GroupBy):
         --------
         >>> grouped = df.groupby(lambda x: mapping[x])
         >>> grouped.transform(lambda x: (x - x.mean()) / x.std())
+
+        Named aggregations ('mean', 'std', ...) and transforms ('cumsum',
+        'shift', 'rank', ...) are computed by vectorized routines instead:
+
+        >>> (df - grouped.transform('mean')) / grouped.transform('std')
         """
         from pandas.tools.merge import concat
 
+        fast_result = self._transform_fast(func, *args, **kwargs)
+        if fast_result is not None:
+            return fast_result
+
         applied = []
 
         obj = self._obj_with_exclusions
@@ -1653,6 +2037,12 @@ class NDFrameGroupBy(GroupBy):
 
 
 
+    def _wrap_transformed_output(self, output):
+        columns = [c for c in self._obj_with_exclusions.columns
+                   if c in output]
+        return DataFrame(output, index=self.obj.index, columns=columns)
+
+
 class DataFrameGroupBy(NDFrameGroupBy):
 
     _block_agg_axis = 1
@@ -1665,7 +2055,8 @@ class DataFrameGroupBy(NDFrameGroupBy):
             return DataFrameGroupBy(self.obj, self.grouper, selection=key,
                                     grouper=self.grouper,
                                     exclusions=self.exclusions,
-                                    as_index=self.as_index)
+                                    as_index=self.as_index,
+                                    n_jobs=self.n_jobs)
         else:
             if key not in self.obj:  # pragma: no cover
                 raise KeyError(str(key))
@@ -2081,9 +2472,39 @@ _cython_table = {
     np.mean: 'mean',
     np.prod: 'prod',
     np.std: 'std',
-    np.var: 'var'
+    np.var: 'var',
+    np.median: 'median'
 }
 
+# like-indexed group-wise operations with a vectorized implementation
+_transform_functions = set(['cumsum', 'cumprod', 'cummax', 'cummin', 'rank',
+                            'shift', 'fillna'])
+
+# aggregations that are exact on datetime64 values viewed as int64
+_datetime_functions = set(['min', 'max', 'first', 'last'])
+
+# aggregations computed on the factorized values, so of any dtype
+_factorized_functions = set(['nunique'])
+
+def _can_cython_aggregate(values, how):
+    if issubclass(values.dtype.type, (np.number, np.bool_)):
+        return True
+    if how in _factorized_functions:
+        return True
+    return com.is_datetime64_dtype(values) and how in _datetime_functions
+
+def _factorize_columns(values):
+    """
+    int64 codes of the values in each column of a 2D array, -1 for NA
+    """
+    if values.ndim > 2:
+        raise NotImplementedError
+
+    codes = np.empty(values.shape, dtype=np.int64)
+    for j in range(values.shape[1]):
+        codes[:, j] = algos.factorize(values[:, j])[0]
+    return codes
+
 def _intercept_function(func):
     return _func_table.get(func, func)
 
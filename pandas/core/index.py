@@ -1280,17 +1280,92 @@ class MultiIndex(Index):
         """
         Return True if there are no unique groups
         """
-        # has duplicates
-        shape = [len(lev) for lev in self.levels]
-        group_index = np.zeros(len(self), dtype='i8')
-        for i in xrange(len(shape)):
-            stride = np.prod([x for x in shape[i+1:]], dtype='i8')
-            group_index += self.labels[i] * stride
-
-        if len(np.unique(group_index)) < len(group_index):
-            return True
+        return not self.is_unique
 
-        return False
+    @property
+    def is_monotonic(self):
+        # the packed keys sort like the tuples only if the levels are sorted
+        if all(lev.is_monotonic for lev in self.levels):
+            return self._engine.is_monotonic
+        return _algos.is_monotonic_object(self.values)[0]
+
+    @cache_readonly
+    def _engine(self):
+        if self._int64_keys is None:
+            return lib.ObjectEngine(weakref.ref(self))
+        return lib.MultiIndexEngine(weakref.ref(self))
+
+    @cache_readonly
+    def _tuple_engine(self):
+        # for lookups of tuples not expressible in the packed key space.
+        # Without packed keys _engine already hashes the tuples
+        if self._int64_keys is None:
+            return self._engine
+        return lib.ObjectEngine(weakref.ref(self))
+
+    @cache_readonly
+    def _int64_keys(self):
+        """
+        Offsets of the label combinations into the cartesian product of the
+        levels, None if that space overflows int64
+        """
+        return _pack_labels(self.labels, self.levshape)
+
+    def _get_int64_key(self, key):
+        if not isinstance(key, tuple) or len(key) != self.nlevels:
+            raise KeyError(key)
+
+        result = 0
+        stride = 1
+        for k, lev in reversed(zip(key, self.levels)):
+            try:
+                loc = lev.get_loc(k)
+            except KeyError:
+                raise KeyError(key)
+            if not com.is_integer(loc):
+                raise KeyError(key)
+            result += loc * stride
+            stride *= len(lev)
+
+        return result
+
+    def _get_target_int64_keys(self, target):
+        """
+        Packed keys of the entries of another MultiIndex in the label space
+        of this one, -1 for entries containing values not in the levels
+        """
+        labels = []
+        for lev, tlev, tlab in zip(self.levels, target.levels, target.labels):
+            codes = com._ensure_int64(lev.get_indexer(tlev))
+            tlab = com._ensure_int64(tlab)
+            result = ndtake(codes, tlab)
+            result[tlab < 0] = -1
+            labels.append(result)
+        return _pack_labels(labels, self.levshape)
+
+    def _get_setop_int64_keys(self, other):
+        """
+        Union of the levels of both MultiIndex objects and the packed keys of
+        each in that space, or None if the tuples have to be used
+        """
+        levels = []
+        self_labels = []
+        other_labels = []
+        for i in xrange(self.nlevels):
+            lev = self.levels[i].union(other.levels[i])
+            if not lev.is_monotonic:
+                return None
+            levels.append(lev)
+
+            for idx, result in [(self, self_labels), (other, other_labels)]:
+                codes = com._ensure_int64(lev.get_indexer(idx.levels[i]))
+                result.append(ndtake(codes, idx.labels[i]))
+
+        shape = [len(lev) for lev in levels]
+        self_keys = _pack_labels(self_labels, shape)
+        if self_keys is None:
+            return None
+        return levels, self_keys, _pack_labels(other_labels, shape)
 
     def get_value(self, series, key):
         # somewhat broken encapsulation
@@ -1743,6 +1818,13 @@ class MultiIndex(Index):
 
         target = _ensure_index(target)
 
+        if (method is None and isinstance(target, MultiIndex)
+            and target.nlevels == self.nlevels
+            and self._int64_keys is not None):
+            target_keys = self._get_target_int64_keys(target)
+            indexer = self._engine.get_indexer(target_keys)
+            return com._ensure_platform_int(indexer)
+
         target_index = target
         if isinstance(target, MultiIndex) and target._is_legacy_format:
             target_index = target.get_tuple_index()
@@ -1750,20 +1832,16 @@ class MultiIndex(Index):
         if target_index.dtype != object:
             return np.ones(len(target_index)) * -1
 
-        self_index = self
-        if self._is_legacy_format:
-            self_index = self.get_tuple_index()
+        engine = self._tuple_engine
 
         if method == 'pad':
             assert(self.is_unique and self.is_monotonic)
-            indexer = self_index._engine.get_pad_indexer(target_index,
-                                                         limit=limit)
+            indexer = engine.get_pad_indexer(target_index, limit=limit)
         elif method == 'backfill':
             assert(self.is_unique and self.is_monotonic)
-            indexer = self_index._engine.get_backfill_indexer(target_index,
-                                                              limit=limit)
+            indexer = engine.get_backfill_indexer(target_index, limit=limit)
         else:
-            indexer = self_index._engine.get_indexer(target_index)
+            indexer = engine.get_indexer(target_index)
 
         return com._ensure_platform_int(indexer)
 
@@ -2051,6 +2129,12 @@ class MultiIndex(Index):
         if len(self) != len(other):
             return False
 
+        if self.equal_levels(other):
+            for i in xrange(self.nlevels):
+                if not np.array_equal(self.labels[i], other.labels[i]):
+                    return False
+            return True
+
         for i in xrange(self.nlevels):
             svalues = np.asarray(self.levels[i]).take(self.labels[i])
             ovalues = np.asarray(other.levels[i]).take(other.labels[i])
@@ -2091,6 +2175,12 @@ class MultiIndex(Index):
 
         result_names = self.names if self.names == other.names else None
 
+        packed = self._get_setop_int64_keys(other)
+        if packed is not None:
+            levels, self_keys, other_keys = packed
+            keys = np.unique(np.concatenate([self_keys, other_keys]))
+            return _from_int64_keys(levels, keys, result_names)
+
         uniq_tuples = lib.fast_unique_multiple([self.values, other.values])
         return MultiIndex.from_arrays(zip(*uniq_tuples), sortorder=0,
                                       names=result_names)
@@ -2114,6 +2204,17 @@ class MultiIndex(Index):
 
         result_names = self.names if self.names == other.names else None
 
+        packed = self._get_setop_int64_keys(other)
+        if packed is not None:
+            levels, self_keys, other_keys = packed
+            keys = np.intersect1d(self_keys, other_keys)
+            if len(keys) > 0:
+                return _from_int64_keys(levels, keys, result_names)
+
+            return MultiIndex(levels=[[]] * self.nlevels,
+                              labels=[[]] * self.nlevels,
+                              names=result_names)
+
         self_tuples = self.values
         other_tuples = other.values
         uniq_tuples = sorted(set(self_tuples) & set(other_tuples))
@@ -2142,6 +2243,17 @@ class MultiIndex(Index):
                               labels=[[]] * self.nlevels,
                               names=result_names)
 
+        packed = self._get_setop_int64_keys(other)
+        if packed is not None:
+            levels, self_keys, other_keys = packed
+            keys = np.setdiff1d(self_keys, other_keys)
+            if len(keys) > 0:
+                return _from_int64_keys(levels, keys, result_names)
+
+            return MultiIndex(levels=[[]] * self.nlevels,
+                              labels=[[]] * self.nlevels,
+                              names=result_names)
+
         difference = sorted(set(self.values) - set(other.values))
 
         if len(difference) == 0:
@@ -2230,6 +2342,37 @@ class MultiIndex(Index):
 # For utility purposes
 
 
+def _pack_labels(labels, shape):
+    """
+    Combine the labels of each level into int64 keys, -1 where any label is
+    -1, or None if the product of the level sizes overflows int64
+    """
+    from pandas.core.groupby import get_group_index, _int64_overflow_possible
+
+    if _int64_overflow_possible(shape):
+        return None
+    return com._ensure_int64(get_group_index(labels, shape))
+
+
+def _from_int64_keys(levels, keys, names):
+    """
+    Sorted MultiIndex from unique keys packed in the space of levels,
+    dropping the level values that are not used
+    """
+    from pandas.core.groupby import decons_group_index
+
+    shape = [len(lev) for lev in levels]
+    new_levels = []
+    new_labels = []
+    for lev, lab in zip(levels, decons_group_index(keys, shape)):
+        used = np.unique(lab)
+        new_levels.append(lev.take(used))
+        new_labels.append(used.searchsorted(lab))
+
+    return MultiIndex(levels=new_levels, labels=new_labels, names=names,
+                      sortorder=0)
+
+
 def _sparsify(label_list, start=0):
     pivoted = zip(*label_list)
     k = len(label_list)
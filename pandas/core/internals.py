@@ -840,51 +840,59 @@ class BlockManager(object):
         new_axis, indexer = cur_axis.reindex(new_axis, method)
         return self.reindex_indexer(new_axis, indexer, axis=axis)
 
-    def reindex_indexer(self, new_axis, indexer, axis=1, fill_value=np.nan):
+    def reindex_indexer(self, new_axis, indexer, axis=1, fill_value=np.nan,
+                        n_jobs=1):
         """
-        pandas-indexer with -1's only.
+        pandas-indexer with -1's only. Blocks are reindexed on up to n_jobs
+        threads
         """
         if axis == 0:
-            return self._reindex_indexer_items(new_axis, indexer, fill_value)
+            return self._reindex_indexer_items(new_axis, indexer, fill_value,
+                                               n_jobs=n_jobs)
 
         mask = indexer == -1
 
         # TODO: deal with length-0 case? or does it fall out?
         needs_masking = len(new_axis) > 0 and mask.any()
 
-        new_blocks = []
-        for block in self.blocks:
-            newb = block.reindex_axis(indexer, mask, needs_masking,
+        def _reindex_block(block):
+            return block.reindex_axis(indexer, mask, needs_masking,
                                       axis=axis, fill_value=fill_value)
-            new_blocks.append(newb)
+        new_blocks = com._threaded_map(_reindex_block, self.blocks, n_jobs)
 
         new_axes = list(self.axes)
         new_axes[axis] = new_axis
         return BlockManager(new_blocks, new_axes)
 
-    def _reindex_indexer_items(self, new_items, indexer, fill_value):
+    def _reindex_indexer_items(self, new_items, indexer, fill_value,
+                               n_jobs=1):
         # TODO: less efficient than I'd like
 
         item_order = com.take_1d(self.items.values, indexer)
 
-        # keep track of what items aren't found anywhere
-        mask = np.zeros(len(item_order), dtype=bool)
-
-        new_blocks = []
-        for blk in self.blocks:
+        def _reindex_block(blk):
             blk_indexer = blk.items.get_indexer(item_order)
             selector = blk_indexer != -1
-            # update with observed items
-            mask |= selector
 
             if not selector.any():
-                continue
+                return selector, None
 
             new_block_items = new_items.take(selector.nonzero()[0])
             new_values = com.take_fast(blk.values, blk_indexer[selector],
                                        None, False, axis=0)
-            new_blocks.append(make_block(new_values, new_block_items,
-                                         new_items))
+            return selector, make_block(new_values, new_block_items,
+                                        new_items)
+
+        # keep track of what items aren't found anywhere
+        mask = np.zeros(len(item_order), dtype=bool)
+
+        new_blocks = []
+        for selector, new_block in com._threaded_map(_reindex_block,
+                                                     self.blocks, n_jobs):
+            # update with observed items
+            mask |= selector
+            if new_block is not None:
+                new_blocks.append(new_block)
 
         if not mask.all():
             na_items = new_items[-mask]
@@ -946,7 +954,7 @@ class BlockManager(object):
                               do_integrity_check=True)
         return na_block
 
-    def take(self, indexer, axis=1):
+    def take(self, indexer, axis=1, n_jobs=1):
         if axis == 0:
             raise NotImplementedError
 
@@ -959,12 +967,12 @@ class BlockManager(object):
 
         new_axes = list(self.axes)
         new_axes[axis] = self.axes[axis].take(indexer)
-        new_blocks = []
-        for blk in self.blocks:
+
+        def _take_block(blk):
             new_values = com.take_fast(blk.values, indexer,
                                        None, False, axis=axis)
-            newb = make_block(new_values, blk.items, self.items)
-            new_blocks.append(newb)
+            return make_block(new_values, blk.items, self.items)
+        new_blocks = com._threaded_map(_take_block, self.blocks, n_jobs)
 
         return BlockManager(new_blocks, new_axes)
 
@@ -2339,7 +2339,8 @@ copy : boolean, default False
         return df.ix[:, 0]
 
     def to_csv(self, path, index=True, sep=",", na_rep='', header=False,
-               index_label=None, mode='w', nanRep=None, encoding=None):
+               index_label=None, mode='w', nanRep=None, encoding=None,
+               chunksize=None):
         """
         Write Series to a comma-separated values (csv) file
 
@@ -2363,12 +2364,14 @@ copy : boolean, default False
         encoding : string, optional
             a string representing the encoding to use if the contents are
             non-ascii, for python versions prior to 3
+        chunksize : int, optional
+            Number of rows to format and write at a time
         """
         from pandas.core.frame import DataFrame
         df = DataFrame(self)
         df.to_csv(path, index=index, sep=sep, na_rep=na_rep, header=header,
                   index_label=index_label, mode=mode, nanRep=nanRep,
-                  encoding=encoding)
+                  encoding=encoding, chunksize=chunksize)
 
     def dropna(self):
         """
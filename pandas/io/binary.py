@@ -0,0 +1,292 @@
+"""
+Native binary format for Series, DataFrame and Panel objects.
+
+The blocks and axes of an object are written as raw contiguous buffers after
+a small pickled header describing them, so that they can be read back with a
+single pass over the file or memory-mapped without copying.
+"""
+
+# pylint: disable-msg=E1101
+
+try:
+    import cPickle as pickle
+except ImportError:  # pragma: no cover
+    import pickle
+
+import struct
+
+import numpy as np
+
+from pandas.core.frame import DataFrame
+from pandas.core.index import Index, Int64Index, MultiIndex
+from pandas.core.internals import BlockManager, make_block
+from pandas.core.panel import Panel
+from pandas.core.series import Series, TimeSeries
+from pandas.tseries.index import DatetimeIndex
+
+_MAGIC = b'\x93PDBIN\x01\x00'
+_VERSION = 1
+
+# all buffers start on a multiple of this many bytes
+_ALIGNMENT = 64
+
+_CONTAINERS = {
+    'series' : Series,
+    'time_series' : TimeSeries,
+    'frame' : DataFrame,
+    'panel' : Panel,
+}
+
+_CONTAINER_KINDS = dict((v, k) for k, v in _CONTAINERS.iteritems())
+
+
+def is_binary_file(path):
+    """
+    Check whether the file at path was written by save_binary
+    """
+    f = open(path, 'rb')
+    try:
+        return f.read(len(_MAGIC)) == _MAGIC
+    finally:
+        f.close()
+
+
+def save_binary(obj, path):
+    """
+    Write a Series, DataFrame or Panel to path in the native binary format
+
+    Parameters
+    ----------
+    obj : Series, TimeSeries, DataFrame or Panel
+    path : string
+        File path
+    """
+    kind = _CONTAINER_KINDS.get(type(obj))
+    if kind is None:
+        raise TypeError('Cannot save %s objects in binary format'
+                        % type(obj).__name__)
+
+    writer = _BufferWriter()
+
+    if kind in ('series', 'time_series'):
+        header = {
+            'values' : writer.add(obj.values),
+            'index' : _pack_index(obj.index, writer),
+            'name' : obj.name,
+        }
+    else:
+        mgr = obj._data
+        header = {
+            'axes' : [_pack_index(ax, writer) for ax in mgr.axes],
+            'blocks' : [(_pack_index(b.items, writer), writer.add(b.values))
+                        for b in mgr.blocks],
+        }
+
+    header['kind'] = kind
+    header['version'] = _VERSION
+
+    packed = pickle.dumps(header, protocol=pickle.HIGHEST_PROTOCOL)
+
+    f = open(path, 'wb')
+    try:
+        f.write(_MAGIC)
+        f.write(struct.pack('<Q', len(packed)))
+        f.write(packed)
+        _pad(f, _data_start(len(packed)) - f.tell())
+        writer.write_to(f)
+    finally:
+        f.close()
+
+
+def load_binary(path, mmap=False):
+    """
+    Read an object written by save_binary
+
+    Parameters
+    ----------
+    path : string
+        File path
+    mmap : boolean, default False
+        Memory-map the file instead of reading it. The data are then paged in
+        on access and the arrays are copy-on-write views of the file, so
+        modifying them never touches the file on disk
+
+    Returns
+    -------
+    obj : Series, TimeSeries, DataFrame or Panel
+    """
+    f = open(path, 'rb')
+    try:
+        if f.read(len(_MAGIC)) != _MAGIC:
+            raise ValueError('%s is not a pandas binary file' % path)
+
+        header_len, = struct.unpack('<Q', f.read(8))
+        header = pickle.loads(f.read(header_len))
+        start = _data_start(header_len)
+
+        if mmap:
+            mapped = np.memmap(f, dtype=np.uint8, mode='c')
+            def reader(spec):
+                return _map_array(mapped, start, spec)
+        else:
+            def reader(spec):
+                return _read_array(f, start, spec)
+
+        return _unpack_object(header, reader)
+    finally:
+        f.close()
+
+
+def _data_start(header_len):
+    return _align(len(_MAGIC) + 8 + header_len)
+
+
+def _align(offset):
+    return -(-offset // _ALIGNMENT) * _ALIGNMENT
+
+
+def _pad(f, nbytes):
+    if nbytes > 0:
+        f.write(b'\x00' * nbytes)
+
+
+class _BufferWriter(object):
+    """
+    Lays out the raw buffers of arrays one after the other. Object arrays
+    cannot be stored raw and are pickled in the header instead
+    """
+
+    def __init__(self):
+        self.arrays = []
+        self.offset = 0
+
+    def add(self, values):
+        values = np.asarray(values)
+
+        if values.dtype == np.object_:
+            return {'pickled' : values}
+
+        # Fortran-ordered blocks (e.g. a DataFrame built from a 2D array)
+        # are written as is rather than copied
+        fortran = values.flags.f_contiguous and not values.flags.c_contiguous
+        if fortran:
+            values = values.T
+        else:
+            values = np.ascontiguousarray(values)
+
+        spec = {
+            'dtype' : values.dtype.str,
+            'shape' : values.shape,
+            'fortran' : fortran,
+            'offset' : self.offset,
+        }
+
+        self.arrays.append(values)
+        self.offset = _align(self.offset + values.nbytes)
+        return spec
+
+    def write_to(self, f):
+        start = f.tell()
+        for values in self.arrays:
+            values.tofile(f)
+            _pad(f, _align(f.tell() - start) - (f.tell() - start))
+
+
+def _map_array(mapped, start, spec):
+    if 'pickled' in spec:
+        return spec['pickled']
+
+    dtype = np.dtype(spec['dtype'])
+    shape = spec['shape']
+    nbytes = dtype.itemsize * int(np.prod(shape))
+    if nbytes == 0:
+        return np.empty(shape, dtype=dtype)
+
+    offset = start + spec['offset']
+    buf = mapped[offset : offset + nbytes]
+    return _shape_array(np.asarray(buf), dtype, spec)
+
+
+def _read_array(f, start, spec):
+    if 'pickled' in spec:
+        return spec['pickled']
+
+    dtype = np.dtype(spec['dtype'])
+    shape = spec['shape']
+    count = int(np.prod(shape))
+    if count == 0:
+        return np.empty(shape, dtype=dtype)
+
+    f.seek(start + spec['offset'])
+    buf = np.fromfile(f, dtype=np.uint8, count=dtype.itemsize * count)
+    return _shape_array(buf, dtype, spec)
+
+
+def _shape_array(buf, dtype, spec):
+    values = buf.view(dtype).reshape(spec['shape'])
+    if spec['fortran']:
+        values = values.T
+    return values
+
+
+def _pack_index(index, writer):
+    if isinstance(index, MultiIndex):
+        return {
+            'kind' : 'multi',
+            'levels' : [_pack_index(lev, writer) for lev in index.levels],
+            'labels' : [writer.add(lab) for lab in index.labels],
+            'names' : index.names,
+            'sortorder' : index.sortorder,
+        }
+    elif isinstance(index, DatetimeIndex):
+        return {
+            'kind' : 'datetime',
+            'values' : writer.add(index.asi8),
+            'name' : index.name,
+            'freq' : index.offset,
+            'tz' : index.tz,
+        }
+    elif type(index) in (Index, Int64Index):
+        return {
+            'kind' : 'index',
+            'values' : writer.add(index.values),
+            'name' : index.name,
+        }
+    else:
+        # PeriodIndex and friends
+        return {'kind' : 'pickled', 'index' : index}
+
+
+def _unpack_index(spec, reader):
+    kind = spec['kind']
+
+    if kind == 'multi':
+        levels = [_unpack_index(lev, reader) for lev in spec['levels']]
+        labels = [reader(lab) for lab in spec['labels']]
+        return MultiIndex(levels=levels, labels=labels, names=spec['names'],
+                          sortorder=spec['sortorder'])
+    elif kind == 'datetime':
+        values = reader(spec['values']).view('M8[ns]')
+        return DatetimeIndex._simple_new(values, spec['name'],
+                                         freq=spec['freq'], tz=spec['tz'])
+    elif kind == 'index':
+        return Index(reader(spec['values']), name=spec['name'])
+    else:
+        return spec['index']
+
+
+def _unpack_object(header, reader):
+    kind = header['kind']
+    klass = _CONTAINERS[kind]
+
+    if kind in ('series', 'time_series'):
+        index = _unpack_index(header['index'], reader)
+        return klass(reader(header['values']), index=index,
+                     name=header['name'])
+
+    axes = [_unpack_index(ax, reader) for ax in header['axes']]
+    blocks = [make_block(reader(values), _unpack_index(items, reader),
+                         axes[0])
+              for items, values in header['blocks']]
+
+    return klass(BlockManager(blocks, axes))
@@ -88,6 +88,10 @@ encoding : string, default None
     Encoding to use for UTF when reading/writing (ex. 'utf-8')
 squeeze : boolean, default False
     If the parsed data only contains one column then return a Series
+engine : {'python', 'c'}, default 'python'
+    Parser engine to use. The C engine tokenizes directly into typed
+    columns and is much faster on large files, but only supports
+    single-character delimiters
 
 Returns
 -------
@@ -171,6 +175,15 @@ def _read(cls, filepath_or_buffer, kwds):
         if isinstance(kwds['parse_dates'], bool):
             kwds['parse_dates'] = True
 
+    engine = kwds.pop('engine', 'python')
+    if engine == 'c':
+        if cls is not TextParser:
+            raise ValueError('The C engine does not support %s'
+                             % cls.__name__)
+        cls = CParser
+    elif engine != 'python':
+        raise ValueError('Unknown engine: %s' % engine)
+
     # Extract some of the arguments (pass chunksize on).
     kwds.pop('filepath_or_buffer')
     iterator = kwds.pop('iterator')
@@ -209,7 +222,8 @@ def read_csv(filepath_or_buffer,
              verbose=False,
              delimiter=None,
              encoding=None,
-             squeeze=False):
+             squeeze=False,
+             engine='python'):
     kwds = locals()
 
     # Alias sep -> delimiter.
@@ -241,7 +255,8 @@ def read_table(filepath_or_buffer,
                verbose=False,
                delimiter=None,
                encoding=None,
-               squeeze=False):
+               squeeze=False,
+               engine='python'):
     kwds = locals()
 
     # Alias sep -> delimiter.
@@ -277,7 +292,8 @@ def read_fwf(filepath_or_buffer,
              delimiter=None,
              verbose=False,
              encoding=None,
-             squeeze=False):
+             squeeze=False,
+             engine='python'):
 
     kwds = locals()
 
@@ -712,16 +728,7 @@ class TextParser(object):
         self._first_chunk = False
 
         if len(content) == 0: # pragma: no cover
-            if self.index_col is not None:
-                if np.isscalar(self.index_col):
-                    index = Index([], name=self.index_name)
-                else:
-                    index = MultiIndex.from_arrays([[]] * len(self.index_col),
-                                                   names=self.index_name)
-            else:
-                index = Index([])
-
-            return DataFrame(index=index, columns=self.columns)
+            return self._empty_frame()
 
         zipped_content = list(lib.to_object_array(content).T)
 
@@ -775,6 +782,18 @@ class TextParser(object):
             return df[df.columns[0]]
         return df
 
+    def _empty_frame(self):
+        if self.index_col is not None:
+            if np.isscalar(self.index_col):
+                index = Index([], name=self.index_name)
+            else:
+                index = MultiIndex.from_arrays([[]] * len(self.index_col),
+                                               names=self.index_name)
+        else:
+            index = Index([])
+
+        return DataFrame(index=index, columns=self.columns)
+
     @property
     def _has_complex_date_col(self):
         return (isinstance(self.parse_dates, dict) or
@@ -1026,6 +1045,234 @@ class TextParser(object):
         lines = self._check_comments(lines)
         return self._check_thousands(lines)
 
+class _PrefixedReader(object):
+    """
+    File-like object returning the text already read from f, then the rest
+    of f
+    """
+
+    def __init__(self, head, f):
+        self.head = head
+        self.f = f
+
+    def read(self, size=-1):
+        if not self.head:
+            return self.f.read(size)
+
+        if size < 0:
+            result = self.head + self.f.read()
+            self.head = ''
+        else:
+            result = self.head[:size]
+            self.head = self.head[size:]
+        return result
+
+class CParser(TextParser):
+    """
+    TextParser specialization using the compiled tokenizer in
+    pandas._parser. Rows are tokenized straight into a character buffer and
+    converted column by column into typed arrays, with NA detection and
+    numeric inference done on the raw bytes. Index, date and converter
+    columns are handed back as strings and go through the same code paths
+    as TextParser. See TextParser for details.
+    """
+
+    _raw_names = None
+
+    def _make_reader(self, f):
+        from pandas._parser import TextReader
+
+        sep = self.delimiter
+        if sep is not None and len(sep) > 1:
+            raise ValueError('The C engine only supports single-character '
+                             'delimiters, got %r' % sep)
+
+        if sep is None:
+            sep, head = self._sniff_delimiter(f)
+            f = _PrefixedReader(head, f)
+
+        # the tokenizer reads f in blocks as rows are requested
+        self.data = TextReader(f, delimiter=sep, comment=self.comment,
+                               thousands=self.thousands,
+                               skiprows=self.skiprows,
+                               skip_footer=self.skip_footer,
+                               encoding=self.encoding)
+
+        # skipped rows are dropped by the tokenizer
+        self.skiprows = set()
+
+    def _sniff_delimiter(self, f):
+        """
+        Sniff the delimiter from the first line that is neither skipped nor
+        a comment. Returns the delimiter and the text read from f
+        """
+        import csv
+
+        lines = []
+        line = ''
+        for i, line in enumerate(iter(f.readline, '')):
+            lines.append(line)
+            if i in self.skiprows:
+                continue
+            if self.comment is not None and line.startswith(self.comment):
+                continue
+            break
+
+        if self.comment is not None:
+            line = line.split(self.comment)[0]
+
+        return csv.Sniffer().sniff(line).delimiter, ''.join(lines)
+
+    def _setup_reader(self):
+        """
+        Tell the tokenizer which column positions to leave as strings and
+        which NA values to use for each column
+        """
+        if len(self.buf) > 0:
+            width = max(len(line) for line in self.buf)
+        else:
+            width = len(self.orig_columns)
+
+        offset = max(width - len(self.orig_columns), 0)
+
+        def _position(col):
+            if isinstance(col, basestring):
+                if col not in self.orig_columns:
+                    return None
+                return self.orig_columns.index(col) + offset
+            return col + offset
+
+        raw = set()
+        if self.index_col is not None:
+            if np.isscalar(self.index_col):
+                index_col = [self.index_col]
+            else:
+                index_col = self.index_col
+            for col in index_col:
+                if isinstance(col, basestring):
+                    raw.add(_position(col))
+                else:
+                    raw.add(col)
+
+        for col in self.converters:
+            if isinstance(col, int) and col not in self.columns:
+                col = self.columns[col]
+            raw.add(_position(col))
+
+        if isinstance(self.parse_dates, dict):
+            date_specs = self.parse_dates.values()
+        elif isinstance(self.parse_dates, list):
+            date_specs = self.parse_dates
+        else:
+            date_specs = []
+        for spec in date_specs:
+            if np.isscalar(spec):
+                spec = [spec]
+            for col in spec:
+                raw.add(_position(col))
+
+        raw.discard(None)
+
+        names = [None] * offset + list(self.orig_columns)
+        self._raw_names = set(names[i] for i in raw if i < len(names))
+
+        reader = self.data
+        reader.raw_columns = raw
+        if isinstance(self.na_values, dict):
+            reader.na_values = _NA_VALUES
+            col_na_values = {}
+            for col, values in self.na_values.iteritems():
+                pos = _position(col)
+                if pos is not None:
+                    col_na_values[pos] = set(list(values))
+            reader.col_na_values = col_na_values
+        else:
+            reader.na_values = self.na_values
+
+    def get_chunk(self, rows=None):
+        if rows is not None and self.skip_footer:
+            raise ValueError('skip_footer not supported for iteration')
+
+        if self._raw_names is None:
+            self._setup_reader()
+
+        # rows buffered during header and index inference get re-read in
+        # typed form
+        if len(self.buf) > 0:
+            self.data.rewind(len(self.buf))
+            self.pos -= len(self.buf)
+            self._clear_buffer()
+
+        try:
+            columns = self.data.read(rows)
+        except StopIteration:
+            if self._first_chunk:
+                columns = {}
+            else:
+                raise
+
+        # done with first read, next time raise StopIteration
+        self._first_chunk = False
+
+        if len(columns) == 0:
+            return self._empty_frame()
+
+        zipped_content = [columns[i] for i in range(len(columns))]
+        nrows = len(zipped_content[0])
+        self.pos += nrows
+
+        if not self._has_complex_date_col and self.index_col is not None:
+            index = self._get_index(zipped_content)
+        else:
+            index = Index(np.arange(nrows))
+
+        col_len, zip_len = len(self.columns), len(zipped_content)
+        if col_len != zip_len:
+            raise ValueError('Expecting %d columns, got %d'
+                             % (col_len, zip_len))
+
+        data = dict((k, v) for k, v in izip(self.columns, zipped_content))
+
+        # apply converters
+        for col, f in self.converters.iteritems():
+            if isinstance(col, int) and col not in self.columns:
+                col = self.columns[col]
+            data[col] = lib.map_infer(data[col], f)
+
+        columns = self.columns
+        if self.parse_dates is not None:
+            data, columns = self._process_date_conversion(data)
+
+        # columns handed over as strings still need type inference
+        raw = dict((k, v) for k, v in data.iteritems()
+                   if k in self._raw_names)
+        data.update(_convert_to_ndarrays(raw, self.na_values, self.verbose))
+
+        if self.verbose:
+            for c, values in data.iteritems():
+                if c in raw or not issubclass(values.dtype.type, np.floating):
+                    continue
+                na_count = np.isnan(values).sum()
+                if na_count:
+                    print 'Filled %d NA values in column %s' % (na_count,
+                                                                 str(c))
+
+        df = DataFrame(data=data, columns=columns, index=index)
+        if self._has_complex_date_col and self.index_col is not None:
+            if not self._name_processed:
+                self.index_name = self._get_index_name()
+                self._name_processed = True
+            data = dict(((k, v) for k, v in df.iteritems()))
+            columns = list(columns)
+            index = self._get_index(data, col_order=columns, parse_dates=False)
+            data = dict(((k, v.values) for k, v in data.iteritems()))
+            df = DataFrame(data=data, columns=columns, index=index)
+
+        if self.squeeze and len(df.columns) == 1:
+            return df[df.columns[0]]
+        return df
+
+
 def _convert_to_ndarrays(dct, na_values, verbose=False):
     def _get_na_values(col):
         if isinstance(na_values, dict):
@@ -16,10 +16,8 @@ from pandas.sparse.api import SparseSeries, SparseDataFrame, SparsePanel
 from pandas.sparse.array import BlockIndex, IntIndex
 from pandas.tseries.api import PeriodIndex, DatetimeIndex
 from pandas.core.common import adjoin
-from pandas.core.algorithms import match, unique
 
 from pandas.core.factor import Factor
-from pandas.core.common import _asarray_tuplesafe
 from pandas.core.internals import BlockManager, make_block
 from pandas.core.reshape import block2d_to_block3d
 import pandas.core.common as com
@@ -65,6 +63,12 @@ _LEGACY_MAP = {
     'WidePanel' : 'wide_table',
 }
 
+# number of rows per Table.append call when writing tables
+_WRITE_CHUNKSIZE = 500000
+
+# number of columns per piece when iterating over a table selection
+_READ_CHUNKSIZE = 100
+
 # oh the troubles to reduce import time
 _table_mod = None
 def _tables():
@@ -283,7 +287,7 @@ class HDFStore(object):
         except AttributeError:
             raise
 
-    def select(self, key, where=None):
+    def select(self, key, where=None, iterator=False, chunksize=None):
         """
         Retrieve pandas object stored in file, optionally based on where
         criteria
@@ -309,11 +313,19 @@ class HDFStore(object):
                {'field' : 'index',
                 'value' : [v1, v2, v3]}
 
+        iterator : boolean, default False
+            Return an iterator over the selection, each piece holding a chunk
+            of the (sorted) columns
+        chunksize : int, optional
+            Number of columns per piece. Implies iterator=True
+
         """
         group = getattr(self.handle.root, key, None)
         if 'table' not in group._v_attrs.pandas_type:
             raise Exception('can only select on objects written as tables')
         if group is not None:
+            if iterator or chunksize is not None:
+                return self._iter_table(group, where, chunksize)
             return self._read_group(group, where)
 
     def put(self, key, value, table=False, append=False,
@@ -720,7 +732,8 @@ class HDFStore(object):
             self.handle.createArray(group, key, value)
 
     def _write_table(self, group, items=None, index=None, columns=None,
-                     values=None, append=False, compression=None):
+                     values=None, append=False, compression=None,
+                     chunksize=None):
         """ need to check for conform to the existing table:
             e.g. columns should match """
         # create dict of types
@@ -771,21 +784,8 @@ class HDFStore(object):
 
         # add the rows
         try:
-            for i, index in enumerate(index_converted):
-                for c, col in enumerate(columns_converted):
-                    v = values[:, i, c]
-
-                    # don't store the row if all values are np.nan
-                    if np.isnan(v).all():
-                        continue
-
-                    row = table.row
-                    row['index'] = index
-                    row['column'] = col
-
-                    # create the values array
-                    row['values'] = v
-                    row.append()
+            self._append_table_rows(table, index_converted,
+                                    columns_converted, values, chunksize)
             self.handle.flush()
         except (ValueError), detail: # pragma: no cover
             print "value_error in _write_table -> %s" % str(detail)
@@ -795,6 +795,47 @@ class HDFStore(object):
                 pass
             raise
 
+    def _append_table_rows(self, table, index, columns, values,
+                           chunksize=None):
+        """
+        Append one row per (index, column) pair in index-major order, building
+        a record array per batch of index labels and handing each to PyTables
+        in a single Table.append call. Rows whose values are all NaN are not
+        stored.
+        """
+        if chunksize is None:
+            chunksize = _WRITE_CHUNKSIZE
+
+        nitems = len(values)
+        N, K = len(index), len(columns)
+        if N == 0 or K == 0:
+            return
+
+        # number of index labels per batch
+        step = max(chunksize // K, 1)
+
+        for start in xrange(0, N, step):
+            end = min(start + step, N)
+
+            # (nitems, n, K) -> (n * K, nitems)
+            chunk = values[:, start:end, :]
+            rows = chunk.transpose((1, 2, 0)).reshape((-1, nitems))
+
+            # don't store the row if all values are np.nan
+            mask = -np.isnan(rows).all(axis=1)
+            if not mask.any():
+                continue
+
+            n = end - start
+            major = np.repeat(np.arange(start, end), K)[mask]
+            minor = np.tile(np.arange(K), n)[mask]
+
+            rec = np.empty(len(major), dtype=table.dtype)
+            rec['index'] = index.take(major)
+            rec['column'] = columns.take(minor)
+            rec['values'] = rows[mask].reshape(rec['values'].shape)
+            table.append(rec)
+
     def _read_group(self, group, where=None):
         kind = group._v_attrs.pandas_type
         kind = _LEGACY_MAP.get(kind, kind)
@@ -830,67 +871,88 @@ class HDFStore(object):
 
     def _read_panel_table(self, group, where=None):
         table = getattr(group, 'table')
-        fields = table._v_attrs.fields
 
         # create the selection
         sel = Selection(table, where, table._v_attrs.index_kind)
         sel.select()
-        fields = table._v_attrs.fields
 
-        columns = _maybe_convert(sel.values['column'],
+        return self._table_to_panel(table, sel.values)
+
+    def _iter_table(self, group, where=None, chunksize=None):
+        kind = group._v_attrs.pandas_type
+        kind = _LEGACY_MAP.get(kind, kind)
+        table = getattr(group, 'table')
+
+        if chunksize is None:
+            chunksize = _READ_CHUNKSIZE
+
+        sel = Selection(table, where, table._v_attrs.index_kind)
+        sel.select_coords()
+        coords = sel.values
+
+        columns = _maybe_convert(table.read(field='column')[coords],
                                  table._v_attrs.columns_kind)
-        index = _maybe_convert(sel.values['index'], table._v_attrs.index_kind)
-        values = sel.values['values']
+        minor = Factor(columns)
+        labels = minor.labels
+
+        K = len(minor.levels)
+        for start in xrange(0, K, chunksize):
+            mask = (labels >= start) & (labels < start + chunksize)
+            rows = _read_coordinates(table, coords[mask])
+            wp = self._table_to_panel(table, rows)
+
+            if kind == 'frame_table':
+                yield wp['value']
+            else:
+                yield wp
+
+    def _table_to_panel(self, table, rows):
+        fields = table._v_attrs.fields
+
+        columns = _maybe_convert(rows['column'], table._v_attrs.columns_kind)
+        index = _maybe_convert(rows['index'], table._v_attrs.index_kind)
+        values = rows['values']
 
         major = Factor(index)
         minor = Factor(columns)
 
-        J, K = len(major.levels), len(minor.levels)
-        key = major.labels * K + minor.labels
-
-        if len(unique(key)) == len(key):
-            sorter, _ = lib.groupsort_indexer(com._ensure_int64(key), J * K)
-            sorter = com._ensure_platform_int(sorter)
+        major_labels = major.labels
+        minor_labels = minor.labels
 
-            # the data need to be sorted
-            sorted_values = values.take(sorter, axis=0)
-            major_labels = major.labels.take(sorter)
-            minor_labels = minor.labels.take(sorter)
+        J, K = len(major.levels), len(minor.levels)
+        key = com._ensure_int64(major_labels * K + minor_labels)
 
-            block = block2d_to_block3d(sorted_values, fields, (J, K),
-                                       major_labels, minor_labels)
+        # maps each key to the location of its last occurrence
+        htable = lib.Int64HashTable(len(key))
+        htable.map_locations(key)
 
-            mgr = BlockManager([block], [block.ref_items,
-                                         major.levels, minor.levels])
-            wp = Panel(mgr)
-        else:
+        if len(htable) < len(key):
             if not self._quiet:  # pragma: no cover
                 print ('Duplicate entries in table, taking most recently '
                        'appended')
 
-            # reconstruct
-            long_index = MultiIndex.from_arrays([index, columns])
-            lp = DataFrame(values, index=long_index, columns=fields)
+            last = htable.lookup(key)
+            indexer = (last == np.arange(len(key))).nonzero()[0]
 
-            # need a better algorithm
-            tuple_index = long_index.get_tuple_index()
+            values = values.take(indexer, axis=0)
+            major_labels = major_labels.take(indexer)
+            minor_labels = minor_labels.take(indexer)
+            key = key.take(indexer)
 
-            unique_tuples = lib.fast_unique(tuple_index)
-            unique_tuples = _asarray_tuplesafe(unique_tuples)
+        sorter, _ = lib.groupsort_indexer(key, J * K)
+        sorter = com._ensure_platform_int(sorter)
 
-            indexer = match(unique_tuples, tuple_index)
-            indexer = com._ensure_platform_int(indexer)
+        # the data need to be sorted
+        sorted_values = values.take(sorter, axis=0)
+        major_labels = major_labels.take(sorter)
+        minor_labels = minor_labels.take(sorter)
 
-            new_index = long_index.take(indexer)
-            new_values = lp.values.take(indexer, axis=0)
+        block = block2d_to_block3d(sorted_values, fields, (J, K),
+                                   major_labels, minor_labels)
 
-            lp = DataFrame(new_values, index=new_index, columns=lp.columns)
-            wp = lp.to_panel()
-
-        if sel.column_filter:
-            new_minor = sorted(set(wp.minor_axis) & sel.column_filter)
-            wp = wp.reindex(minor=new_minor)
-        return wp
+        mgr = BlockManager([block], [block.ref_items,
+                                     major.levels, minor.levels])
+        return Panel(mgr)
 
     def _delete_from_table(self, group, where = None):
         table = getattr(group, 'table')
@@ -1097,9 +1159,12 @@ class Selection(object):
         """
         generate the selection
         """
-        if self.the_condition:
+        if self.column_filter:
+            # only read the rows of the requested columns
+            self.select_coords()
+            self.values = _read_coordinates(self.table, self.values)
+        elif self.the_condition:
             self.values = self.table.readWhere(self.the_condition)
-
         else:
             self.values = self.table.read()
 
@@ -1107,7 +1172,25 @@ class Selection(object):
         """
         generate the selection
         """
-        self.values = self.table.getWhereList(self.the_condition)
+        if self.the_condition:
+            coords = self.table.getWhereList(self.the_condition)
+        else:
+            coords = np.arange(self.table.nrows)
+
+        if self.column_filter:
+            columns = self.table.read(field='column')[coords]
+            columns = _maybe_convert(columns, self.table._v_attrs.columns_kind)
+            minor = Factor(columns)
+            keep = np.array([c in self.column_filter for c in minor.levels],
+                            dtype=bool)
+            coords = coords[keep.take(minor.labels)]
+
+        self.values = coords
+
+def _read_coordinates(table, coords):
+    if len(coords) == 0:
+        return table.read(start=0, stop=0)
+    return table.readCoordinates(coords)
 
 def _get_index_factory(klass):
     if klass == DatetimeIndex:
@@ -8,7 +8,8 @@ import numpy as np
 import traceback
 
 from pandas.core.datetools import format as date_format
-from pandas.core.api import DataFrame, isnull
+from pandas.core.api import DataFrame, Index, isnull
+import pandas._tseries as lib
 
 #-------------------------------------------------------------------------------
 # Helper execution function
@@ -118,7 +119,7 @@ def uquery(sql, con=None, cur=None, retry=True, params=()):
             return uquery(sql, con, retry=False)
     return result
 
-def read_frame(sql, con, index_col=None, coerce_float=True):
+def read_frame(sql, con, index_col=None, coerce_float=True, chunksize=None):
     """
     Returns a DataFrame corresponding to the result set of the query
     string.
@@ -133,12 +134,35 @@ def read_frame(sql, con, index_col=None, coerce_float=True):
     con: DB connection object, optional
     index_col: string, optional
         column name to use for the returned DataFrame object.
+    chunksize: int, optional
+        If given, return an iterator yielding DataFrames of at most
+        chunksize rows, fetched with cursor.fetchmany.
+
+    Notes
+    -----
+    With chunksize, the dtype of each column is inferred from the first
+    chunk and only ever upcast afterwards. Chunks already yielded are not
+    revisited, so the dtypes of a column can differ between chunks: an
+    INTEGER column is int64 in the chunks before its first NULL and float64
+    from then on, and a column mixing numbers and strings becomes object.
+    Concatenating the chunks gives the same dtypes as a single read.
+
+    Numeric columns whose dtype is known from the previous chunks are
+    written straight into typed arrays. Other columns, including every
+    column of the first chunk, go through an intermediate object array one
+    column at a time, so the first chunk costs about one object column of
+    extra memory on top of the fetched rows.
     """
     cur = execute(sql, con)
+    columns = [col_desc[0] for col_desc in cur.description]
+
+    if chunksize is not None:
+        return _iter_frames(cur, con, columns, chunksize,
+                            index_col=index_col, coerce_float=coerce_float)
+
     rows = _safe_fetch(cur)
     con.commit()
 
-    columns = [col_desc[0] for col_desc in cur.description]
     result = DataFrame.from_records(rows, columns=columns,
                                     coerce_float=coerce_float)
 
@@ -147,24 +171,161 @@ def read_frame(sql, con, index_col=None, coerce_float=True):
 
     return result
 
+def _iter_frames(cur, con, columns, chunksize, index_col=None,
+                 coerce_float=True):
+    """
+    Generate DataFrames from cursor.fetchmany batches, converting each
+    batch column by column. Columns are filled straight into the dtype of
+    the previous chunks when every value fits
+    """
+    dtypes = {}
+    start = 0
+    while True:
+        rows = cur.fetchmany(chunksize)
+        if not rows:
+            break
+
+        if not isinstance(rows, list):
+            rows = list(rows)
+
+        data = {}
+        for i, col in enumerate(columns):
+            arr = lib.sql_column_from_rows(rows, i, dtypes.get(col))
+            if arr.dtype == np.object_:
+                if coerce_float:
+                    arr = lib.convert_sql_column(arr)
+                else:
+                    arr = lib.maybe_convert_objects(arr)
+            arr, dtypes[col] = _stabilize_dtype(arr, dtypes.get(col))
+            data[col] = arr
+
+        index = Index(np.arange(start, start + len(rows)))
+        start += len(rows)
+
+        result = DataFrame(data, index=index, columns=columns)
+        if index_col is not None:
+            result = result.set_index(index_col)
+
+        yield result
+
+    con.commit()
+
+def _stabilize_dtype(values, dtype):
+    """
+    Reconcile a chunk's column with the dtype of the previous chunks, None
+    for none yet. Numeric columns are upcast, so integers in a float column
+    become float and the column stays float; any other mismatch makes the
+    column object. An all-NULL chunk is NaN in a numeric column and does not
+    fix the dtype of a new one
+
+    Returns
+    -------
+    (values, dtype for the following chunks)
+    """
+    if values.dtype == np.object_ and isnull(values).all():
+        if dtype is not None and _is_numeric(dtype):
+            dtype = np.promote_types(dtype, np.float64)
+            result = np.empty(len(values), dtype=dtype)
+            result.fill(np.nan)
+            return result, dtype
+        return values, dtype
+
+    if dtype is None:
+        return values, values.dtype
+
+    if _is_numeric(values.dtype) and _is_numeric(dtype):
+        dtype = np.promote_types(values.dtype, dtype)
+    elif values.dtype != dtype:
+        dtype = np.dtype(np.object_)
+
+    return values.astype(dtype), dtype
+
+def _is_numeric(dtype):
+    return issubclass(dtype.type, (np.number, np.bool_))
+
 frame_query = read_frame
 
-def write_frame(frame, name=None, con=None, flavor='sqlite'):
+def write_frame(frame, name=None, con=None, flavor='sqlite', if_exists='fail',
+                chunksize=10000):
     """
     Write records stored in a DataFrame to SQLite. The index will currently be
     dropped
+
+    Parameters
+    ----------
+    frame: DataFrame
+    name: string
+        Name of the SQL table
+    con: DB connection object
+    flavor: {'sqlite'}, default 'sqlite'
+    if_exists: {'fail', 'replace', 'append'}, default 'fail'
+        fail: raise ValueError if the table already exists
+        replace: drop the table and recreate it
+        append: insert the rows into the existing table
+    chunksize: int, default 10000
+        Number of rows passed to each executemany call. All rows are inserted
+        in a single transaction
     """
     if flavor == 'sqlite':
         schema = get_sqlite_schema(frame, name)
+        exists = _sqlite_table_exists(name, con)
     else:
         raise NotImplementedError
 
-    con.execute(schema)
+    if if_exists not in ('fail', 'replace', 'append'):
+        raise ValueError("'%s' is not valid for if_exists" % if_exists)
+
+    if exists:
+        if if_exists == 'fail':
+            raise ValueError('Table %s already exists' % name)
+        elif if_exists == 'replace':
+            con.execute('DROP TABLE %s' % name)
+            exists = False
 
     wildcards = ','.join(['?'] * len(frame.columns))
     insert_sql = 'INSERT INTO %s VALUES (%s)' % (name, wildcards)
-    data = [tuple(x) for x in frame.values]
-    con.executemany(insert_sql, data)
+
+    columns = [_to_sql_values(frame[c]) for c in frame.columns]
+
+    try:
+        if not exists:
+            con.execute(schema)
+        for start in xrange(0, len(frame), chunksize):
+            end = start + chunksize
+            con.executemany(insert_sql,
+                            zip(*[col[start:end] for col in columns]))
+        con.commit()
+    except Exception:
+        con.rollback()
+        raise
+
+def _sqlite_table_exists(name, con):
+    query = "SELECT name FROM sqlite_master WHERE type='table' AND name=?"
+    return len(con.execute(query, (name,)).fetchall()) > 0
+
+def _to_sql_values(series):
+    """
+    Convert a column to a list of native Python values the DB API accepts,
+    with None for missing values
+    """
+    values = series.values
+
+    if issubclass(values.dtype.type, np.datetime64):
+        mask = isnull(values)
+        values = lib.ints_to_pydatetime(values.view('i8'))
+    elif issubclass(values.dtype.type, np.bool_):
+        return values.astype(np.int64).tolist()
+    elif issubclass(values.dtype.type, np.integer):
+        return values.tolist()
+    else:
+        mask = isnull(values)
+
+    if not mask.any():
+        return values.tolist()
+
+    values = values.astype(object)
+    values[mask] = None
+    return values.tolist()
 
 def get_sqlite_schema(frame, name):
     template = """
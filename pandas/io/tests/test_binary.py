@@ -0,0 +1,137 @@
+import os
+import nose
+import unittest
+
+from datetime import datetime
+import numpy as np
+
+from pandas import (Series, DataFrame, Panel, MultiIndex, Index, date_range,
+                    load, save)
+from pandas.io.binary import save_binary, load_binary, is_binary_file
+from pandas.util.testing import (assert_series_equal, assert_frame_equal,
+                                 assert_panel_equal)
+import pandas.util.testing as tm
+
+
+class TestBinary(unittest.TestCase):
+    path = '__test_binary__'
+
+    def tearDown(self):
+        if os.path.exists(self.path):
+            os.remove(self.path)
+
+    def _roundtrip(self, obj, mmap=False):
+        save_binary(obj, self.path)
+        self.assert_(is_binary_file(self.path))
+        return load_binary(self.path, mmap=mmap)
+
+    def _check_roundtrip(self, obj, comparator):
+        for mmap in [False, True]:
+            result = self._roundtrip(obj, mmap=mmap)
+            self.assert_(type(result) is type(obj))
+            comparator(result, obj)
+
+    def test_series(self):
+        self._check_roundtrip(tm.makeFloatSeries(), assert_series_equal)
+        self._check_roundtrip(tm.makeStringSeries(), assert_series_equal)
+        self._check_roundtrip(tm.makeObjectSeries(), assert_series_equal)
+        self._check_roundtrip(tm.makePeriodSeries(), assert_series_equal)
+
+        ts = tm.makeTimeSeries()
+        ts.name = 'foo'
+        result = self._roundtrip(ts)
+        assert_series_equal(result, ts)
+        self.assertEqual(result.name, 'foo')
+        self.assertEqual(result.index.freq, ts.index.freq)
+
+        s = Series([], dtype=np.float64)
+        self._check_roundtrip(s, assert_series_equal)
+
+    def test_frame(self):
+        self._check_roundtrip(tm.makeDataFrame(), assert_frame_equal)
+        self._check_roundtrip(tm.makeTimeDataFrame(), assert_frame_equal)
+        self._check_roundtrip(DataFrame(), assert_frame_equal)
+
+        df = tm.makeDataFrame()
+        df['obj'] = 'foo'
+        df['int'] = 1
+        df['bool'] = df['A'] > 0
+        df['date'] = datetime(2012, 1, 1)
+        df.ix[3:6, 'A'] = np.nan
+        self._check_roundtrip(df, assert_frame_equal)
+
+        # non-contiguous block values
+        df = DataFrame(np.random.randn(10, 5).T.copy().T)
+        self._check_roundtrip(df, assert_frame_equal)
+
+    def test_frame_multiindex(self):
+        index = MultiIndex(levels=[['foo', 'bar', 'baz', 'qux'],
+                                   ['one', 'two', 'three']],
+                           labels=[[0, 0, 0, 1, 1, 2, 2, 3, 3, 3],
+                                   [0, 1, 2, 0, 1, 1, 2, 0, 1, 2]],
+                           names=['first', 'second'])
+        df = DataFrame(np.random.randn(10, 3), index=index,
+                       columns=Index(['A', 'B', 'C'], name='exp'))
+        self._check_roundtrip(df, assert_frame_equal)
+
+        result = self._roundtrip(df)
+        self.assertEqual(result.index.names, ['first', 'second'])
+        self.assertEqual(result.columns.name, 'exp')
+
+        self._check_roundtrip(df.T, assert_frame_equal)
+
+    def test_datetime_tz(self):
+        try:
+            import pytz
+        except ImportError:
+            raise nose.SkipTest
+
+        rng = date_range('1/1/2012', periods=20, freq='H', tz='US/Eastern')
+        df = DataFrame({'a' : np.arange(20.)}, index=rng)
+
+        result = self._roundtrip(df, mmap=True)
+        assert_frame_equal(result, df)
+        self.assertEqual(result.index.tz.zone, 'US/Eastern')
+
+    def test_panel(self):
+        self._check_roundtrip(tm.makePanel(), assert_panel_equal)
+
+    def test_mmap_copy_on_write(self):
+        df = tm.makeDataFrame()
+        result = self._roundtrip(df, mmap=True)
+
+        result['A'][:5] = 0.
+        self.assert_((result['A'][:5] == 0).all())
+
+        # file untouched
+        assert_frame_equal(load_binary(self.path), df)
+
+    def test_save_load_format(self):
+        df = tm.makeTimeDataFrame()
+
+        df.save(self.path, format='binary')
+        self.assert_(is_binary_file(self.path))
+        assert_frame_equal(DataFrame.load(self.path), df)
+        assert_frame_equal(load(self.path, mmap=True), df)
+
+        save(df, self.path)
+        self.assert_(not is_binary_file(self.path))
+        assert_frame_equal(load(self.path), df)
+
+        self.assertRaises(ValueError, df.save, self.path, format='foo')
+
+    def test_unsupported(self):
+        self.assertRaises(TypeError, save_binary, [1, 2, 3], self.path)
+        sp = tm.makeDataFrame().to_sparse()
+        self.assertRaises(TypeError, save_binary, sp, self.path)
+
+        f = open(self.path, 'wb')
+        f.write('foo')
+        f.close()
+        self.assertRaises(ValueError, load_binary, self.path)
+
+
+if __name__ == '__main__':
+    import nose
+    nose.runmodule(argv=[__file__,'-vvs','-x','--pdb', '--pdb-failure'],
+                   exit=False)
@@ -1128,6 +1128,171 @@ bar,foo,foo"""
         assert_frame_equal(url_table, local_table)
 
 
+class TestCParser(unittest.TestCase):
+
+    def _check_engines(self, data, **kwds):
+        expected = read_csv(StringIO(data), **kwds)
+        result = read_csv(StringIO(data), engine='c', **kwds)
+        assert_frame_equal(result, expected)
+        self.assert_((result.dtypes == expected.dtypes).all())
+        return result
+
+    def test_basic(self):
+        data = """A,B,C,D
+1,2.5,foo,True
+3,4.,bar,False
+5,-6e3,baz,True
+"""
+        result = self._check_engines(data)
+        self.assert_(result['A'].dtype == np.int64)
+        self.assert_(result['B'].dtype == np.float64)
+        self.assert_(result['C'].dtype == np.object_)
+        self.assert_(result['D'].dtype == np.bool_)
+
+    def test_index_col(self):
+        self._check_engines(TestParsers.data1, index_col=0)
+        self._check_engines(TestParsers.data1, index_col=[0, 1])
+
+        # implicit index
+        data = """A,B,C
+foo,1,2,3
+bar,4,5,6
+"""
+        self._check_engines(data)
+
+    def test_na_values(self):
+        data = """A,B,C
+1,NA,foo
+,5,baz
+7,-999,NaN
+"""
+        result = self._check_engines(data)
+        self.assert_(isnull(result['A'][1]))
+        self.assert_(isnull(result['C'][2]))
+
+        self._check_engines(data, na_values=['-999'])
+        self._check_engines(data, na_values={'B': ['-999']})
+
+    def test_quoting(self):
+        data = '''A,B
+"a, ""quoted"" value",1
+"multi
+line",2
+'''
+        result = self._check_engines(data)
+        self.assertEqual(result['A'][0], 'a, "quoted" value')
+        self.assertEqual(result['A'][1], 'multi\nline')
+
+    def test_thousands_comment(self):
+        data = """A|B|C
+1|2,334.0|5
+10|13|10.
+"""
+        self._check_engines(data, sep='|', thousands=',')
+
+        data = """A,B,C
+1,2.,4.#hello world
+5.,NaN,10.0
+"""
+        self._check_engines(data, comment='#')
+
+    def test_skiprows_skip_footer(self):
+        data = """junk
+A,B,C
+1,2,3
+skip me
+4,5,6
+7,8,9
+footer
+"""
+        result = read_csv(StringIO(data), skiprows=[0, 3], skip_footer=1,
+                          engine='c')
+        expected = DataFrame({'A': [1, 4, 7], 'B': [2, 5, 8],
+                              'C': [3, 6, 9]}, columns=['A', 'B', 'C'])
+        assert_frame_equal(result, expected)
+
+    def test_converters_parse_dates(self):
+        data = """date,A,B
+20090101,a,1
+20090102,b,2
+"""
+        self._check_engines(data, index_col=0, parse_dates=True)
+        self._check_engines(data, converters={'B': lambda x: float(x) * 2})
+        self._check_engines(data, parse_dates=[0])
+
+    def test_iterator(self):
+        data = "A,B\n" + "\n".join("%d,%d.5" % (i, i) for i in range(10))
+        reader = read_csv(StringIO(data), chunksize=3, engine='c')
+        chunks = list(reader)
+        self.assertEqual([len(c) for c in chunks], [3, 3, 3, 1])
+
+        expected = list(read_csv(StringIO(data), chunksize=3))
+        for result, exp in zip(chunks, expected):
+            assert_frame_equal(result, exp)
+
+    def test_block_boundaries(self):
+        from pandas._parser import TextReader
+
+        # \r\n and quoted fields split across blocks
+        data = ('A,B,C\r\n' +
+                ''.join('%d,"x\r\n""y""",%d.5\r\n' % (i, i)
+                        for i in range(50)))
+        expected = TextReader(data).read()
+        for block_size in [1, 2, 7, 64]:
+            result = TextReader(StringIO(data), block_size=block_size).read()
+            self.assertEqual(sorted(result), sorted(expected))
+            for i in expected:
+                self.assert_(np.array_equal(result[i], expected[i]))
+
+        self.assertRaises(ValueError, TextReader, StringIO(data),
+                          block_size=0)
+
+    def test_chunks_read_file_in_blocks(self):
+        class CountingReader(object):
+            def __init__(self, data):
+                self.buf = StringIO(data)
+                self.nread = 0
+
+            def read(self, size=-1):
+                result = self.buf.read(size)
+                self.nread += len(result)
+                return result
+
+            def readline(self):
+                result = self.buf.readline()
+                self.nread += len(result)
+                return result
+
+        data = 'A,B\n' + ''.join('%d,%d\n' % (i, i) for i in range(100000))
+        f = CountingReader(data)
+        reader = read_csv(f, chunksize=10, engine='c')
+        chunk = reader.get_chunk(10)
+        self.assertEqual(list(chunk['A']), range(10))
+        self.assert_(f.nread < len(data))
+
+        # sniffed delimiter
+        f = CountingReader(data.replace(',', '|'))
+        chunk = read_csv(f, sep=None, chunksize=10, engine='c').get_chunk(10)
+        self.assertEqual(list(chunk['B']), range(10))
+        self.assert_(f.nread < len(data))
+
+    def test_int64_bounds(self):
+        data = """A,B
+-9223372036854775808,9223372036854775807
+0,9223372036854775808
+"""
+        result = read_csv(StringIO(data), engine='c')
+        self.assert_(result['A'].dtype == np.int64)
+        self.assertEqual(result['A'][0], np.iinfo(np.int64).min)
+        self.assert_(result['B'].dtype == np.float64)
+
+    def test_bad_engine_args(self):
+        self.assertRaises(ValueError, read_csv, StringIO('a,b\n1,2'),
+                          engine='foo')
+        self.assertRaises(ValueError, read_csv, StringIO('a,b\n1,2'),
+                          sep='\s+', engine='c')
+
+
 class TestParseSQL(unittest.TestCase):
 
     def test_convert_sql_column_floats(self):
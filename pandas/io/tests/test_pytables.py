@@ -8,7 +8,7 @@ import sys
 from datetime import datetime
 import numpy as np
 
-from pandas import (Series, DataFrame, Panel, MultiIndex, bdate_range,
+from pandas import (Series, DataFrame, Panel, MultiIndex, bdate_range, concat,
                     date_range)
 from pandas.io.pytables import HDFStore, get_store
 import pandas.util.testing as tm
@@ -146,6 +146,31 @@ class TestHDFStore(unittest.TestCase):
         self.store.append('c', df[10:])
         tm.assert_frame_equal(self.store['c'], df)
 
+    def test_append_chunked_all_nan_rows(self):
+        wp = tm.makePanel()
+        values = wp.values.copy()
+        values[:, 3, :] = np.nan
+        values[0, 5, 1] = np.nan
+        wp = Panel(values, items=wp.items, major_axis=wp.major_axis,
+                   minor_axis=wp.minor_axis)
+
+        try:
+            store = HDFStore(self.scratchpath)
+            # several Table.append calls, all-NaN rows are not stored
+            store._write_table(store.handle.createGroup('/', 'panel'),
+                               items=wp.items, index=wp.major_axis,
+                               columns=wp.minor_axis, values=wp.values,
+                               chunksize=7)
+            store.handle.root.panel._v_attrs.pandas_type = 'wide_table'
+            table = store.handle.root.panel.table
+            K = len(wp.minor_axis)
+            self.assertEquals(table.nrows, (len(wp.major_axis) - 1) * K)
+            tm.assert_panel_equal(store['panel'], wp.drop(wp.major_axis[3],
+                                                          axis=1))
+        finally:
+            store.close()
+            os.remove(self.scratchpath)
+
     def test_append_diff_item_order(self):
         wp = tm.makePanel()
         wp1 = wp.ix[:, :10, :]
@@ -547,6 +572,66 @@ class TestHDFStore(unittest.TestCase):
         result = self.store.select('frame', [crit])
         tm.assert_frame_equal(result, df.ix[:, df.columns[:75]])
 
+    def test_select_iterator(self):
+        df = tm.makeTimeDataFrame()
+        df['E'] = df['A'] * 2
+        self.store.put('frame', df, table=True)
+
+        pieces = list(self.store.select('frame', chunksize=2))
+        self.assertEqual(len(pieces), 3)
+        tm.assert_frame_equal(pieces[0], df.ix[:, ['A', 'B']])
+        tm.assert_frame_equal(pieces[2], df.ix[:, ['E']])
+
+        date = df.index[len(df) // 2]
+        crit1 = {
+            'field' : 'index',
+            'op' : '>=',
+            'value' : date
+        }
+        crit2 = {
+            'field' : 'column',
+            'value' : ['A', 'C', 'D']
+        }
+        pieces = list(self.store.select('frame', [crit1, crit2],
+                                        iterator=True))
+        self.assertEqual(len(pieces), 1)
+        tm.assert_frame_equal(pieces[0], df.ix[date:, ['A', 'C', 'D']])
+
+        wp = tm.makePanel()
+        self.store.put('panel', wp, table=True)
+        for piece in self.store.select('panel', chunksize=3):
+            tm.assert_panel_equal(piece, wp.reindex(minor=piece.minor_axis))
+
+    def test_select_iterator_filter_corner(self):
+        df = DataFrame(np.random.randn(50, 100))
+        df.index = ['%.3d' % c for c in df.index]
+        df.columns = ['%.3d' % c for c in df.columns]
+        self.store.put('frame', df, table=True)
+
+        crit = {
+            'field' : 'column',
+            'value' : df.columns[:75]
+        }
+        pieces = self.store.select('frame', [crit], chunksize=10)
+        result = concat(list(pieces), axis=1)
+        tm.assert_frame_equal(result, df.ix[:, df.columns[:75]])
+
+    def test_frame_table_dups(self):
+        df = tm.makeTimeDataFrame()
+        newer = df * 2
+
+        try:
+            store = HDFStore(self.scratchpath)
+            store._quiet = True
+            store.put('frame', df, table=True)
+            store.append('frame', newer[:5])
+            recons = store.select('frame')
+            tm.assert_frame_equal(recons[:5], newer[:5])
+            tm.assert_frame_equal(recons[5:], df[5:])
+        finally:
+            store.close()
+            os.remove(self.scratchpath)
+
     def _check_roundtrip(self, obj, comparator, compression=False, **kwargs):
         options = {}
         if compression:
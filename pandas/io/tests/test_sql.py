@@ -7,7 +7,7 @@ import numpy as np
 
 import pandas.io.sql as sql
 import pandas.util.testing as tm
-from pandas import Series, Index
+from pandas import Series, Index, DataFrame, date_range
 
 class TestSQLite(unittest.TestCase):
 
@@ -98,7 +98,43 @@ class TestSQLite(unittest.TestCase):
             sys.stdout = sys.__stdout__
 
     def test_na_roundtrip(self):
-        pass
+        frame = tm.makeTimeDataFrame()
+        frame.ix[0, 0] = np.nan
+        frame.ix[3, 2] = np.nan
+        frame['txt'] = ['a', None] * (len(frame) // 2)
+        self._check_roundtrip(frame)
+
+    def test_write_frame_chunksize(self):
+        frame = tm.makeTimeDataFrame()
+        sql.write_frame(frame, name='test', con=self.db, chunksize=7)
+        result = sql.read_frame("select * from test", self.db)
+        result.index = frame.index
+        tm.assert_frame_equal(result, frame)
+
+    def test_write_frame_if_exists(self):
+        frame = tm.makeTimeDataFrame()
+        sql.write_frame(frame, name='test', con=self.db)
+        self.assertRaises(ValueError, sql.write_frame, frame, name='test',
+                          con=self.db)
+        self.assertRaises(ValueError, sql.write_frame, frame, name='test',
+                          con=self.db, if_exists='foo')
+
+        sql.write_frame(frame, name='test', con=self.db, if_exists='append')
+        result = sql.read_frame("select * from test", self.db)
+        self.assertEqual(len(result), 2 * len(frame))
+
+        sql.write_frame(frame[:5], name='test', con=self.db,
+                        if_exists='replace')
+        result = sql.read_frame("select * from test", self.db)
+        result.index = frame.index[:5]
+        tm.assert_frame_equal(result, frame[:5])
+
+    def test_write_frame_dtypes(self):
+        frame = DataFrame({'a': [1, 2, 3], 'b': [True, False, True],
+                           'c': date_range('1/1/2000', periods=3)})
+        sql.write_frame(frame, name='test', con=self.db)
+        result = sql.tquery("select * from test", self.db)
+        self.assertEqual(result[0], (1, 1, '2000-01-01 00:00:00'))
 
     def _check_roundtrip(self, frame):
         sql.write_frame(frame, name='test_table', con=self.db)
@@ -122,6 +158,74 @@ class TestSQLite(unittest.TestCase):
 
 
 
+    def test_read_frame_chunksize(self):
+        frame = tm.makeTimeDataFrame()
+        frame['txt'] = ['a', 'b'] * (len(frame) // 2)
+        sql.write_frame(frame, name='test_table', con=self.db)
+
+        expected = sql.read_frame("select * from test_table", self.db)
+
+        chunks = list(sql.read_frame("select * from test_table", self.db,
+                                     chunksize=7))
+        self.assertEqual([len(c) for c in chunks],
+                         [7] * (len(frame) // 7) + [len(frame) % 7])
+        result = chunks[0].append(chunks[1:])
+        tm.assert_frame_equal(result, expected)
+
+        chunks = sql.read_frame("select * from test_table", self.db,
+                                index_col='txt', chunksize=7)
+        self.assertEqual(list(chunks.next().index), list(frame['txt'][:7]))
+
+    def test_read_frame_chunksize_dtypes(self):
+        self.db.execute('CREATE TABLE test (a INTEGER, b REAL, c TEXT)')
+        rows = [(1, 1.5, 'x'), (2, 2.0, 'y'),
+                (3, None, None), (None, None, None),
+                (5, 5.0, 'z')]
+        self.db.executemany('INSERT INTO test VALUES (?, ?, ?)', rows)
+
+        chunks = list(sql.read_frame("select * from test", self.db,
+                                     chunksize=2))
+        self.assertEqual(len(chunks), 3)
+
+        # b is REAL, all-integral and all-NULL chunks stay float
+        for chunk in chunks:
+            self.assert_(chunk['b'].dtype == np.float64)
+        self.assert_(np.isnan(chunks[1]['b']).all())
+
+        # a NULL makes the INTEGER column a float from then on
+        self.assert_(chunks[0]['a'].dtype == np.int64)
+        self.assert_(chunks[1]['a'].dtype == np.float64)
+        self.assert_(chunks[2]['a'].dtype == np.float64)
+
+        for chunk in chunks:
+            self.assert_(chunk['c'].dtype == np.object_)
+
+        result = chunks[0].append(chunks[1:])
+        expected = sql.read_frame("select * from test", self.db)
+        tm.assert_frame_equal(result, expected)
+
+        # a leading all-NULL chunk does not make a numeric column object
+        self.db.execute('CREATE TABLE test2 (a REAL)')
+        self.db.executemany('INSERT INTO test2 VALUES (?)',
+                            [(None,), (None,), (1.5,), (2.5,)])
+        chunks = list(sql.read_frame("select * from test2", self.db,
+                                     chunksize=2))
+        self.assert_(chunks[1]['a'].dtype == np.float64)
+
+        # values that do not fit the dtype of the previous chunks
+        self.db.execute('CREATE TABLE test3 (a, b, c)')
+        self.db.executemany('INSERT INTO test3 VALUES (?, ?, ?)',
+                            [(1, 1.5, 1), (2, 2.5, 2),
+                             ('x', 3, 2.5), (4, 'y', 5)])
+        chunks = list(sql.read_frame("select * from test3", self.db,
+                                     chunksize=2))
+        self.assert_(chunks[0]['a'].dtype == np.int64)
+        self.assert_(chunks[1]['a'].dtype == np.object_)
+        self.assertEqual(list(chunks[1]['a']), ['x', 4])
+        self.assertEqual(list(chunks[1]['b']), [3, 'y'])
+        self.assert_(chunks[1]['c'].dtype == np.float64)
+        self.assertEqual(list(chunks[1]['c']), [2.5, 5.0])
+
     def test_tquery(self):
         frame = tm.makeTimeDataFrame()
         sql.write_frame(frame, name='test_table', con=self.db)
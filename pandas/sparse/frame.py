@@ -488,7 +488,7 @@ class SparseDataFrame(DataFrame):
                                  columns=self.columns)
 
     def _reindex_index(self, index, method, copy, level, fill_value=np.nan,
-                       limit=None):
+                       limit=None, n_jobs=1):
         if level is not None:
             raise Exception('Reindex by level not supported for sparse')
 
@@ -519,7 +519,8 @@ class SparseDataFrame(DataFrame):
         return SparseDataFrame(new_series, index=index, columns=self.columns,
                                default_fill_value=self.default_fill_value)
 
-    def _reindex_columns(self, columns, copy, level, fill_value, limit=None):
+    def _reindex_columns(self, columns, copy, level, fill_value, limit=None,
+                         n_jobs=1):
         if level is not None:
             raise Exception('Reindex by level not supported for sparse')
 
@@ -535,7 +536,7 @@ class SparseDataFrame(DataFrame):
                                default_fill_value=self.default_fill_value)
 
     def _reindex_with_indexers(self, index, row_indexer, columns, col_indexer,
-                               copy, fill_value):
+                               copy, fill_value, n_jobs=1):
         if columns is None:
             columns = self.columns
 
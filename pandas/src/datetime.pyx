@@ -198,16 +198,6 @@ cdef inline bint _is_multiple(int64_t us, int64_t mult):
     return us % mult == 0
 
 
-def apply_offset(ndarray[object] values, object offset):
-    cdef:
-        Py_ssize_t i, n = len(values)
-        ndarray[int64_t] new_values
-        object boxed
-
-    result = np.empty(n, dtype='M8[ns]')
-    new_values = result.view('i8')
-    pass
-
 # This is PITA. Because we inherit from datetime, which has very specific
 # construction requirements, we need to do object instantiation in python
 # (see Timestamp class above). This will serve as a C extension type that
@@ -799,15 +789,162 @@ cdef class DayOffset(_Offset):
 #        offset.next()
 #    return i
 
-def string_to_datetime(ndarray[object] strings, raise_=False, dayfirst=False):
+cdef inline bint _try_iso_8601(object val, pandas_datetimestruct *dts):
+    """
+    Fast path for strings of the form YYYY-MM-DD[(T| )HH[:MM[:SS[.f]]]]
+    with no time zone. Returns False, with any parse error cleared, for
+    anything else so the caller can fall back on dateutil
+    """
+    cdef:
+        npy_bool islocal, special
+        PANDAS_DATETIMEUNIT out_bestunit
+        char *buf
+        Py_ssize_t i, length
+
+    if PyUnicode_Check(val):
+        try:
+            val = PyUnicode_AsASCIIString(val)
+        except UnicodeError:
+            return False
+    if not isinstance(val, bytes):
+        return False
+    buf = val
+    length = len(val)
+
+    # the ISO parser reads '20120312' as a year, so insist on the dashes
+    if length < 10 or buf[4] != c'-' or buf[7] != c'-':
+        return False
+    for i in range(4):
+        if buf[i] < c'0' or buf[i] > c'9':
+            return False
+
+    if parse_iso_8601_datetime(buf, length, PANDAS_FR_ns, NPY_UNSAFE_CASTING,
+                               dts, &islocal, &out_bestunit, &special) == -1:
+        PyErr_Clear()
+        return False
+
+    # dateutil returns a tz-aware datetime for an explicit offset
+    if out_bestunit > PANDAS_FR_D and not islocal:
+        return False
+
+    return True
+
+
+_format_directives = {
+    'Y': r'(?P<Y>\d{4})',
+    'y': r'(?P<y>\d\d)',
+    'm': r'(?P<m>1[0-2]|0[1-9]|[1-9])',
+    'd': r'(?P<d>3[01]|[12]\d|0[1-9]|[1-9]| [1-9])',
+    'H': r'(?P<H>2[0-3]|[0-1]\d|\d)',
+    'M': r'(?P<M>[0-5]\d|\d)',
+    'S': r'(?P<S>6[0-1]|[0-5]\d|\d)',
+    'f': r'(?P<f>\d{1,6})',
+}
+
+_format_cache = {}
+
+def _compile_format(format):
+    """
+    Translate a strptime format built only from numeric directives into a
+    compiled regex matching the whole string, or None if the format needs
+    the full strptime machinery (locale names, weekdays, time zones, ...)
+    """
+    import re
+
+    if format in _format_cache:
+        return _format_cache[format]
+
+    pieces = []
+    seen = set()
+    i, n = 0, len(format)
+    regex = None
+    while i < n:
+        c = format[i]
+        if c != '%':
+            if c.isspace():
+                pieces.append(r'\s+')
+            else:
+                pieces.append(re.escape(c))
+            i += 1
+            continue
+        if i + 1 == n:
+            break
+        c = format[i + 1]
+        i += 2
+        if c == '%':
+            pieces.append('%')
+        elif c in _format_directives and c not in seen:
+            seen.add(c)
+            pieces.append(_format_directives[c])
+        else:
+            break
+    else:
+        regex = re.compile(''.join(pieces) + '$', re.IGNORECASE)
+
+    _format_cache[format] = regex
+    return regex
+
+
+cdef int64_t _match_to_datetime64(object match,
+                                  pandas_datetimestruct *dts) except? -1:
+    cdef:
+        object year, frac
+
+    groups = match.groupdict()
+
+    year = groups.get('Y')
+    if year is not None:
+        dts.year = int(year)
+    else:
+        year = groups.get('y')
+        if year is not None:
+            # same pivot as time.strptime
+            dts.year = int(year)
+            dts.year += 1900 if dts.year >= 69 else 2000
+        else:
+            dts.year = 1900
+    dts.month = int(groups.get('m') or 1)
+    dts.day = int(groups.get('d') or 1)
+    dts.hour = int(groups.get('H') or 0)
+    dts.min = int(groups.get('M') or 0)
+    dts.sec = int(groups.get('S') or 0)
+
+    frac = groups.get('f')
+    dts.us = int(frac + '0' * (6 - len(frac))) if frac is not None else 0
+    dts.ps = dts.as = 0
+
+    if dts.day > _days_per_month_table[is_leapyear(dts.year)][dts.month - 1]:
+        raise ValueError('day is out of range for month')
+    if dts.sec > 59:
+        raise ValueError('second must be in 0..59')
+
+    return pandas_datetimestruct_to_datetime(PANDAS_FR_ns, dts)
+
+
+def string_to_datetime(ndarray[object] strings, raise_=False, dayfirst=False,
+                       format=None):
+    """
+    Convert an array of strings (and datetime-likes / NAs) to datetime64[ns]
+
+    ISO 8601 strings are parsed in C and anything else is handed to
+    dateutil; with `format` given, strings are matched against that
+    strptime format instead. Each distinct string is parsed only once.
+    """
     cdef:
         Py_ssize_t i, n = len(strings)
-        object val
+        object val, regex, match, value
         ndarray[int64_t] iresult
         ndarray[object] oresult
         pandas_datetimestruct dts
+        bint use_iso = not dayfirst
+        dict seen = {}
 
     from dateutil.parser import parse
+    from datetime import datetime as pydatetime
+
+    regex = None
+    if format is not None:
+        regex = _compile_format(format)
 
     try:
         result = np.empty(n, dtype='M8[ns]')
@@ -826,13 +963,45 @@ def string_to_datetime(ndarray[object] strings, raise_=False, dayfirst=False):
                 if len(val) == 0:
                     iresult[i] = NaT
                     continue
-                try:
-                    result[i] = parse(val, dayfirst=dayfirst)
-                except Exception:
-                    raise TypeError
+
+                value = seen.get(val)
+                if value is not None:
+                    iresult[i] = value
+                    continue
+
+                if format is not None:
+                    try:
+                        if regex is not None:
+                            match = regex.match(val)
+                            if match is None:
+                                raise ValueError('time data %r does not '
+                                                 'match format %r'
+                                                 % (val, format))
+                            iresult[i] = _match_to_datetime64(match, &dts)
+                        else:
+                            iresult[i] = _pydatetime_to_dts(
+                                pydatetime.strptime(val, format), &dts)
+                    except ValueError:
+                        if raise_:
+                            raise
+                        return strings
+                elif use_iso and _try_iso_8601(val, &dts):
+                    iresult[i] = pandas_datetimestruct_to_datetime(
+                        PANDAS_FR_ns, &dts)
+                else:
+                    try:
+                        value = parse(val, dayfirst=dayfirst)
+                    except Exception:
+                        raise TypeError
+                    if value.tzinfo is None:
+                        iresult[i] = _pydatetime_to_dts(value, &dts)
+                    else:
+                        result[i] = value
+                seen[val] = iresult[i]
         return result
     except TypeError:
         oresult = np.empty(n, dtype=object)
+        seen = {}
 
         for i in range(n):
             val = strings[i]
@@ -842,13 +1011,17 @@ def string_to_datetime(ndarray[object] strings, raise_=False, dayfirst=False):
                 if len(val) == 0:
                     oresult[i] = 'NaT'
                     continue
-                try:
-                    oresult[i] = parse(val, dayfirst=dayfirst)
-                except Exception:
-                    if raise_:
-                        raise
-                    return strings
-                    # oresult[i] = val
+                value = seen.get(val)
+                if value is None:
+                    try:
+                        value = parse(val, dayfirst=dayfirst)
+                    except Exception:
+                        if raise_:
+                            raise
+                        return strings
+                        # oresult[i] = val
+                    seen[val] = value
+                oresult[i] = value
 
         return oresult
 
@@ -885,112 +1058,232 @@ except:
     have_pytz = False
 
 def tz_convert(ndarray[int64_t] vals, object tz1, object tz2):
+    """
+    Convert int64 wall times in tz1 to wall times in tz2 (either may be UTC).
+    The values need not be sorted, and NaT is passed through. Wall times
+    that are ambiguous or don't exist in tz1 raise, as in tz_localize_to_utc
+    """
     cdef:
-        ndarray[int64_t] utc_dates, result, trans, deltas
-        Py_ssize_t i, pos, n = len(vals)
-        int64_t v, offset
+        ndarray[int64_t] utc_dates
 
     if not have_pytz:
         import pytz
 
     # Convert to UTC
 
-    if tz1.zone != 'UTC':
-        utc_dates = np.empty(n, dtype=np.int64)
-        deltas = _get_deltas(tz1)
-        trans = _get_transitions(tz1)
-        pos = trans.searchsorted(vals[0]) - 1
-        if pos < 0:
-            raise ValueError('First time before start of DST info')
-
-        offset = deltas[pos]
-        for i in range(n):
-            v = vals[i]
-            if v >= trans[pos + 1]:
-                pos += 1
-                offset = deltas[pos]
-            utc_dates[i] = v - offset
+    if not _is_utc(tz1):
+        utc_dates = tz_localize_to_utc(vals, tz1)
     else:
         utc_dates = vals
 
-    if tz2.zone == 'UTC':
+    if _is_utc(tz2):
         return utc_dates
 
     # Convert UTC to other timezone
 
-    result = np.empty(n, dtype=np.int64)
-    trans = _get_transitions(tz2)
-    deltas = _get_deltas(tz2)
-    pos = trans.searchsorted(utc_dates[0]) - 1
-    if pos < 0:
-        raise ValueError('First time before start of DST info')
+    return _utc_to_local(utc_dates, tz2)
+
+def tz_convert_single(int64_t val, object tz1, object tz2):
+    return tz_convert(np.array([val], dtype=np.int64), tz1, tz2)[0]
+
+cdef inline bint _is_utc(object tz):
+    return getattr(tz, 'zone', None) == 'UTC'
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cdef ndarray _utc_to_local(ndarray[int64_t] utc_dates, object tz):
+    cdef:
+        ndarray[int64_t] trans, deltas, result
+        Py_ssize_t i, pos = 0, n = len(utc_dates)
+        int64_t v
 
-    offset = deltas[pos]
+    trans, deltas = _get_dst_info(tz)
+
+    result = np.empty(n, dtype=np.int64)
     for i in range(n):
         v = utc_dates[i]
-        if v >= trans[pos + 1]:
-            pos += 1
-            offset = deltas[pos]
-        result[i] = v + offset
+        if v == iNaT:
+            result[i] = iNaT
+        else:
+            pos = _dst_pos(<int64_t*> trans.data, len(trans), v, pos)
+            result[i] = v + deltas[pos]
 
     return result
 
-def tz_convert_single(int64_t val, object tz1, object tz2):
-    cdef:
-        ndarray[int64_t] trans, deltas
-        Py_ssize_t pos
-        int64_t v, offset, utc_date
+cdef inline Py_ssize_t _dst_pos(int64_t *trans, Py_ssize_t ntrans,
+                                int64_t val, Py_ssize_t guess):
+    # index of the last transition at or before val. The previous answer is
+    # tried first, so sorted values rarely need the bisection
+    cdef Py_ssize_t lo = 0, hi = ntrans, mid
+
+    if trans[guess] <= val and (guess == ntrans - 1 or
+                                val < trans[guess + 1]):
+        return guess
 
+    if val < trans[0]:
+        return 0
+
+    while hi - lo > 1:
+        mid = (lo + hi) >> 1
+        if trans[mid] <= val:
+            lo = mid
+        else:
+            hi = mid
+    return lo
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def tz_localize_to_utc(ndarray[int64_t] vals, object tz,
+                       object ambiguous='raise', object nonexistent='raise'):
+    """
+    Localize tz-naive int64 wall times to the given time zone (using pytz),
+    returning them as UTC. The values need not be sorted, and NaT is passed
+    through.
+
+    Parameters
+    ----------
+    vals : ndarray[int64_t]
+    tz : pytz time zone
+    ambiguous : {'raise', 'NaT'} or boolean array, default 'raise'
+        Wall times repeated when the clocks go back: raise
+        AmbiguousTimeError, return NaT, or for each value True to take the
+        first (DST) occurrence and False to take the second
+    nonexistent : {'raise', 'NaT', 'shift_forward'}, default 'raise'
+        Wall times skipped when the clocks go forward: raise
+        NonExistentTimeError, return NaT, or move them forward by the size
+        of the gap (what pytz's normalize does)
+
+    Returns
+    -------
+    utc_dates : ndarray[int64_t]
+    """
+    cdef:
+        ndarray[int64_t] trans, deltas, result
+        ndarray[uint8_t] first_flags
+        int64_t *tdata
+        Py_ssize_t i, k, n = len(vals), ntrans, left = 0, right = 0
+        int64_t v, utc, first, last
+        int nvalid, ambiguous_mode, nonexistent_mode
 
     if not have_pytz:
-        import pytz
+        raise Exception("Could not find pytz module")
 
-    # Convert to UTC
+    if tz is None or _is_utc(tz):
+        return vals
 
-    if tz1.zone != 'UTC':
-        deltas = _get_deltas(tz1)
-        trans = _get_transitions(tz1)
-        pos = trans.searchsorted(val) - 1
-        if pos < 0:
-            raise ValueError('First time before start of DST info')
-        offset = deltas[pos]
-        utc_date = val - offset
+    if isinstance(ambiguous, basestring):
+        if ambiguous not in ('raise', 'NaT'):
+            raise ValueError('ambiguous must be raise, NaT or a boolean '
+                             'array, got %s' % ambiguous)
+        ambiguous_mode = ambiguous == 'NaT'
     else:
-        utc_date = val
+        first_flags = np.asarray(ambiguous, dtype=bool).view(np.uint8)
+        if len(first_flags) != n:
+            raise ValueError('Length of ambiguous (%d) does not match '
+                             'length of values (%d)' % (len(first_flags), n))
+        ambiguous_mode = 2
 
-    if tz2.zone == 'UTC':
-        return utc_date
+    if nonexistent not in ('raise', 'NaT', 'shift_forward'):
+        raise ValueError('nonexistent must be raise, NaT or shift_forward, '
+                         'got %s' % nonexistent)
+    nonexistent_mode = ('raise', 'NaT', 'shift_forward').index(nonexistent)
 
-    # Convert UTC to other timezone
-    trans = _get_transitions(tz2)
-    deltas = _get_deltas(tz2)
-    pos = trans.searchsorted(utc_date) - 1
-    if pos < 0:
-        raise ValueError('First time before start of DST info')
+    trans, deltas = _get_dst_info(tz)
+    tdata = <int64_t*> trans.data
+    ntrans = len(trans)
+
+    result = np.empty(n, dtype=np.int64)
+    for i in range(n):
+        v = vals[i]
+        if v == iNaT:
+            result[i] = iNaT
+            continue
+
+        # UTC offsets are less than a day, so only the transitions within a
+        # day either side of the wall time can apply
+        left = _dst_pos(tdata, ntrans, v - DAY_NS, left)
+        right = _dst_pos(tdata, ntrans, v + DAY_NS, right)
+        if left == right:
+            result[i] = v - deltas[left]
+            continue
+
+        # v is valid under offset k if v - offset k falls in transition k
+        nvalid = 0
+        for k in range(left, right + 1):
+            utc = v - deltas[k]
+            if tdata[k] <= utc and (k == ntrans - 1 or utc < tdata[k + 1]):
+                if nvalid == 0:
+                    first = utc
+                last = utc
+                nvalid += 1
+
+        if nvalid == 1:
+            result[i] = first
+        elif nvalid > 1:
+            if ambiguous_mode == 0:
+                msg = ("Cannot localize, ambiguous time %s found"
+                       % Timestamp(v))
+                raise pytz.AmbiguousTimeError(msg)
+            elif ambiguous_mode == 1:
+                result[i] = iNaT
+            else:
+                result[i] = first if first_flags[i] else last
+        else:
+            if nonexistent_mode == 0:
+                msg = ("Cannot localize, nonexistent time %s found"
+                       % Timestamp(v))
+                raise pytz.NonExistentTimeError(msg)
+            elif nonexistent_mode == 1:
+                result[i] = iNaT
+            else:
+                result[i] = v - deltas[left]
+
+    return result
+
+def tz_localize_check(ndarray[int64_t] vals, object tz):
+    """
+    Check that tz-naive values can be localized to the given time zone (using
+    pytz), raising AmbiguousTimeError or NonExistentTimeError if not
+    """
+    tz_localize_to_utc(vals, tz)
 
-    offset = deltas[pos]
-    return utc_date + offset
 
+dst_cache = {}
 
-trans_cache = {}
-utc_offset_cache = {}
+def _get_dst_info(tz):
+    """
+    UTC times of the DST transitions of tz, and the UTC offsets (in
+    nanoseconds) in effect from each one. Cached by zone name, so the
+    differently localized copies of a pytz zone share one table. Zones
+    without transitions (fixed offsets) get a single entry
+    """
+    key = getattr(tz, 'zone', None) or tz
+    if key not in dst_cache:
+        if hasattr(tz, '_utc_transition_times'):
+            # the first transition is datetime(1, 1, 1), out of the
+            # datetime64[ns] range
+            times = np.array(tz._utc_transition_times[1:], dtype='M8[ns]')
+            trans = np.empty(len(times) + 1, dtype=np.int64)
+            trans[0] = iNaT + 1
+            trans[1:] = times.view('i8')
+            deltas = _unbox_utcoffsets(tz._transition_info)
+        else:
+            trans = np.array([iNaT + 1], dtype=np.int64)
+            deltas = _unbox_utcoffsets([(tz.utcoffset(None),)])
+        dst_cache[key] = trans, deltas
+    return dst_cache[key]
 
 def _get_transitions(tz):
     """
     Get UTC times of DST transitions
     """
-    if tz not in trans_cache:
-        arr = np.array(tz._utc_transition_times, dtype='M8[ns]')
-        trans_cache[tz] = arr.view('i8')
-    return trans_cache[tz]
+    return _get_dst_info(tz)[0]
 
 def _get_deltas(tz):
     """
-    Get UTC offsets in microseconds corresponding to DST transitions
+    Get UTC offsets in nanoseconds corresponding to DST transitions
     """
-    if tz not in utc_offset_cache:
-        utc_offset_cache[tz] = _unbox_utcoffsets(tz._transition_info)
-    return utc_offset_cache[tz]
+    return _get_dst_info(tz)[1]
 
 cdef double total_seconds(object td): # Python 2.6 compat
     return ((td.microseconds + (td.seconds + td.days * 24 * 3600) * 10**6) //
@@ -1010,48 +1303,6 @@ cpdef ndarray _unbox_utcoffsets(object transinfo):
     return arr
 
 
-def tz_localize_check(ndarray[int64_t] vals, object tz):
-    """
-    Localize tzinfo-naive DateRange to given time zone (using pytz). If
-    there are ambiguities in the values, raise AmbiguousTimeError.
-
-    Returns
-    -------
-    localized : DatetimeIndex
-    """
-    cdef:
-        ndarray[int64_t] trans, deltas
-        Py_ssize_t i, pos, n = len(vals)
-        int64_t v, dst_start, dst_end
-
-    if not have_pytz:
-        raise Exception("Could not find pytz module")
-
-    if tz == pytz.utc or tz is None:
-        return
-
-    trans = _get_transitions(tz)
-    deltas = _get_deltas(tz)
-
-    pos = np.searchsorted(trans, vals[0])
-    dst_start = trans[pos] + deltas[pos - 1]
-    dst_end = trans[pos] + deltas[pos]
-
-    for i in range(n):
-        v = vals[i]
-        if v >= trans[pos + 1]:
-            pos += 1
-            dst_start = trans[pos] + deltas[pos - 1]
-            dst_end = trans[pos] + deltas[pos]
-
-        if dst_start > dst_end:
-            dst_end, dst_start = dst_start, dst_end
-
-        if dst_start <= v and v <= dst_end:
-            msg = "Cannot localize, ambiguous time %s found" % Timestamp(v)
-            raise pytz.AmbiguousTimeError(msg)
-
-
 # Accessors
 #----------------------------------------------------------------------
 
@@ -1332,6 +1583,301 @@ def dates_normalized(ndarray[int64_t] stamps):
 
     return True
 
+# Vectorized DateOffset arithmetic, see the offsets' apply_index
+#----------------------------------------------------------------------
+
+@cython.cdivision(True)
+cdef inline int64_t _floor_div(int64_t a, int64_t b):
+    # C division truncates toward zero, we want pre-1970 stamps to floor
+    cdef int64_t q = a / b
+    if (a % b != 0) and ((a < 0) != (b < 0)):
+        q -= 1
+    return q
+
+cdef inline int _weekday_i8(int64_t val):
+    return (_floor_div(val, DAY_NS) + 3) % 7  # 1970-01-01 was a Thursday
+
+cdef inline int _day_in_month(int64_t year, int month, int day_opt):
+    cdef int wkday, days_in_month
+
+    days_in_month = _days_per_month_table[is_leapyear(year)][month - 1]
+    if day_opt == 0:
+        return 1
+    elif day_opt == 1:
+        return days_in_month
+
+    wkday = dayofweek(year, month, 1)
+    if day_opt == 2:
+        # first business day
+        if wkday == 5:
+            return 3
+        elif wkday == 6:
+            return 2
+        return 1
+    else:
+        # last business day
+        return days_in_month - int_max((wkday + days_in_month - 1) % 7 - 4, 0)
+
+_day_opts = {'start': 0, 'end': 1, 'business_start': 2, 'business_end': 3}
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def shift_anchored(ndarray[int64_t] stamps, int n, int stride, int month,
+                   object day_opt, bint roll_before=True, bint roll_zero=True,
+                   bint normalize=False):
+    """
+    Move each stamp n anchors along the grid of every stride-th month
+    (counting from month), landing on the 'start', 'end', 'business_start'
+    or 'business_end' day of the target month; month-, quarter- and
+    year-anchored offsets are all of this form. A stamp not on an anchor
+    first rolls back for n > 0 and forward for n <= 0, as the scalar
+    offsets do; roll_before / roll_zero switch those rolls off for the
+    offsets whose apply doesn't make them.
+    """
+    cdef:
+        Py_ssize_t i, count = len(stamps)
+        ndarray[int64_t] out
+        pandas_datetimestruct dts
+        int opt, k, months_to_go, anchor
+        bint before, after
+        int64_t mindex
+
+    if day_opt not in _day_opts:
+        raise ValueError('day_opt must be one of %s, got %s'
+                         % (sorted(_day_opts), day_opt))
+    if stride <= 0:
+        raise ValueError("Stride must be positive")
+    opt = _day_opts[day_opt]
+
+    out = np.empty(count, dtype=np.int64)
+    for i in range(count):
+        if stamps[i] == iNaT:
+            out[i] = iNaT
+            continue
+
+        pandas_datetime_to_datetimestruct(stamps[i], PANDAS_FR_ns, &dts)
+
+        months_to_go = (month - dts.month) % stride
+        if months_to_go < 0:
+            months_to_go += stride
+        if months_to_go == 0:
+            anchor = _day_in_month(dts.year, dts.month, opt)
+            before = dts.day < anchor
+            after = dts.day > anchor
+        else:
+            before = 1
+            after = 0
+
+        k = n
+        if k > 0:
+            if before and roll_before:
+                k -= 1
+        elif after and (k < 0 or roll_zero):
+            k += 1
+
+        mindex = dts.year * 12 + dts.month - 1 + months_to_go + stride * k
+        dts.year = _floor_div(mindex, 12)
+        dts.month = mindex - dts.year * 12 + 1
+        dts.day = _day_in_month(dts.year, dts.month, opt)
+        if normalize:
+            dts.hour = dts.min = dts.sec = dts.us = 0
+            dts.ps = dts.as = 0
+
+        out[i] = pandas_datetimestruct_to_datetime(PANDAS_FR_ns, &dts)
+
+    return out
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def shift_bdays(ndarray[int64_t] stamps, int n, bint normalize=False,
+                int64_t offset=0):
+    """
+    Add n business days to each stamp, a weekend stamp counting as the
+    Friday before (n > 0) or Monday after (n < 0) it, and with BDay(0)
+    rolling weekends forward. Then optionally drop the time of day and add
+    offset nanoseconds
+    """
+    cdef:
+        Py_ssize_t i, count = len(stamps)
+        ndarray[int64_t] out
+        int64_t val, shift
+        int k, wkday, weeks, rem
+
+    out = np.empty(count, dtype=np.int64)
+    for i in range(count):
+        val = stamps[i]
+        if val == iNaT:
+            out[i] = iNaT
+            continue
+
+        wkday = _weekday_i8(val)
+        k = n
+        if k == 0 and wkday > 4:
+            k = 1
+
+        shift = 0
+        if k > 0:
+            if wkday > 4:
+                shift = 4 - wkday
+                wkday = 4
+            weeks = k / 5
+            rem = k % 5
+            shift += weeks * 7 + rem
+            if wkday + rem > 4:
+                shift += 2
+        elif k < 0:
+            if wkday > 4:
+                shift = 7 - wkday
+                wkday = 0
+            weeks = (-k) / 5
+            rem = (-k) % 5
+            shift -= weeks * 7 + rem
+            if wkday - rem < 0:
+                shift -= 2
+
+        val += shift * DAY_NS
+        if normalize:
+            val = _floor_div(val, DAY_NS) * DAY_NS
+        out[i] = val + offset
+
+    return out
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def shift_weekday(ndarray[int64_t] stamps, int n, int weekday):
+    """
+    Move each stamp n weeks, onto the given weekday (0 is Monday) if
+    weekday >= 0. A stamp on another weekday first rolls forward, which
+    counts as one of the weeks for n > 0
+    """
+    cdef:
+        Py_ssize_t i, count = len(stamps)
+        ndarray[int64_t] out
+        int64_t days
+        int wkday
+
+    out = np.empty(count, dtype=np.int64)
+    for i in range(count):
+        if stamps[i] == iNaT:
+            out[i] = iNaT
+            continue
+
+        if weekday < 0:
+            days = 7 * n
+        else:
+            wkday = _weekday_i8(stamps[i])
+            days = (weekday - wkday + 7) % 7
+            if n > 0 and wkday != weekday:
+                days += 7 * (n - 1)
+            else:
+                days += 7 * n
+
+        out[i] = stamps[i] + days * DAY_NS
+
+    return out
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def shift_week_of_month(ndarray[int64_t] stamps, int n, int week,
+                        int weekday):
+    """
+    Move each stamp n months to midnight of the given weekday of the given
+    week (0-based) of the month, rolling first as shift_anchored does
+    """
+    cdef:
+        Py_ssize_t i, count = len(stamps)
+        ndarray[int64_t] out
+        pandas_datetimestruct dts
+        int k, anchor
+        bint before, after
+        int64_t mindex
+
+    out = np.empty(count, dtype=np.int64)
+    for i in range(count):
+        if stamps[i] == iNaT:
+            out[i] = iNaT
+            continue
+
+        pandas_datetime_to_datetimestruct(stamps[i], PANDAS_FR_ns, &dts)
+
+        anchor = (1 + (weekday - dayofweek(dts.year, dts.month, 1) + 7) % 7
+                  + 7 * week)
+        before = dts.day < anchor
+        # the anchor is at midnight
+        after = (dts.day > anchor or
+                 (dts.day == anchor and
+                  (dts.hour or dts.min or dts.sec or dts.us or dts.ps)))
+
+        k = n
+        if k > 0:
+            if before:
+                k -= 1
+        elif after:
+            k += 1
+
+        mindex = dts.year * 12 + dts.month - 1 + k
+        dts.year = _floor_div(mindex, 12)
+        dts.month = mindex - dts.year * 12 + 1
+        dts.day = (1 + (weekday - dayofweek(dts.year, dts.month, 1) + 7) % 7
+                   + 7 * week)
+        dts.hour = dts.min = dts.sec = dts.us = 0
+        dts.ps = dts.as = 0
+
+        out[i] = pandas_datetimestruct_to_datetime(PANDAS_FR_ns, &dts)
+
+    return out
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def shift_relative(ndarray[int64_t] stamps, int n, int months, int64_t nanos):
+    """
+    Apply relativedelta(months=months) + nanos nanoseconds n times (-n times
+    backwards for n < 0) to each stamp, clipping the day to the end of a
+    shorter month at each step like relativedelta does
+    """
+    cdef:
+        Py_ssize_t i, j, count = len(stamps)
+        ndarray[int64_t] out
+        pandas_datetimestruct dts
+        int64_t val, mindex
+        int steps, days_in_month
+
+    out = np.empty(count, dtype=np.int64)
+
+    if months == 0:
+        for i in range(count):
+            if stamps[i] == iNaT:
+                out[i] = iNaT
+            else:
+                out[i] = stamps[i] + n * nanos
+        return out
+
+    steps = n
+    if n < 0:
+        steps = -n
+        months = -months
+        nanos = -nanos
+
+    for i in range(count):
+        val = stamps[i]
+        if val == iNaT:
+            out[i] = iNaT
+            continue
+
+        for j in range(steps):
+            pandas_datetime_to_datetimestruct(val, PANDAS_FR_ns, &dts)
+            mindex = dts.year * 12 + dts.month - 1 + months
+            dts.year = _floor_div(mindex, 12)
+            dts.month = mindex - dts.year * 12 + 1
+            days_in_month = _day_in_month(dts.year, dts.month, 1)
+            if dts.day > days_in_month:
+                dts.day = days_in_month
+            val = pandas_datetimestruct_to_datetime(PANDAS_FR_ns, &dts) + nanos
+
+        out[i] = val
+
+    return out
+
 # Some general helper functions
 #----------------------------------------------------------------------
 
@@ -435,6 +435,33 @@ cdef class DatetimeEngine(Int64Engine):
                                      limit=limit)
 
 
+cdef class MultiIndexEngine(Int64Engine):
+    '''
+    Engine over the int64 keys packed from the level labels of a MultiIndex,
+    so that lookups never hash or compare tuples
+    '''
+
+    def __contains__(self, object val):
+        try:
+            self.get_loc(val)
+        except (KeyError, TypeError):
+            return False
+        return True
+
+    cdef _get_index_values(self):
+        return self.index_weakref()._int64_keys
+
+    cpdef get_loc(self, object val):
+        if is_definitely_invalid_key(val):
+            raise TypeError
+
+        key = self.index_weakref()._get_int64_key(val)
+        try:
+            return Int64Engine.get_loc(self, key)
+        except KeyError:
+            raise KeyError(val)
+
+
 cdef inline _to_i8(object val):
     cdef pandas_datetimestruct dts
     if util.is_datetime64_object(val):
@@ -50,6 +50,10 @@ import_ufunc()
 
 cdef int PLATFORM_INT = (<ndarray> np.arange(0, dtype=np.int_)).descr.type_num
 
+# missing-value markers for the integer groupby kernels
+cdef int64_t iNaT = util.get_nat()
+cdef int32_t INT32_NA = np.iinfo(np.int32).min
+
 cpdef ensure_platform_int(object arr):
     if util.is_array(arr):
         if (<ndarray> arr).descr.type_num == PLATFORM_INT:
@@ -87,12 +91,13 @@ def take_1d_%(name)s(ndarray[%(c_type)s] values,
                 outbuf[i] = values[idx]
     else:
         fv = fill_value
-        for i in range(n):
-            idx = indexer[i]
-            if idx == -1:
-                outbuf[i] = fv
-            else:
-                outbuf[i] = values[idx]
+        %(nogil)s
+            for i in range(n):
+                idx = indexer[i]
+                if idx == -1:
+                    outbuf[i] = fv
+                else:
+                    outbuf[i] = values[idx]
 
 """
 
@@ -125,14 +130,15 @@ def take_2d_axis0_%(name)s(ndarray[%(c_type)s, ndim=2] values,
                     outbuf[i, j] = values[idx, j]
     else:
         fv = fill_value
-        for i in range(n):
-            idx = indexer[i]
-            if idx == -1:
-                for j in range(k):
-                    outbuf[i, j] = fv
-            else:
-                for j in range(k):
-                    outbuf[i, j] = values[idx, j]
+        %(nogil)s
+            for i in range(n):
+                idx = indexer[i]
+                if idx == -1:
+                    for j in range(k):
+                        outbuf[i, j] = fv
+                else:
+                    for j in range(k):
+                        outbuf[i, j] = values[idx, j]
 
 """
 
@@ -166,15 +172,16 @@ def take_2d_axis1_%(name)s(ndarray[%(c_type)s, ndim=2] values,
                     outbuf[i, j] = values[i, idx]
     else:
         fv = fill_value
-        for j in range(k):
-            idx = indexer[j]
+        %(nogil)s
+            for j in range(k):
+                idx = indexer[j]
 
-            if idx == -1:
-                for i in range(n):
-                    outbuf[i, j] = fv
-            else:
-                for i in range(n):
-                    outbuf[i, j] = values[i, idx]
+                if idx == -1:
+                    for i in range(n):
+                        outbuf[i, j] = fv
+                else:
+                    for i in range(n):
+                        outbuf[i, j] = values[i, idx]
 
 """
 
@@ -212,17 +219,18 @@ def take_2d_multi_%(name)s(ndarray[%(c_type)s, ndim=2] values,
                         outbuf[i, j] = values[idx, idx1[j]]
     else:
         fv = fill_value
-        for i in range(n):
-            idx = idx0[i]
-            if idx == -1:
-                for j in range(k):
-                    outbuf[i, j] = fv
-            else:
-                for j in range(k):
-                    if idx1[j] == -1:
+        %(nogil)s
+            for i in range(n):
+                idx = idx0[i]
+                if idx == -1:
+                    for j in range(k):
                         outbuf[i, j] = fv
-                    else:
-                        outbuf[i, j] = values[idx, idx1[j]]
+                else:
+                    for j in range(k):
+                        if idx1[j] == -1:
+                            outbuf[i, j] = fv
+                        else:
+                            outbuf[i, j] = values[idx, idx1[j]]
 
 """
 
@@ -284,41 +292,42 @@ def backfill_%(name)s(ndarray[%(c_type)s] old, ndarray[%(c_type)s] new,
     if nleft == 0 or nright == 0 or new[0] > old[nleft - 1]:
         return indexer
 
-    i = nleft - 1
-    j = nright - 1
+    %(nogil)s
+        i = nleft - 1
+        j = nright - 1
+
+        cur = old[nleft - 1]
+
+        while j >= 0 and new[j] > cur:
+            j -= 1
 
-    cur = old[nleft - 1]
+        while True:
+            if j < 0:
+                break
 
-    while j >= 0 and new[j] > cur:
-        j -= 1
+            if i == 0:
+                while j >= 0:
+                    if new[j] == cur:
+                        indexer[j] = i
+                    elif new[j] < cur and fill_count < lim:
+                        indexer[j] = i
+                        fill_count += 1
+                    j -= 1
+                break
 
-    while True:
-        if j < 0:
-            break
+            prev = old[i - 1]
 
-        if i == 0:
-            while j >= 0:
+            while j >= 0 and prev < new[j] <= cur:
                 if new[j] == cur:
                     indexer[j] = i
                 elif new[j] < cur and fill_count < lim:
                     indexer[j] = i
                     fill_count += 1
                 j -= 1
-            break
 
-        prev = old[i - 1]
-
-        while j >= 0 and prev < new[j] <= cur:
-            if new[j] == cur:
-                indexer[j] = i
-            elif new[j] < cur and fill_count < lim:
-                indexer[j] = i
-                fill_count += 1
-            j -= 1
-
-        fill_count = 0
-        i -= 1
-        cur = prev
+            fill_count = 0
+            i -= 1
+            cur = prev
 
     return indexer
 
@@ -349,40 +358,41 @@ def pad_%(name)s(ndarray[%(c_type)s] old, ndarray[%(c_type)s] new,
     if nleft == 0 or nright == 0 or new[nright - 1] < old[0]:
         return indexer
 
-    i = j = 0
+    %(nogil)s
+        i = j = 0
 
-    cur = old[0]
+        cur = old[0]
 
-    while j <= nright - 1 and new[j] < cur:
-        j += 1
+        while j <= nright - 1 and new[j] < cur:
+            j += 1
 
-    while True:
-        if j == nright:
-            break
+        while True:
+            if j == nright:
+                break
 
-        if i == nleft - 1:
-            while j < nright:
+            if i == nleft - 1:
+                while j < nright:
+                    if new[j] == cur:
+                        indexer[j] = i
+                    elif new[j] > cur and fill_count < lim:
+                        indexer[j] = i
+                        fill_count += 1
+                    j += 1
+                break
+
+            next = old[i + 1]
+
+            while j < nright and cur <= new[j] < next:
                 if new[j] == cur:
                     indexer[j] = i
-                elif new[j] > cur and fill_count < lim:
+                elif fill_count < lim:
                     indexer[j] = i
                     fill_count += 1
                 j += 1
-            break
-
-        next = old[i + 1]
-
-        while j < nright and cur <= new[j] < next:
-            if new[j] == cur:
-                indexer[j] = i
-            elif fill_count < lim:
-                indexer[j] = i
-                fill_count += 1
-            j += 1
 
-        fill_count = 0
-        i += 1
-        cur = next
+            fill_count = 0
+            i += 1
+            cur = next
 
     return indexer
 
@@ -407,15 +417,16 @@ def pad_inplace_%(name)s(ndarray[%(c_type)s] values,
         lim = limit
 
     val = values[0]
-    for i in range(N):
-        if mask[i]:
-            if fill_count >= lim:
-                continue
-            fill_count += 1
-            values[i] = val
-        else:
-            fill_count = 0
-            val = values[i]
+    %(nogil)s
+        for i in range(N):
+            if mask[i]:
+                if fill_count >= lim:
+                    continue
+                fill_count += 1
+                values[i] = val
+            else:
+                fill_count = 0
+                val = values[i]
 
 """
 
@@ -437,18 +448,19 @@ def pad_2d_inplace_%(name)s(ndarray[%(c_type)s, ndim=2] values,
             raise ValueError('Limit must be non-negative')
         lim = limit
 
-    for j in range(K):
-        fill_count = 0
-        val = values[j, 0]
-        for i in range(N):
-            if mask[j, i]:
-                if fill_count >= lim:
-                    continue
-                fill_count += 1
-                values[j, i] = val
-            else:
-                fill_count = 0
-                val = values[j, i]
+    %(nogil)s
+        for j in range(K):
+            fill_count = 0
+            val = values[j, 0]
+            for i in range(N):
+                if mask[j, i]:
+                    if fill_count >= lim:
+                        continue
+                    fill_count += 1
+                    values[j, i] = val
+                else:
+                    fill_count = 0
+                    val = values[j, i]
 """
 
 backfill_2d_template = """@cython.boundscheck(False)
@@ -469,18 +481,19 @@ def backfill_2d_inplace_%(name)s(ndarray[%(c_type)s, ndim=2] values,
             raise ValueError('Limit must be non-negative')
         lim = limit
 
-    for j in range(K):
-        fill_count = 0
-        val = values[j, N - 1]
-        for i in range(N - 1, -1 , -1):
-            if mask[j, i]:
-                if fill_count >= lim:
-                    continue
-                fill_count += 1
-                values[j, i] = val
-            else:
-                fill_count = 0
-                val = values[j, i]
+    %(nogil)s
+        for j in range(K):
+            fill_count = 0
+            val = values[j, N - 1]
+            for i in range(N - 1, -1 , -1):
+                if mask[j, i]:
+                    if fill_count >= lim:
+                        continue
+                    fill_count += 1
+                    values[j, i] = val
+                else:
+                    fill_count = 0
+                    val = values[j, i]
 """
 
 backfill_1d_template = """@cython.boundscheck(False)
@@ -502,15 +515,16 @@ def backfill_inplace_%(name)s(ndarray[%(c_type)s] values,
         lim = limit
 
     val = values[N - 1]
-    for i in range(N - 1, -1 , -1):
-        if mask[i]:
-            if fill_count >= lim:
-                continue
-            fill_count += 1
-            values[i] = val
-        else:
-            fill_count = 0
-            val = values[i]
+    %(nogil)s
+        for i in range(N - 1, -1 , -1):
+            if mask[i]:
+                if fill_count >= lim:
+                    continue
+                fill_count += 1
+                values[i] = val
+            else:
+                fill_count = 0
+                val = values[i]
 """
 
 is_monotonic_template = """@cython.boundscheck(False)
@@ -524,7 +538,7 @@ def is_monotonic_%(name)s(ndarray[%(c_type)s] arr):
     cdef:
         Py_ssize_t i, n
         %(c_type)s prev, cur
-        bint is_unique = 1
+        bint is_monotonic = 1, is_unique = 1
 
     n = len(arr)
 
@@ -532,13 +546,18 @@ def is_monotonic_%(name)s(ndarray[%(c_type)s] arr):
         return True, True
 
     prev = arr[0]
-    for i in range(1, n):
-        cur = arr[i]
-        if cur < prev:
-            return False, None
-        elif cur == prev:
-            is_unique = 0
-        prev = cur
+    %(nogil)s
+        for i in range(1, n):
+            cur = arr[i]
+            if cur < prev:
+                is_monotonic = 0
+                break
+            elif cur == prev:
+                is_unique = 0
+            prev = cur
+
+    if not is_monotonic:
+        return False, None
     return True, is_unique
 """
 
@@ -630,34 +649,35 @@ def left_join_indexer_%(name)s(ndarray[%(c_type)s] left,
     nright = len(right)
 
     indexer = np.empty(nleft, dtype=np.int64)
-    while True:
-        if i == nleft:
-            break
-
-        if j == nright:
-            indexer[i] = -1
-            i += 1
-            continue
+    %(nogil)s
+        while True:
+            if i == nleft:
+                break
 
-        rval = right[j]
+            if j == nright:
+                indexer[i] = -1
+                i += 1
+                continue
 
-        while i < nleft - 1 and left[i] == rval:
-            indexer[i] = j
-            i += 1
+            rval = right[j]
 
-        if left[i] == right[j]:
-            indexer[i] = j
-            i += 1
             while i < nleft - 1 and left[i] == rval:
                 indexer[i] = j
                 i += 1
-            j += 1
-        elif left[i] > rval:
-            indexer[i] = -1
-            j += 1
-        else:
-            indexer[i] = -1
-            i += 1
+
+            if left[i] == right[j]:
+                indexer[i] = j
+                i += 1
+                while i < nleft - 1 and left[i] == rval:
+                    indexer[i] = j
+                    i += 1
+                j += 1
+            elif left[i] > rval:
+                indexer[i] = -1
+                j += 1
+            else:
+                indexer[i] = -1
+                i += 1
     return indexer
 
 """
@@ -678,23 +698,24 @@ def inner_join_indexer_%(name)s(ndarray[%(c_type)s] left,
     nleft = len(left)
     nright = len(right)
 
-    i = 0
-    j = 0
-    count = 0
-    while True:
-        if i == nleft or j == nright:
-             break
-        else:
-            lval = left[i]
-            rval = right[j]
-            if lval == rval:
-                i += 1
-                j += 1
-                count += 1
-            elif lval < rval:
-                i += 1
+    %(nogil)s
+        i = 0
+        j = 0
+        count = 0
+        while True:
+            if i == nleft or j == nright:
+                 break
             else:
-                j += 1
+                lval = left[i]
+                rval = right[j]
+                if lval == rval:
+                    i += 1
+                    j += 1
+                    count += 1
+                elif lval < rval:
+                    i += 1
+                else:
+                    j += 1
 
     # do it again now that result size is known
 
@@ -702,26 +723,27 @@ def inner_join_indexer_%(name)s(ndarray[%(c_type)s] left,
     rindexer = np.empty(count, dtype=np.int64)
     result = np.empty(count, dtype=%(dtype)s)
 
-    i = 0
-    j = 0
-    count = 0
-    while True:
-        if i == nleft or j == nright:
-             break
-        else:
-            lval = left[i]
-            rval = right[j]
-            if lval == rval:
-                lindexer[count] = i
-                rindexer[count] = j
-                result[count] = lval
-                i += 1
-                j += 1
-                count += 1
-            elif lval < rval:
-                i += 1
+    %(nogil)s
+        i = 0
+        j = 0
+        count = 0
+        while True:
+            if i == nleft or j == nright:
+                 break
             else:
-                j += 1
+                lval = left[i]
+                rval = right[j]
+                if lval == rval:
+                    lindexer[count] = i
+                    rindexer[count] = j
+                    result[count] = lval
+                    i += 1
+                    j += 1
+                    count += 1
+                elif lval < rval:
+                    i += 1
+                else:
+                    j += 1
 
     return result, lindexer, rindexer
 
@@ -740,34 +762,35 @@ def outer_join_indexer_%(name)s(ndarray[%(c_type)s] left,
     nleft = len(left)
     nright = len(right)
 
-    i = 0
-    j = 0
-    count = 0
-    while True:
-        if i == nleft:
-            if j == nright:
-                # we are done
-                break
-            else:
-                while j < nright:
-                    j += 1
+    %(nogil)s
+        i = 0
+        j = 0
+        count = 0
+        while True:
+            if i == nleft:
+                if j == nright:
+                    # we are done
+                    break
+                else:
+                    while j < nright:
+                        j += 1
+                        count += 1
+                    break
+            elif j == nright:
+                while i < nleft:
+                    i += 1
                     count += 1
                 break
-        elif j == nright:
-            while i < nleft:
-                i += 1
-                count += 1
-            break
-        else:
-            if left[i] == right[j]:
-                i += 1
-                j += 1
-            elif left[i] < right[j]:
-                i += 1
             else:
-                j += 1
+                if left[i] == right[j]:
+                    i += 1
+                    j += 1
+                elif left[i] < right[j]:
+                    i += 1
+                else:
+                    j += 1
 
-            count += 1
+                count += 1
 
     lindexer = np.empty(count, dtype=np.int64)
     rindexer = np.empty(count, dtype=np.int64)
@@ -775,56 +798,972 @@ def outer_join_indexer_%(name)s(ndarray[%(c_type)s] left,
 
     # do it again, but populate the indexers / result
 
-    i = 0
-    j = 0
-    count = 0
-    while True:
-        if i == nleft:
-            if j == nright:
-                # we are done
+    %(nogil)s
+        i = 0
+        j = 0
+        count = 0
+        while True:
+            if i == nleft:
+                if j == nright:
+                    # we are done
+                    break
+                else:
+                    while j < nright:
+                        lindexer[count] = -1
+                        rindexer[count] = j
+                        result[count] = right[j]
+                        j += 1
+                        count += 1
+                    break
+            elif j == nright:
+                while i < nleft:
+                    lindexer[count] = i
+                    rindexer[count] = -1
+                    result[count] = left[i]
+                    i += 1
+                    count += 1
                 break
             else:
-                while j < nright:
+                lval = left[i]
+                rval = right[j]
+                if lval == rval:
+                    lindexer[count] = i
+                    rindexer[count] = j
+                    result[count] = lval
+                    i += 1
+                    j += 1
+                elif lval < rval:
+                    lindexer[count] = i
+                    rindexer[count] = -1
+                    result[count] = lval
+                    i += 1
+                else:
                     lindexer[count] = -1
                     rindexer[count] = j
-                    result[count] = right[j]
+                    result[count] = rval
                     j += 1
-                    count += 1
-                break
-        elif j == nright:
-            while i < nleft:
-                lindexer[count] = i
-                rindexer[count] = -1
-                result[count] = left[i]
-                i += 1
-                count += 1
-            break
-        else:
-            lval = left[i]
-            rval = right[j]
-            if lval == rval:
-                lindexer[count] = i
-                rindexer[count] = j
-                result[count] = lval
-                i += 1
-                j += 1
-            elif lval < rval:
-                lindexer[count] = i
-                rindexer[count] = -1
-                result[count] = lval
-                i += 1
-            else:
-                lindexer[count] = -1
-                rindexer[count] = j
-                result[count] = rval
-                j += 1
 
-            count += 1
+                count += 1
 
     return result, lindexer, rindexer
 
 """
 
+#----------------------------------------------------------------------
+# groupby aggregation kernels
+#
+# dtype-specific versions of the float64 kernels in groupby.pyx. Integers
+# cannot be missing, so the integer kernels count every value; the minimum of
+# the type is only written for empty groups. The datetime kernels take
+# datetime64 data viewed as int64 and skip iNaT (NaT), so it round-trips
+# exactly.
+
+group_add_template = """@cython.boundscheck(False)
+@cython.wraparound(False)
+def group_add_%(name)s(ndarray[%(c_type)s, ndim=2] out,
+                       ndarray[int64_t] counts,
+                       ndarray[%(c_type)s, ndim=2] values,
+                       ndarray[int64_t] labels):
+    '''
+    Only aggregates on axis=0
+    '''
+    cdef:
+        Py_ssize_t i, j, N, K, lab, ncounts
+        %(c_type)s val
+        ndarray[%(acc_type)s, ndim=2] sumx
+        ndarray[int64_t, ndim=2] nobs
+
+    nobs = np.zeros((<object> out).shape, dtype=np.int64)
+    sumx = np.zeros((<object> out).shape, dtype=%(acc_dtype)s)
+
+    N, K = (<object> values).shape
+
+    ncounts = len(counts)
+
+    with nogil:
+        for i in range(N):
+            lab = labels[i]
+            if lab < 0:
+                continue
+
+            counts[lab] += 1
+            for j in range(K):
+                val = values[i, j]
+
+                # not nan
+                if %(notna)s:
+                    nobs[lab, j] += 1
+                    sumx[lab, j] += val
+
+        for i in range(ncounts):
+            for j in range(K):
+                if nobs[i, j] == 0:
+                    out[i, j] = %(na_val)s
+                else:
+                    out[i, j] = <%(c_type)s> sumx[i, j]
+
+"""
+
+group_add_bin_template = """@cython.boundscheck(False)
+@cython.wraparound(False)
+def group_add_bin_%(name)s(ndarray[%(c_type)s, ndim=2] out,
+                           ndarray[int64_t] counts,
+                           ndarray[%(c_type)s, ndim=2] values,
+                           ndarray[int64_t] bins):
+    '''
+    Only aggregates on axis=0
+    '''
+    cdef:
+        Py_ssize_t i, j, N, K, ngroups, b
+        %(c_type)s val
+        ndarray[%(acc_type)s, ndim=2] sumx
+        ndarray[int64_t, ndim=2] nobs
+
+    nobs = np.zeros((<object> out).shape, dtype=np.int64)
+    sumx = np.zeros((<object> out).shape, dtype=%(acc_dtype)s)
+
+    if bins[len(bins) - 1] == len(values):
+        ngroups = len(bins)
+    else:
+        ngroups = len(bins) + 1
+
+    N, K = (<object> values).shape
+
+    with nogil:
+        b = 0
+        for i in range(N):
+            while b < ngroups - 1 and i >= bins[b]:
+                b += 1
+
+            counts[b] += 1
+            for j in range(K):
+                val = values[i, j]
+
+                # not nan
+                if %(notna)s:
+                    nobs[b, j] += 1
+                    sumx[b, j] += val
+
+        for i in range(ngroups):
+            for j in range(K):
+                if nobs[i, j] == 0:
+                    out[i, j] = %(na_val)s
+                else:
+                    out[i, j] = <%(c_type)s> sumx[i, j]
+
+"""
+
+group_prod_template = """@cython.boundscheck(False)
+@cython.wraparound(False)
+def group_prod_%(name)s(ndarray[%(c_type)s, ndim=2] out,
+                        ndarray[int64_t] counts,
+                        ndarray[%(c_type)s, ndim=2] values,
+                        ndarray[int64_t] labels):
+    '''
+    Only aggregates on axis=0
+    '''
+    cdef:
+        Py_ssize_t i, j, N, K, lab, ncounts
+        %(c_type)s val
+        ndarray[%(acc_type)s, ndim=2] prodx
+        ndarray[int64_t, ndim=2] nobs
+
+    nobs = np.zeros((<object> out).shape, dtype=np.int64)
+    prodx = np.ones((<object> out).shape, dtype=%(acc_dtype)s)
+
+    N, K = (<object> values).shape
+
+    ncounts = len(counts)
+
+    with nogil:
+        for i in range(N):
+            lab = labels[i]
+            if lab < 0:
+                continue
+
+            counts[lab] += 1
+            for j in range(K):
+                val = values[i, j]
+
+                # not nan
+                if %(notna)s:
+                    nobs[lab, j] += 1
+                    prodx[lab, j] *= val
+
+        for i in range(ncounts):
+            for j in range(K):
+                if nobs[i, j] == 0:
+                    out[i, j] = %(na_val)s
+                else:
+                    out[i, j] = <%(c_type)s> prodx[i, j]
+
+"""
+
+group_prod_bin_template = """@cython.boundscheck(False)
+@cython.wraparound(False)
+def group_prod_bin_%(name)s(ndarray[%(c_type)s, ndim=2] out,
+                            ndarray[int64_t] counts,
+                            ndarray[%(c_type)s, ndim=2] values,
+                            ndarray[int64_t] bins):
+    '''
+    Only aggregates on axis=0
+    '''
+    cdef:
+        Py_ssize_t i, j, N, K, ngroups, b
+        %(c_type)s val
+        ndarray[%(acc_type)s, ndim=2] prodx
+        ndarray[int64_t, ndim=2] nobs
+
+    nobs = np.zeros((<object> out).shape, dtype=np.int64)
+    prodx = np.ones((<object> out).shape, dtype=%(acc_dtype)s)
+
+    if bins[len(bins) - 1] == len(values):
+        ngroups = len(bins)
+    else:
+        ngroups = len(bins) + 1
+
+    N, K = (<object> values).shape
+
+    with nogil:
+        b = 0
+        for i in range(N):
+            while b < ngroups - 1 and i >= bins[b]:
+                b += 1
+
+            counts[b] += 1
+            for j in range(K):
+                val = values[i, j]
+
+                # not nan
+                if %(notna)s:
+                    nobs[b, j] += 1
+                    prodx[b, j] *= val
+
+        for i in range(ngroups):
+            for j in range(K):
+                if nobs[i, j] == 0:
+                    out[i, j] = %(na_val)s
+                else:
+                    out[i, j] = <%(c_type)s> prodx[i, j]
+
+"""
+
+group_nth_template = """@cython.boundscheck(False)
+@cython.wraparound(False)
+def group_nth_%(name)s(ndarray[%(c_type)s, ndim=2] out,
+                       ndarray[int64_t] counts,
+                       ndarray[%(c_type)s, ndim=2] values,
+                       ndarray[int64_t] labels, int64_t rank):
+    '''
+    Only aggregates on axis=0
+    '''
+    cdef:
+        Py_ssize_t i, j, N, K, lab, ncounts
+        %(c_type)s val
+        ndarray[%(c_type)s, ndim=2] resx
+        ndarray[int64_t, ndim=2] nobs
+
+    nobs = np.zeros((<object> out).shape, dtype=np.int64)
+    resx = np.empty_like(out)
+
+    N, K = (<object> values).shape
+
+    ncounts = len(counts)
+
+    with nogil:
+        for i in range(N):
+            lab = labels[i]
+            if lab < 0:
+                continue
+
+            counts[lab] += 1
+            for j in range(K):
+                val = values[i, j]
+
+                # not nan
+                if %(notna)s:
+                    nobs[lab, j] += 1
+                    if nobs[lab, j] == rank:
+                        resx[lab, j] = val
+
+        for i in range(ncounts):
+            for j in range(K):
+                if nobs[i, j] < rank:
+                    out[i, j] = %(na_val)s
+                else:
+                    out[i, j] = resx[i, j]
+
+"""
+
+group_nth_bin_template = """@cython.boundscheck(False)
+@cython.wraparound(False)
+def group_nth_bin_%(name)s(ndarray[%(c_type)s, ndim=2] out,
+                           ndarray[int64_t] counts,
+                           ndarray[%(c_type)s, ndim=2] values,
+                           ndarray[int64_t] bins, int64_t rank):
+    '''
+    Only aggregates on axis=0
+    '''
+    cdef:
+        Py_ssize_t i, j, N, K, ngroups, b
+        %(c_type)s val
+        ndarray[%(c_type)s, ndim=2] resx
+        ndarray[int64_t, ndim=2] nobs
+
+    nobs = np.zeros((<object> out).shape, dtype=np.int64)
+    resx = np.empty_like(out)
+
+    if bins[len(bins) - 1] == len(values):
+        ngroups = len(bins)
+    else:
+        ngroups = len(bins) + 1
+
+    N, K = (<object> values).shape
+
+    with nogil:
+        b = 0
+        for i in range(N):
+            while b < ngroups - 1 and i >= bins[b]:
+                b += 1
+
+            counts[b] += 1
+            for j in range(K):
+                val = values[i, j]
+
+                # not nan
+                if %(notna)s:
+                    nobs[b, j] += 1
+                    if nobs[b, j] == rank:
+                        resx[b, j] = val
+
+        for i in range(ngroups):
+            for j in range(K):
+                if nobs[i, j] < rank:
+                    out[i, j] = %(na_val)s
+                else:
+                    out[i, j] = resx[i, j]
+
+"""
+
+group_last_template = """@cython.boundscheck(False)
+@cython.wraparound(False)
+def group_last_%(name)s(ndarray[%(c_type)s, ndim=2] out,
+                        ndarray[int64_t] counts,
+                        ndarray[%(c_type)s, ndim=2] values,
+                        ndarray[int64_t] labels):
+    '''
+    Only aggregates on axis=0
+    '''
+    cdef:
+        Py_ssize_t i, j, N, K, lab, ncounts
+        %(c_type)s val
+        ndarray[%(c_type)s, ndim=2] resx
+        ndarray[int64_t, ndim=2] nobs
+
+    nobs = np.zeros((<object> out).shape, dtype=np.int64)
+    resx = np.empty_like(out)
+
+    N, K = (<object> values).shape
+
+    ncounts = len(counts)
+
+    with nogil:
+        for i in range(N):
+            lab = labels[i]
+            if lab < 0:
+                continue
+
+            counts[lab] += 1
+            for j in range(K):
+                val = values[i, j]
+
+                # not nan
+                if %(notna)s:
+                    nobs[lab, j] += 1
+                    resx[lab, j] = val
+
+        for i in range(ncounts):
+            for j in range(K):
+                if nobs[i, j] == 0:
+                    out[i, j] = %(na_val)s
+                else:
+                    out[i, j] = resx[i, j]
+
+"""
+
+group_last_bin_template = """@cython.boundscheck(False)
+@cython.wraparound(False)
+def group_last_bin_%(name)s(ndarray[%(c_type)s, ndim=2] out,
+                            ndarray[int64_t] counts,
+                            ndarray[%(c_type)s, ndim=2] values,
+                            ndarray[int64_t] bins):
+    '''
+    Only aggregates on axis=0
+    '''
+    cdef:
+        Py_ssize_t i, j, N, K, ngroups, b
+        %(c_type)s val
+        ndarray[%(c_type)s, ndim=2] resx
+        ndarray[int64_t, ndim=2] nobs
+
+    nobs = np.zeros((<object> out).shape, dtype=np.int64)
+    resx = np.empty_like(out)
+
+    if bins[len(bins) - 1] == len(values):
+        ngroups = len(bins)
+    else:
+        ngroups = len(bins) + 1
+
+    N, K = (<object> values).shape
+
+    with nogil:
+        b = 0
+        for i in range(N):
+            while b < ngroups - 1 and i >= bins[b]:
+                b += 1
+
+            counts[b] += 1
+            for j in range(K):
+                val = values[i, j]
+
+                # not nan
+                if %(notna)s:
+                    nobs[b, j] += 1
+                    resx[b, j] = val
+
+        for i in range(ngroups):
+            for j in range(K):
+                if nobs[i, j] == 0:
+                    out[i, j] = %(na_val)s
+                else:
+                    out[i, j] = resx[i, j]
+
+"""
+
+group_min_template = """@cython.boundscheck(False)
+@cython.wraparound(False)
+def group_min_%(name)s(ndarray[%(c_type)s, ndim=2] out,
+                       ndarray[int64_t] counts,
+                       ndarray[%(c_type)s, ndim=2] values,
+                       ndarray[int64_t] labels):
+    '''
+    Only aggregates on axis=0
+    '''
+    cdef:
+        Py_ssize_t i, j, N, K, lab, ncounts
+        %(c_type)s val
+        ndarray[%(c_type)s, ndim=2] minx
+        ndarray[int64_t, ndim=2] nobs
+
+    nobs = np.zeros((<object> out).shape, dtype=np.int64)
+
+    minx = np.empty_like(out)
+    minx.fill(%(max_val)s)
+
+    N, K = (<object> values).shape
+
+    ncounts = len(counts)
+
+    with nogil:
+        for i in range(N):
+            lab = labels[i]
+            if lab < 0:
+                continue
+
+            counts[lab] += 1
+            for j in range(K):
+                val = values[i, j]
+
+                # not nan
+                if %(notna)s:
+                    nobs[lab, j] += 1
+                    if val < minx[lab, j]:
+                        minx[lab, j] = val
+
+        for i in range(ncounts):
+            for j in range(K):
+                if nobs[i, j] == 0:
+                    out[i, j] = %(na_val)s
+                else:
+                    out[i, j] = minx[i, j]
+
+"""
+
+group_min_bin_template = """@cython.boundscheck(False)
+@cython.wraparound(False)
+def group_min_bin_%(name)s(ndarray[%(c_type)s, ndim=2] out,
+                           ndarray[int64_t] counts,
+                           ndarray[%(c_type)s, ndim=2] values,
+                           ndarray[int64_t] bins):
+    '''
+    Only aggregates on axis=0
+    '''
+    cdef:
+        Py_ssize_t i, j, N, K, ngroups, b
+        %(c_type)s val
+        ndarray[%(c_type)s, ndim=2] minx
+        ndarray[int64_t, ndim=2] nobs
+
+    nobs = np.zeros((<object> out).shape, dtype=np.int64)
+
+    minx = np.empty_like(out)
+    minx.fill(%(max_val)s)
+
+    if bins[len(bins) - 1] == len(values):
+        ngroups = len(bins)
+    else:
+        ngroups = len(bins) + 1
+
+    N, K = (<object> values).shape
+
+    with nogil:
+        b = 0
+        for i in range(N):
+            while b < ngroups - 1 and i >= bins[b]:
+                b += 1
+
+            counts[b] += 1
+            for j in range(K):
+                val = values[i, j]
+
+                # not nan
+                if %(notna)s:
+                    nobs[b, j] += 1
+                    if val < minx[b, j]:
+                        minx[b, j] = val
+
+        for i in range(ngroups):
+            for j in range(K):
+                if nobs[i, j] == 0:
+                    out[i, j] = %(na_val)s
+                else:
+                    out[i, j] = minx[i, j]
+
+"""
+
+group_max_template = """@cython.boundscheck(False)
+@cython.wraparound(False)
+def group_max_%(name)s(ndarray[%(c_type)s, ndim=2] out,
+                       ndarray[int64_t] counts,
+                       ndarray[%(c_type)s, ndim=2] values,
+                       ndarray[int64_t] labels):
+    '''
+    Only aggregates on axis=0
+    '''
+    cdef:
+        Py_ssize_t i, j, N, K, lab, ncounts
+        %(c_type)s val
+        ndarray[%(c_type)s, ndim=2] maxx
+        ndarray[int64_t, ndim=2] nobs
+
+    nobs = np.zeros((<object> out).shape, dtype=np.int64)
+
+    maxx = np.empty_like(out)
+    maxx.fill(%(min_val)s)
+
+    N, K = (<object> values).shape
+
+    ncounts = len(counts)
+
+    with nogil:
+        for i in range(N):
+            lab = labels[i]
+            if lab < 0:
+                continue
+
+            counts[lab] += 1
+            for j in range(K):
+                val = values[i, j]
+
+                # not nan
+                if %(notna)s:
+                    nobs[lab, j] += 1
+                    if val > maxx[lab, j]:
+                        maxx[lab, j] = val
+
+        for i in range(ncounts):
+            for j in range(K):
+                if nobs[i, j] == 0:
+                    out[i, j] = %(na_val)s
+                else:
+                    out[i, j] = maxx[i, j]
+
+"""
+
+group_max_bin_template = """@cython.boundscheck(False)
+@cython.wraparound(False)
+def group_max_bin_%(name)s(ndarray[%(c_type)s, ndim=2] out,
+                           ndarray[int64_t] counts,
+                           ndarray[%(c_type)s, ndim=2] values,
+                           ndarray[int64_t] bins):
+    '''
+    Only aggregates on axis=0
+    '''
+    cdef:
+        Py_ssize_t i, j, N, K, ngroups, b
+        %(c_type)s val
+        ndarray[%(c_type)s, ndim=2] maxx
+        ndarray[int64_t, ndim=2] nobs
+
+    nobs = np.zeros((<object> out).shape, dtype=np.int64)
+
+    maxx = np.empty_like(out)
+    maxx.fill(%(min_val)s)
+
+    if bins[len(bins) - 1] == len(values):
+        ngroups = len(bins)
+    else:
+        ngroups = len(bins) + 1
+
+    N, K = (<object> values).shape
+
+    with nogil:
+        b = 0
+        for i in range(N):
+            while b < ngroups - 1 and i >= bins[b]:
+                b += 1
+
+            counts[b] += 1
+            for j in range(K):
+                val = values[i, j]
+
+                # not nan
+                if %(notna)s:
+                    nobs[b, j] += 1
+                    if val > maxx[b, j]:
+                        maxx[b, j] = val
+
+        for i in range(ngroups):
+            for j in range(K):
+                if nobs[i, j] == 0:
+                    out[i, j] = %(na_val)s
+                else:
+                    out[i, j] = maxx[i, j]
+
+"""
+
+group_mean_template = """@cython.boundscheck(False)
+@cython.wraparound(False)
+@cython.cdivision(True)
+def group_mean_%(name)s(ndarray[%(c_type)s, ndim=2] out,
+                        ndarray[int64_t] counts,
+                        ndarray[%(c_type)s, ndim=2] values,
+                        ndarray[int64_t] labels):
+    cdef:
+        Py_ssize_t i, j, N, K, lab, ncounts
+        %(c_type)s val
+        float64_t count
+        ndarray[float64_t, ndim=2] sumx, nobs
+
+    nobs = np.zeros((<object> out).shape, dtype=np.float64)
+    sumx = np.zeros((<object> out).shape, dtype=np.float64)
+
+    N, K = (<object> values).shape
+
+    ncounts = len(counts)
+
+    with nogil:
+        for i in range(N):
+            lab = labels[i]
+            if lab < 0:
+                continue
+
+            counts[lab] += 1
+            for j in range(K):
+                val = values[i, j]
+
+                # not nan
+                if %(notna)s:
+                    nobs[lab, j] += 1
+                    sumx[lab, j] += val
+
+        for i in range(ncounts):
+            for j in range(K):
+                count = nobs[i, j]
+                if count == 0:
+                    out[i, j] = %(na_val)s
+                else:
+                    out[i, j] = <%(c_type)s> (sumx[i, j] / count)
+
+"""
+
+group_mean_bin_template = """@cython.boundscheck(False)
+@cython.wraparound(False)
+@cython.cdivision(True)
+def group_mean_bin_%(name)s(ndarray[%(c_type)s, ndim=2] out,
+                            ndarray[int64_t] counts,
+                            ndarray[%(c_type)s, ndim=2] values,
+                            ndarray[int64_t] bins):
+    cdef:
+        Py_ssize_t i, j, N, K, ngroups, b
+        %(c_type)s val
+        float64_t count
+        ndarray[float64_t, ndim=2] sumx, nobs
+
+    nobs = np.zeros((<object> out).shape, dtype=np.float64)
+    sumx = np.zeros((<object> out).shape, dtype=np.float64)
+
+    if bins[len(bins) - 1] == len(values):
+        ngroups = len(bins)
+    else:
+        ngroups = len(bins) + 1
+
+    N, K = (<object> values).shape
+
+    with nogil:
+        b = 0
+        for i in range(N):
+            while b < ngroups - 1 and i >= bins[b]:
+                b += 1
+
+            counts[b] += 1
+            for j in range(K):
+                val = values[i, j]
+
+                # not nan
+                if %(notna)s:
+                    nobs[b, j] += 1
+                    sumx[b, j] += val
+
+        for i in range(ngroups):
+            for j in range(K):
+                count = nobs[i, j]
+                if count == 0:
+                    out[i, j] = %(na_val)s
+                else:
+                    out[i, j] = <%(c_type)s> (sumx[i, j] / count)
+
+"""
+
+group_var_template = """@cython.boundscheck(False)
+@cython.wraparound(False)
+@cython.cdivision(True)
+def group_var_%(name)s(ndarray[%(c_type)s, ndim=2] out,
+                       ndarray[int64_t] counts,
+                       ndarray[%(c_type)s, ndim=2] values,
+                       ndarray[int64_t] labels):
+    cdef:
+        Py_ssize_t i, j, N, K, lab, ncounts
+        %(c_type)s val
+        float64_t ct
+        ndarray[float64_t, ndim=2] nobs, sumx, sumxx
+
+    nobs = np.zeros((<object> out).shape, dtype=np.float64)
+    sumx = np.zeros((<object> out).shape, dtype=np.float64)
+    sumxx = np.zeros((<object> out).shape, dtype=np.float64)
+
+    N, K = (<object> values).shape
+
+    ncounts = len(counts)
+
+    with nogil:
+        for i in range(N):
+            lab = labels[i]
+            if lab < 0:
+                continue
+
+            counts[lab] += 1
+            for j in range(K):
+                val = values[i, j]
+
+                # not nan
+                if %(notna)s:
+                    nobs[lab, j] += 1
+                    sumx[lab, j] += val
+                    sumxx[lab, j] += <float64_t> val * val
+
+        for i in range(ncounts):
+            for j in range(K):
+                ct = nobs[i, j]
+                if ct < 2:
+                    out[i, j] = %(na_val)s
+                else:
+                    out[i, j] = <%(c_type)s> (
+                        (ct * sumxx[i, j] - sumx[i, j] * sumx[i, j]) /
+                        (ct * ct - ct))
+
+"""
+
+group_var_bin_template = """@cython.boundscheck(False)
+@cython.wraparound(False)
+@cython.cdivision(True)
+def group_var_bin_%(name)s(ndarray[%(c_type)s, ndim=2] out,
+                           ndarray[int64_t] counts,
+                           ndarray[%(c_type)s, ndim=2] values,
+                           ndarray[int64_t] bins):
+    cdef:
+        Py_ssize_t i, j, N, K, ngroups, b
+        %(c_type)s val
+        float64_t ct
+        ndarray[float64_t, ndim=2] nobs, sumx, sumxx
+
+    nobs = np.zeros((<object> out).shape, dtype=np.float64)
+    sumx = np.zeros((<object> out).shape, dtype=np.float64)
+    sumxx = np.zeros((<object> out).shape, dtype=np.float64)
+
+    if bins[len(bins) - 1] == len(values):
+        ngroups = len(bins)
+    else:
+        ngroups = len(bins) + 1
+
+    N, K = (<object> values).shape
+
+    with nogil:
+        b = 0
+        for i in range(N):
+            while b < ngroups - 1 and i >= bins[b]:
+                b += 1
+
+            counts[b] += 1
+            for j in range(K):
+                val = values[i, j]
+
+                # not nan
+                if %(notna)s:
+                    nobs[b, j] += 1
+                    sumx[b, j] += val
+                    sumxx[b, j] += <float64_t> val * val
+
+        for i in range(ngroups):
+            for j in range(K):
+                ct = nobs[i, j]
+                if ct < 2:
+                    out[i, j] = %(na_val)s
+                else:
+                    out[i, j] = <%(c_type)s> (
+                        (ct * sumxx[i, j] - sumx[i, j] * sumx[i, j]) /
+                        (ct * ct - ct))
+
+"""
+
+# group-wise cumulative transforms
+#
+# exact versions of the float64 kernels in groupby.pyx for integer data,
+# which holds no missing values. Rows having a missing key get the missing
+# value of the type
+
+group_cumsum_template = """@cython.boundscheck(False)
+@cython.wraparound(False)
+def group_cumsum_%(name)s(ndarray[%(c_type)s, ndim=2] out,
+                          ndarray[%(c_type)s, ndim=2] values,
+                          ndarray[int64_t] labels, Py_ssize_t ngroups):
+    '''
+    Cumulative sum within each group
+    '''
+    cdef:
+        Py_ssize_t i, j, N, K, lab
+        %(c_type)s val
+        ndarray[%(c_type)s, ndim=2] accum
+
+    N, K = (<object> values).shape
+    accum = np.empty((ngroups, K), dtype=np.%(name)s)
+    accum.fill(0)
+
+    with nogil:
+        for i in range(N):
+            lab = labels[i]
+            for j in range(K):
+                if lab < 0:
+                    out[i, j] = %(na_val)s
+                else:
+                    val = values[i, j]
+                    accum[lab, j] += val
+                    out[i, j] = accum[lab, j]
+
+"""
+
+group_cumprod_template = """@cython.boundscheck(False)
+@cython.wraparound(False)
+def group_cumprod_%(name)s(ndarray[%(c_type)s, ndim=2] out,
+                           ndarray[%(c_type)s, ndim=2] values,
+                           ndarray[int64_t] labels, Py_ssize_t ngroups):
+    '''
+    Cumulative product within each group
+    '''
+    cdef:
+        Py_ssize_t i, j, N, K, lab
+        %(c_type)s val
+        ndarray[%(c_type)s, ndim=2] accum
+
+    N, K = (<object> values).shape
+    accum = np.empty((ngroups, K), dtype=np.%(name)s)
+    accum.fill(1)
+
+    with nogil:
+        for i in range(N):
+            lab = labels[i]
+            for j in range(K):
+                if lab < 0:
+                    out[i, j] = %(na_val)s
+                else:
+                    val = values[i, j]
+                    accum[lab, j] *= val
+                    out[i, j] = accum[lab, j]
+
+"""
+
+group_cummax_template = """@cython.boundscheck(False)
+@cython.wraparound(False)
+def group_cummax_%(name)s(ndarray[%(c_type)s, ndim=2] out,
+                          ndarray[%(c_type)s, ndim=2] values,
+                          ndarray[int64_t] labels, Py_ssize_t ngroups):
+    '''
+    Cumulative max within each group
+    '''
+    cdef:
+        Py_ssize_t i, j, N, K, lab
+        %(c_type)s val
+        ndarray[%(c_type)s, ndim=2] accum
+
+    N, K = (<object> values).shape
+    accum = np.empty((ngroups, K), dtype=np.%(name)s)
+    accum.fill(%(min_val)s)
+
+    with nogil:
+        for i in range(N):
+            lab = labels[i]
+            for j in range(K):
+                if lab < 0:
+                    out[i, j] = %(na_val)s
+                else:
+                    val = values[i, j]
+                    if val > accum[lab, j]:
+                        accum[lab, j] = val
+                    out[i, j] = accum[lab, j]
+
+"""
+
+group_cummin_template = """@cython.boundscheck(False)
+@cython.wraparound(False)
+def group_cummin_%(name)s(ndarray[%(c_type)s, ndim=2] out,
+                          ndarray[%(c_type)s, ndim=2] values,
+                          ndarray[int64_t] labels, Py_ssize_t ngroups):
+    '''
+    Cumulative min within each group
+    '''
+    cdef:
+        Py_ssize_t i, j, N, K, lab
+        %(c_type)s val
+        ndarray[%(c_type)s, ndim=2] accum
+
+    N, K = (<object> values).shape
+    accum = np.empty((ngroups, K), dtype=np.%(name)s)
+    accum.fill(%(max_val)s)
+
+    with nogil:
+        for i in range(N):
+            lab = labels[i]
+            for j in range(K):
+                if lab < 0:
+                    out[i, j] = %(na_val)s
+                else:
+                    val = values[i, j]
+                    if val < accum[lab, j]:
+                        accum[lab, j] = val
+                    out[i, j] = accum[lab, j]
+
+"""
+
 # ensure_dtype functions
 
 ensure_dtype_template = """
@@ -841,6 +1780,7 @@ cpdef ensure_%(name)s(object arr):
 
 ensure_functions = [
     ('float64', 'FLOAT64', 'float64'),
+    ('float32', 'FLOAT32', 'float32'),
     ('int32', 'INT32', 'int32'),
     ('int64', 'INT64', 'int64'),
     # ('platform_int', 'INT', 'int_'),
@@ -907,6 +1847,11 @@ function_list = [
     ('bool', 'uint8_t', 'np.bool', False)
 ]
 
+# the loops of the typed kernels run without the GIL. The object kernels
+# need it, so their %(nogil)s block is a plain (always true) if statement
+def _nogil_block(c_type):
+    return 'if True:' if c_type == 'object' else 'with nogil:'
+
 def generate_from_template(template, ndim=1, exclude=None):
     output = StringIO()
     for name, c_type, dtype, can_hold_na in function_list:
@@ -915,7 +1860,8 @@ def generate_from_template(template, ndim=1, exclude=None):
 
         func = template % {'name': name, 'c_type': c_type,
                            'dtype': dtype,
-                           'raise_on_na': 'False' if can_hold_na else 'True'}
+                           'raise_on_na': 'False' if can_hold_na else 'True',
+                           'nogil': _nogil_block(c_type)}
         output.write(func)
     return output.getvalue()
 
@@ -939,6 +1885,60 @@ templates_2d = [take_2d_axis0_template,
                 take_2d_axis1_template,
                 take_2d_multi_template]
 
+# name, ctype, accumulator ctype, accumulator dtype, missing value, not-missing
+# test, smallest and largest value
+groupby_function_list = [
+    ('float32', 'float32_t', 'float64_t', 'np.float64', 'nan',
+     'val == val', '-np.inf', 'np.inf'),
+    ('int64', 'int64_t', 'int64_t', 'np.int64', 'iNaT',
+     'True', 'iNaT', 'np.iinfo(np.int64).max'),
+    ('int32', 'int32_t', 'int64_t', 'np.int64', 'INT32_NA',
+     'True', 'INT32_NA', 'np.iinfo(np.int32).max'),
+    ('datetime', 'int64_t', 'int64_t', 'np.int64', 'iNaT',
+     'val != iNaT', 'iNaT', 'np.iinfo(np.int64).max'),
+]
+
+def generate_groupby_from_template(template, exclude=None):
+    output = StringIO()
+    for (name, c_type, acc_type, acc_dtype, na_val, notna,
+         min_val, max_val) in groupby_function_list:
+        if exclude is not None and name in exclude:
+            continue
+
+        func = template % {'name': name, 'c_type': c_type,
+                           'acc_type': acc_type, 'acc_dtype': acc_dtype,
+                           'na_val': na_val, 'notna': notna,
+                           'min_val': min_val, 'max_val': max_val}
+        output.write(func)
+    return output.getvalue()
+
+# order statistics are exact for every dtype
+groupby_templates = [group_nth_template,
+                     group_nth_bin_template,
+                     group_last_template,
+                     group_last_bin_template,
+                     group_min_template,
+                     group_min_bin_template,
+                     group_max_template,
+                     group_max_bin_template]
+
+# products of integers nearly always overflow and the mean and variance are
+# not integers: those go through float64. int32 is summed by the int64
+# kernels, as the int32 sums would overflow
+groupby_float_templates = [group_prod_template,
+                           group_prod_bin_template,
+                           group_mean_template,
+                           group_mean_bin_template,
+                           group_var_template,
+                           group_var_bin_template]
+
+# integer cumulative sums and products wrap around on overflow like
+# ndarray.cumsum, so unlike the aggregations they stay in the input type
+groupby_cum_templates = [group_cumsum_template,
+                         group_cumprod_template,
+                         group_cummax_template,
+                         group_cummin_template]
+
 def generate_take_cython_file(path='generated.pyx'):
     with open(path, 'w') as f:
         print >> f, header
@@ -958,5 +1958,27 @@ def generate_take_cython_file(path='generated.pyx'):
         for template in nobool_1d_templates:
             print >> f, generate_from_template(template, exclude=['bool'])
 
+        for template in groupby_templates:
+            print >> f, generate_groupby_from_template(template)
+
+        for template in [group_add_template, group_add_bin_template]:
+            print >> f, generate_groupby_from_template(template,
+                                                       exclude=['int32',
+                                                                'datetime'])
+
+        for template in groupby_float_templates:
+            print >> f, generate_groupby_from_template(template,
+                                                       exclude=['int64',
+                                                                'int32',
+                                                                'datetime'])
+
+        for template in groupby_cum_templates:
+            print >> f, generate_groupby_from_template(template,
+                                                       exclude=['float32',
+                                                                'int32',
+                                                                'datetime'])
+
+        print >> f, generate_ensure_dtypes()
+
 if __name__ == '__main__':
     generate_take_cython_file()
@@ -45,6 +45,10 @@ import_ufunc()
 
 cdef int PLATFORM_INT = (<ndarray> np.arange(0, dtype=np.int_)).descr.type_num
 
+# missing-value markers for the integer groupby kernels
+cdef int64_t iNaT = util.get_nat()
+cdef int32_t INT32_NA = np.iinfo(np.int32).min
+
 cpdef ensure_platform_int(object arr):
     if util.is_array(arr):
         if (<ndarray> arr).descr.type_num == PLATFORM_INT:
@@ -190,40 +194,41 @@ def pad_float64(ndarray[float64_t] old, ndarray[float64_t] new,
     if nleft == 0 or nright == 0 or new[nright - 1] < old[0]:
         return indexer
 
-    i = j = 0
+    with nogil:
+        i = j = 0
+
+        cur = old[0]
+
+        while j <= nright - 1 and new[j] < cur:
+            j += 1
 
-    cur = old[0]
+        while True:
+            if j == nright:
+                break
 
-    while j <= nright - 1 and new[j] < cur:
-        j += 1
+            if i == nleft - 1:
+                while j < nright:
+                    if new[j] == cur:
+                        indexer[j] = i
+                    elif new[j] > cur and fill_count < lim:
+                        indexer[j] = i
+                        fill_count += 1
+                    j += 1
+                break
 
-    while True:
-        if j == nright:
-            break
+            next = old[i + 1]
 
-        if i == nleft - 1:
-            while j < nright:
+            while j < nright and cur <= new[j] < next:
                 if new[j] == cur:
                     indexer[j] = i
-                elif new[j] > cur and fill_count < lim:
+                elif fill_count < lim:
                     indexer[j] = i
                     fill_count += 1
                 j += 1
-            break
-
-        next = old[i + 1]
-
-        while j < nright and cur <= new[j] < next:
-            if new[j] == cur:
-                indexer[j] = i
-            elif fill_count < lim:
-                indexer[j] = i
-                fill_count += 1
-            j += 1
 
-        fill_count = 0
-        i += 1
-        cur = next
+            fill_count = 0
+            i += 1
+            cur = next
 
     return indexer
 
@@ -251,40 +256,41 @@ def pad_object(ndarray[object] old, ndarray[object] new,
     if nleft == 0 or nright == 0 or new[nright - 1] < old[0]:
         return indexer
 
-    i = j = 0
+    if True:
+        i = j = 0
+
+        cur = old[0]
 
-    cur = old[0]
+        while j <= nright - 1 and new[j] < cur:
+            j += 1
+
+        while True:
+            if j == nright:
+                break
 
-    while j <= nright - 1 and new[j] < cur:
-        j += 1
+            if i == nleft - 1:
+                while j < nright:
+                    if new[j] == cur:
+                        indexer[j] = i
+                    elif new[j] > cur and fill_count < lim:
+                        indexer[j] = i
+                        fill_count += 1
+                    j += 1
+                break
 
-    while True:
-        if j == nright:
-            break
+            next = old[i + 1]
 
-        if i == nleft - 1:
-            while j < nright:
+            while j < nright and cur <= new[j] < next:
                 if new[j] == cur:
                     indexer[j] = i
-                elif new[j] > cur and fill_count < lim:
+                elif fill_count < lim:
                     indexer[j] = i
                     fill_count += 1
                 j += 1
-            break
-
-        next = old[i + 1]
 
-        while j < nright and cur <= new[j] < next:
-            if new[j] == cur:
-                indexer[j] = i
-            elif fill_count < lim:
-                indexer[j] = i
-                fill_count += 1
-            j += 1
-
-        fill_count = 0
-        i += 1
-        cur = next
+            fill_count = 0
+            i += 1
+            cur = next
 
     return indexer
 
@@ -312,40 +318,41 @@ def pad_int32(ndarray[int32_t] old, ndarray[int32_t] new,
     if nleft == 0 or nright == 0 or new[nright - 1] < old[0]:
         return indexer
 
-    i = j = 0
+    with nogil:
+        i = j = 0
+
+        cur = old[0]
+
+        while j <= nright - 1 and new[j] < cur:
+            j += 1
 
-    cur = old[0]
+        while True:
+            if j == nright:
+                break
 
-    while j <= nright - 1 and new[j] < cur:
-        j += 1
+            if i == nleft - 1:
+                while j < nright:
+                    if new[j] == cur:
+                        indexer[j] = i
+                    elif new[j] > cur and fill_count < lim:
+                        indexer[j] = i
+                        fill_count += 1
+                    j += 1
+                break
 
-    while True:
-        if j == nright:
-            break
+            next = old[i + 1]
 
-        if i == nleft - 1:
-            while j < nright:
+            while j < nright and cur <= new[j] < next:
                 if new[j] == cur:
                     indexer[j] = i
-                elif new[j] > cur and fill_count < lim:
+                elif fill_count < lim:
                     indexer[j] = i
                     fill_count += 1
                 j += 1
-            break
-
-        next = old[i + 1]
-
-        while j < nright and cur <= new[j] < next:
-            if new[j] == cur:
-                indexer[j] = i
-            elif fill_count < lim:
-                indexer[j] = i
-                fill_count += 1
-            j += 1
 
-        fill_count = 0
-        i += 1
-        cur = next
+            fill_count = 0
+            i += 1
+            cur = next
 
     return indexer
 
@@ -373,40 +380,41 @@ def pad_int64(ndarray[int64_t] old, ndarray[int64_t] new,
     if nleft == 0 or nright == 0 or new[nright - 1] < old[0]:
         return indexer
 
-    i = j = 0
+    with nogil:
+        i = j = 0
+
+        cur = old[0]
 
-    cur = old[0]
+        while j <= nright - 1 and new[j] < cur:
+            j += 1
+
+        while True:
+            if j == nright:
+                break
 
-    while j <= nright - 1 and new[j] < cur:
-        j += 1
+            if i == nleft - 1:
+                while j < nright:
+                    if new[j] == cur:
+                        indexer[j] = i
+                    elif new[j] > cur and fill_count < lim:
+                        indexer[j] = i
+                        fill_count += 1
+                    j += 1
+                break
 
-    while True:
-        if j == nright:
-            break
+            next = old[i + 1]
 
-        if i == nleft - 1:
-            while j < nright:
+            while j < nright and cur <= new[j] < next:
                 if new[j] == cur:
                     indexer[j] = i
-                elif new[j] > cur and fill_count < lim:
+                elif fill_count < lim:
                     indexer[j] = i
                     fill_count += 1
                 j += 1
-            break
-
-        next = old[i + 1]
 
-        while j < nright and cur <= new[j] < next:
-            if new[j] == cur:
-                indexer[j] = i
-            elif fill_count < lim:
-                indexer[j] = i
-                fill_count += 1
-            j += 1
-
-        fill_count = 0
-        i += 1
-        cur = next
+            fill_count = 0
+            i += 1
+            cur = next
 
     return indexer
 
@@ -434,40 +442,41 @@ def pad_bool(ndarray[uint8_t] old, ndarray[uint8_t] new,
     if nleft == 0 or nright == 0 or new[nright - 1] < old[0]:
         return indexer
 
-    i = j = 0
+    with nogil:
+        i = j = 0
+
+        cur = old[0]
+
+        while j <= nright - 1 and new[j] < cur:
+            j += 1
 
-    cur = old[0]
+        while True:
+            if j == nright:
+                break
 
-    while j <= nright - 1 and new[j] < cur:
-        j += 1
+            if i == nleft - 1:
+                while j < nright:
+                    if new[j] == cur:
+                        indexer[j] = i
+                    elif new[j] > cur and fill_count < lim:
+                        indexer[j] = i
+                        fill_count += 1
+                    j += 1
+                break
 
-    while True:
-        if j == nright:
-            break
+            next = old[i + 1]
 
-        if i == nleft - 1:
-            while j < nright:
+            while j < nright and cur <= new[j] < next:
                 if new[j] == cur:
                     indexer[j] = i
-                elif new[j] > cur and fill_count < lim:
+                elif fill_count < lim:
                     indexer[j] = i
                     fill_count += 1
                 j += 1
-            break
-
-        next = old[i + 1]
-
-        while j < nright and cur <= new[j] < next:
-            if new[j] == cur:
-                indexer[j] = i
-            elif fill_count < lim:
-                indexer[j] = i
-                fill_count += 1
-            j += 1
 
-        fill_count = 0
-        i += 1
-        cur = next
+            fill_count = 0
+            i += 1
+            cur = next
 
     return indexer
 
@@ -496,41 +505,42 @@ def backfill_float64(ndarray[float64_t] old, ndarray[float64_t] new,
     if nleft == 0 or nright == 0 or new[0] > old[nleft - 1]:
         return indexer
 
-    i = nleft - 1
-    j = nright - 1
+    with nogil:
+        i = nleft - 1
+        j = nright - 1
+
+        cur = old[nleft - 1]
 
-    cur = old[nleft - 1]
+        while j >= 0 and new[j] > cur:
+            j -= 1
+
+        while True:
+            if j < 0:
+                break
 
-    while j >= 0 and new[j] > cur:
-        j -= 1
+            if i == 0:
+                while j >= 0:
+                    if new[j] == cur:
+                        indexer[j] = i
+                    elif new[j] < cur and fill_count < lim:
+                        indexer[j] = i
+                        fill_count += 1
+                    j -= 1
+                break
 
-    while True:
-        if j < 0:
-            break
+            prev = old[i - 1]
 
-        if i == 0:
-            while j >= 0:
+            while j >= 0 and prev < new[j] <= cur:
                 if new[j] == cur:
                     indexer[j] = i
                 elif new[j] < cur and fill_count < lim:
                     indexer[j] = i
                     fill_count += 1
                 j -= 1
-            break
-
-        prev = old[i - 1]
-
-        while j >= 0 and prev < new[j] <= cur:
-            if new[j] == cur:
-                indexer[j] = i
-            elif new[j] < cur and fill_count < lim:
-                indexer[j] = i
-                fill_count += 1
-            j -= 1
 
-        fill_count = 0
-        i -= 1
-        cur = prev
+            fill_count = 0
+            i -= 1
+            cur = prev
 
     return indexer
 
@@ -558,41 +568,42 @@ def backfill_object(ndarray[object] old, ndarray[object] new,
     if nleft == 0 or nright == 0 or new[0] > old[nleft - 1]:
         return indexer
 
-    i = nleft - 1
-    j = nright - 1
+    if True:
+        i = nleft - 1
+        j = nright - 1
+
+        cur = old[nleft - 1]
+
+        while j >= 0 and new[j] > cur:
+            j -= 1
 
-    cur = old[nleft - 1]
+        while True:
+            if j < 0:
+                break
 
-    while j >= 0 and new[j] > cur:
-        j -= 1
+            if i == 0:
+                while j >= 0:
+                    if new[j] == cur:
+                        indexer[j] = i
+                    elif new[j] < cur and fill_count < lim:
+                        indexer[j] = i
+                        fill_count += 1
+                    j -= 1
+                break
 
-    while True:
-        if j < 0:
-            break
+            prev = old[i - 1]
 
-        if i == 0:
-            while j >= 0:
+            while j >= 0 and prev < new[j] <= cur:
                 if new[j] == cur:
                     indexer[j] = i
                 elif new[j] < cur and fill_count < lim:
                     indexer[j] = i
                     fill_count += 1
                 j -= 1
-            break
-
-        prev = old[i - 1]
-
-        while j >= 0 and prev < new[j] <= cur:
-            if new[j] == cur:
-                indexer[j] = i
-            elif new[j] < cur and fill_count < lim:
-                indexer[j] = i
-                fill_count += 1
-            j -= 1
 
-        fill_count = 0
-        i -= 1
-        cur = prev
+            fill_count = 0
+            i -= 1
+            cur = prev
 
     return indexer
 
@@ -620,41 +631,42 @@ def backfill_int32(ndarray[int32_t] old, ndarray[int32_t] new,
     if nleft == 0 or nright == 0 or new[0] > old[nleft - 1]:
         return indexer
 
-    i = nleft - 1
-    j = nright - 1
+    with nogil:
+        i = nleft - 1
+        j = nright - 1
+
+        cur = old[nleft - 1]
 
-    cur = old[nleft - 1]
+        while j >= 0 and new[j] > cur:
+            j -= 1
+
+        while True:
+            if j < 0:
+                break
 
-    while j >= 0 and new[j] > cur:
-        j -= 1
+            if i == 0:
+                while j >= 0:
+                    if new[j] == cur:
+                        indexer[j] = i
+                    elif new[j] < cur and fill_count < lim:
+                        indexer[j] = i
+                        fill_count += 1
+                    j -= 1
+                break
 
-    while True:
-        if j < 0:
-            break
+            prev = old[i - 1]
 
-        if i == 0:
-            while j >= 0:
+            while j >= 0 and prev < new[j] <= cur:
                 if new[j] == cur:
                     indexer[j] = i
                 elif new[j] < cur and fill_count < lim:
                     indexer[j] = i
                     fill_count += 1
                 j -= 1
-            break
 
-        prev = old[i - 1]
-
-        while j >= 0 and prev < new[j] <= cur:
-            if new[j] == cur:
-                indexer[j] = i
-            elif new[j] < cur and fill_count < lim:
-                indexer[j] = i
-                fill_count += 1
-            j -= 1
-
-        fill_count = 0
-        i -= 1
-        cur = prev
+            fill_count = 0
+            i -= 1
+            cur = prev
 
     return indexer
 
@@ -682,41 +694,42 @@ def backfill_int64(ndarray[int64_t] old, ndarray[int64_t] new,
     if nleft == 0 or nright == 0 or new[0] > old[nleft - 1]:
         return indexer
 
-    i = nleft - 1
-    j = nright - 1
+    with nogil:
+        i = nleft - 1
+        j = nright - 1
+
+        cur = old[nleft - 1]
+
+        while j >= 0 and new[j] > cur:
+            j -= 1
 
-    cur = old[nleft - 1]
+        while True:
+            if j < 0:
+                break
 
-    while j >= 0 and new[j] > cur:
-        j -= 1
+            if i == 0:
+                while j >= 0:
+                    if new[j] == cur:
+                        indexer[j] = i
+                    elif new[j] < cur and fill_count < lim:
+                        indexer[j] = i
+                        fill_count += 1
+                    j -= 1
+                break
 
-    while True:
-        if j < 0:
-            break
+            prev = old[i - 1]
 
-        if i == 0:
-            while j >= 0:
+            while j >= 0 and prev < new[j] <= cur:
                 if new[j] == cur:
                     indexer[j] = i
                 elif new[j] < cur and fill_count < lim:
                     indexer[j] = i
                     fill_count += 1
                 j -= 1
-            break
-
-        prev = old[i - 1]
-
-        while j >= 0 and prev < new[j] <= cur:
-            if new[j] == cur:
-                indexer[j] = i
-            elif new[j] < cur and fill_count < lim:
-                indexer[j] = i
-                fill_count += 1
-            j -= 1
 
-        fill_count = 0
-        i -= 1
-        cur = prev
+            fill_count = 0
+            i -= 1
+            cur = prev
 
     return indexer
 
@@ -744,41 +757,42 @@ def backfill_bool(ndarray[uint8_t] old, ndarray[uint8_t] new,
     if nleft == 0 or nright == 0 or new[0] > old[nleft - 1]:
         return indexer
 
-    i = nleft - 1
-    j = nright - 1
+    with nogil:
+        i = nleft - 1
+        j = nright - 1
+
+        cur = old[nleft - 1]
 
-    cur = old[nleft - 1]
+        while j >= 0 and new[j] > cur:
+            j -= 1
+
+        while True:
+            if j < 0:
+                break
 
-    while j >= 0 and new[j] > cur:
-        j -= 1
+            if i == 0:
+                while j >= 0:
+                    if new[j] == cur:
+                        indexer[j] = i
+                    elif new[j] < cur and fill_count < lim:
+                        indexer[j] = i
+                        fill_count += 1
+                    j -= 1
+                break
 
-    while True:
-        if j < 0:
-            break
+            prev = old[i - 1]
 
-        if i == 0:
-            while j >= 0:
+            while j >= 0 and prev < new[j] <= cur:
                 if new[j] == cur:
                     indexer[j] = i
                 elif new[j] < cur and fill_count < lim:
                     indexer[j] = i
                     fill_count += 1
                 j -= 1
-            break
-
-        prev = old[i - 1]
-
-        while j >= 0 and prev < new[j] <= cur:
-            if new[j] == cur:
-                indexer[j] = i
-            elif new[j] < cur and fill_count < lim:
-                indexer[j] = i
-                fill_count += 1
-            j -= 1
 
-        fill_count = 0
-        i -= 1
-        cur = prev
+            fill_count = 0
+            i -= 1
+            cur = prev
 
     return indexer
 
@@ -802,15 +816,16 @@ def pad_inplace_float64(ndarray[float64_t] values,
         lim = limit
 
     val = values[0]
-    for i in range(N):
-        if mask[i]:
-            if fill_count >= lim:
-                continue
-            fill_count += 1
-            values[i] = val
-        else:
-            fill_count = 0
-            val = values[i]
+    with nogil:
+        for i in range(N):
+            if mask[i]:
+                if fill_count >= lim:
+                    continue
+                fill_count += 1
+                values[i] = val
+            else:
+                fill_count = 0
+                val = values[i]
 
 @cython.boundscheck(False)
 @cython.wraparound(False)
@@ -831,15 +846,16 @@ def pad_inplace_object(ndarray[object] values,
         lim = limit
 
     val = values[0]
-    for i in range(N):
-        if mask[i]:
-            if fill_count >= lim:
-                continue
-            fill_count += 1
-            values[i] = val
-        else:
-            fill_count = 0
-            val = values[i]
+    if True:
+        for i in range(N):
+            if mask[i]:
+                if fill_count >= lim:
+                    continue
+                fill_count += 1
+                values[i] = val
+            else:
+                fill_count = 0
+                val = values[i]
 
 @cython.boundscheck(False)
 @cython.wraparound(False)
@@ -860,15 +876,16 @@ def pad_inplace_int32(ndarray[int32_t] values,
         lim = limit
 
     val = values[0]
-    for i in range(N):
-        if mask[i]:
-            if fill_count >= lim:
-                continue
-            fill_count += 1
-            values[i] = val
-        else:
-            fill_count = 0
-            val = values[i]
+    with nogil:
+        for i in range(N):
+            if mask[i]:
+                if fill_count >= lim:
+                    continue
+                fill_count += 1
+                values[i] = val
+            else:
+                fill_count = 0
+                val = values[i]
 
 @cython.boundscheck(False)
 @cython.wraparound(False)
@@ -889,15 +906,16 @@ def pad_inplace_int64(ndarray[int64_t] values,
         lim = limit
 
     val = values[0]
-    for i in range(N):
-        if mask[i]:
-            if fill_count >= lim:
-                continue
-            fill_count += 1
-            values[i] = val
-        else:
-            fill_count = 0
-            val = values[i]
+    with nogil:
+        for i in range(N):
+            if mask[i]:
+                if fill_count >= lim:
+                    continue
+                fill_count += 1
+                values[i] = val
+            else:
+                fill_count = 0
+                val = values[i]
 
 @cython.boundscheck(False)
 @cython.wraparound(False)
@@ -918,15 +936,16 @@ def pad_inplace_bool(ndarray[uint8_t] values,
         lim = limit
 
     val = values[0]
-    for i in range(N):
-        if mask[i]:
-            if fill_count >= lim:
-                continue
-            fill_count += 1
-            values[i] = val
-        else:
-            fill_count = 0
-            val = values[i]
+    with nogil:
+        for i in range(N):
+            if mask[i]:
+                if fill_count >= lim:
+                    continue
+                fill_count += 1
+                values[i] = val
+            else:
+                fill_count = 0
+                val = values[i]
 
 
 @cython.boundscheck(False)
@@ -948,15 +967,16 @@ def backfill_inplace_float64(ndarray[float64_t] values,
         lim = limit
 
     val = values[N - 1]
-    for i in range(N - 1, -1 , -1):
-        if mask[i]:
-            if fill_count >= lim:
-                continue
-            fill_count += 1
-            values[i] = val
-        else:
-            fill_count = 0
-            val = values[i]
+    with nogil:
+        for i in range(N - 1, -1 , -1):
+            if mask[i]:
+                if fill_count >= lim:
+                    continue
+                fill_count += 1
+                values[i] = val
+            else:
+                fill_count = 0
+                val = values[i]
 @cython.boundscheck(False)
 @cython.wraparound(False)
 def backfill_inplace_object(ndarray[object] values,
@@ -976,15 +996,16 @@ def backfill_inplace_object(ndarray[object] values,
         lim = limit
 
     val = values[N - 1]
-    for i in range(N - 1, -1 , -1):
-        if mask[i]:
-            if fill_count >= lim:
-                continue
-            fill_count += 1
-            values[i] = val
-        else:
-            fill_count = 0
-            val = values[i]
+    if True:
+        for i in range(N - 1, -1 , -1):
+            if mask[i]:
+                if fill_count >= lim:
+                    continue
+                fill_count += 1
+                values[i] = val
+            else:
+                fill_count = 0
+                val = values[i]
 @cython.boundscheck(False)
 @cython.wraparound(False)
 def backfill_inplace_int32(ndarray[int32_t] values,
@@ -1004,15 +1025,16 @@ def backfill_inplace_int32(ndarray[int32_t] values,
         lim = limit
 
     val = values[N - 1]
-    for i in range(N - 1, -1 , -1):
-        if mask[i]:
-            if fill_count >= lim:
-                continue
-            fill_count += 1
-            values[i] = val
-        else:
-            fill_count = 0
-            val = values[i]
+    with nogil:
+        for i in range(N - 1, -1 , -1):
+            if mask[i]:
+                if fill_count >= lim:
+                    continue
+                fill_count += 1
+                values[i] = val
+            else:
+                fill_count = 0
+                val = values[i]
 @cython.boundscheck(False)
 @cython.wraparound(False)
 def backfill_inplace_int64(ndarray[int64_t] values,
@@ -1032,15 +1054,16 @@ def backfill_inplace_int64(ndarray[int64_t] values,
         lim = limit
 
     val = values[N - 1]
-    for i in range(N - 1, -1 , -1):
-        if mask[i]:
-            if fill_count >= lim:
-                continue
-            fill_count += 1
-            values[i] = val
-        else:
-            fill_count = 0
-            val = values[i]
+    with nogil:
+        for i in range(N - 1, -1 , -1):
+            if mask[i]:
+                if fill_count >= lim:
+                    continue
+                fill_count += 1
+                values[i] = val
+            else:
+                fill_count = 0
+                val = values[i]
 @cython.boundscheck(False)
 @cython.wraparound(False)
 def backfill_inplace_bool(ndarray[uint8_t] values,
@@ -1060,15 +1083,16 @@ def backfill_inplace_bool(ndarray[uint8_t] values,
         lim = limit
 
     val = values[N - 1]
-    for i in range(N - 1, -1 , -1):
-        if mask[i]:
-            if fill_count >= lim:
-                continue
-            fill_count += 1
-            values[i] = val
-        else:
-            fill_count = 0
-            val = values[i]
+    with nogil:
+        for i in range(N - 1, -1 , -1):
+            if mask[i]:
+                if fill_count >= lim:
+                    continue
+                fill_count += 1
+                values[i] = val
+            else:
+                fill_count = 0
+                val = values[i]
 
 @cython.boundscheck(False)
 @cython.wraparound(False)
@@ -1088,18 +1112,19 @@ def pad_2d_inplace_float64(ndarray[float64_t, ndim=2] values,
             raise ValueError('Limit must be non-negative')
         lim = limit
 
-    for j in range(K):
-        fill_count = 0
-        val = values[j, 0]
-        for i in range(N):
-            if mask[j, i]:
-                if fill_count >= lim:
-                    continue
-                fill_count += 1
-                values[j, i] = val
-            else:
-                fill_count = 0
-                val = values[j, i]
+    with nogil:
+        for j in range(K):
+            fill_count = 0
+            val = values[j, 0]
+            for i in range(N):
+                if mask[j, i]:
+                    if fill_count >= lim:
+                        continue
+                    fill_count += 1
+                    values[j, i] = val
+                else:
+                    fill_count = 0
+                    val = values[j, i]
 @cython.boundscheck(False)
 @cython.wraparound(False)
 def pad_2d_inplace_object(ndarray[object, ndim=2] values,
@@ -1118,18 +1143,19 @@ def pad_2d_inplace_object(ndarray[object, ndim=2] values,
             raise ValueError('Limit must be non-negative')
         lim = limit
 
-    for j in range(K):
-        fill_count = 0
-        val = values[j, 0]
-        for i in range(N):
-            if mask[j, i]:
-                if fill_count >= lim:
-                    continue
-                fill_count += 1
-                values[j, i] = val
-            else:
-                fill_count = 0
-                val = values[j, i]
+    if True:
+        for j in range(K):
+            fill_count = 0
+            val = values[j, 0]
+            for i in range(N):
+                if mask[j, i]:
+                    if fill_count >= lim:
+                        continue
+                    fill_count += 1
+                    values[j, i] = val
+                else:
+                    fill_count = 0
+                    val = values[j, i]
 @cython.boundscheck(False)
 @cython.wraparound(False)
 def pad_2d_inplace_int32(ndarray[int32_t, ndim=2] values,
@@ -1148,18 +1174,19 @@ def pad_2d_inplace_int32(ndarray[int32_t, ndim=2] values,
             raise ValueError('Limit must be non-negative')
         lim = limit
 
-    for j in range(K):
-        fill_count = 0
-        val = values[j, 0]
-        for i in range(N):
-            if mask[j, i]:
-                if fill_count >= lim:
-                    continue
-                fill_count += 1
-                values[j, i] = val
-            else:
-                fill_count = 0
-                val = values[j, i]
+    with nogil:
+        for j in range(K):
+            fill_count = 0
+            val = values[j, 0]
+            for i in range(N):
+                if mask[j, i]:
+                    if fill_count >= lim:
+                        continue
+                    fill_count += 1
+                    values[j, i] = val
+                else:
+                    fill_count = 0
+                    val = values[j, i]
 @cython.boundscheck(False)
 @cython.wraparound(False)
 def pad_2d_inplace_int64(ndarray[int64_t, ndim=2] values,
@@ -1178,18 +1205,19 @@ def pad_2d_inplace_int64(ndarray[int64_t, ndim=2] values,
             raise ValueError('Limit must be non-negative')
         lim = limit
 
-    for j in range(K):
-        fill_count = 0
-        val = values[j, 0]
-        for i in range(N):
-            if mask[j, i]:
-                if fill_count >= lim:
-                    continue
-                fill_count += 1
-                values[j, i] = val
-            else:
-                fill_count = 0
-                val = values[j, i]
+    with nogil:
+        for j in range(K):
+            fill_count = 0
+            val = values[j, 0]
+            for i in range(N):
+                if mask[j, i]:
+                    if fill_count >= lim:
+                        continue
+                    fill_count += 1
+                    values[j, i] = val
+                else:
+                    fill_count = 0
+                    val = values[j, i]
 @cython.boundscheck(False)
 @cython.wraparound(False)
 def pad_2d_inplace_bool(ndarray[uint8_t, ndim=2] values,
@@ -1208,18 +1236,19 @@ def pad_2d_inplace_bool(ndarray[uint8_t, ndim=2] values,
             raise ValueError('Limit must be non-negative')
         lim = limit
 
-    for j in range(K):
-        fill_count = 0
-        val = values[j, 0]
-        for i in range(N):
-            if mask[j, i]:
-                if fill_count >= lim:
-                    continue
-                fill_count += 1
-                values[j, i] = val
-            else:
-                fill_count = 0
-                val = values[j, i]
+    with nogil:
+        for j in range(K):
+            fill_count = 0
+            val = values[j, 0]
+            for i in range(N):
+                if mask[j, i]:
+                    if fill_count >= lim:
+                        continue
+                    fill_count += 1
+                    values[j, i] = val
+                else:
+                    fill_count = 0
+                    val = values[j, i]
 
 @cython.boundscheck(False)
 @cython.wraparound(False)
@@ -1239,18 +1268,19 @@ def backfill_2d_inplace_float64(ndarray[float64_t, ndim=2] values,
             raise ValueError('Limit must be non-negative')
         lim = limit
 
-    for j in range(K):
-        fill_count = 0
-        val = values[j, N - 1]
-        for i in range(N - 1, -1 , -1):
-            if mask[j, i]:
-                if fill_count >= lim:
-                    continue
-                fill_count += 1
-                values[j, i] = val
-            else:
-                fill_count = 0
-                val = values[j, i]
+    with nogil:
+        for j in range(K):
+            fill_count = 0
+            val = values[j, N - 1]
+            for i in range(N - 1, -1 , -1):
+                if mask[j, i]:
+                    if fill_count >= lim:
+                        continue
+                    fill_count += 1
+                    values[j, i] = val
+                else:
+                    fill_count = 0
+                    val = values[j, i]
 @cython.boundscheck(False)
 @cython.wraparound(False)
 def backfill_2d_inplace_object(ndarray[object, ndim=2] values,
@@ -1269,18 +1299,19 @@ def backfill_2d_inplace_object(ndarray[object, ndim=2] values,
             raise ValueError('Limit must be non-negative')
         lim = limit
 
-    for j in range(K):
-        fill_count = 0
-        val = values[j, N - 1]
-        for i in range(N - 1, -1 , -1):
-            if mask[j, i]:
-                if fill_count >= lim:
-                    continue
-                fill_count += 1
-                values[j, i] = val
-            else:
-                fill_count = 0
-                val = values[j, i]
+    if True:
+        for j in range(K):
+            fill_count = 0
+            val = values[j, N - 1]
+            for i in range(N - 1, -1 , -1):
+                if mask[j, i]:
+                    if fill_count >= lim:
+                        continue
+                    fill_count += 1
+                    values[j, i] = val
+                else:
+                    fill_count = 0
+                    val = values[j, i]
 @cython.boundscheck(False)
 @cython.wraparound(False)
 def backfill_2d_inplace_int32(ndarray[int32_t, ndim=2] values,
@@ -1299,18 +1330,19 @@ def backfill_2d_inplace_int32(ndarray[int32_t, ndim=2] values,
             raise ValueError('Limit must be non-negative')
         lim = limit
 
-    for j in range(K):
-        fill_count = 0
-        val = values[j, N - 1]
-        for i in range(N - 1, -1 , -1):
-            if mask[j, i]:
-                if fill_count >= lim:
-                    continue
-                fill_count += 1
-                values[j, i] = val
-            else:
-                fill_count = 0
-                val = values[j, i]
+    with nogil:
+        for j in range(K):
+            fill_count = 0
+            val = values[j, N - 1]
+            for i in range(N - 1, -1 , -1):
+                if mask[j, i]:
+                    if fill_count >= lim:
+                        continue
+                    fill_count += 1
+                    values[j, i] = val
+                else:
+                    fill_count = 0
+                    val = values[j, i]
 @cython.boundscheck(False)
 @cython.wraparound(False)
 def backfill_2d_inplace_int64(ndarray[int64_t, ndim=2] values,
@@ -1329,18 +1361,19 @@ def backfill_2d_inplace_int64(ndarray[int64_t, ndim=2] values,
             raise ValueError('Limit must be non-negative')
         lim = limit
 
-    for j in range(K):
-        fill_count = 0
-        val = values[j, N - 1]
-        for i in range(N - 1, -1 , -1):
-            if mask[j, i]:
-                if fill_count >= lim:
-                    continue
-                fill_count += 1
-                values[j, i] = val
-            else:
-                fill_count = 0
-                val = values[j, i]
+    with nogil:
+        for j in range(K):
+            fill_count = 0
+            val = values[j, N - 1]
+            for i in range(N - 1, -1 , -1):
+                if mask[j, i]:
+                    if fill_count >= lim:
+                        continue
+                    fill_count += 1
+                    values[j, i] = val
+                else:
+                    fill_count = 0
+                    val = values[j, i]
 @cython.boundscheck(False)
 @cython.wraparound(False)
 def backfill_2d_inplace_bool(ndarray[uint8_t, ndim=2] values,
@@ -1359,18 +1392,19 @@ def backfill_2d_inplace_bool(ndarray[uint8_t, ndim=2] values,
             raise ValueError('Limit must be non-negative')
         lim = limit
 
-    for j in range(K):
-        fill_count = 0
-        val = values[j, N - 1]
-        for i in range(N - 1, -1 , -1):
-            if mask[j, i]:
-                if fill_count >= lim:
-                    continue
-                fill_count += 1
-                values[j, i] = val
-            else:
-                fill_count = 0
-                val = values[j, i]
+    with nogil:
+        for j in range(K):
+            fill_count = 0
+            val = values[j, N - 1]
+            for i in range(N - 1, -1 , -1):
+                if mask[j, i]:
+                    if fill_count >= lim:
+                        continue
+                    fill_count += 1
+                    values[j, i] = val
+                else:
+                    fill_count = 0
+                    val = values[j, i]
 
 @cython.wraparound(False)
 @cython.boundscheck(False)
@@ -1398,12 +1432,13 @@ def take_1d_float64(ndarray[float64_t] values,
                 outbuf[i] = values[idx]
     else:
         fv = fill_value
-        for i in range(n):
-            idx = indexer[i]
-            if idx == -1:
-                outbuf[i] = fv
-            else:
-                outbuf[i] = values[idx]
+        with nogil:
+            for i in range(n):
+                idx = indexer[i]
+                if idx == -1:
+                    outbuf[i] = fv
+                else:
+                    outbuf[i] = values[idx]
 
 @cython.wraparound(False)
 @cython.boundscheck(False)
@@ -1431,12 +1466,13 @@ def take_1d_object(ndarray[object] values,
                 outbuf[i] = values[idx]
     else:
         fv = fill_value
-        for i in range(n):
-            idx = indexer[i]
-            if idx == -1:
-                outbuf[i] = fv
-            else:
-                outbuf[i] = values[idx]
+        if True:
+            for i in range(n):
+                idx = indexer[i]
+                if idx == -1:
+                    outbuf[i] = fv
+                else:
+                    outbuf[i] = values[idx]
 
 @cython.wraparound(False)
 @cython.boundscheck(False)
@@ -1464,12 +1500,13 @@ def take_1d_int32(ndarray[int32_t] values,
                 outbuf[i] = values[idx]
     else:
         fv = fill_value
-        for i in range(n):
-            idx = indexer[i]
-            if idx == -1:
-                outbuf[i] = fv
-            else:
-                outbuf[i] = values[idx]
+        with nogil:
+            for i in range(n):
+                idx = indexer[i]
+                if idx == -1:
+                    outbuf[i] = fv
+                else:
+                    outbuf[i] = values[idx]
 
 @cython.wraparound(False)
 @cython.boundscheck(False)
@@ -1497,12 +1534,13 @@ def take_1d_int64(ndarray[int64_t] values,
                 outbuf[i] = values[idx]
     else:
         fv = fill_value
-        for i in range(n):
-            idx = indexer[i]
-            if idx == -1:
-                outbuf[i] = fv
-            else:
-                outbuf[i] = values[idx]
+        with nogil:
+            for i in range(n):
+                idx = indexer[i]
+                if idx == -1:
+                    outbuf[i] = fv
+                else:
+                    outbuf[i] = values[idx]
 
 @cython.wraparound(False)
 @cython.boundscheck(False)
@@ -1530,12 +1568,13 @@ def take_1d_bool(ndarray[uint8_t] values,
                 outbuf[i] = values[idx]
     else:
         fv = fill_value
-        for i in range(n):
-            idx = indexer[i]
-            if idx == -1:
-                outbuf[i] = fv
-            else:
-                outbuf[i] = values[idx]
+        with nogil:
+            for i in range(n):
+                idx = indexer[i]
+                if idx == -1:
+                    outbuf[i] = fv
+                else:
+                    outbuf[i] = values[idx]
 
 
 @cython.boundscheck(False)
@@ -1549,7 +1588,7 @@ def is_monotonic_float64(ndarray[float64_t] arr):
     cdef:
         Py_ssize_t i, n
         float64_t prev, cur
-        bint is_unique = 1
+        bint is_monotonic = 1, is_unique = 1
 
     n = len(arr)
 
@@ -1557,13 +1596,18 @@ def is_monotonic_float64(ndarray[float64_t] arr):
         return True, True
 
     prev = arr[0]
-    for i in range(1, n):
-        cur = arr[i]
-        if cur < prev:
-            return False, None
-        elif cur == prev:
-            is_unique = 0
-        prev = cur
+    with nogil:
+        for i in range(1, n):
+            cur = arr[i]
+            if cur < prev:
+                is_monotonic = 0
+                break
+            elif cur == prev:
+                is_unique = 0
+            prev = cur
+
+    if not is_monotonic:
+        return False, None
     return True, is_unique
 @cython.boundscheck(False)
 @cython.wraparound(False)
@@ -1576,7 +1620,7 @@ def is_monotonic_object(ndarray[object] arr):
     cdef:
         Py_ssize_t i, n
         object prev, cur
-        bint is_unique = 1
+        bint is_monotonic = 1, is_unique = 1
 
     n = len(arr)
 
@@ -1584,13 +1628,18 @@ def is_monotonic_object(ndarray[object] arr):
         return True, True
 
     prev = arr[0]
-    for i in range(1, n):
-        cur = arr[i]
-        if cur < prev:
-            return False, None
-        elif cur == prev:
-            is_unique = 0
-        prev = cur
+    if True:
+        for i in range(1, n):
+            cur = arr[i]
+            if cur < prev:
+                is_monotonic = 0
+                break
+            elif cur == prev:
+                is_unique = 0
+            prev = cur
+
+    if not is_monotonic:
+        return False, None
     return True, is_unique
 @cython.boundscheck(False)
 @cython.wraparound(False)
@@ -1603,7 +1652,7 @@ def is_monotonic_int32(ndarray[int32_t] arr):
     cdef:
         Py_ssize_t i, n
         int32_t prev, cur
-        bint is_unique = 1
+        bint is_monotonic = 1, is_unique = 1
 
     n = len(arr)
 
@@ -1611,13 +1660,18 @@ def is_monotonic_int32(ndarray[int32_t] arr):
         return True, True
 
     prev = arr[0]
-    for i in range(1, n):
-        cur = arr[i]
-        if cur < prev:
-            return False, None
-        elif cur == prev:
-            is_unique = 0
-        prev = cur
+    with nogil:
+        for i in range(1, n):
+            cur = arr[i]
+            if cur < prev:
+                is_monotonic = 0
+                break
+            elif cur == prev:
+                is_unique = 0
+            prev = cur
+
+    if not is_monotonic:
+        return False, None
     return True, is_unique
 @cython.boundscheck(False)
 @cython.wraparound(False)
@@ -1630,7 +1684,7 @@ def is_monotonic_int64(ndarray[int64_t] arr):
     cdef:
         Py_ssize_t i, n
         int64_t prev, cur
-        bint is_unique = 1
+        bint is_monotonic = 1, is_unique = 1
 
     n = len(arr)
 
@@ -1638,13 +1692,18 @@ def is_monotonic_int64(ndarray[int64_t] arr):
         return True, True
 
     prev = arr[0]
-    for i in range(1, n):
-        cur = arr[i]
-        if cur < prev:
-            return False, None
-        elif cur == prev:
-            is_unique = 0
-        prev = cur
+    with nogil:
+        for i in range(1, n):
+            cur = arr[i]
+            if cur < prev:
+                is_monotonic = 0
+                break
+            elif cur == prev:
+                is_unique = 0
+            prev = cur
+
+    if not is_monotonic:
+        return False, None
     return True, is_unique
 @cython.boundscheck(False)
 @cython.wraparound(False)
@@ -1657,7 +1716,7 @@ def is_monotonic_bool(ndarray[uint8_t] arr):
     cdef:
         Py_ssize_t i, n
         uint8_t prev, cur
-        bint is_unique = 1
+        bint is_monotonic = 1, is_unique = 1
 
     n = len(arr)
 
@@ -1665,13 +1724,18 @@ def is_monotonic_bool(ndarray[uint8_t] arr):
         return True, True
 
     prev = arr[0]
-    for i in range(1, n):
-        cur = arr[i]
-        if cur < prev:
-            return False, None
-        elif cur == prev:
-            is_unique = 0
-        prev = cur
+    with nogil:
+        for i in range(1, n):
+            cur = arr[i]
+            if cur < prev:
+                is_monotonic = 0
+                break
+            elif cur == prev:
+                is_unique = 0
+            prev = cur
+
+    if not is_monotonic:
+        return False, None
     return True, is_unique
 
 @cython.wraparound(False)
@@ -1905,14 +1969,15 @@ def take_2d_axis0_float64(ndarray[float64_t, ndim=2] values,
                     outbuf[i, j] = values[idx, j]
     else:
         fv = fill_value
-        for i in range(n):
-            idx = indexer[i]
-            if idx == -1:
-                for j in range(k):
-                    outbuf[i, j] = fv
-            else:
-                for j in range(k):
-                    outbuf[i, j] = values[idx, j]
+        with nogil:
+            for i in range(n):
+                idx = indexer[i]
+                if idx == -1:
+                    for j in range(k):
+                        outbuf[i, j] = fv
+                else:
+                    for j in range(k):
+                        outbuf[i, j] = values[idx, j]
 
 @cython.wraparound(False)
 @cython.boundscheck(False)
@@ -1943,14 +2008,15 @@ def take_2d_axis0_object(ndarray[object, ndim=2] values,
                     outbuf[i, j] = values[idx, j]
     else:
         fv = fill_value
-        for i in range(n):
-            idx = indexer[i]
-            if idx == -1:
-                for j in range(k):
-                    outbuf[i, j] = fv
-            else:
-                for j in range(k):
-                    outbuf[i, j] = values[idx, j]
+        if True:
+            for i in range(n):
+                idx = indexer[i]
+                if idx == -1:
+                    for j in range(k):
+                        outbuf[i, j] = fv
+                else:
+                    for j in range(k):
+                        outbuf[i, j] = values[idx, j]
 
 @cython.wraparound(False)
 @cython.boundscheck(False)
@@ -1981,14 +2047,15 @@ def take_2d_axis0_int32(ndarray[int32_t, ndim=2] values,
                     outbuf[i, j] = values[idx, j]
     else:
         fv = fill_value
-        for i in range(n):
-            idx = indexer[i]
-            if idx == -1:
-                for j in range(k):
-                    outbuf[i, j] = fv
-            else:
-                for j in range(k):
-                    outbuf[i, j] = values[idx, j]
+        with nogil:
+            for i in range(n):
+                idx = indexer[i]
+                if idx == -1:
+                    for j in range(k):
+                        outbuf[i, j] = fv
+                else:
+                    for j in range(k):
+                        outbuf[i, j] = values[idx, j]
 
 @cython.wraparound(False)
 @cython.boundscheck(False)
@@ -2019,14 +2086,15 @@ def take_2d_axis0_int64(ndarray[int64_t, ndim=2] values,
                     outbuf[i, j] = values[idx, j]
     else:
         fv = fill_value
-        for i in range(n):
-            idx = indexer[i]
-            if idx == -1:
-                for j in range(k):
-                    outbuf[i, j] = fv
-            else:
-                for j in range(k):
-                    outbuf[i, j] = values[idx, j]
+        with nogil:
+            for i in range(n):
+                idx = indexer[i]
+                if idx == -1:
+                    for j in range(k):
+                        outbuf[i, j] = fv
+                else:
+                    for j in range(k):
+                        outbuf[i, j] = values[idx, j]
 
 @cython.wraparound(False)
 @cython.boundscheck(False)
@@ -2057,14 +2125,15 @@ def take_2d_axis0_bool(ndarray[uint8_t, ndim=2] values,
                     outbuf[i, j] = values[idx, j]
     else:
         fv = fill_value
-        for i in range(n):
-            idx = indexer[i]
-            if idx == -1:
-                for j in range(k):
-                    outbuf[i, j] = fv
-            else:
-                for j in range(k):
-                    outbuf[i, j] = values[idx, j]
+        with nogil:
+            for i in range(n):
+                idx = indexer[i]
+                if idx == -1:
+                    for j in range(k):
+                        outbuf[i, j] = fv
+                else:
+                    for j in range(k):
+                        outbuf[i, j] = values[idx, j]
 
 
 @cython.wraparound(False)
@@ -2097,15 +2166,16 @@ def take_2d_axis1_float64(ndarray[float64_t, ndim=2] values,
                     outbuf[i, j] = values[i, idx]
     else:
         fv = fill_value
-        for j in range(k):
-            idx = indexer[j]
+        with nogil:
+            for j in range(k):
+                idx = indexer[j]
 
-            if idx == -1:
-                for i in range(n):
-                    outbuf[i, j] = fv
-            else:
-                for i in range(n):
-                    outbuf[i, j] = values[i, idx]
+                if idx == -1:
+                    for i in range(n):
+                        outbuf[i, j] = fv
+                else:
+                    for i in range(n):
+                        outbuf[i, j] = values[i, idx]
 
 @cython.wraparound(False)
 @cython.boundscheck(False)
@@ -2137,15 +2207,16 @@ def take_2d_axis1_object(ndarray[object, ndim=2] values,
                     outbuf[i, j] = values[i, idx]
     else:
         fv = fill_value
-        for j in range(k):
-            idx = indexer[j]
+        if True:
+            for j in range(k):
+                idx = indexer[j]
 
-            if idx == -1:
-                for i in range(n):
-                    outbuf[i, j] = fv
-            else:
-                for i in range(n):
-                    outbuf[i, j] = values[i, idx]
+                if idx == -1:
+                    for i in range(n):
+                        outbuf[i, j] = fv
+                else:
+                    for i in range(n):
+                        outbuf[i, j] = values[i, idx]
 
 @cython.wraparound(False)
 @cython.boundscheck(False)
@@ -2177,15 +2248,16 @@ def take_2d_axis1_int32(ndarray[int32_t, ndim=2] values,
                     outbuf[i, j] = values[i, idx]
     else:
         fv = fill_value
-        for j in range(k):
-            idx = indexer[j]
+        with nogil:
+            for j in range(k):
+                idx = indexer[j]
 
-            if idx == -1:
-                for i in range(n):
-                    outbuf[i, j] = fv
-            else:
-                for i in range(n):
-                    outbuf[i, j] = values[i, idx]
+                if idx == -1:
+                    for i in range(n):
+                        outbuf[i, j] = fv
+                else:
+                    for i in range(n):
+                        outbuf[i, j] = values[i, idx]
 
 @cython.wraparound(False)
 @cython.boundscheck(False)
@@ -2217,15 +2289,16 @@ def take_2d_axis1_int64(ndarray[int64_t, ndim=2] values,
                     outbuf[i, j] = values[i, idx]
     else:
         fv = fill_value
-        for j in range(k):
-            idx = indexer[j]
+        with nogil:
+            for j in range(k):
+                idx = indexer[j]
 
-            if idx == -1:
-                for i in range(n):
-                    outbuf[i, j] = fv
-            else:
-                for i in range(n):
-                    outbuf[i, j] = values[i, idx]
+                if idx == -1:
+                    for i in range(n):
+                        outbuf[i, j] = fv
+                else:
+                    for i in range(n):
+                        outbuf[i, j] = values[i, idx]
 
 @cython.wraparound(False)
 @cython.boundscheck(False)
@@ -2257,15 +2330,16 @@ def take_2d_axis1_bool(ndarray[uint8_t, ndim=2] values,
                     outbuf[i, j] = values[i, idx]
     else:
         fv = fill_value
-        for j in range(k):
-            idx = indexer[j]
+        with nogil:
+            for j in range(k):
+                idx = indexer[j]
 
-            if idx == -1:
-                for i in range(n):
-                    outbuf[i, j] = fv
-            else:
-                for i in range(n):
-                    outbuf[i, j] = values[i, idx]
+                if idx == -1:
+                    for i in range(n):
+                        outbuf[i, j] = fv
+                else:
+                    for i in range(n):
+                        outbuf[i, j] = values[i, idx]
 
 
 @cython.wraparound(False)
@@ -2302,17 +2376,18 @@ def take_2d_multi_float64(ndarray[float64_t, ndim=2] values,
                         outbuf[i, j] = values[idx, idx1[j]]
     else:
         fv = fill_value
-        for i in range(n):
-            idx = idx0[i]
-            if idx == -1:
-                for j in range(k):
-                    outbuf[i, j] = fv
-            else:
-                for j in range(k):
-                    if idx1[j] == -1:
+        with nogil:
+            for i in range(n):
+                idx = idx0[i]
+                if idx == -1:
+                    for j in range(k):
                         outbuf[i, j] = fv
-                    else:
-                        outbuf[i, j] = values[idx, idx1[j]]
+                else:
+                    for j in range(k):
+                        if idx1[j] == -1:
+                            outbuf[i, j] = fv
+                        else:
+                            outbuf[i, j] = values[idx, idx1[j]]
 
 @cython.wraparound(False)
 @cython.boundscheck(False)
@@ -2348,17 +2423,18 @@ def take_2d_multi_object(ndarray[object, ndim=2] values,
                         outbuf[i, j] = values[idx, idx1[j]]
     else:
         fv = fill_value
-        for i in range(n):
-            idx = idx0[i]
-            if idx == -1:
-                for j in range(k):
-                    outbuf[i, j] = fv
-            else:
-                for j in range(k):
-                    if idx1[j] == -1:
+        if True:
+            for i in range(n):
+                idx = idx0[i]
+                if idx == -1:
+                    for j in range(k):
                         outbuf[i, j] = fv
-                    else:
-                        outbuf[i, j] = values[idx, idx1[j]]
+                else:
+                    for j in range(k):
+                        if idx1[j] == -1:
+                            outbuf[i, j] = fv
+                        else:
+                            outbuf[i, j] = values[idx, idx1[j]]
 
 @cython.wraparound(False)
 @cython.boundscheck(False)
@@ -2394,17 +2470,18 @@ def take_2d_multi_int32(ndarray[int32_t, ndim=2] values,
                         outbuf[i, j] = values[idx, idx1[j]]
     else:
         fv = fill_value
-        for i in range(n):
-            idx = idx0[i]
-            if idx == -1:
-                for j in range(k):
-                    outbuf[i, j] = fv
-            else:
-                for j in range(k):
-                    if idx1[j] == -1:
+        with nogil:
+            for i in range(n):
+                idx = idx0[i]
+                if idx == -1:
+                    for j in range(k):
                         outbuf[i, j] = fv
-                    else:
-                        outbuf[i, j] = values[idx, idx1[j]]
+                else:
+                    for j in range(k):
+                        if idx1[j] == -1:
+                            outbuf[i, j] = fv
+                        else:
+                            outbuf[i, j] = values[idx, idx1[j]]
 
 @cython.wraparound(False)
 @cython.boundscheck(False)
@@ -2440,17 +2517,18 @@ def take_2d_multi_int64(ndarray[int64_t, ndim=2] values,
                         outbuf[i, j] = values[idx, idx1[j]]
     else:
         fv = fill_value
-        for i in range(n):
-            idx = idx0[i]
-            if idx == -1:
-                for j in range(k):
-                    outbuf[i, j] = fv
-            else:
-                for j in range(k):
-                    if idx1[j] == -1:
+        with nogil:
+            for i in range(n):
+                idx = idx0[i]
+                if idx == -1:
+                    for j in range(k):
                         outbuf[i, j] = fv
-                    else:
-                        outbuf[i, j] = values[idx, idx1[j]]
+                else:
+                    for j in range(k):
+                        if idx1[j] == -1:
+                            outbuf[i, j] = fv
+                        else:
+                            outbuf[i, j] = values[idx, idx1[j]]
 
 @cython.wraparound(False)
 @cython.boundscheck(False)
@@ -2486,17 +2564,18 @@ def take_2d_multi_bool(ndarray[uint8_t, ndim=2] values,
                         outbuf[i, j] = values[idx, idx1[j]]
     else:
         fv = fill_value
-        for i in range(n):
-            idx = idx0[i]
-            if idx == -1:
-                for j in range(k):
-                    outbuf[i, j] = fv
-            else:
-                for j in range(k):
-                    if idx1[j] == -1:
+        with nogil:
+            for i in range(n):
+                idx = idx0[i]
+                if idx == -1:
+                    for j in range(k):
                         outbuf[i, j] = fv
-                    else:
-                        outbuf[i, j] = values[idx, idx1[j]]
+                else:
+                    for j in range(k):
+                        if idx1[j] == -1:
+                            outbuf[i, j] = fv
+                        else:
+                            outbuf[i, j] = values[idx, idx1[j]]
 
 
 @cython.wraparound(False)
@@ -2514,34 +2593,35 @@ def left_join_indexer_float64(ndarray[float64_t] left,
     nright = len(right)
 
     indexer = np.empty(nleft, dtype=np.int64)
-    while True:
-        if i == nleft:
-            break
-
-        if j == nright:
-            indexer[i] = -1
-            i += 1
-            continue
+    with nogil:
+        while True:
+            if i == nleft:
+                break
 
-        rval = right[j]
+            if j == nright:
+                indexer[i] = -1
+                i += 1
+                continue
 
-        while i < nleft - 1 and left[i] == rval:
-            indexer[i] = j
-            i += 1
+            rval = right[j]
 
-        if left[i] == right[j]:
-            indexer[i] = j
-            i += 1
             while i < nleft - 1 and left[i] == rval:
                 indexer[i] = j
                 i += 1
-            j += 1
-        elif left[i] > rval:
-            indexer[i] = -1
-            j += 1
-        else:
-            indexer[i] = -1
-            i += 1
+
+            if left[i] == right[j]:
+                indexer[i] = j
+                i += 1
+                while i < nleft - 1 and left[i] == rval:
+                    indexer[i] = j
+                    i += 1
+                j += 1
+            elif left[i] > rval:
+                indexer[i] = -1
+                j += 1
+            else:
+                indexer[i] = -1
+                i += 1
     return indexer
 
 @cython.wraparound(False)
@@ -2559,34 +2639,35 @@ def left_join_indexer_object(ndarray[object] left,
     nright = len(right)
 
     indexer = np.empty(nleft, dtype=np.int64)
-    while True:
-        if i == nleft:
-            break
-
-        if j == nright:
-            indexer[i] = -1
-            i += 1
-            continue
+    if True:
+        while True:
+            if i == nleft:
+                break
 
-        rval = right[j]
+            if j == nright:
+                indexer[i] = -1
+                i += 1
+                continue
 
-        while i < nleft - 1 and left[i] == rval:
-            indexer[i] = j
-            i += 1
+            rval = right[j]
 
-        if left[i] == right[j]:
-            indexer[i] = j
-            i += 1
             while i < nleft - 1 and left[i] == rval:
                 indexer[i] = j
                 i += 1
-            j += 1
-        elif left[i] > rval:
-            indexer[i] = -1
-            j += 1
-        else:
-            indexer[i] = -1
-            i += 1
+
+            if left[i] == right[j]:
+                indexer[i] = j
+                i += 1
+                while i < nleft - 1 and left[i] == rval:
+                    indexer[i] = j
+                    i += 1
+                j += 1
+            elif left[i] > rval:
+                indexer[i] = -1
+                j += 1
+            else:
+                indexer[i] = -1
+                i += 1
     return indexer
 
 @cython.wraparound(False)
@@ -2604,38 +2685,39 @@ def left_join_indexer_int32(ndarray[int32_t] left,
     nright = len(right)
 
     indexer = np.empty(nleft, dtype=np.int64)
-    while True:
-        if i == nleft:
-            break
-
-        if j == nright:
-            indexer[i] = -1
-            i += 1
-            continue
+    with nogil:
+        while True:
+            if i == nleft:
+                break
 
-        rval = right[j]
+            if j == nright:
+                indexer[i] = -1
+                i += 1
+                continue
 
-        while i < nleft - 1 and left[i] == rval:
-            indexer[i] = j
-            i += 1
+            rval = right[j]
 
-        if left[i] == right[j]:
-            indexer[i] = j
-            i += 1
             while i < nleft - 1 and left[i] == rval:
                 indexer[i] = j
                 i += 1
-            j += 1
-        elif left[i] > rval:
-            indexer[i] = -1
-            j += 1
-        else:
-            indexer[i] = -1
-            i += 1
-    return indexer
 
-@cython.wraparound(False)
-@cython.boundscheck(False)
+            if left[i] == right[j]:
+                indexer[i] = j
+                i += 1
+                while i < nleft - 1 and left[i] == rval:
+                    indexer[i] = j
+                    i += 1
+                j += 1
+            elif left[i] > rval:
+                indexer[i] = -1
+                j += 1
+            else:
+                indexer[i] = -1
+                i += 1
+    return indexer
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
 def left_join_indexer_int64(ndarray[int64_t] left,
                              ndarray[int64_t] right):
     cdef:
@@ -2649,34 +2731,35 @@ def left_join_indexer_int64(ndarray[int64_t] left,
     nright = len(right)
 
     indexer = np.empty(nleft, dtype=np.int64)
-    while True:
-        if i == nleft:
-            break
-
-        if j == nright:
-            indexer[i] = -1
-            i += 1
-            continue
+    with nogil:
+        while True:
+            if i == nleft:
+                break
 
-        rval = right[j]
+            if j == nright:
+                indexer[i] = -1
+                i += 1
+                continue
 
-        while i < nleft - 1 and left[i] == rval:
-            indexer[i] = j
-            i += 1
+            rval = right[j]
 
-        if left[i] == right[j]:
-            indexer[i] = j
-            i += 1
             while i < nleft - 1 and left[i] == rval:
                 indexer[i] = j
                 i += 1
-            j += 1
-        elif left[i] > rval:
-            indexer[i] = -1
-            j += 1
-        else:
-            indexer[i] = -1
-            i += 1
+
+            if left[i] == right[j]:
+                indexer[i] = j
+                i += 1
+                while i < nleft - 1 and left[i] == rval:
+                    indexer[i] = j
+                    i += 1
+                j += 1
+            elif left[i] > rval:
+                indexer[i] = -1
+                j += 1
+            else:
+                indexer[i] = -1
+                i += 1
     return indexer
 
 
@@ -2693,34 +2776,35 @@ def outer_join_indexer_float64(ndarray[float64_t] left,
     nleft = len(left)
     nright = len(right)
 
-    i = 0
-    j = 0
-    count = 0
-    while True:
-        if i == nleft:
-            if j == nright:
-                # we are done
-                break
-            else:
-                while j < nright:
-                    j += 1
+    with nogil:
+        i = 0
+        j = 0
+        count = 0
+        while True:
+            if i == nleft:
+                if j == nright:
+                    # we are done
+                    break
+                else:
+                    while j < nright:
+                        j += 1
+                        count += 1
+                    break
+            elif j == nright:
+                while i < nleft:
+                    i += 1
                     count += 1
                 break
-        elif j == nright:
-            while i < nleft:
-                i += 1
-                count += 1
-            break
-        else:
-            if left[i] == right[j]:
-                i += 1
-                j += 1
-            elif left[i] < right[j]:
-                i += 1
             else:
-                j += 1
+                if left[i] == right[j]:
+                    i += 1
+                    j += 1
+                elif left[i] < right[j]:
+                    i += 1
+                else:
+                    j += 1
 
-            count += 1
+                count += 1
 
     lindexer = np.empty(count, dtype=np.int64)
     rindexer = np.empty(count, dtype=np.int64)
@@ -2728,51 +2812,52 @@ def outer_join_indexer_float64(ndarray[float64_t] left,
 
     # do it again, but populate the indexers / result
 
-    i = 0
-    j = 0
-    count = 0
-    while True:
-        if i == nleft:
-            if j == nright:
-                # we are done
+    with nogil:
+        i = 0
+        j = 0
+        count = 0
+        while True:
+            if i == nleft:
+                if j == nright:
+                    # we are done
+                    break
+                else:
+                    while j < nright:
+                        lindexer[count] = -1
+                        rindexer[count] = j
+                        result[count] = right[j]
+                        j += 1
+                        count += 1
+                    break
+            elif j == nright:
+                while i < nleft:
+                    lindexer[count] = i
+                    rindexer[count] = -1
+                    result[count] = left[i]
+                    i += 1
+                    count += 1
                 break
             else:
-                while j < nright:
+                lval = left[i]
+                rval = right[j]
+                if lval == rval:
+                    lindexer[count] = i
+                    rindexer[count] = j
+                    result[count] = lval
+                    i += 1
+                    j += 1
+                elif lval < rval:
+                    lindexer[count] = i
+                    rindexer[count] = -1
+                    result[count] = lval
+                    i += 1
+                else:
                     lindexer[count] = -1
                     rindexer[count] = j
-                    result[count] = right[j]
+                    result[count] = rval
                     j += 1
-                    count += 1
-                break
-        elif j == nright:
-            while i < nleft:
-                lindexer[count] = i
-                rindexer[count] = -1
-                result[count] = left[i]
-                i += 1
-                count += 1
-            break
-        else:
-            lval = left[i]
-            rval = right[j]
-            if lval == rval:
-                lindexer[count] = i
-                rindexer[count] = j
-                result[count] = lval
-                i += 1
-                j += 1
-            elif lval < rval:
-                lindexer[count] = i
-                rindexer[count] = -1
-                result[count] = lval
-                i += 1
-            else:
-                lindexer[count] = -1
-                rindexer[count] = j
-                result[count] = rval
-                j += 1
 
-            count += 1
+                count += 1
 
     return result, lindexer, rindexer
 
@@ -2789,34 +2874,35 @@ def outer_join_indexer_object(ndarray[object] left,
     nleft = len(left)
     nright = len(right)
 
-    i = 0
-    j = 0
-    count = 0
-    while True:
-        if i == nleft:
-            if j == nright:
-                # we are done
-                break
-            else:
-                while j < nright:
-                    j += 1
+    if True:
+        i = 0
+        j = 0
+        count = 0
+        while True:
+            if i == nleft:
+                if j == nright:
+                    # we are done
+                    break
+                else:
+                    while j < nright:
+                        j += 1
+                        count += 1
+                    break
+            elif j == nright:
+                while i < nleft:
+                    i += 1
                     count += 1
                 break
-        elif j == nright:
-            while i < nleft:
-                i += 1
-                count += 1
-            break
-        else:
-            if left[i] == right[j]:
-                i += 1
-                j += 1
-            elif left[i] < right[j]:
-                i += 1
             else:
-                j += 1
+                if left[i] == right[j]:
+                    i += 1
+                    j += 1
+                elif left[i] < right[j]:
+                    i += 1
+                else:
+                    j += 1
 
-            count += 1
+                count += 1
 
     lindexer = np.empty(count, dtype=np.int64)
     rindexer = np.empty(count, dtype=np.int64)
@@ -2824,51 +2910,52 @@ def outer_join_indexer_object(ndarray[object] left,
 
     # do it again, but populate the indexers / result
 
-    i = 0
-    j = 0
-    count = 0
-    while True:
-        if i == nleft:
-            if j == nright:
-                # we are done
+    if True:
+        i = 0
+        j = 0
+        count = 0
+        while True:
+            if i == nleft:
+                if j == nright:
+                    # we are done
+                    break
+                else:
+                    while j < nright:
+                        lindexer[count] = -1
+                        rindexer[count] = j
+                        result[count] = right[j]
+                        j += 1
+                        count += 1
+                    break
+            elif j == nright:
+                while i < nleft:
+                    lindexer[count] = i
+                    rindexer[count] = -1
+                    result[count] = left[i]
+                    i += 1
+                    count += 1
                 break
             else:
-                while j < nright:
+                lval = left[i]
+                rval = right[j]
+                if lval == rval:
+                    lindexer[count] = i
+                    rindexer[count] = j
+                    result[count] = lval
+                    i += 1
+                    j += 1
+                elif lval < rval:
+                    lindexer[count] = i
+                    rindexer[count] = -1
+                    result[count] = lval
+                    i += 1
+                else:
                     lindexer[count] = -1
                     rindexer[count] = j
-                    result[count] = right[j]
+                    result[count] = rval
                     j += 1
-                    count += 1
-                break
-        elif j == nright:
-            while i < nleft:
-                lindexer[count] = i
-                rindexer[count] = -1
-                result[count] = left[i]
-                i += 1
-                count += 1
-            break
-        else:
-            lval = left[i]
-            rval = right[j]
-            if lval == rval:
-                lindexer[count] = i
-                rindexer[count] = j
-                result[count] = lval
-                i += 1
-                j += 1
-            elif lval < rval:
-                lindexer[count] = i
-                rindexer[count] = -1
-                result[count] = lval
-                i += 1
-            else:
-                lindexer[count] = -1
-                rindexer[count] = j
-                result[count] = rval
-                j += 1
 
-            count += 1
+                count += 1
 
     return result, lindexer, rindexer
 
@@ -2885,34 +2972,35 @@ def outer_join_indexer_int32(ndarray[int32_t] left,
     nleft = len(left)
     nright = len(right)
 
-    i = 0
-    j = 0
-    count = 0
-    while True:
-        if i == nleft:
-            if j == nright:
-                # we are done
-                break
-            else:
-                while j < nright:
-                    j += 1
+    with nogil:
+        i = 0
+        j = 0
+        count = 0
+        while True:
+            if i == nleft:
+                if j == nright:
+                    # we are done
+                    break
+                else:
+                    while j < nright:
+                        j += 1
+                        count += 1
+                    break
+            elif j == nright:
+                while i < nleft:
+                    i += 1
                     count += 1
                 break
-        elif j == nright:
-            while i < nleft:
-                i += 1
-                count += 1
-            break
-        else:
-            if left[i] == right[j]:
-                i += 1
-                j += 1
-            elif left[i] < right[j]:
-                i += 1
             else:
-                j += 1
+                if left[i] == right[j]:
+                    i += 1
+                    j += 1
+                elif left[i] < right[j]:
+                    i += 1
+                else:
+                    j += 1
 
-            count += 1
+                count += 1
 
     lindexer = np.empty(count, dtype=np.int64)
     rindexer = np.empty(count, dtype=np.int64)
@@ -2920,51 +3008,52 @@ def outer_join_indexer_int32(ndarray[int32_t] left,
 
     # do it again, but populate the indexers / result
 
-    i = 0
-    j = 0
-    count = 0
-    while True:
-        if i == nleft:
-            if j == nright:
-                # we are done
+    with nogil:
+        i = 0
+        j = 0
+        count = 0
+        while True:
+            if i == nleft:
+                if j == nright:
+                    # we are done
+                    break
+                else:
+                    while j < nright:
+                        lindexer[count] = -1
+                        rindexer[count] = j
+                        result[count] = right[j]
+                        j += 1
+                        count += 1
+                    break
+            elif j == nright:
+                while i < nleft:
+                    lindexer[count] = i
+                    rindexer[count] = -1
+                    result[count] = left[i]
+                    i += 1
+                    count += 1
                 break
             else:
-                while j < nright:
+                lval = left[i]
+                rval = right[j]
+                if lval == rval:
+                    lindexer[count] = i
+                    rindexer[count] = j
+                    result[count] = lval
+                    i += 1
+                    j += 1
+                elif lval < rval:
+                    lindexer[count] = i
+                    rindexer[count] = -1
+                    result[count] = lval
+                    i += 1
+                else:
                     lindexer[count] = -1
                     rindexer[count] = j
-                    result[count] = right[j]
+                    result[count] = rval
                     j += 1
-                    count += 1
-                break
-        elif j == nright:
-            while i < nleft:
-                lindexer[count] = i
-                rindexer[count] = -1
-                result[count] = left[i]
-                i += 1
-                count += 1
-            break
-        else:
-            lval = left[i]
-            rval = right[j]
-            if lval == rval:
-                lindexer[count] = i
-                rindexer[count] = j
-                result[count] = lval
-                i += 1
-                j += 1
-            elif lval < rval:
-                lindexer[count] = i
-                rindexer[count] = -1
-                result[count] = lval
-                i += 1
-            else:
-                lindexer[count] = -1
-                rindexer[count] = j
-                result[count] = rval
-                j += 1
 
-            count += 1
+                count += 1
 
     return result, lindexer, rindexer
 
@@ -2981,34 +3070,35 @@ def outer_join_indexer_int64(ndarray[int64_t] left,
     nleft = len(left)
     nright = len(right)
 
-    i = 0
-    j = 0
-    count = 0
-    while True:
-        if i == nleft:
-            if j == nright:
-                # we are done
-                break
-            else:
-                while j < nright:
-                    j += 1
+    with nogil:
+        i = 0
+        j = 0
+        count = 0
+        while True:
+            if i == nleft:
+                if j == nright:
+                    # we are done
+                    break
+                else:
+                    while j < nright:
+                        j += 1
+                        count += 1
+                    break
+            elif j == nright:
+                while i < nleft:
+                    i += 1
                     count += 1
                 break
-        elif j == nright:
-            while i < nleft:
-                i += 1
-                count += 1
-            break
-        else:
-            if left[i] == right[j]:
-                i += 1
-                j += 1
-            elif left[i] < right[j]:
-                i += 1
             else:
-                j += 1
+                if left[i] == right[j]:
+                    i += 1
+                    j += 1
+                elif left[i] < right[j]:
+                    i += 1
+                else:
+                    j += 1
 
-            count += 1
+                count += 1
 
     lindexer = np.empty(count, dtype=np.int64)
     rindexer = np.empty(count, dtype=np.int64)
@@ -3016,51 +3106,52 @@ def outer_join_indexer_int64(ndarray[int64_t] left,
 
     # do it again, but populate the indexers / result
 
-    i = 0
-    j = 0
-    count = 0
-    while True:
-        if i == nleft:
-            if j == nright:
-                # we are done
+    with nogil:
+        i = 0
+        j = 0
+        count = 0
+        while True:
+            if i == nleft:
+                if j == nright:
+                    # we are done
+                    break
+                else:
+                    while j < nright:
+                        lindexer[count] = -1
+                        rindexer[count] = j
+                        result[count] = right[j]
+                        j += 1
+                        count += 1
+                    break
+            elif j == nright:
+                while i < nleft:
+                    lindexer[count] = i
+                    rindexer[count] = -1
+                    result[count] = left[i]
+                    i += 1
+                    count += 1
                 break
             else:
-                while j < nright:
+                lval = left[i]
+                rval = right[j]
+                if lval == rval:
+                    lindexer[count] = i
+                    rindexer[count] = j
+                    result[count] = lval
+                    i += 1
+                    j += 1
+                elif lval < rval:
+                    lindexer[count] = i
+                    rindexer[count] = -1
+                    result[count] = lval
+                    i += 1
+                else:
                     lindexer[count] = -1
                     rindexer[count] = j
-                    result[count] = right[j]
+                    result[count] = rval
                     j += 1
-                    count += 1
-                break
-        elif j == nright:
-            while i < nleft:
-                lindexer[count] = i
-                rindexer[count] = -1
-                result[count] = left[i]
-                i += 1
-                count += 1
-            break
-        else:
-            lval = left[i]
-            rval = right[j]
-            if lval == rval:
-                lindexer[count] = i
-                rindexer[count] = j
-                result[count] = lval
-                i += 1
-                j += 1
-            elif lval < rval:
-                lindexer[count] = i
-                rindexer[count] = -1
-                result[count] = lval
-                i += 1
-            else:
-                lindexer[count] = -1
-                rindexer[count] = j
-                result[count] = rval
-                j += 1
 
-            count += 1
+                count += 1
 
     return result, lindexer, rindexer
 
@@ -3081,23 +3172,24 @@ def inner_join_indexer_float64(ndarray[float64_t] left,
     nleft = len(left)
     nright = len(right)
 
-    i = 0
-    j = 0
-    count = 0
-    while True:
-        if i == nleft or j == nright:
-             break
-        else:
-            lval = left[i]
-            rval = right[j]
-            if lval == rval:
-                i += 1
-                j += 1
-                count += 1
-            elif lval < rval:
-                i += 1
+    with nogil:
+        i = 0
+        j = 0
+        count = 0
+        while True:
+            if i == nleft or j == nright:
+                 break
             else:
-                j += 1
+                lval = left[i]
+                rval = right[j]
+                if lval == rval:
+                    i += 1
+                    j += 1
+                    count += 1
+                elif lval < rval:
+                    i += 1
+                else:
+                    j += 1
 
     # do it again now that result size is known
 
@@ -3105,26 +3197,27 @@ def inner_join_indexer_float64(ndarray[float64_t] left,
     rindexer = np.empty(count, dtype=np.int64)
     result = np.empty(count, dtype=np.float64)
 
-    i = 0
-    j = 0
-    count = 0
-    while True:
-        if i == nleft or j == nright:
-             break
-        else:
-            lval = left[i]
-            rval = right[j]
-            if lval == rval:
-                lindexer[count] = i
-                rindexer[count] = j
-                result[count] = lval
-                i += 1
-                j += 1
-                count += 1
-            elif lval < rval:
-                i += 1
+    with nogil:
+        i = 0
+        j = 0
+        count = 0
+        while True:
+            if i == nleft or j == nright:
+                 break
             else:
-                j += 1
+                lval = left[i]
+                rval = right[j]
+                if lval == rval:
+                    lindexer[count] = i
+                    rindexer[count] = j
+                    result[count] = lval
+                    i += 1
+                    j += 1
+                    count += 1
+                elif lval < rval:
+                    i += 1
+                else:
+                    j += 1
 
     return result, lindexer, rindexer
 
@@ -3144,23 +3237,24 @@ def inner_join_indexer_object(ndarray[object] left,
     nleft = len(left)
     nright = len(right)
 
-    i = 0
-    j = 0
-    count = 0
-    while True:
-        if i == nleft or j == nright:
-             break
-        else:
-            lval = left[i]
-            rval = right[j]
-            if lval == rval:
-                i += 1
-                j += 1
-                count += 1
-            elif lval < rval:
-                i += 1
+    if True:
+        i = 0
+        j = 0
+        count = 0
+        while True:
+            if i == nleft or j == nright:
+                 break
             else:
-                j += 1
+                lval = left[i]
+                rval = right[j]
+                if lval == rval:
+                    i += 1
+                    j += 1
+                    count += 1
+                elif lval < rval:
+                    i += 1
+                else:
+                    j += 1
 
     # do it again now that result size is known
 
@@ -3168,26 +3262,27 @@ def inner_join_indexer_object(ndarray[object] left,
     rindexer = np.empty(count, dtype=np.int64)
     result = np.empty(count, dtype=object)
 
-    i = 0
-    j = 0
-    count = 0
-    while True:
-        if i == nleft or j == nright:
-             break
-        else:
-            lval = left[i]
-            rval = right[j]
-            if lval == rval:
-                lindexer[count] = i
-                rindexer[count] = j
-                result[count] = lval
-                i += 1
-                j += 1
-                count += 1
-            elif lval < rval:
-                i += 1
+    if True:
+        i = 0
+        j = 0
+        count = 0
+        while True:
+            if i == nleft or j == nright:
+                 break
             else:
-                j += 1
+                lval = left[i]
+                rval = right[j]
+                if lval == rval:
+                    lindexer[count] = i
+                    rindexer[count] = j
+                    result[count] = lval
+                    i += 1
+                    j += 1
+                    count += 1
+                elif lval < rval:
+                    i += 1
+                else:
+                    j += 1
 
     return result, lindexer, rindexer
 
@@ -3207,23 +3302,24 @@ def inner_join_indexer_int32(ndarray[int32_t] left,
     nleft = len(left)
     nright = len(right)
 
-    i = 0
-    j = 0
-    count = 0
-    while True:
-        if i == nleft or j == nright:
-             break
-        else:
-            lval = left[i]
-            rval = right[j]
-            if lval == rval:
-                i += 1
-                j += 1
-                count += 1
-            elif lval < rval:
-                i += 1
+    with nogil:
+        i = 0
+        j = 0
+        count = 0
+        while True:
+            if i == nleft or j == nright:
+                 break
             else:
-                j += 1
+                lval = left[i]
+                rval = right[j]
+                if lval == rval:
+                    i += 1
+                    j += 1
+                    count += 1
+                elif lval < rval:
+                    i += 1
+                else:
+                    j += 1
 
     # do it again now that result size is known
 
@@ -3231,26 +3327,27 @@ def inner_join_indexer_int32(ndarray[int32_t] left,
     rindexer = np.empty(count, dtype=np.int64)
     result = np.empty(count, dtype=np.int32)
 
-    i = 0
-    j = 0
-    count = 0
-    while True:
-        if i == nleft or j == nright:
-             break
-        else:
-            lval = left[i]
-            rval = right[j]
-            if lval == rval:
-                lindexer[count] = i
-                rindexer[count] = j
-                result[count] = lval
-                i += 1
-                j += 1
-                count += 1
-            elif lval < rval:
-                i += 1
+    with nogil:
+        i = 0
+        j = 0
+        count = 0
+        while True:
+            if i == nleft or j == nright:
+                 break
             else:
-                j += 1
+                lval = left[i]
+                rval = right[j]
+                if lval == rval:
+                    lindexer[count] = i
+                    rindexer[count] = j
+                    result[count] = lval
+                    i += 1
+                    j += 1
+                    count += 1
+                elif lval < rval:
+                    i += 1
+                else:
+                    j += 1
 
     return result, lindexer, rindexer
 
@@ -3270,52 +3367,2159 @@ def inner_join_indexer_int64(ndarray[int64_t] left,
     nleft = len(left)
     nright = len(right)
 
-    i = 0
-    j = 0
-    count = 0
-    while True:
-        if i == nleft or j == nright:
-             break
-        else:
-            lval = left[i]
-            rval = right[j]
-            if lval == rval:
-                i += 1
-                j += 1
-                count += 1
-            elif lval < rval:
-                i += 1
+    with nogil:
+        i = 0
+        j = 0
+        count = 0
+        while True:
+            if i == nleft or j == nright:
+                 break
             else:
-                j += 1
+                lval = left[i]
+                rval = right[j]
+                if lval == rval:
+                    i += 1
+                    j += 1
+                    count += 1
+                elif lval < rval:
+                    i += 1
+                else:
+                    j += 1
+
+    # do it again now that result size is known
+
+    lindexer = np.empty(count, dtype=np.int64)
+    rindexer = np.empty(count, dtype=np.int64)
+    result = np.empty(count, dtype=np.int64)
+
+    with nogil:
+        i = 0
+        j = 0
+        count = 0
+        while True:
+            if i == nleft or j == nright:
+                 break
+            else:
+                lval = left[i]
+                rval = right[j]
+                if lval == rval:
+                    lindexer[count] = i
+                    rindexer[count] = j
+                    result[count] = lval
+                    i += 1
+                    j += 1
+                    count += 1
+                elif lval < rval:
+                    i += 1
+                else:
+                    j += 1
+
+    return result, lindexer, rindexer
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def group_nth_float32(ndarray[float32_t, ndim=2] out,
+                       ndarray[int64_t] counts,
+                       ndarray[float32_t, ndim=2] values,
+                       ndarray[int64_t] labels, int64_t rank):
+    '''
+    Only aggregates on axis=0
+    '''
+    cdef:
+        Py_ssize_t i, j, N, K, lab, ncounts
+        float32_t val
+        ndarray[float32_t, ndim=2] resx
+        ndarray[int64_t, ndim=2] nobs
+
+    nobs = np.zeros((<object> out).shape, dtype=np.int64)
+    resx = np.empty_like(out)
+
+    N, K = (<object> values).shape
+
+    ncounts = len(counts)
+
+    with nogil:
+        for i in range(N):
+            lab = labels[i]
+            if lab < 0:
+                continue
+
+            counts[lab] += 1
+            for j in range(K):
+                val = values[i, j]
+
+                # not nan
+                if val == val:
+                    nobs[lab, j] += 1
+                    if nobs[lab, j] == rank:
+                        resx[lab, j] = val
+
+        for i in range(ncounts):
+            for j in range(K):
+                if nobs[i, j] < rank:
+                    out[i, j] = nan
+                else:
+                    out[i, j] = resx[i, j]
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def group_nth_int64(ndarray[int64_t, ndim=2] out,
+                       ndarray[int64_t] counts,
+                       ndarray[int64_t, ndim=2] values,
+                       ndarray[int64_t] labels, int64_t rank):
+    '''
+    Only aggregates on axis=0
+    '''
+    cdef:
+        Py_ssize_t i, j, N, K, lab, ncounts
+        int64_t val
+        ndarray[int64_t, ndim=2] resx
+        ndarray[int64_t, ndim=2] nobs
+
+    nobs = np.zeros((<object> out).shape, dtype=np.int64)
+    resx = np.empty_like(out)
+
+    N, K = (<object> values).shape
+
+    ncounts = len(counts)
+
+    with nogil:
+        for i in range(N):
+            lab = labels[i]
+            if lab < 0:
+                continue
+
+            counts[lab] += 1
+            for j in range(K):
+                val = values[i, j]
+
+                # not nan
+                if True:
+                    nobs[lab, j] += 1
+                    if nobs[lab, j] == rank:
+                        resx[lab, j] = val
+
+        for i in range(ncounts):
+            for j in range(K):
+                if nobs[i, j] < rank:
+                    out[i, j] = iNaT
+                else:
+                    out[i, j] = resx[i, j]
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def group_nth_int32(ndarray[int32_t, ndim=2] out,
+                       ndarray[int64_t] counts,
+                       ndarray[int32_t, ndim=2] values,
+                       ndarray[int64_t] labels, int64_t rank):
+    '''
+    Only aggregates on axis=0
+    '''
+    cdef:
+        Py_ssize_t i, j, N, K, lab, ncounts
+        int32_t val
+        ndarray[int32_t, ndim=2] resx
+        ndarray[int64_t, ndim=2] nobs
+
+    nobs = np.zeros((<object> out).shape, dtype=np.int64)
+    resx = np.empty_like(out)
+
+    N, K = (<object> values).shape
+
+    ncounts = len(counts)
+
+    with nogil:
+        for i in range(N):
+            lab = labels[i]
+            if lab < 0:
+                continue
+
+            counts[lab] += 1
+            for j in range(K):
+                val = values[i, j]
+
+                # not nan
+                if True:
+                    nobs[lab, j] += 1
+                    if nobs[lab, j] == rank:
+                        resx[lab, j] = val
+
+        for i in range(ncounts):
+            for j in range(K):
+                if nobs[i, j] < rank:
+                    out[i, j] = INT32_NA
+                else:
+                    out[i, j] = resx[i, j]
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def group_nth_datetime(ndarray[int64_t, ndim=2] out,
+                       ndarray[int64_t] counts,
+                       ndarray[int64_t, ndim=2] values,
+                       ndarray[int64_t] labels, int64_t rank):
+    '''
+    Only aggregates on axis=0
+    '''
+    cdef:
+        Py_ssize_t i, j, N, K, lab, ncounts
+        int64_t val
+        ndarray[int64_t, ndim=2] resx
+        ndarray[int64_t, ndim=2] nobs
+
+    nobs = np.zeros((<object> out).shape, dtype=np.int64)
+    resx = np.empty_like(out)
+
+    N, K = (<object> values).shape
+
+    ncounts = len(counts)
+
+    with nogil:
+        for i in range(N):
+            lab = labels[i]
+            if lab < 0:
+                continue
+
+            counts[lab] += 1
+            for j in range(K):
+                val = values[i, j]
+
+                # not nan
+                if val != iNaT:
+                    nobs[lab, j] += 1
+                    if nobs[lab, j] == rank:
+                        resx[lab, j] = val
+
+        for i in range(ncounts):
+            for j in range(K):
+                if nobs[i, j] < rank:
+                    out[i, j] = iNaT
+                else:
+                    out[i, j] = resx[i, j]
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def group_nth_bin_float32(ndarray[float32_t, ndim=2] out,
+                           ndarray[int64_t] counts,
+                           ndarray[float32_t, ndim=2] values,
+                           ndarray[int64_t] bins, int64_t rank):
+    '''
+    Only aggregates on axis=0
+    '''
+    cdef:
+        Py_ssize_t i, j, N, K, ngroups, b
+        float32_t val
+        ndarray[float32_t, ndim=2] resx
+        ndarray[int64_t, ndim=2] nobs
+
+    nobs = np.zeros((<object> out).shape, dtype=np.int64)
+    resx = np.empty_like(out)
+
+    if bins[len(bins) - 1] == len(values):
+        ngroups = len(bins)
+    else:
+        ngroups = len(bins) + 1
+
+    N, K = (<object> values).shape
+
+    with nogil:
+        b = 0
+        for i in range(N):
+            while b < ngroups - 1 and i >= bins[b]:
+                b += 1
+
+            counts[b] += 1
+            for j in range(K):
+                val = values[i, j]
+
+                # not nan
+                if val == val:
+                    nobs[b, j] += 1
+                    if nobs[b, j] == rank:
+                        resx[b, j] = val
+
+        for i in range(ngroups):
+            for j in range(K):
+                if nobs[i, j] < rank:
+                    out[i, j] = nan
+                else:
+                    out[i, j] = resx[i, j]
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def group_nth_bin_int64(ndarray[int64_t, ndim=2] out,
+                           ndarray[int64_t] counts,
+                           ndarray[int64_t, ndim=2] values,
+                           ndarray[int64_t] bins, int64_t rank):
+    '''
+    Only aggregates on axis=0
+    '''
+    cdef:
+        Py_ssize_t i, j, N, K, ngroups, b
+        int64_t val
+        ndarray[int64_t, ndim=2] resx
+        ndarray[int64_t, ndim=2] nobs
+
+    nobs = np.zeros((<object> out).shape, dtype=np.int64)
+    resx = np.empty_like(out)
+
+    if bins[len(bins) - 1] == len(values):
+        ngroups = len(bins)
+    else:
+        ngroups = len(bins) + 1
+
+    N, K = (<object> values).shape
+
+    with nogil:
+        b = 0
+        for i in range(N):
+            while b < ngroups - 1 and i >= bins[b]:
+                b += 1
+
+            counts[b] += 1
+            for j in range(K):
+                val = values[i, j]
+
+                # not nan
+                if True:
+                    nobs[b, j] += 1
+                    if nobs[b, j] == rank:
+                        resx[b, j] = val
+
+        for i in range(ngroups):
+            for j in range(K):
+                if nobs[i, j] < rank:
+                    out[i, j] = iNaT
+                else:
+                    out[i, j] = resx[i, j]
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def group_nth_bin_int32(ndarray[int32_t, ndim=2] out,
+                           ndarray[int64_t] counts,
+                           ndarray[int32_t, ndim=2] values,
+                           ndarray[int64_t] bins, int64_t rank):
+    '''
+    Only aggregates on axis=0
+    '''
+    cdef:
+        Py_ssize_t i, j, N, K, ngroups, b
+        int32_t val
+        ndarray[int32_t, ndim=2] resx
+        ndarray[int64_t, ndim=2] nobs
+
+    nobs = np.zeros((<object> out).shape, dtype=np.int64)
+    resx = np.empty_like(out)
+
+    if bins[len(bins) - 1] == len(values):
+        ngroups = len(bins)
+    else:
+        ngroups = len(bins) + 1
+
+    N, K = (<object> values).shape
+
+    with nogil:
+        b = 0
+        for i in range(N):
+            while b < ngroups - 1 and i >= bins[b]:
+                b += 1
+
+            counts[b] += 1
+            for j in range(K):
+                val = values[i, j]
+
+                # not nan
+                if True:
+                    nobs[b, j] += 1
+                    if nobs[b, j] == rank:
+                        resx[b, j] = val
+
+        for i in range(ngroups):
+            for j in range(K):
+                if nobs[i, j] < rank:
+                    out[i, j] = INT32_NA
+                else:
+                    out[i, j] = resx[i, j]
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def group_nth_bin_datetime(ndarray[int64_t, ndim=2] out,
+                           ndarray[int64_t] counts,
+                           ndarray[int64_t, ndim=2] values,
+                           ndarray[int64_t] bins, int64_t rank):
+    '''
+    Only aggregates on axis=0
+    '''
+    cdef:
+        Py_ssize_t i, j, N, K, ngroups, b
+        int64_t val
+        ndarray[int64_t, ndim=2] resx
+        ndarray[int64_t, ndim=2] nobs
+
+    nobs = np.zeros((<object> out).shape, dtype=np.int64)
+    resx = np.empty_like(out)
+
+    if bins[len(bins) - 1] == len(values):
+        ngroups = len(bins)
+    else:
+        ngroups = len(bins) + 1
+
+    N, K = (<object> values).shape
+
+    with nogil:
+        b = 0
+        for i in range(N):
+            while b < ngroups - 1 and i >= bins[b]:
+                b += 1
+
+            counts[b] += 1
+            for j in range(K):
+                val = values[i, j]
+
+                # not nan
+                if val != iNaT:
+                    nobs[b, j] += 1
+                    if nobs[b, j] == rank:
+                        resx[b, j] = val
+
+        for i in range(ngroups):
+            for j in range(K):
+                if nobs[i, j] < rank:
+                    out[i, j] = iNaT
+                else:
+                    out[i, j] = resx[i, j]
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def group_last_float32(ndarray[float32_t, ndim=2] out,
+                        ndarray[int64_t] counts,
+                        ndarray[float32_t, ndim=2] values,
+                        ndarray[int64_t] labels):
+    '''
+    Only aggregates on axis=0
+    '''
+    cdef:
+        Py_ssize_t i, j, N, K, lab, ncounts
+        float32_t val
+        ndarray[float32_t, ndim=2] resx
+        ndarray[int64_t, ndim=2] nobs
+
+    nobs = np.zeros((<object> out).shape, dtype=np.int64)
+    resx = np.empty_like(out)
+
+    N, K = (<object> values).shape
+
+    ncounts = len(counts)
+
+    with nogil:
+        for i in range(N):
+            lab = labels[i]
+            if lab < 0:
+                continue
+
+            counts[lab] += 1
+            for j in range(K):
+                val = values[i, j]
+
+                # not nan
+                if val == val:
+                    nobs[lab, j] += 1
+                    resx[lab, j] = val
+
+        for i in range(ncounts):
+            for j in range(K):
+                if nobs[i, j] == 0:
+                    out[i, j] = nan
+                else:
+                    out[i, j] = resx[i, j]
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def group_last_int64(ndarray[int64_t, ndim=2] out,
+                        ndarray[int64_t] counts,
+                        ndarray[int64_t, ndim=2] values,
+                        ndarray[int64_t] labels):
+    '''
+    Only aggregates on axis=0
+    '''
+    cdef:
+        Py_ssize_t i, j, N, K, lab, ncounts
+        int64_t val
+        ndarray[int64_t, ndim=2] resx
+        ndarray[int64_t, ndim=2] nobs
+
+    nobs = np.zeros((<object> out).shape, dtype=np.int64)
+    resx = np.empty_like(out)
+
+    N, K = (<object> values).shape
+
+    ncounts = len(counts)
+
+    with nogil:
+        for i in range(N):
+            lab = labels[i]
+            if lab < 0:
+                continue
+
+            counts[lab] += 1
+            for j in range(K):
+                val = values[i, j]
+
+                # not nan
+                if True:
+                    nobs[lab, j] += 1
+                    resx[lab, j] = val
+
+        for i in range(ncounts):
+            for j in range(K):
+                if nobs[i, j] == 0:
+                    out[i, j] = iNaT
+                else:
+                    out[i, j] = resx[i, j]
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def group_last_int32(ndarray[int32_t, ndim=2] out,
+                        ndarray[int64_t] counts,
+                        ndarray[int32_t, ndim=2] values,
+                        ndarray[int64_t] labels):
+    '''
+    Only aggregates on axis=0
+    '''
+    cdef:
+        Py_ssize_t i, j, N, K, lab, ncounts
+        int32_t val
+        ndarray[int32_t, ndim=2] resx
+        ndarray[int64_t, ndim=2] nobs
+
+    nobs = np.zeros((<object> out).shape, dtype=np.int64)
+    resx = np.empty_like(out)
+
+    N, K = (<object> values).shape
+
+    ncounts = len(counts)
+
+    with nogil:
+        for i in range(N):
+            lab = labels[i]
+            if lab < 0:
+                continue
+
+            counts[lab] += 1
+            for j in range(K):
+                val = values[i, j]
+
+                # not nan
+                if True:
+                    nobs[lab, j] += 1
+                    resx[lab, j] = val
+
+        for i in range(ncounts):
+            for j in range(K):
+                if nobs[i, j] == 0:
+                    out[i, j] = INT32_NA
+                else:
+                    out[i, j] = resx[i, j]
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def group_last_datetime(ndarray[int64_t, ndim=2] out,
+                        ndarray[int64_t] counts,
+                        ndarray[int64_t, ndim=2] values,
+                        ndarray[int64_t] labels):
+    '''
+    Only aggregates on axis=0
+    '''
+    cdef:
+        Py_ssize_t i, j, N, K, lab, ncounts
+        int64_t val
+        ndarray[int64_t, ndim=2] resx
+        ndarray[int64_t, ndim=2] nobs
+
+    nobs = np.zeros((<object> out).shape, dtype=np.int64)
+    resx = np.empty_like(out)
+
+    N, K = (<object> values).shape
+
+    ncounts = len(counts)
+
+    with nogil:
+        for i in range(N):
+            lab = labels[i]
+            if lab < 0:
+                continue
+
+            counts[lab] += 1
+            for j in range(K):
+                val = values[i, j]
+
+                # not nan
+                if val != iNaT:
+                    nobs[lab, j] += 1
+                    resx[lab, j] = val
+
+        for i in range(ncounts):
+            for j in range(K):
+                if nobs[i, j] == 0:
+                    out[i, j] = iNaT
+                else:
+                    out[i, j] = resx[i, j]
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def group_last_bin_float32(ndarray[float32_t, ndim=2] out,
+                            ndarray[int64_t] counts,
+                            ndarray[float32_t, ndim=2] values,
+                            ndarray[int64_t] bins):
+    '''
+    Only aggregates on axis=0
+    '''
+    cdef:
+        Py_ssize_t i, j, N, K, ngroups, b
+        float32_t val
+        ndarray[float32_t, ndim=2] resx
+        ndarray[int64_t, ndim=2] nobs
+
+    nobs = np.zeros((<object> out).shape, dtype=np.int64)
+    resx = np.empty_like(out)
+
+    if bins[len(bins) - 1] == len(values):
+        ngroups = len(bins)
+    else:
+        ngroups = len(bins) + 1
+
+    N, K = (<object> values).shape
+
+    with nogil:
+        b = 0
+        for i in range(N):
+            while b < ngroups - 1 and i >= bins[b]:
+                b += 1
+
+            counts[b] += 1
+            for j in range(K):
+                val = values[i, j]
+
+                # not nan
+                if val == val:
+                    nobs[b, j] += 1
+                    resx[b, j] = val
+
+        for i in range(ngroups):
+            for j in range(K):
+                if nobs[i, j] == 0:
+                    out[i, j] = nan
+                else:
+                    out[i, j] = resx[i, j]
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def group_last_bin_int64(ndarray[int64_t, ndim=2] out,
+                            ndarray[int64_t] counts,
+                            ndarray[int64_t, ndim=2] values,
+                            ndarray[int64_t] bins):
+    '''
+    Only aggregates on axis=0
+    '''
+    cdef:
+        Py_ssize_t i, j, N, K, ngroups, b
+        int64_t val
+        ndarray[int64_t, ndim=2] resx
+        ndarray[int64_t, ndim=2] nobs
+
+    nobs = np.zeros((<object> out).shape, dtype=np.int64)
+    resx = np.empty_like(out)
+
+    if bins[len(bins) - 1] == len(values):
+        ngroups = len(bins)
+    else:
+        ngroups = len(bins) + 1
+
+    N, K = (<object> values).shape
+
+    with nogil:
+        b = 0
+        for i in range(N):
+            while b < ngroups - 1 and i >= bins[b]:
+                b += 1
+
+            counts[b] += 1
+            for j in range(K):
+                val = values[i, j]
+
+                # not nan
+                if True:
+                    nobs[b, j] += 1
+                    resx[b, j] = val
+
+        for i in range(ngroups):
+            for j in range(K):
+                if nobs[i, j] == 0:
+                    out[i, j] = iNaT
+                else:
+                    out[i, j] = resx[i, j]
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def group_last_bin_int32(ndarray[int32_t, ndim=2] out,
+                            ndarray[int64_t] counts,
+                            ndarray[int32_t, ndim=2] values,
+                            ndarray[int64_t] bins):
+    '''
+    Only aggregates on axis=0
+    '''
+    cdef:
+        Py_ssize_t i, j, N, K, ngroups, b
+        int32_t val
+        ndarray[int32_t, ndim=2] resx
+        ndarray[int64_t, ndim=2] nobs
+
+    nobs = np.zeros((<object> out).shape, dtype=np.int64)
+    resx = np.empty_like(out)
+
+    if bins[len(bins) - 1] == len(values):
+        ngroups = len(bins)
+    else:
+        ngroups = len(bins) + 1
+
+    N, K = (<object> values).shape
+
+    with nogil:
+        b = 0
+        for i in range(N):
+            while b < ngroups - 1 and i >= bins[b]:
+                b += 1
+
+            counts[b] += 1
+            for j in range(K):
+                val = values[i, j]
+
+                # not nan
+                if True:
+                    nobs[b, j] += 1
+                    resx[b, j] = val
+
+        for i in range(ngroups):
+            for j in range(K):
+                if nobs[i, j] == 0:
+                    out[i, j] = INT32_NA
+                else:
+                    out[i, j] = resx[i, j]
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def group_last_bin_datetime(ndarray[int64_t, ndim=2] out,
+                            ndarray[int64_t] counts,
+                            ndarray[int64_t, ndim=2] values,
+                            ndarray[int64_t] bins):
+    '''
+    Only aggregates on axis=0
+    '''
+    cdef:
+        Py_ssize_t i, j, N, K, ngroups, b
+        int64_t val
+        ndarray[int64_t, ndim=2] resx
+        ndarray[int64_t, ndim=2] nobs
+
+    nobs = np.zeros((<object> out).shape, dtype=np.int64)
+    resx = np.empty_like(out)
+
+    if bins[len(bins) - 1] == len(values):
+        ngroups = len(bins)
+    else:
+        ngroups = len(bins) + 1
+
+    N, K = (<object> values).shape
+
+    with nogil:
+        b = 0
+        for i in range(N):
+            while b < ngroups - 1 and i >= bins[b]:
+                b += 1
+
+            counts[b] += 1
+            for j in range(K):
+                val = values[i, j]
+
+                # not nan
+                if val != iNaT:
+                    nobs[b, j] += 1
+                    resx[b, j] = val
+
+        for i in range(ngroups):
+            for j in range(K):
+                if nobs[i, j] == 0:
+                    out[i, j] = iNaT
+                else:
+                    out[i, j] = resx[i, j]
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def group_min_float32(ndarray[float32_t, ndim=2] out,
+                       ndarray[int64_t] counts,
+                       ndarray[float32_t, ndim=2] values,
+                       ndarray[int64_t] labels):
+    '''
+    Only aggregates on axis=0
+    '''
+    cdef:
+        Py_ssize_t i, j, N, K, lab, ncounts
+        float32_t val
+        ndarray[float32_t, ndim=2] minx
+        ndarray[int64_t, ndim=2] nobs
+
+    nobs = np.zeros((<object> out).shape, dtype=np.int64)
+
+    minx = np.empty_like(out)
+    minx.fill(np.inf)
+
+    N, K = (<object> values).shape
+
+    ncounts = len(counts)
+
+    with nogil:
+        for i in range(N):
+            lab = labels[i]
+            if lab < 0:
+                continue
+
+            counts[lab] += 1
+            for j in range(K):
+                val = values[i, j]
+
+                # not nan
+                if val == val:
+                    nobs[lab, j] += 1
+                    if val < minx[lab, j]:
+                        minx[lab, j] = val
+
+        for i in range(ncounts):
+            for j in range(K):
+                if nobs[i, j] == 0:
+                    out[i, j] = nan
+                else:
+                    out[i, j] = minx[i, j]
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def group_min_int64(ndarray[int64_t, ndim=2] out,
+                       ndarray[int64_t] counts,
+                       ndarray[int64_t, ndim=2] values,
+                       ndarray[int64_t] labels):
+    '''
+    Only aggregates on axis=0
+    '''
+    cdef:
+        Py_ssize_t i, j, N, K, lab, ncounts
+        int64_t val
+        ndarray[int64_t, ndim=2] minx
+        ndarray[int64_t, ndim=2] nobs
+
+    nobs = np.zeros((<object> out).shape, dtype=np.int64)
+
+    minx = np.empty_like(out)
+    minx.fill(np.iinfo(np.int64).max)
+
+    N, K = (<object> values).shape
+
+    ncounts = len(counts)
+
+    with nogil:
+        for i in range(N):
+            lab = labels[i]
+            if lab < 0:
+                continue
+
+            counts[lab] += 1
+            for j in range(K):
+                val = values[i, j]
+
+                # not nan
+                if True:
+                    nobs[lab, j] += 1
+                    if val < minx[lab, j]:
+                        minx[lab, j] = val
+
+        for i in range(ncounts):
+            for j in range(K):
+                if nobs[i, j] == 0:
+                    out[i, j] = iNaT
+                else:
+                    out[i, j] = minx[i, j]
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def group_min_int32(ndarray[int32_t, ndim=2] out,
+                       ndarray[int64_t] counts,
+                       ndarray[int32_t, ndim=2] values,
+                       ndarray[int64_t] labels):
+    '''
+    Only aggregates on axis=0
+    '''
+    cdef:
+        Py_ssize_t i, j, N, K, lab, ncounts
+        int32_t val
+        ndarray[int32_t, ndim=2] minx
+        ndarray[int64_t, ndim=2] nobs
+
+    nobs = np.zeros((<object> out).shape, dtype=np.int64)
+
+    minx = np.empty_like(out)
+    minx.fill(np.iinfo(np.int32).max)
+
+    N, K = (<object> values).shape
+
+    ncounts = len(counts)
+
+    with nogil:
+        for i in range(N):
+            lab = labels[i]
+            if lab < 0:
+                continue
+
+            counts[lab] += 1
+            for j in range(K):
+                val = values[i, j]
+
+                # not nan
+                if True:
+                    nobs[lab, j] += 1
+                    if val < minx[lab, j]:
+                        minx[lab, j] = val
+
+        for i in range(ncounts):
+            for j in range(K):
+                if nobs[i, j] == 0:
+                    out[i, j] = INT32_NA
+                else:
+                    out[i, j] = minx[i, j]
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def group_min_datetime(ndarray[int64_t, ndim=2] out,
+                       ndarray[int64_t] counts,
+                       ndarray[int64_t, ndim=2] values,
+                       ndarray[int64_t] labels):
+    '''
+    Only aggregates on axis=0
+    '''
+    cdef:
+        Py_ssize_t i, j, N, K, lab, ncounts
+        int64_t val
+        ndarray[int64_t, ndim=2] minx
+        ndarray[int64_t, ndim=2] nobs
+
+    nobs = np.zeros((<object> out).shape, dtype=np.int64)
+
+    minx = np.empty_like(out)
+    minx.fill(np.iinfo(np.int64).max)
+
+    N, K = (<object> values).shape
+
+    ncounts = len(counts)
+
+    with nogil:
+        for i in range(N):
+            lab = labels[i]
+            if lab < 0:
+                continue
+
+            counts[lab] += 1
+            for j in range(K):
+                val = values[i, j]
+
+                # not nan
+                if val != iNaT:
+                    nobs[lab, j] += 1
+                    if val < minx[lab, j]:
+                        minx[lab, j] = val
+
+        for i in range(ncounts):
+            for j in range(K):
+                if nobs[i, j] == 0:
+                    out[i, j] = iNaT
+                else:
+                    out[i, j] = minx[i, j]
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def group_min_bin_float32(ndarray[float32_t, ndim=2] out,
+                           ndarray[int64_t] counts,
+                           ndarray[float32_t, ndim=2] values,
+                           ndarray[int64_t] bins):
+    '''
+    Only aggregates on axis=0
+    '''
+    cdef:
+        Py_ssize_t i, j, N, K, ngroups, b
+        float32_t val
+        ndarray[float32_t, ndim=2] minx
+        ndarray[int64_t, ndim=2] nobs
+
+    nobs = np.zeros((<object> out).shape, dtype=np.int64)
+
+    minx = np.empty_like(out)
+    minx.fill(np.inf)
+
+    if bins[len(bins) - 1] == len(values):
+        ngroups = len(bins)
+    else:
+        ngroups = len(bins) + 1
+
+    N, K = (<object> values).shape
+
+    with nogil:
+        b = 0
+        for i in range(N):
+            while b < ngroups - 1 and i >= bins[b]:
+                b += 1
+
+            counts[b] += 1
+            for j in range(K):
+                val = values[i, j]
+
+                # not nan
+                if val == val:
+                    nobs[b, j] += 1
+                    if val < minx[b, j]:
+                        minx[b, j] = val
+
+        for i in range(ngroups):
+            for j in range(K):
+                if nobs[i, j] == 0:
+                    out[i, j] = nan
+                else:
+                    out[i, j] = minx[i, j]
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def group_min_bin_int64(ndarray[int64_t, ndim=2] out,
+                           ndarray[int64_t] counts,
+                           ndarray[int64_t, ndim=2] values,
+                           ndarray[int64_t] bins):
+    '''
+    Only aggregates on axis=0
+    '''
+    cdef:
+        Py_ssize_t i, j, N, K, ngroups, b
+        int64_t val
+        ndarray[int64_t, ndim=2] minx
+        ndarray[int64_t, ndim=2] nobs
+
+    nobs = np.zeros((<object> out).shape, dtype=np.int64)
+
+    minx = np.empty_like(out)
+    minx.fill(np.iinfo(np.int64).max)
+
+    if bins[len(bins) - 1] == len(values):
+        ngroups = len(bins)
+    else:
+        ngroups = len(bins) + 1
+
+    N, K = (<object> values).shape
+
+    with nogil:
+        b = 0
+        for i in range(N):
+            while b < ngroups - 1 and i >= bins[b]:
+                b += 1
+
+            counts[b] += 1
+            for j in range(K):
+                val = values[i, j]
+
+                # not nan
+                if True:
+                    nobs[b, j] += 1
+                    if val < minx[b, j]:
+                        minx[b, j] = val
+
+        for i in range(ngroups):
+            for j in range(K):
+                if nobs[i, j] == 0:
+                    out[i, j] = iNaT
+                else:
+                    out[i, j] = minx[i, j]
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def group_min_bin_int32(ndarray[int32_t, ndim=2] out,
+                           ndarray[int64_t] counts,
+                           ndarray[int32_t, ndim=2] values,
+                           ndarray[int64_t] bins):
+    '''
+    Only aggregates on axis=0
+    '''
+    cdef:
+        Py_ssize_t i, j, N, K, ngroups, b
+        int32_t val
+        ndarray[int32_t, ndim=2] minx
+        ndarray[int64_t, ndim=2] nobs
+
+    nobs = np.zeros((<object> out).shape, dtype=np.int64)
+
+    minx = np.empty_like(out)
+    minx.fill(np.iinfo(np.int32).max)
+
+    if bins[len(bins) - 1] == len(values):
+        ngroups = len(bins)
+    else:
+        ngroups = len(bins) + 1
+
+    N, K = (<object> values).shape
+
+    with nogil:
+        b = 0
+        for i in range(N):
+            while b < ngroups - 1 and i >= bins[b]:
+                b += 1
+
+            counts[b] += 1
+            for j in range(K):
+                val = values[i, j]
+
+                # not nan
+                if True:
+                    nobs[b, j] += 1
+                    if val < minx[b, j]:
+                        minx[b, j] = val
+
+        for i in range(ngroups):
+            for j in range(K):
+                if nobs[i, j] == 0:
+                    out[i, j] = INT32_NA
+                else:
+                    out[i, j] = minx[i, j]
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def group_min_bin_datetime(ndarray[int64_t, ndim=2] out,
+                           ndarray[int64_t] counts,
+                           ndarray[int64_t, ndim=2] values,
+                           ndarray[int64_t] bins):
+    '''
+    Only aggregates on axis=0
+    '''
+    cdef:
+        Py_ssize_t i, j, N, K, ngroups, b
+        int64_t val
+        ndarray[int64_t, ndim=2] minx
+        ndarray[int64_t, ndim=2] nobs
+
+    nobs = np.zeros((<object> out).shape, dtype=np.int64)
+
+    minx = np.empty_like(out)
+    minx.fill(np.iinfo(np.int64).max)
+
+    if bins[len(bins) - 1] == len(values):
+        ngroups = len(bins)
+    else:
+        ngroups = len(bins) + 1
+
+    N, K = (<object> values).shape
+
+    with nogil:
+        b = 0
+        for i in range(N):
+            while b < ngroups - 1 and i >= bins[b]:
+                b += 1
+
+            counts[b] += 1
+            for j in range(K):
+                val = values[i, j]
+
+                # not nan
+                if val != iNaT:
+                    nobs[b, j] += 1
+                    if val < minx[b, j]:
+                        minx[b, j] = val
+
+        for i in range(ngroups):
+            for j in range(K):
+                if nobs[i, j] == 0:
+                    out[i, j] = iNaT
+                else:
+                    out[i, j] = minx[i, j]
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def group_max_float32(ndarray[float32_t, ndim=2] out,
+                       ndarray[int64_t] counts,
+                       ndarray[float32_t, ndim=2] values,
+                       ndarray[int64_t] labels):
+    '''
+    Only aggregates on axis=0
+    '''
+    cdef:
+        Py_ssize_t i, j, N, K, lab, ncounts
+        float32_t val
+        ndarray[float32_t, ndim=2] maxx
+        ndarray[int64_t, ndim=2] nobs
+
+    nobs = np.zeros((<object> out).shape, dtype=np.int64)
+
+    maxx = np.empty_like(out)
+    maxx.fill(-np.inf)
+
+    N, K = (<object> values).shape
+
+    ncounts = len(counts)
+
+    with nogil:
+        for i in range(N):
+            lab = labels[i]
+            if lab < 0:
+                continue
+
+            counts[lab] += 1
+            for j in range(K):
+                val = values[i, j]
+
+                # not nan
+                if val == val:
+                    nobs[lab, j] += 1
+                    if val > maxx[lab, j]:
+                        maxx[lab, j] = val
+
+        for i in range(ncounts):
+            for j in range(K):
+                if nobs[i, j] == 0:
+                    out[i, j] = nan
+                else:
+                    out[i, j] = maxx[i, j]
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def group_max_int64(ndarray[int64_t, ndim=2] out,
+                       ndarray[int64_t] counts,
+                       ndarray[int64_t, ndim=2] values,
+                       ndarray[int64_t] labels):
+    '''
+    Only aggregates on axis=0
+    '''
+    cdef:
+        Py_ssize_t i, j, N, K, lab, ncounts
+        int64_t val
+        ndarray[int64_t, ndim=2] maxx
+        ndarray[int64_t, ndim=2] nobs
+
+    nobs = np.zeros((<object> out).shape, dtype=np.int64)
+
+    maxx = np.empty_like(out)
+    maxx.fill(iNaT)
+
+    N, K = (<object> values).shape
+
+    ncounts = len(counts)
+
+    with nogil:
+        for i in range(N):
+            lab = labels[i]
+            if lab < 0:
+                continue
+
+            counts[lab] += 1
+            for j in range(K):
+                val = values[i, j]
+
+                # not nan
+                if True:
+                    nobs[lab, j] += 1
+                    if val > maxx[lab, j]:
+                        maxx[lab, j] = val
+
+        for i in range(ncounts):
+            for j in range(K):
+                if nobs[i, j] == 0:
+                    out[i, j] = iNaT
+                else:
+                    out[i, j] = maxx[i, j]
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def group_max_int32(ndarray[int32_t, ndim=2] out,
+                       ndarray[int64_t] counts,
+                       ndarray[int32_t, ndim=2] values,
+                       ndarray[int64_t] labels):
+    '''
+    Only aggregates on axis=0
+    '''
+    cdef:
+        Py_ssize_t i, j, N, K, lab, ncounts
+        int32_t val
+        ndarray[int32_t, ndim=2] maxx
+        ndarray[int64_t, ndim=2] nobs
+
+    nobs = np.zeros((<object> out).shape, dtype=np.int64)
+
+    maxx = np.empty_like(out)
+    maxx.fill(INT32_NA)
+
+    N, K = (<object> values).shape
+
+    ncounts = len(counts)
+
+    with nogil:
+        for i in range(N):
+            lab = labels[i]
+            if lab < 0:
+                continue
+
+            counts[lab] += 1
+            for j in range(K):
+                val = values[i, j]
+
+                # not nan
+                if True:
+                    nobs[lab, j] += 1
+                    if val > maxx[lab, j]:
+                        maxx[lab, j] = val
+
+        for i in range(ncounts):
+            for j in range(K):
+                if nobs[i, j] == 0:
+                    out[i, j] = INT32_NA
+                else:
+                    out[i, j] = maxx[i, j]
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def group_max_datetime(ndarray[int64_t, ndim=2] out,
+                       ndarray[int64_t] counts,
+                       ndarray[int64_t, ndim=2] values,
+                       ndarray[int64_t] labels):
+    '''
+    Only aggregates on axis=0
+    '''
+    cdef:
+        Py_ssize_t i, j, N, K, lab, ncounts
+        int64_t val
+        ndarray[int64_t, ndim=2] maxx
+        ndarray[int64_t, ndim=2] nobs
+
+    nobs = np.zeros((<object> out).shape, dtype=np.int64)
+
+    maxx = np.empty_like(out)
+    maxx.fill(iNaT)
+
+    N, K = (<object> values).shape
+
+    ncounts = len(counts)
+
+    with nogil:
+        for i in range(N):
+            lab = labels[i]
+            if lab < 0:
+                continue
+
+            counts[lab] += 1
+            for j in range(K):
+                val = values[i, j]
+
+                # not nan
+                if val != iNaT:
+                    nobs[lab, j] += 1
+                    if val > maxx[lab, j]:
+                        maxx[lab, j] = val
+
+        for i in range(ncounts):
+            for j in range(K):
+                if nobs[i, j] == 0:
+                    out[i, j] = iNaT
+                else:
+                    out[i, j] = maxx[i, j]
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def group_max_bin_float32(ndarray[float32_t, ndim=2] out,
+                           ndarray[int64_t] counts,
+                           ndarray[float32_t, ndim=2] values,
+                           ndarray[int64_t] bins):
+    '''
+    Only aggregates on axis=0
+    '''
+    cdef:
+        Py_ssize_t i, j, N, K, ngroups, b
+        float32_t val
+        ndarray[float32_t, ndim=2] maxx
+        ndarray[int64_t, ndim=2] nobs
 
-    # do it again now that result size is known
+    nobs = np.zeros((<object> out).shape, dtype=np.int64)
 
-    lindexer = np.empty(count, dtype=np.int64)
-    rindexer = np.empty(count, dtype=np.int64)
-    result = np.empty(count, dtype=np.int64)
+    maxx = np.empty_like(out)
+    maxx.fill(-np.inf)
 
-    i = 0
-    j = 0
-    count = 0
-    while True:
-        if i == nleft or j == nright:
-             break
-        else:
-            lval = left[i]
-            rval = right[j]
-            if lval == rval:
-                lindexer[count] = i
-                rindexer[count] = j
-                result[count] = lval
-                i += 1
-                j += 1
-                count += 1
-            elif lval < rval:
-                i += 1
-            else:
-                j += 1
+    if bins[len(bins) - 1] == len(values):
+        ngroups = len(bins)
+    else:
+        ngroups = len(bins) + 1
 
-    return result, lindexer, rindexer
+    N, K = (<object> values).shape
+
+    with nogil:
+        b = 0
+        for i in range(N):
+            while b < ngroups - 1 and i >= bins[b]:
+                b += 1
+
+            counts[b] += 1
+            for j in range(K):
+                val = values[i, j]
+
+                # not nan
+                if val == val:
+                    nobs[b, j] += 1
+                    if val > maxx[b, j]:
+                        maxx[b, j] = val
+
+        for i in range(ngroups):
+            for j in range(K):
+                if nobs[i, j] == 0:
+                    out[i, j] = nan
+                else:
+                    out[i, j] = maxx[i, j]
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def group_max_bin_int64(ndarray[int64_t, ndim=2] out,
+                           ndarray[int64_t] counts,
+                           ndarray[int64_t, ndim=2] values,
+                           ndarray[int64_t] bins):
+    '''
+    Only aggregates on axis=0
+    '''
+    cdef:
+        Py_ssize_t i, j, N, K, ngroups, b
+        int64_t val
+        ndarray[int64_t, ndim=2] maxx
+        ndarray[int64_t, ndim=2] nobs
+
+    nobs = np.zeros((<object> out).shape, dtype=np.int64)
+
+    maxx = np.empty_like(out)
+    maxx.fill(iNaT)
+
+    if bins[len(bins) - 1] == len(values):
+        ngroups = len(bins)
+    else:
+        ngroups = len(bins) + 1
+
+    N, K = (<object> values).shape
+
+    with nogil:
+        b = 0
+        for i in range(N):
+            while b < ngroups - 1 and i >= bins[b]:
+                b += 1
+
+            counts[b] += 1
+            for j in range(K):
+                val = values[i, j]
+
+                # not nan
+                if True:
+                    nobs[b, j] += 1
+                    if val > maxx[b, j]:
+                        maxx[b, j] = val
+
+        for i in range(ngroups):
+            for j in range(K):
+                if nobs[i, j] == 0:
+                    out[i, j] = iNaT
+                else:
+                    out[i, j] = maxx[i, j]
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def group_max_bin_int32(ndarray[int32_t, ndim=2] out,
+                           ndarray[int64_t] counts,
+                           ndarray[int32_t, ndim=2] values,
+                           ndarray[int64_t] bins):
+    '''
+    Only aggregates on axis=0
+    '''
+    cdef:
+        Py_ssize_t i, j, N, K, ngroups, b
+        int32_t val
+        ndarray[int32_t, ndim=2] maxx
+        ndarray[int64_t, ndim=2] nobs
+
+    nobs = np.zeros((<object> out).shape, dtype=np.int64)
+
+    maxx = np.empty_like(out)
+    maxx.fill(INT32_NA)
+
+    if bins[len(bins) - 1] == len(values):
+        ngroups = len(bins)
+    else:
+        ngroups = len(bins) + 1
+
+    N, K = (<object> values).shape
+
+    with nogil:
+        b = 0
+        for i in range(N):
+            while b < ngroups - 1 and i >= bins[b]:
+                b += 1
+
+            counts[b] += 1
+            for j in range(K):
+                val = values[i, j]
+
+                # not nan
+                if True:
+                    nobs[b, j] += 1
+                    if val > maxx[b, j]:
+                        maxx[b, j] = val
+
+        for i in range(ngroups):
+            for j in range(K):
+                if nobs[i, j] == 0:
+                    out[i, j] = INT32_NA
+                else:
+                    out[i, j] = maxx[i, j]
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def group_max_bin_datetime(ndarray[int64_t, ndim=2] out,
+                           ndarray[int64_t] counts,
+                           ndarray[int64_t, ndim=2] values,
+                           ndarray[int64_t] bins):
+    '''
+    Only aggregates on axis=0
+    '''
+    cdef:
+        Py_ssize_t i, j, N, K, ngroups, b
+        int64_t val
+        ndarray[int64_t, ndim=2] maxx
+        ndarray[int64_t, ndim=2] nobs
+
+    nobs = np.zeros((<object> out).shape, dtype=np.int64)
+
+    maxx = np.empty_like(out)
+    maxx.fill(iNaT)
+
+    if bins[len(bins) - 1] == len(values):
+        ngroups = len(bins)
+    else:
+        ngroups = len(bins) + 1
+
+    N, K = (<object> values).shape
+
+    with nogil:
+        b = 0
+        for i in range(N):
+            while b < ngroups - 1 and i >= bins[b]:
+                b += 1
+
+            counts[b] += 1
+            for j in range(K):
+                val = values[i, j]
+
+                # not nan
+                if val != iNaT:
+                    nobs[b, j] += 1
+                    if val > maxx[b, j]:
+                        maxx[b, j] = val
+
+        for i in range(ngroups):
+            for j in range(K):
+                if nobs[i, j] == 0:
+                    out[i, j] = iNaT
+                else:
+                    out[i, j] = maxx[i, j]
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def group_add_float32(ndarray[float32_t, ndim=2] out,
+                       ndarray[int64_t] counts,
+                       ndarray[float32_t, ndim=2] values,
+                       ndarray[int64_t] labels):
+    '''
+    Only aggregates on axis=0
+    '''
+    cdef:
+        Py_ssize_t i, j, N, K, lab, ncounts
+        float32_t val
+        ndarray[float64_t, ndim=2] sumx
+        ndarray[int64_t, ndim=2] nobs
+
+    nobs = np.zeros((<object> out).shape, dtype=np.int64)
+    sumx = np.zeros((<object> out).shape, dtype=np.float64)
+
+    N, K = (<object> values).shape
+
+    ncounts = len(counts)
+
+    with nogil:
+        for i in range(N):
+            lab = labels[i]
+            if lab < 0:
+                continue
+
+            counts[lab] += 1
+            for j in range(K):
+                val = values[i, j]
+
+                # not nan
+                if val == val:
+                    nobs[lab, j] += 1
+                    sumx[lab, j] += val
+
+        for i in range(ncounts):
+            for j in range(K):
+                if nobs[i, j] == 0:
+                    out[i, j] = nan
+                else:
+                    out[i, j] = <float32_t> sumx[i, j]
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def group_add_int64(ndarray[int64_t, ndim=2] out,
+                       ndarray[int64_t] counts,
+                       ndarray[int64_t, ndim=2] values,
+                       ndarray[int64_t] labels):
+    '''
+    Only aggregates on axis=0
+    '''
+    cdef:
+        Py_ssize_t i, j, N, K, lab, ncounts
+        int64_t val
+        ndarray[int64_t, ndim=2] sumx
+        ndarray[int64_t, ndim=2] nobs
+
+    nobs = np.zeros((<object> out).shape, dtype=np.int64)
+    sumx = np.zeros((<object> out).shape, dtype=np.int64)
+
+    N, K = (<object> values).shape
+
+    ncounts = len(counts)
+
+    with nogil:
+        for i in range(N):
+            lab = labels[i]
+            if lab < 0:
+                continue
+
+            counts[lab] += 1
+            for j in range(K):
+                val = values[i, j]
+
+                # not nan
+                if True:
+                    nobs[lab, j] += 1
+                    sumx[lab, j] += val
+
+        for i in range(ncounts):
+            for j in range(K):
+                if nobs[i, j] == 0:
+                    out[i, j] = iNaT
+                else:
+                    out[i, j] = <int64_t> sumx[i, j]
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def group_add_bin_float32(ndarray[float32_t, ndim=2] out,
+                           ndarray[int64_t] counts,
+                           ndarray[float32_t, ndim=2] values,
+                           ndarray[int64_t] bins):
+    '''
+    Only aggregates on axis=0
+    '''
+    cdef:
+        Py_ssize_t i, j, N, K, ngroups, b
+        float32_t val
+        ndarray[float64_t, ndim=2] sumx
+        ndarray[int64_t, ndim=2] nobs
+
+    nobs = np.zeros((<object> out).shape, dtype=np.int64)
+    sumx = np.zeros((<object> out).shape, dtype=np.float64)
+
+    if bins[len(bins) - 1] == len(values):
+        ngroups = len(bins)
+    else:
+        ngroups = len(bins) + 1
+
+    N, K = (<object> values).shape
+
+    with nogil:
+        b = 0
+        for i in range(N):
+            while b < ngroups - 1 and i >= bins[b]:
+                b += 1
+
+            counts[b] += 1
+            for j in range(K):
+                val = values[i, j]
+
+                # not nan
+                if val == val:
+                    nobs[b, j] += 1
+                    sumx[b, j] += val
+
+        for i in range(ngroups):
+            for j in range(K):
+                if nobs[i, j] == 0:
+                    out[i, j] = nan
+                else:
+                    out[i, j] = <float32_t> sumx[i, j]
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def group_add_bin_int64(ndarray[int64_t, ndim=2] out,
+                           ndarray[int64_t] counts,
+                           ndarray[int64_t, ndim=2] values,
+                           ndarray[int64_t] bins):
+    '''
+    Only aggregates on axis=0
+    '''
+    cdef:
+        Py_ssize_t i, j, N, K, ngroups, b
+        int64_t val
+        ndarray[int64_t, ndim=2] sumx
+        ndarray[int64_t, ndim=2] nobs
+
+    nobs = np.zeros((<object> out).shape, dtype=np.int64)
+    sumx = np.zeros((<object> out).shape, dtype=np.int64)
+
+    if bins[len(bins) - 1] == len(values):
+        ngroups = len(bins)
+    else:
+        ngroups = len(bins) + 1
+
+    N, K = (<object> values).shape
+
+    with nogil:
+        b = 0
+        for i in range(N):
+            while b < ngroups - 1 and i >= bins[b]:
+                b += 1
+
+            counts[b] += 1
+            for j in range(K):
+                val = values[i, j]
+
+                # not nan
+                if True:
+                    nobs[b, j] += 1
+                    sumx[b, j] += val
+
+        for i in range(ngroups):
+            for j in range(K):
+                if nobs[i, j] == 0:
+                    out[i, j] = iNaT
+                else:
+                    out[i, j] = <int64_t> sumx[i, j]
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def group_prod_float32(ndarray[float32_t, ndim=2] out,
+                        ndarray[int64_t] counts,
+                        ndarray[float32_t, ndim=2] values,
+                        ndarray[int64_t] labels):
+    '''
+    Only aggregates on axis=0
+    '''
+    cdef:
+        Py_ssize_t i, j, N, K, lab, ncounts
+        float32_t val
+        ndarray[float64_t, ndim=2] prodx
+        ndarray[int64_t, ndim=2] nobs
+
+    nobs = np.zeros((<object> out).shape, dtype=np.int64)
+    prodx = np.ones((<object> out).shape, dtype=np.float64)
+
+    N, K = (<object> values).shape
+
+    ncounts = len(counts)
+
+    with nogil:
+        for i in range(N):
+            lab = labels[i]
+            if lab < 0:
+                continue
+
+            counts[lab] += 1
+            for j in range(K):
+                val = values[i, j]
+
+                # not nan
+                if val == val:
+                    nobs[lab, j] += 1
+                    prodx[lab, j] *= val
+
+        for i in range(ncounts):
+            for j in range(K):
+                if nobs[i, j] == 0:
+                    out[i, j] = nan
+                else:
+                    out[i, j] = <float32_t> prodx[i, j]
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def group_prod_bin_float32(ndarray[float32_t, ndim=2] out,
+                            ndarray[int64_t] counts,
+                            ndarray[float32_t, ndim=2] values,
+                            ndarray[int64_t] bins):
+    '''
+    Only aggregates on axis=0
+    '''
+    cdef:
+        Py_ssize_t i, j, N, K, ngroups, b
+        float32_t val
+        ndarray[float64_t, ndim=2] prodx
+        ndarray[int64_t, ndim=2] nobs
+
+    nobs = np.zeros((<object> out).shape, dtype=np.int64)
+    prodx = np.ones((<object> out).shape, dtype=np.float64)
+
+    if bins[len(bins) - 1] == len(values):
+        ngroups = len(bins)
+    else:
+        ngroups = len(bins) + 1
+
+    N, K = (<object> values).shape
+
+    with nogil:
+        b = 0
+        for i in range(N):
+            while b < ngroups - 1 and i >= bins[b]:
+                b += 1
+
+            counts[b] += 1
+            for j in range(K):
+                val = values[i, j]
+
+                # not nan
+                if val == val:
+                    nobs[b, j] += 1
+                    prodx[b, j] *= val
+
+        for i in range(ngroups):
+            for j in range(K):
+                if nobs[i, j] == 0:
+                    out[i, j] = nan
+                else:
+                    out[i, j] = <float32_t> prodx[i, j]
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+@cython.cdivision(True)
+def group_mean_float32(ndarray[float32_t, ndim=2] out,
+                        ndarray[int64_t] counts,
+                        ndarray[float32_t, ndim=2] values,
+                        ndarray[int64_t] labels):
+    cdef:
+        Py_ssize_t i, j, N, K, lab, ncounts
+        float32_t val
+        float64_t count
+        ndarray[float64_t, ndim=2] sumx, nobs
+
+    nobs = np.zeros((<object> out).shape, dtype=np.float64)
+    sumx = np.zeros((<object> out).shape, dtype=np.float64)
+
+    N, K = (<object> values).shape
+
+    ncounts = len(counts)
+
+    with nogil:
+        for i in range(N):
+            lab = labels[i]
+            if lab < 0:
+                continue
+
+            counts[lab] += 1
+            for j in range(K):
+                val = values[i, j]
+
+                # not nan
+                if val == val:
+                    nobs[lab, j] += 1
+                    sumx[lab, j] += val
+
+        for i in range(ncounts):
+            for j in range(K):
+                count = nobs[i, j]
+                if count == 0:
+                    out[i, j] = nan
+                else:
+                    out[i, j] = <float32_t> (sumx[i, j] / count)
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+@cython.cdivision(True)
+def group_mean_bin_float32(ndarray[float32_t, ndim=2] out,
+                            ndarray[int64_t] counts,
+                            ndarray[float32_t, ndim=2] values,
+                            ndarray[int64_t] bins):
+    cdef:
+        Py_ssize_t i, j, N, K, ngroups, b
+        float32_t val
+        float64_t count
+        ndarray[float64_t, ndim=2] sumx, nobs
+
+    nobs = np.zeros((<object> out).shape, dtype=np.float64)
+    sumx = np.zeros((<object> out).shape, dtype=np.float64)
+
+    if bins[len(bins) - 1] == len(values):
+        ngroups = len(bins)
+    else:
+        ngroups = len(bins) + 1
+
+    N, K = (<object> values).shape
+
+    with nogil:
+        b = 0
+        for i in range(N):
+            while b < ngroups - 1 and i >= bins[b]:
+                b += 1
+
+            counts[b] += 1
+            for j in range(K):
+                val = values[i, j]
+
+                # not nan
+                if val == val:
+                    nobs[b, j] += 1
+                    sumx[b, j] += val
+
+        for i in range(ngroups):
+            for j in range(K):
+                count = nobs[i, j]
+                if count == 0:
+                    out[i, j] = nan
+                else:
+                    out[i, j] = <float32_t> (sumx[i, j] / count)
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+@cython.cdivision(True)
+def group_var_float32(ndarray[float32_t, ndim=2] out,
+                       ndarray[int64_t] counts,
+                       ndarray[float32_t, ndim=2] values,
+                       ndarray[int64_t] labels):
+    cdef:
+        Py_ssize_t i, j, N, K, lab, ncounts
+        float32_t val
+        float64_t ct
+        ndarray[float64_t, ndim=2] nobs, sumx, sumxx
+
+    nobs = np.zeros((<object> out).shape, dtype=np.float64)
+    sumx = np.zeros((<object> out).shape, dtype=np.float64)
+    sumxx = np.zeros((<object> out).shape, dtype=np.float64)
+
+    N, K = (<object> values).shape
+
+    ncounts = len(counts)
+
+    with nogil:
+        for i in range(N):
+            lab = labels[i]
+            if lab < 0:
+                continue
+
+            counts[lab] += 1
+            for j in range(K):
+                val = values[i, j]
+
+                # not nan
+                if val == val:
+                    nobs[lab, j] += 1
+                    sumx[lab, j] += val
+                    sumxx[lab, j] += <float64_t> val * val
+
+        for i in range(ncounts):
+            for j in range(K):
+                ct = nobs[i, j]
+                if ct < 2:
+                    out[i, j] = nan
+                else:
+                    out[i, j] = <float32_t> (
+                        (ct * sumxx[i, j] - sumx[i, j] * sumx[i, j]) /
+                        (ct * ct - ct))
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+@cython.cdivision(True)
+def group_var_bin_float32(ndarray[float32_t, ndim=2] out,
+                           ndarray[int64_t] counts,
+                           ndarray[float32_t, ndim=2] values,
+                           ndarray[int64_t] bins):
+    cdef:
+        Py_ssize_t i, j, N, K, ngroups, b
+        float32_t val
+        float64_t ct
+        ndarray[float64_t, ndim=2] nobs, sumx, sumxx
+
+    nobs = np.zeros((<object> out).shape, dtype=np.float64)
+    sumx = np.zeros((<object> out).shape, dtype=np.float64)
+    sumxx = np.zeros((<object> out).shape, dtype=np.float64)
+
+    if bins[len(bins) - 1] == len(values):
+        ngroups = len(bins)
+    else:
+        ngroups = len(bins) + 1
+
+    N, K = (<object> values).shape
+
+    with nogil:
+        b = 0
+        for i in range(N):
+            while b < ngroups - 1 and i >= bins[b]:
+                b += 1
+
+            counts[b] += 1
+            for j in range(K):
+                val = values[i, j]
+
+                # not nan
+                if val == val:
+                    nobs[b, j] += 1
+                    sumx[b, j] += val
+                    sumxx[b, j] += <float64_t> val * val
+
+        for i in range(ngroups):
+            for j in range(K):
+                ct = nobs[i, j]
+                if ct < 2:
+                    out[i, j] = nan
+                else:
+                    out[i, j] = <float32_t> (
+                        (ct * sumxx[i, j] - sumx[i, j] * sumx[i, j]) /
+                        (ct * ct - ct))
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def group_cumsum_int64(ndarray[int64_t, ndim=2] out,
+                          ndarray[int64_t, ndim=2] values,
+                          ndarray[int64_t] labels, Py_ssize_t ngroups):
+    '''
+    Cumulative sum within each group
+    '''
+    cdef:
+        Py_ssize_t i, j, N, K, lab
+        int64_t val
+        ndarray[int64_t, ndim=2] accum
+
+    N, K = (<object> values).shape
+    accum = np.empty((ngroups, K), dtype=np.int64)
+    accum.fill(0)
+
+    with nogil:
+        for i in range(N):
+            lab = labels[i]
+            for j in range(K):
+                if lab < 0:
+                    out[i, j] = iNaT
+                else:
+                    val = values[i, j]
+                    accum[lab, j] += val
+                    out[i, j] = accum[lab, j]
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def group_cumprod_int64(ndarray[int64_t, ndim=2] out,
+                           ndarray[int64_t, ndim=2] values,
+                           ndarray[int64_t] labels, Py_ssize_t ngroups):
+    '''
+    Cumulative product within each group
+    '''
+    cdef:
+        Py_ssize_t i, j, N, K, lab
+        int64_t val
+        ndarray[int64_t, ndim=2] accum
+
+    N, K = (<object> values).shape
+    accum = np.empty((ngroups, K), dtype=np.int64)
+    accum.fill(1)
+
+    with nogil:
+        for i in range(N):
+            lab = labels[i]
+            for j in range(K):
+                if lab < 0:
+                    out[i, j] = iNaT
+                else:
+                    val = values[i, j]
+                    accum[lab, j] *= val
+                    out[i, j] = accum[lab, j]
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def group_cummax_int64(ndarray[int64_t, ndim=2] out,
+                          ndarray[int64_t, ndim=2] values,
+                          ndarray[int64_t] labels, Py_ssize_t ngroups):
+    '''
+    Cumulative max within each group
+    '''
+    cdef:
+        Py_ssize_t i, j, N, K, lab
+        int64_t val
+        ndarray[int64_t, ndim=2] accum
+
+    N, K = (<object> values).shape
+    accum = np.empty((ngroups, K), dtype=np.int64)
+    accum.fill(iNaT)
+
+    with nogil:
+        for i in range(N):
+            lab = labels[i]
+            for j in range(K):
+                if lab < 0:
+                    out[i, j] = iNaT
+                else:
+                    val = values[i, j]
+                    if val > accum[lab, j]:
+                        accum[lab, j] = val
+                    out[i, j] = accum[lab, j]
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def group_cummin_int64(ndarray[int64_t, ndim=2] out,
+                          ndarray[int64_t, ndim=2] values,
+                          ndarray[int64_t] labels, Py_ssize_t ngroups):
+    '''
+    Cumulative min within each group
+    '''
+    cdef:
+        Py_ssize_t i, j, N, K, lab
+        int64_t val
+        ndarray[int64_t, ndim=2] accum
+
+    N, K = (<object> values).shape
+    accum = np.empty((ngroups, K), dtype=np.int64)
+    accum.fill(np.iinfo(np.int64).max)
+
+    with nogil:
+        for i in range(N):
+            lab = labels[i]
+            for j in range(K):
+                if lab < 0:
+                    out[i, j] = iNaT
+                else:
+                    val = values[i, j]
+                    if val < accum[lab, j]:
+                        accum[lab, j] = val
+                    out[i, j] = accum[lab, j]
 
 
 
@@ -3329,6 +5533,16 @@ cpdef ensure_float64(object arr):
         return np.array(arr, dtype=np.float64)
 
 
+cpdef ensure_float32(object arr):
+    if util.is_array(arr):
+        if (<ndarray> arr).descr.type_num == NPY_FLOAT32:
+            return arr
+        else:
+            return arr.astype(np.float32)
+    else:
+        return np.array(arr, dtype=np.float32)
+
+
 cpdef ensure_int32(object arr):
     if util.is_array(arr):
         if (<ndarray> arr).descr.type_num == NPY_INT32:
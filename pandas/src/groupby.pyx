@@ -203,20 +203,23 @@ def groupsort_indexer(ndarray[int64_t] index, Py_ssize_t ngroups):
     # count group sizes, location 0 for NA
     counts = np.zeros(ngroups + 1, dtype=np.int64)
     n = len(index)
-    for i from 0 <= i < n:
-        counts[index[i] + 1] += 1
+    with nogil:
+        for i from 0 <= i < n:
+            counts[index[i] + 1] += 1
 
     # mark the start of each contiguous group of like-indexed data
     where = np.zeros(ngroups + 1, dtype=np.int64)
-    for i from 1 <= i < ngroups + 1:
-        where[i] = where[i - 1] + counts[i - 1]
+    with nogil:
+        for i from 1 <= i < ngroups + 1:
+            where[i] = where[i - 1] + counts[i - 1]
 
     # this is our indexer
     result = np.zeros(n, dtype=np.int64)
-    for i from 0 <= i < n:
-        label = index[i] + 1
-        result[where[label]] = i
-        where[label] += 1
+    with nogil:
+        for i from 0 <= i < n:
+            label = index[i] + 1
+            result[where[label]] = i
+            where[label] += 1
 
     return result, counts
 
@@ -232,7 +235,7 @@ def group_add(ndarray[float64_t, ndim=2] out,
     Only aggregates on axis=0
     '''
     cdef:
-        Py_ssize_t i, j, N, K, lab
+        Py_ssize_t i, j, N, K, lab, ncounts
         float64_t val, count
         ndarray[float64_t, ndim=2] sumx, nobs
 
@@ -241,40 +244,43 @@ def group_add(ndarray[float64_t, ndim=2] out,
 
     N, K = (<object> values).shape
 
-    if K > 1:
-        for i in range(N):
-            lab = labels[i]
-            if lab < 0:
-                continue
+    ncounts = len(counts)
 
-            counts[lab] += 1
-            for j in range(K):
-                val = values[i, j]
+    with nogil:
+        if K > 1:
+            for i in range(N):
+                lab = labels[i]
+                if lab < 0:
+                    continue
 
-                # not nan
-                if val == val:
-                    nobs[lab, j] += 1
-                    sumx[lab, j] += val
-    else:
-        for i in range(N):
-            lab = labels[i]
-            if lab < 0:
-                continue
+                counts[lab] += 1
+                for j in range(K):
+                    val = values[i, j]
 
-            counts[lab] += 1
-            val = values[i, 0]
+                    # not nan
+                    if val == val:
+                        nobs[lab, j] += 1
+                        sumx[lab, j] += val
+        else:
+            for i in range(N):
+                lab = labels[i]
+                if lab < 0:
+                    continue
 
-            # not nan
-            if val == val:
-                nobs[lab, 0] += 1
-                sumx[lab, 0] += val
+                counts[lab] += 1
+                val = values[i, 0]
 
-    for i in range(len(counts)):
-        for j in range(K):
-            if nobs[i, j] == 0:
-                out[i, j] = nan
-            else:
-                out[i, j] = sumx[i, j]
+                # not nan
+                if val == val:
+                    nobs[lab, 0] += 1
+                    sumx[lab, 0] += val
+
+        for i in range(ncounts):
+            for j in range(K):
+                if nobs[i, j] == 0:
+                    out[i, j] = nan
+                else:
+                    out[i, j] = sumx[i, j]
 
 @cython.boundscheck(False)
 @cython.wraparound(False)
@@ -286,7 +292,7 @@ def group_prod(ndarray[float64_t, ndim=2] out,
     Only aggregates on axis=0
     '''
     cdef:
-        Py_ssize_t i, j, N, K, lab
+        Py_ssize_t i, j, N, K, lab, ncounts
         float64_t val, count
         ndarray[float64_t, ndim=2] prodx, nobs
 
@@ -295,40 +301,43 @@ def group_prod(ndarray[float64_t, ndim=2] out,
 
     N, K = (<object> values).shape
 
-    if K > 1:
-        for i in range(N):
-            lab = labels[i]
-            if lab < 0:
-                continue
+    ncounts = len(counts)
 
-            counts[lab] += 1
-            for j in range(K):
-                val = values[i, j]
+    with nogil:
+        if K > 1:
+            for i in range(N):
+                lab = labels[i]
+                if lab < 0:
+                    continue
 
-                # not nan
-                if val == val:
-                    nobs[lab, j] += 1
-                    prodx[lab, j] *= val
-    else:
-        for i in range(N):
-            lab = labels[i]
-            if lab < 0:
-                continue
+                counts[lab] += 1
+                for j in range(K):
+                    val = values[i, j]
 
-            counts[lab] += 1
-            val = values[i, 0]
+                    # not nan
+                    if val == val:
+                        nobs[lab, j] += 1
+                        prodx[lab, j] *= val
+        else:
+            for i in range(N):
+                lab = labels[i]
+                if lab < 0:
+                    continue
 
-            # not nan
-            if val == val:
-                nobs[lab, 0] += 1
-                prodx[lab, 0] *= val
+                counts[lab] += 1
+                val = values[i, 0]
 
-    for i in range(len(counts)):
-        for j in range(K):
-            if nobs[i, j] == 0:
-                out[i, j] = nan
-            else:
-                out[i, j] = prodx[i, j]
+                # not nan
+                if val == val:
+                    nobs[lab, 0] += 1
+                    prodx[lab, 0] *= val
+
+        for i in range(ncounts):
+            for j in range(K):
+                if nobs[i, j] == 0:
+                    out[i, j] = nan
+                else:
+                    out[i, j] = prodx[i, j]
 
 #----------------------------------------------------------------------
 # first, nth, last
@@ -343,7 +352,7 @@ def group_nth(ndarray[float64_t, ndim=2] out,
     Only aggregates on axis=0
     '''
     cdef:
-        Py_ssize_t i, j, N, K, lab
+        Py_ssize_t i, j, N, K, lab, ncounts
         float64_t val, count
         ndarray[float64_t, ndim=2] resx
         ndarray[int64_t, ndim=2] nobs
@@ -353,27 +362,30 @@ def group_nth(ndarray[float64_t, ndim=2] out,
 
     N, K = (<object> values).shape
 
-    for i in range(N):
-        lab = labels[i]
-        if lab < 0:
-            continue
+    ncounts = len(counts)
 
-        counts[lab] += 1
-        for j in range(K):
-            val = values[i, j]
+    with nogil:
+        for i in range(N):
+            lab = labels[i]
+            if lab < 0:
+                continue
 
-            # not nan
-            if val == val:
-                nobs[lab, j] += 1
-                if nobs[lab, j] == rank:
-                    resx[lab, j] = val
+            counts[lab] += 1
+            for j in range(K):
+                val = values[i, j]
 
-    for i in range(len(counts)):
-        for j in range(K):
-            if nobs[i, j] == 0:
-                out[i, j] = nan
-            else:
-                out[i, j] = resx[i, j]
+                # not nan
+                if val == val:
+                    nobs[lab, j] += 1
+                    if nobs[lab, j] == rank:
+                        resx[lab, j] = val
+
+        for i in range(ncounts):
+            for j in range(K):
+                if nobs[i, j] == 0:
+                    out[i, j] = nan
+                else:
+                    out[i, j] = resx[i, j]
 
 
 @cython.boundscheck(False)
@@ -400,27 +412,28 @@ def group_nth_bin(ndarray[float64_t, ndim=2] out,
 
     N, K = (<object> values).shape
 
-    b = 0
-    for i in range(N):
-        while b < ngroups - 1 and i >= bins[b]:
-            b += 1
+    with nogil:
+        b = 0
+        for i in range(N):
+            while b < ngroups - 1 and i >= bins[b]:
+                b += 1
 
-        counts[b] += 1
-        for j in range(K):
-            val = values[i, j]
+            counts[b] += 1
+            for j in range(K):
+                val = values[i, j]
 
-            # not nan
-            if val == val:
-                nobs[b, j] += 1
-                if nobs[b, j] == rank:
-                    resx[b, j] = val
+                # not nan
+                if val == val:
+                    nobs[b, j] += 1
+                    if nobs[b, j] == rank:
+                        resx[b, j] = val
 
-    for i in range(ngroups):
-        for j in range(K):
-            if nobs[i, j] == 0:
-                out[i, j] = nan
-            else:
-                out[i, j] = resx[i, j]
+        for i in range(ngroups):
+            for j in range(K):
+                if nobs[i, j] == 0:
+                    out[i, j] = nan
+                else:
+                    out[i, j] = resx[i, j]
 
 @cython.boundscheck(False)
 @cython.wraparound(False)
@@ -432,7 +445,7 @@ def group_last(ndarray[float64_t, ndim=2] out,
     Only aggregates on axis=0
     '''
     cdef:
-        Py_ssize_t i, j, N, K, lab
+        Py_ssize_t i, j, N, K, lab, ncounts
         float64_t val, count
         ndarray[float64_t, ndim=2] resx
         ndarray[int64_t, ndim=2] nobs
@@ -442,26 +455,29 @@ def group_last(ndarray[float64_t, ndim=2] out,
 
     N, K = (<object> values).shape
 
-    for i in range(N):
-        lab = labels[i]
-        if lab < 0:
-            continue
+    ncounts = len(counts)
 
-        counts[lab] += 1
-        for j in range(K):
-            val = values[i, j]
+    with nogil:
+        for i in range(N):
+            lab = labels[i]
+            if lab < 0:
+                continue
 
-            # not nan
-            if val == val:
-                nobs[lab, j] += 1
-                resx[lab, j] = val
+            counts[lab] += 1
+            for j in range(K):
+                val = values[i, j]
 
-    for i in range(len(counts)):
-        for j in range(K):
-            if nobs[i, j] == 0:
-                out[i, j] = nan
-            else:
-                out[i, j] = resx[i, j]
+                # not nan
+                if val == val:
+                    nobs[lab, j] += 1
+                    resx[lab, j] = val
+
+        for i in range(ncounts):
+            for j in range(K):
+                if nobs[i, j] == 0:
+                    out[i, j] = nan
+                else:
+                    out[i, j] = resx[i, j]
 
 
 @cython.boundscheck(False)
@@ -488,26 +504,64 @@ def group_last_bin(ndarray[float64_t, ndim=2] out,
 
     N, K = (<object> values).shape
 
-    b = 0
-    for i in range(N):
-        while b < ngroups - 1 and i >= bins[b]:
-            b += 1
+    with nogil:
+        b = 0
+        for i in range(N):
+            while b < ngroups - 1 and i >= bins[b]:
+                b += 1
+
+            counts[b] += 1
+            for j in range(K):
+                val = values[i, j]
 
-        counts[b] += 1
-        for j in range(K):
-            val = values[i, j]
+                # not nan
+                if val == val:
+                    nobs[b, j] += 1
+                    resx[b, j] = val
 
-            # not nan
-            if val == val:
-                nobs[b, j] += 1
-                resx[b, j] = val
+        for i in range(ngroups):
+            for j in range(K):
+                if nobs[i, j] == 0:
+                    out[i, j] = nan
+                else:
+                    out[i, j] = resx[i, j]
 
-    for i in range(ngroups):
-        for j in range(K):
-            if nobs[i, j] == 0:
-                out[i, j] = nan
-            else:
-                out[i, j] = resx[i, j]
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def group_count_bin(ndarray[int64_t, ndim=2] out,
+                    ndarray[int64_t] counts,
+                    ndarray[float64_t, ndim=2] values,
+                    ndarray[int64_t] bins):
+    '''
+    Number of non-NA values of each column in each bin. Only aggregates on
+    axis=0
+    '''
+    cdef:
+        Py_ssize_t i, j, N, K, ngroups, b
+        float64_t val
+
+    if bins[len(bins) - 1] == len(values):
+        ngroups = len(bins)
+    else:
+        ngroups = len(bins) + 1
+
+    N, K = (<object> values).shape
+
+    out.fill(0)
+
+    with nogil:
+        b = 0
+        for i in range(N):
+            while b < ngroups - 1 and i >= bins[b]:
+                b += 1
+
+            counts[b] += 1
+            for j in range(K):
+                val = values[i, j]
+
+                # not nan
+                if val == val:
+                    out[b, j] += 1
 
 #----------------------------------------------------------------------
 # group_min, group_max
@@ -523,7 +577,7 @@ def group_min(ndarray[float64_t, ndim=2] out,
     Only aggregates on axis=0
     '''
     cdef:
-        Py_ssize_t i, j, N, K, lab
+        Py_ssize_t i, j, N, K, lab, ncounts
         float64_t val, count
         ndarray[float64_t, ndim=2] minx, nobs
 
@@ -534,42 +588,45 @@ def group_min(ndarray[float64_t, ndim=2] out,
 
     N, K = (<object> values).shape
 
-    if K > 1:
-        for i in range(N):
-            lab = labels[i]
-            if lab < 0:
-                continue
+    ncounts = len(counts)
 
-            counts[lab] += 1
-            for j in range(K):
-                val = values[i, j]
+    with nogil:
+        if K > 1:
+            for i in range(N):
+                lab = labels[i]
+                if lab < 0:
+                    continue
 
-                # not nan
-                if val == val:
-                    nobs[lab, j] += 1
-                    if val < minx[lab, j]:
-                        minx[lab, j] = val
-    else:
-        for i in range(N):
-            lab = labels[i]
-            if lab < 0:
-                continue
+                counts[lab] += 1
+                for j in range(K):
+                    val = values[i, j]
 
-            counts[lab] += 1
-            val = values[i, 0]
+                    # not nan
+                    if val == val:
+                        nobs[lab, j] += 1
+                        if val < minx[lab, j]:
+                            minx[lab, j] = val
+        else:
+            for i in range(N):
+                lab = labels[i]
+                if lab < 0:
+                    continue
 
-            # not nan
-            if val == val:
-                nobs[lab, 0] += 1
-                if val < minx[lab, 0]:
-                    minx[lab, 0] = val
+                counts[lab] += 1
+                val = values[i, 0]
 
-    for i in range(len(counts)):
-        for j in range(K):
-            if nobs[i, j] == 0:
-                out[i, j] = nan
-            else:
-                out[i, j] = minx[i, j]
+                # not nan
+                if val == val:
+                    nobs[lab, 0] += 1
+                    if val < minx[lab, 0]:
+                        minx[lab, 0] = val
+
+        for i in range(ncounts):
+            for j in range(K):
+                if nobs[i, j] == 0:
+                    out[i, j] = nan
+                else:
+                    out[i, j] = minx[i, j]
 
 
 @cython.boundscheck(False)
@@ -582,7 +639,7 @@ def group_max(ndarray[float64_t, ndim=2] out,
     Only aggregates on axis=0
     '''
     cdef:
-        Py_ssize_t i, j, N, K, lab
+        Py_ssize_t i, j, N, K, lab, ncounts
         float64_t val, count
         ndarray[float64_t, ndim=2] maxx, nobs
 
@@ -593,52 +650,56 @@ def group_max(ndarray[float64_t, ndim=2] out,
 
     N, K = (<object> values).shape
 
-    if K > 1:
-        for i in range(N):
-            lab = labels[i]
-            if lab < 0:
-                continue
+    ncounts = len(counts)
 
-            counts[lab] += 1
-            for j in range(K):
-                val = values[i, j]
+    with nogil:
+        if K > 1:
+            for i in range(N):
+                lab = labels[i]
+                if lab < 0:
+                    continue
 
-                # not nan
-                if val == val:
-                    nobs[lab, j] += 1
-                    if val > maxx[lab, j]:
-                        maxx[lab, j] = val
-    else:
-        for i in range(N):
-            lab = labels[i]
-            if lab < 0:
-                continue
+                counts[lab] += 1
+                for j in range(K):
+                    val = values[i, j]
 
-            counts[lab] += 1
-            val = values[i, 0]
+                    # not nan
+                    if val == val:
+                        nobs[lab, j] += 1
+                        if val > maxx[lab, j]:
+                            maxx[lab, j] = val
+        else:
+            for i in range(N):
+                lab = labels[i]
+                if lab < 0:
+                    continue
 
-            # not nan
-            if val == val:
-                nobs[lab, 0] += 1
-                if val > maxx[lab, 0]:
-                    maxx[lab, 0] = val
+                counts[lab] += 1
+                val = values[i, 0]
 
-    for i in range(len(counts)):
-        for j in range(K):
-            if nobs[i, j] == 0:
-                out[i, j] = nan
-            else:
-                out[i, j] = maxx[i, j]
+                # not nan
+                if val == val:
+                    nobs[lab, 0] += 1
+                    if val > maxx[lab, 0]:
+                        maxx[lab, 0] = val
+
+        for i in range(ncounts):
+            for j in range(K):
+                if nobs[i, j] == 0:
+                    out[i, j] = nan
+                else:
+                    out[i, j] = maxx[i, j]
 
 
 @cython.boundscheck(False)
 @cython.wraparound(False)
+@cython.cdivision(True)
 def group_mean(ndarray[float64_t, ndim=2] out,
                ndarray[int64_t] counts,
                ndarray[float64_t, ndim=2] values,
                ndarray[int64_t] labels):
     cdef:
-        Py_ssize_t i, j, N, K, lab
+        Py_ssize_t i, j, N, K, lab, ncounts
         float64_t val, count
         ndarray[float64_t, ndim=2] sumx, nobs
 
@@ -647,48 +708,52 @@ def group_mean(ndarray[float64_t, ndim=2] out,
 
     N, K = (<object> values).shape
 
-    if K > 1:
-        for i in range(N):
-            lab = labels[i]
-            if lab < 0:
-                continue
+    ncounts = len(counts)
+
+    with nogil:
+        if K > 1:
+            for i in range(N):
+                lab = labels[i]
+                if lab < 0:
+                    continue
+
+                counts[lab] += 1
+                for j in range(K):
+                    val = values[i, j]
+                    # not nan
+                    if val == val:
+                        nobs[lab, j] += 1
+                        sumx[lab, j] += val
+        else:
+            for i in range(N):
+                lab = labels[i]
+                if lab < 0:
+                    continue
 
-            counts[lab] += 1
-            for j in range(K):
-                val = values[i, j]
+                counts[lab] += 1
+                val = values[i, 0]
                 # not nan
                 if val == val:
-                    nobs[lab, j] += 1
-                    sumx[lab, j] += val
-    else:
-        for i in range(N):
-            lab = labels[i]
-            if lab < 0:
-                continue
-
-            counts[lab] += 1
-            val = values[i, 0]
-            # not nan
-            if val == val:
-                nobs[lab, 0] += 1
-                sumx[lab, 0] += val
+                    nobs[lab, 0] += 1
+                    sumx[lab, 0] += val
 
-    for i in range(len(counts)):
-        for j in range(K):
-            count = nobs[i, j]
-            if nobs[i, j] == 0:
-                out[i, j] = nan
-            else:
-                out[i, j] = sumx[i, j] / count
+        for i in range(ncounts):
+            for j in range(K):
+                count = nobs[i, j]
+                if nobs[i, j] == 0:
+                    out[i, j] = nan
+                else:
+                    out[i, j] = sumx[i, j] / count
 
 @cython.boundscheck(False)
 @cython.wraparound(False)
+@cython.cdivision(True)
 def group_var(ndarray[float64_t, ndim=2] out,
               ndarray[int64_t] counts,
               ndarray[float64_t, ndim=2] values,
               ndarray[int64_t] labels):
     cdef:
-        Py_ssize_t i, j, N, K, lab
+        Py_ssize_t i, j, N, K, lab, ncounts
         float64_t val, ct
         ndarray[float64_t, ndim=2] nobs, sumx, sumxx
 
@@ -698,47 +763,50 @@ def group_var(ndarray[float64_t, ndim=2] out,
 
     N, K = (<object> values).shape
 
-    if K > 1:
-        for i in range(N):
+    ncounts = len(counts)
 
-            lab = labels[i]
-            if lab < 0:
-                continue
+    with nogil:
+        if K > 1:
+            for i in range(N):
 
-            counts[lab] += 1
+                lab = labels[i]
+                if lab < 0:
+                    continue
 
-            for j in range(K):
-                val = values[i, j]
+                counts[lab] += 1
 
-                # not nan
-                if val == val:
-                    nobs[lab, j] += 1
-                    sumx[lab, j] += val
-                    sumxx[lab, j] += val * val
-    else:
-        for i in range(N):
+                for j in range(K):
+                    val = values[i, j]
 
-            lab = labels[i]
-            if lab < 0:
-                continue
+                    # not nan
+                    if val == val:
+                        nobs[lab, j] += 1
+                        sumx[lab, j] += val
+                        sumxx[lab, j] += val * val
+        else:
+            for i in range(N):
 
-            counts[lab] += 1
-            val = values[i, 0]
-            # not nan
-            if val == val:
-                nobs[lab, 0] += 1
-                sumx[lab, 0] += val
-                sumxx[lab, 0] += val * val
+                lab = labels[i]
+                if lab < 0:
+                    continue
+
+                counts[lab] += 1
+                val = values[i, 0]
+                # not nan
+                if val == val:
+                    nobs[lab, 0] += 1
+                    sumx[lab, 0] += val
+                    sumxx[lab, 0] += val * val
 
 
-    for i in range(len(counts)):
-        for j in range(K):
-            ct = nobs[i, j]
-            if ct < 2:
-                out[i, j] = nan
-            else:
-                out[i, j] = ((ct * sumxx[i, j] - sumx[i, j] * sumx[i, j]) /
-                             (ct * ct - ct))
+        for i in range(ncounts):
+            for j in range(K):
+                ct = nobs[i, j]
+                if ct < 2:
+                    out[i, j] = nan
+                else:
+                    out[i, j] = ((ct * sumxx[i, j] - sumx[i, j] * sumx[i, j]) /
+                                 (ct * ct - ct))
 
 # TODO: could do even better if we know something about the data. eg, index has
 # 1-min data, binner has 5-min data, then  bins are just strides in index. This
@@ -790,21 +858,73 @@ def generate_bins_dt64(ndarray[int64_t] values, ndarray[int64_t] binner,
 
     return bins
 
-# add passing bin edges, instead of labels
-
 @cython.boundscheck(False)
 @cython.wraparound(False)
-def group_add_bin(ndarray[float64_t, ndim=2] out,
-                  ndarray[int64_t] counts,
-                  ndarray[float64_t, ndim=2] values,
-                  ndarray[int64_t] bins):
+@cython.cdivision(True)
+def upsample_interpolate(ndarray[int64_t] index,
+                         ndarray[float64_t, ndim=2] values,
+                         ndarray[int64_t] target):
     '''
-    Only aggregates on axis=0
+    Linearly interpolate (in time) each column of values, observed at the
+    sorted int64 timestamps index, at the sorted timestamps target, in one
+    merge pass per column. NaN observations are passed over, so values are
+    interpolated between the nearest non-NaN observations of the column.
+    Rows of target outside of those observations are NaN
     '''
     cdef:
-        Py_ssize_t i, j, N, K, ngroups, b, nbins
-        float64_t val, count
-        ndarray[float64_t, ndim=2] sumx, nobs
+        Py_ssize_t i, j, left, right, N, K, n = len(target)
+        int64_t t
+        float64_t w
+        ndarray[float64_t, ndim=2] out
+
+    N, K = (<object> values).shape
+    out = np.empty((n, K), dtype=np.float64)
+
+    with nogil:
+        for j in range(K):
+            # left is the last non-NaN observation at or before t, -1 if
+            # none, and right the first one after it, N if none
+            left = -1
+            right = 0
+            while right < N and values[right, j] != values[right, j]:
+                right += 1
+
+            for i in range(n):
+                t = target[i]
+
+                while right < N and index[right] <= t:
+                    left = right
+                    right += 1
+                    while right < N and values[right, j] != values[right, j]:
+                        right += 1
+
+                if left >= 0 and index[left] == t:
+                    out[i, j] = values[left, j]
+                elif left < 0 or right == N:
+                    out[i, j] = nan
+                else:
+                    w = (<float64_t> (t - index[left]) /
+                         <float64_t> (index[right] - index[left]))
+                    out[i, j] = values[left, j] + w * (values[right, j] -
+                                                       values[left, j])
+
+    return out
+
+# add passing bin edges, instead of labels
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def group_add_bin(ndarray[float64_t, ndim=2] out,
+                  ndarray[int64_t] counts,
+                  ndarray[float64_t, ndim=2] values,
+                  ndarray[int64_t] bins):
+    '''
+    Only aggregates on axis=0
+    '''
+    cdef:
+        Py_ssize_t i, j, N, K, ngroups, b, nbins
+        float64_t val, count
+        ndarray[float64_t, ndim=2] sumx, nobs
 
     nobs = np.zeros_like(out)
     sumx = np.zeros_like(out)
@@ -815,39 +935,40 @@ def group_add_bin(ndarray[float64_t, ndim=2] out,
         ngroups = len(bins) + 1
     N, K = (<object> values).shape
 
-    b = 0
-    if K > 1:
-        for i in range(N):
-            while b < ngroups - 1 and i >= bins[b]:
-                b += 1
+    with nogil:
+        b = 0
+        if K > 1:
+            for i in range(N):
+                while b < ngroups - 1 and i >= bins[b]:
+                    b += 1
+
+                counts[b] += 1
+                for j in range(K):
+                    val = values[i, j]
+
+                    # not nan
+                    if val == val:
+                        nobs[b, j] += 1
+                        sumx[b, j] += val
+        else:
+            for i in range(N):
+                while b < ngroups - 1 and i >= bins[b]:
+                    b += 1
 
-            counts[b] += 1
-            for j in range(K):
-                val = values[i, j]
+                counts[b] += 1
+                val = values[i, 0]
 
                 # not nan
                 if val == val:
-                    nobs[b, j] += 1
-                    sumx[b, j] += val
-    else:
-        for i in range(N):
-            while b < ngroups - 1 and i >= bins[b]:
-                b += 1
-
-            counts[b] += 1
-            val = values[i, 0]
-
-            # not nan
-            if val == val:
-                nobs[b, 0] += 1
-                sumx[b, 0] += val
+                    nobs[b, 0] += 1
+                    sumx[b, 0] += val
 
-    for i in range(ngroups):
-        for j in range(K):
-            if nobs[i, j] == 0:
-                out[i, j] = nan
-            else:
-                out[i, j] = sumx[i, j]
+        for i in range(ngroups):
+            for j in range(K):
+                if nobs[i, j] == 0:
+                    out[i, j] = nan
+                else:
+                    out[i, j] = sumx[i, j]
 
 @cython.boundscheck(False)
 @cython.wraparound(False)
@@ -872,39 +993,40 @@ def group_prod_bin(ndarray[float64_t, ndim=2] out,
         ngroups = len(bins) + 1
     N, K = (<object> values).shape
 
-    b = 0
-    if K > 1:
-        for i in range(N):
-            while b < ngroups - 1 and i >= bins[b]:
-                b += 1
+    with nogil:
+        b = 0
+        if K > 1:
+            for i in range(N):
+                while b < ngroups - 1 and i >= bins[b]:
+                    b += 1
+
+                counts[b] += 1
+                for j in range(K):
+                    val = values[i, j]
+
+                    # not nan
+                    if val == val:
+                        nobs[b, j] += 1
+                        prodx[b, j] *= val
+        else:
+            for i in range(N):
+                while b < ngroups - 1 and i >= bins[b]:
+                    b += 1
 
-            counts[b] += 1
-            for j in range(K):
-                val = values[i, j]
+                counts[b] += 1
+                val = values[i, 0]
 
                 # not nan
                 if val == val:
-                    nobs[b, j] += 1
-                    prodx[b, j] *= val
-    else:
-        for i in range(N):
-            while b < ngroups - 1 and i >= bins[b]:
-                b += 1
+                    nobs[b, 0] += 1
+                    prodx[b, 0] *= val
 
-            counts[b] += 1
-            val = values[i, 0]
-
-            # not nan
-            if val == val:
-                nobs[b, 0] += 1
-                prodx[b, 0] *= val
-
-    for i in range(ngroups):
-        for j in range(K):
-            if nobs[i, j] == 0:
-                out[i, j] = nan
-            else:
-                out[i, j] = prodx[i, j]
+        for i in range(ngroups):
+            for j in range(K):
+                if nobs[i, j] == 0:
+                    out[i, j] = nan
+                else:
+                    out[i, j] = prodx[i, j]
 
 @cython.boundscheck(False)
 @cython.wraparound(False)
@@ -932,41 +1054,42 @@ def group_min_bin(ndarray[float64_t, ndim=2] out,
 
     N, K = (<object> values).shape
 
-    b = 0
-    if K > 1:
-        for i in range(N):
-            while b < ngroups - 1 and i >= bins[b]:
-                b += 1
+    with nogil:
+        b = 0
+        if K > 1:
+            for i in range(N):
+                while b < ngroups - 1 and i >= bins[b]:
+                    b += 1
+
+                counts[b] += 1
+                for j in range(K):
+                    val = values[i, j]
+
+                    # not nan
+                    if val == val:
+                        nobs[b, j] += 1
+                        if val < minx[b, j]:
+                            minx[b, j] = val
+        else:
+            for i in range(N):
+                while b < ngroups - 1 and i >= bins[b]:
+                    b += 1
 
-            counts[b] += 1
-            for j in range(K):
-                val = values[i, j]
+                counts[b] += 1
+                val = values[i, 0]
 
                 # not nan
                 if val == val:
-                    nobs[b, j] += 1
-                    if val < minx[b, j]:
-                        minx[b, j] = val
-    else:
-        for i in range(N):
-            while b < ngroups - 1 and i >= bins[b]:
-                b += 1
-
-            counts[b] += 1
-            val = values[i, 0]
+                    nobs[b, 0] += 1
+                    if val < minx[b, 0]:
+                        minx[b, 0] = val
 
-            # not nan
-            if val == val:
-                nobs[b, 0] += 1
-                if val < minx[b, 0]:
-                    minx[b, 0] = val
-
-    for i in range(ngroups):
-        for j in range(K):
-            if nobs[i, j] == 0:
-                out[i, j] = nan
-            else:
-                out[i, j] = minx[i, j]
+        for i in range(ngroups):
+            for j in range(K):
+                if nobs[i, j] == 0:
+                    out[i, j] = nan
+                else:
+                    out[i, j] = minx[i, j]
 
 
 @cython.boundscheck(False)
@@ -994,41 +1117,42 @@ def group_max_bin(ndarray[float64_t, ndim=2] out,
 
     N, K = (<object> values).shape
 
-    b = 0
-    if K > 1:
-        for i in range(N):
-            while b < ngroups - 1 and i >= bins[b]:
-                b += 1
+    with nogil:
+        b = 0
+        if K > 1:
+            for i in range(N):
+                while b < ngroups - 1 and i >= bins[b]:
+                    b += 1
+
+                counts[b] += 1
+                for j in range(K):
+                    val = values[i, j]
+
+                    # not nan
+                    if val == val:
+                        nobs[b, j] += 1
+                        if val > maxx[b, j]:
+                            maxx[b, j] = val
+        else:
+            for i in range(N):
+                while b < ngroups - 1 and i >= bins[b]:
+                    b += 1
 
-            counts[b] += 1
-            for j in range(K):
-                val = values[i, j]
+                counts[b] += 1
+                val = values[i, 0]
 
                 # not nan
                 if val == val:
-                    nobs[b, j] += 1
-                    if val > maxx[b, j]:
-                        maxx[b, j] = val
-    else:
-        for i in range(N):
-            while b < ngroups - 1 and i >= bins[b]:
-                b += 1
-
-            counts[b] += 1
-            val = values[i, 0]
-
-            # not nan
-            if val == val:
-                nobs[b, 0] += 1
-                if val > maxx[b, 0]:
-                    maxx[b, 0] = val
+                    nobs[b, 0] += 1
+                    if val > maxx[b, 0]:
+                        maxx[b, 0] = val
 
-    for i in range(ngroups):
-        for j in range(K):
-            if nobs[i, j] == 0:
-                out[i, j] = nan
-            else:
-                out[i, j] = maxx[i, j]
+        for i in range(ngroups):
+            for j in range(K):
+                if nobs[i, j] == 0:
+                    out[i, j] = nan
+                else:
+                    out[i, j] = maxx[i, j]
 
 
 @cython.boundscheck(False)
@@ -1038,13 +1162,14 @@ def group_ohlc(ndarray[float64_t, ndim=2] out,
                   ndarray[float64_t, ndim=2] values,
                   ndarray[int64_t] bins):
     '''
-    Only aggregates on axis=0
+    Only aggregates on axis=0. The open, high, low and close of column j go
+    in columns 4 * j to 4 * j + 3 of out
     '''
     cdef:
-        Py_ssize_t i, j, N, K, ngroups, b
-        float64_t val, count
-        float64_t vopen, vhigh, vlow, vclose, NA
-        bint got_first = 0
+        Py_ssize_t i, j, k, N, K, ngroups, b, end
+        float64_t val
+        ndarray[float64_t, ndim=2] ohlc
+        ndarray[uint8_t] got_first
 
     if bins[len(bins) - 1] == len(values):
         ngroups = len(bins)
@@ -1053,61 +1178,56 @@ def group_ohlc(ndarray[float64_t, ndim=2] out,
 
     N, K = (<object> values).shape
 
-    if out.shape[1] != 4:
-        raise ValueError('Output array must have 4 columns')
+    if out.shape[1] != 4 * K:
+        raise ValueError('Output array must have 4 columns per column of '
+                         'values')
 
-    NA = np.nan
+    ohlc = np.empty((K, 4), dtype=np.float64)
+    got_first = np.zeros(K, dtype=np.uint8)
 
-    b = 0
-    if K > 1:
-        raise NotImplementedError
-    else:
-        for i in range(N):
-            while b < ngroups - 1 and i >= bins[b]:
-                if not got_first:
-                    out[b, 0] = NA
-                    out[b, 1] = NA
-                    out[b, 2] = NA
-                    out[b, 3] = NA
-                else:
-                    out[b, 0] = vopen
-                    out[b, 1] = vhigh
-                    out[b, 2] = vlow
-                    out[b, 3] = vclose
-                b += 1
-                got_first = 0
+    with nogil:
+        i = 0
+        for b in range(ngroups):
+            # the last group takes the values past the last bin edge
+            if b < ngroups - 1:
+                end = bins[b]
+            else:
+                end = N
 
-            counts[b] += 1
-            val = values[i, 0]
-
-            # not nan
-            if val == val:
-                if not got_first:
-                    got_first = 1
-                    vopen = val
-                    vlow = val
-                    vhigh = val
-                else:
-                    if val < vlow:
-                        vlow = val
-                    if val > vhigh:
-                        vhigh = val
-                vclose = val
-
-        if not got_first:
-            out[b, 0] = NA
-            out[b, 1] = NA
-            out[b, 2] = NA
-            out[b, 3] = NA
-        else:
-            out[b, 0] = vopen
-            out[b, 1] = vhigh
-            out[b, 2] = vlow
-            out[b, 3] = vclose
+            for j in range(K):
+                got_first[j] = 0
+
+            while i < end:
+                counts[b] += 1
+                for j in range(K):
+                    val = values[i, j]
+
+                    # not nan
+                    if val == val:
+                        if not got_first[j]:
+                            got_first[j] = 1
+                            ohlc[j, 0] = val
+                            ohlc[j, 1] = val
+                            ohlc[j, 2] = val
+                        else:
+                            if val > ohlc[j, 1]:
+                                ohlc[j, 1] = val
+                            if val < ohlc[j, 2]:
+                                ohlc[j, 2] = val
+                        ohlc[j, 3] = val
+                i += 1
+
+            for j in range(K):
+                for k in range(4):
+                    if got_first[j]:
+                        out[b, 4 * j + k] = ohlc[j, k]
+                    else:
+                        out[b, 4 * j + k] = nan
 
 
-# @cython.boundscheck(False)
-# @cython.wraparound(False)
+@cython.boundscheck(False)
+@cython.wraparound(False)
+@cython.cdivision(True)
 def group_mean_bin(ndarray[float64_t, ndim=2] out,
                    ndarray[int64_t] counts,
                    ndarray[float64_t, ndim=2] values,
@@ -1120,49 +1240,52 @@ def group_mean_bin(ndarray[float64_t, ndim=2] out,
     nobs = np.zeros_like(out)
     sumx = np.zeros_like(out)
 
-    N, K = (<object> values).shape
     if bins[len(bins) - 1] == len(values):
         ngroups = len(bins)
     else:
         ngroups = len(bins) + 1
 
-    b = 0
-    if K > 1:
-        for i in range(N):
-            while b < ngroups - 1 and i >= bins[b]:
-                b += 1
+    N, K = (<object> values).shape
 
-            counts[b] += 1
-            for j in range(K):
-                val = values[i, j]
+    with nogil:
+        b = 0
+        if K > 1:
+            for i in range(N):
+                while b < ngroups - 1 and i >= bins[b]:
+                    b += 1
+
+                counts[b] += 1
+                for j in range(K):
+                    val = values[i, j]
+
+                    # not nan
+                    if val == val:
+                        nobs[b, j] += 1
+                        sumx[b, j] += val
+        else:
+            for i in range(N):
+                while b < ngroups - 1 and i >= bins[b]:
+                    b += 1
+
+                counts[b] += 1
+                val = values[i, 0]
 
                 # not nan
                 if val == val:
-                    nobs[b, j] += 1
-                    sumx[b, j] += val
-    else:
-        for i in range(N):
-            while b < ngroups - 1 and i >= bins[b]:
-                b += 1
-
-            counts[b] += 1
-            val = values[i, 0]
-
-            # not nan
-            if val == val:
-                nobs[b, 0] += 1
-                sumx[b, 0] += val
+                    nobs[b, 0] += 1
+                    sumx[b, 0] += val
 
-    for i in range(ngroups):
-        for j in range(K):
-            count = nobs[i, j]
-            if nobs[i, j] == 0:
-                out[i, j] = nan
-            else:
-                out[i, j] = sumx[i, j] / count
+        for i in range(ngroups):
+            for j in range(K):
+                count = nobs[i, j]
+                if nobs[i, j] == 0:
+                    out[i, j] = nan
+                else:
+                    out[i, j] = sumx[i, j] / count
 
 @cython.boundscheck(False)
 @cython.wraparound(False)
+@cython.cdivision(True)
 def group_var_bin(ndarray[float64_t, ndim=2] out,
                   ndarray[int64_t] counts,
                   ndarray[float64_t, ndim=2] values,
@@ -1184,45 +1307,561 @@ def group_var_bin(ndarray[float64_t, ndim=2] out,
 
     N, K = (<object> values).shape
 
-    b = 0
-    if K > 1:
-        for i in range(N):
-            while b < ngroups - 1 and i >= bins[b]:
-                b += 1
+    with nogil:
+        b = 0
+        if K > 1:
+            for i in range(N):
+                while b < ngroups - 1 and i >= bins[b]:
+                    b += 1
 
-            counts[b] += 1
+                counts[b] += 1
 
-            for j in range(K):
-                val = values[i, j]
+                for j in range(K):
+                    val = values[i, j]
+
+                    # not nan
+                    if val == val:
+                        nobs[b, j] += 1
+                        sumx[b, j] += val
+                        sumxx[b, j] += val * val
+        else:
+            for i in range(N):
+                while b < ngroups - 1 and i >= bins[b]:
+                    b += 1
+
+                counts[b] += 1
+                val = values[i, 0]
 
                 # not nan
                 if val == val:
-                    nobs[b, j] += 1
-                    sumx[b, j] += val
-                    sumxx[b, j] += val * val
+                    nobs[b, 0] += 1
+                    sumx[b, 0] += val
+                    sumxx[b, 0] += val * val
+
+        for i in range(ngroups):
+            for j in range(K):
+                ct = nobs[i, j]
+                if ct < 2:
+                    out[i, j] = nan
+                else:
+                    out[i, j] = ((ct * sumxx[i, j] - sumx[i, j] * sumx[i, j]) /
+                                 (ct * ct - ct))
+
+
+
+#----------------------------------------------------------------------
+# group_quantile, group_nunique
+
+cdef inline float64_t _quantile_c(float64_t* buf, Py_ssize_t n,
+                                  double q) nogil:
+    '''
+    q-th quantile of the first n elements of buf, interpolating between
+    order statistics like scoreatpercentile. Partially sorts buf
+    '''
+    cdef:
+        Py_ssize_t i, lo
+        double idx, frac
+        float64_t vlo, vhi
+
+    if n == 0:
+        return nan
+
+    idx = q * (n - 1)
+    lo = <Py_ssize_t> idx
+    frac = idx - lo
+
+    vlo = kth_smallest_c(buf, lo, n)
+    if frac == 0:
+        return vlo
+
+    # everything after the k-th smallest is at least as large, so the next
+    # order statistic is their minimum
+    vhi = buf[lo + 1]
+    for i in range(lo + 2, n):
+        if buf[i] < vhi:
+            vhi = buf[i]
+
+    return vlo + (vhi - vlo) * frac
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def group_quantile(ndarray[float64_t, ndim=2] out,
+                   ndarray[int64_t] counts,
+                   ndarray[float64_t, ndim=2] values,
+                   ndarray[int64_t] labels, double q):
+    '''
+    Only aggregates on axis=0
+    '''
+    cdef:
+        Py_ssize_t i, j, N, K, ngroups, size, start, n, g
+        float64_t val
+        ndarray[int64_t] indexer, _counts
+        ndarray[float64_t] buf
+        float64_t* bufp
+
+    if q < 0 or q > 1:
+        raise ValueError('quantile must be between 0 and 1, got %s' % q)
+
+    ngroups = len(counts)
+    N, K = (<object> values).shape
+
+    # sorted by group, with the NA group first
+    indexer, _counts = groupsort_indexer(labels, ngroups)
+    counts[:] = _counts[1:]
+
+    buf = np.empty(_counts[1:].max() if ngroups > 0 else 0,
+                   dtype=np.float64)
+    bufp = <float64_t*> buf.data
+
+    with nogil:
+        for j in range(K):
+            start = _counts[0]
+            for g in range(ngroups):
+                size = _counts[g + 1]
+
+                n = 0
+                for i in range(start, start + size):
+                    val = values[indexer[i], j]
+
+                    # not nan
+                    if val == val:
+                        bufp[n] = val
+                        n += 1
+
+                out[g, j] = _quantile_c(bufp, n, q)
+                start += size
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def group_quantile_bin(ndarray[float64_t, ndim=2] out,
+                       ndarray[int64_t] counts,
+                       ndarray[float64_t, ndim=2] values,
+                       ndarray[int64_t] bins, double q):
+    '''
+    Only aggregates on axis=0
+    '''
+    cdef:
+        Py_ssize_t i, j, N, K, ngroups, b, start, end, n
+        float64_t val
+        ndarray[float64_t] buf
+        float64_t* bufp
+
+    if q < 0 or q > 1:
+        raise ValueError('quantile must be between 0 and 1, got %s' % q)
+
+    if bins[len(bins) - 1] == len(values):
+        ngroups = len(bins)
     else:
+        ngroups = len(bins) + 1
+
+    N, K = (<object> values).shape
+
+    buf = np.empty(N, dtype=np.float64)
+    bufp = <float64_t*> buf.data
+
+    with nogil:
+        start = 0
+        for b in range(ngroups):
+            if b < ngroups - 1:
+                end = bins[b]
+            else:
+                end = N
+            counts[b] += end - start
+
+            for j in range(K):
+                n = 0
+                for i in range(start, end):
+                    val = values[i, j]
+
+                    # not nan
+                    if val == val:
+                        bufp[n] = val
+                        n += 1
+
+                out[b, j] = _quantile_c(bufp, n, q)
+
+            start = end
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def group_nunique(ndarray[int64_t, ndim=2] out,
+                  ndarray[int64_t] counts,
+                  ndarray[int64_t, ndim=2] values,
+                  ndarray[int64_t] labels):
+    '''
+    Number of distinct values in each group. values are factorized codes,
+    -1 for NA
+
+    Only aggregates on axis=0
+    '''
+    cdef:
+        Py_ssize_t i, j, N, K, ngroups, lab, code, idx
+        ndarray[int64_t] indexer, _counts, seen
+
+    ngroups = len(counts)
+    N, K = (<object> values).shape
+
+    indexer, _counts = groupsort_indexer(labels, ngroups)
+    counts[:] = _counts[1:]
+
+    # seen[code] is the last group the code turned up in. Visiting the rows
+    # group by group, a code is new to the group iff it isn't marked with it
+    seen = np.empty(values.max() + 1 if N * K > 0 else 0, dtype=np.int64)
+
+    out[:] = 0
+
+    for j in range(K):
+        seen.fill(-1)
+        with nogil:
+            for i in range(_counts[0], N):
+                idx = indexer[i]
+                code = values[idx, j]
+                if code < 0:
+                    continue
+
+                lab = labels[idx]
+                if seen[code] != lab:
+                    seen[code] = lab
+                    out[lab, j] += 1
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def group_nunique_bin(ndarray[int64_t, ndim=2] out,
+                      ndarray[int64_t] counts,
+                      ndarray[int64_t, ndim=2] values,
+                      ndarray[int64_t] bins):
+    '''
+    Number of distinct values in each bin. values are factorized codes, -1
+    for NA
+
+    Only aggregates on axis=0
+    '''
+    cdef:
+        Py_ssize_t i, j, N, K, ngroups, b, code
+        ndarray[int64_t] seen
+
+    if bins[len(bins) - 1] == len(values):
+        ngroups = len(bins)
+    else:
+        ngroups = len(bins) + 1
+
+    N, K = (<object> values).shape
+
+    seen = np.empty(values.max() + 1 if N * K > 0 else 0, dtype=np.int64)
+
+    out[:] = 0
+
+    for j in range(K):
+        seen.fill(-1)
+        with nogil:
+            b = 0
+            for i in range(N):
+                while b < ngroups - 1 and i >= bins[b]:
+                    b += 1
+
+                if j == 0:
+                    counts[b] += 1
+
+                code = values[i, j]
+                if code >= 0 and seen[code] != b:
+                    seen[code] = b
+                    out[b, j] += 1
+
+
+#----------------------------------------------------------------------
+# group-wise transforms, results are aligned with values
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def group_cumsum(ndarray[float64_t, ndim=2] out,
+                 ndarray[float64_t, ndim=2] values,
+                 ndarray[int64_t] labels, Py_ssize_t ngroups):
+    '''
+    Cumulative sum within each group, preserving the locations of NaN
+    '''
+    cdef:
+        Py_ssize_t i, j, N, K, lab
+        float64_t val
+        ndarray[float64_t, ndim=2] accum
+
+    N, K = (<object> values).shape
+    accum = np.zeros((ngroups, K), dtype=np.float64)
+
+    with nogil:
         for i in range(N):
-            while b < ngroups - 1 and i >= bins[b]:
-                b += 1
+            lab = labels[i]
+            for j in range(K):
+                val = values[i, j]
+                if lab < 0 or val != val:
+                    out[i, j] = nan
+                else:
+                    accum[lab, j] += val
+                    out[i, j] = accum[lab, j]
 
-            counts[b] += 1
-            val = values[i, 0]
 
-            # not nan
-            if val == val:
-                nobs[b, 0] += 1
-                sumx[b, 0] += val
-                sumxx[b, 0] += val * val
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def group_cumprod(ndarray[float64_t, ndim=2] out,
+                  ndarray[float64_t, ndim=2] values,
+                  ndarray[int64_t] labels, Py_ssize_t ngroups):
+    '''
+    Cumulative product within each group, preserving the locations of NaN
+    '''
+    cdef:
+        Py_ssize_t i, j, N, K, lab
+        float64_t val
+        ndarray[float64_t, ndim=2] accum
+
+    N, K = (<object> values).shape
+    accum = np.ones((ngroups, K), dtype=np.float64)
 
-    for i in range(ngroups):
-        for j in range(K):
-            ct = nobs[i, j]
-            if ct < 2:
-                out[i, j] = nan
+    with nogil:
+        for i in range(N):
+            lab = labels[i]
+            for j in range(K):
+                val = values[i, j]
+                if lab < 0 or val != val:
+                    out[i, j] = nan
+                else:
+                    accum[lab, j] *= val
+                    out[i, j] = accum[lab, j]
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def group_cummax(ndarray[float64_t, ndim=2] out,
+                 ndarray[float64_t, ndim=2] values,
+                 ndarray[int64_t] labels, Py_ssize_t ngroups):
+    '''
+    Cumulative max within each group, preserving the locations of NaN
+    '''
+    cdef:
+        Py_ssize_t i, j, N, K, lab
+        float64_t val
+        ndarray[float64_t, ndim=2] accum
+
+    N, K = (<object> values).shape
+    accum = np.empty((ngroups, K), dtype=np.float64)
+    accum.fill(-np.inf)
+
+    with nogil:
+        for i in range(N):
+            lab = labels[i]
+            for j in range(K):
+                val = values[i, j]
+                if lab < 0 or val != val:
+                    out[i, j] = nan
+                else:
+                    if val > accum[lab, j]:
+                        accum[lab, j] = val
+                    out[i, j] = accum[lab, j]
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def group_cummin(ndarray[float64_t, ndim=2] out,
+                 ndarray[float64_t, ndim=2] values,
+                 ndarray[int64_t] labels, Py_ssize_t ngroups):
+    '''
+    Cumulative min within each group, preserving the locations of NaN
+    '''
+    cdef:
+        Py_ssize_t i, j, N, K, lab
+        float64_t val
+        ndarray[float64_t, ndim=2] accum
+
+    N, K = (<object> values).shape
+    accum = np.empty((ngroups, K), dtype=np.float64)
+    accum.fill(np.inf)
+
+    with nogil:
+        for i in range(N):
+            lab = labels[i]
+            for j in range(K):
+                val = values[i, j]
+                if lab < 0 or val != val:
+                    out[i, j] = nan
+                else:
+                    if val < accum[lab, j]:
+                        accum[lab, j] = val
+                    out[i, j] = accum[lab, j]
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+@cython.cdivision(True)
+def group_shift_indexer(ndarray[int64_t] labels, Py_ssize_t ngroups,
+                        Py_ssize_t periods):
+    '''
+    Indexer taking each row from the row periods places before it in the
+    same group (after it if periods is negative), -1 where there is none
+    '''
+    cdef:
+        Py_ssize_t i, ii, N, lab, offset
+        ndarray[int64_t] indexer, ring, filled
+
+    N = len(labels)
+    indexer = np.empty(N, dtype=np.int64)
+
+    offset = periods if periods >= 0 else -periods
+
+    # the last offset rows seen in each group, in a ring buffer
+    ring = np.empty(ngroups * offset, dtype=np.int64)
+    filled = np.zeros(ngroups, dtype=np.int64)
+
+    with nogil:
+        for ii in range(N):
+            if periods > 0:
+                i = ii
+            else:
+                i = N - ii - 1
+
+            lab = labels[i]
+            if lab < 0:
+                indexer[i] = -1
+                continue
+
+            if offset == 0:
+                indexer[i] = i
+                continue
+
+            if filled[lab] < offset:
+                indexer[i] = -1
+            else:
+                indexer[i] = ring[lab * offset + filled[lab] % offset]
+
+            ring[lab * offset + filled[lab] % offset] = i
+            filled[lab] += 1
+
+    return indexer
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def group_fillna_indexer(ndarray[int64_t] labels,
+                         ndarray[uint8_t, cast=True] mask,
+                         Py_ssize_t ngroups, object method='pad',
+                         object limit=None):
+    '''
+    Indexer taking each NA row (where mask is set) from the last valid row
+    of the same group, the next one for method 'backfill'. -1 where there
+    is none within limit
+    '''
+    cdef:
+        Py_ssize_t i, ii, N, lab, lim
+        bint forward
+        ndarray[int64_t] indexer, last, run
+
+    N = len(labels)
+    indexer = np.empty(N, dtype=np.int64)
+
+    if method in ('pad', 'ffill'):
+        forward = 1
+    elif method in ('backfill', 'bfill'):
+        forward = 0
+    else:
+        raise ValueError('Invalid fill method %s' % method)
+
+    if limit is None:
+        lim = N
+    else:
+        lim = limit
+
+    # last valid row and the number of NA rows since, per group
+    last = np.empty(ngroups, dtype=np.int64)
+    last.fill(-1)
+    run = np.zeros(ngroups, dtype=np.int64)
+
+    with nogil:
+        for ii in range(N):
+            if forward:
+                i = ii
             else:
-                out[i, j] = ((ct * sumxx[i, j] - sumx[i, j] * sumx[i, j]) /
-                             (ct * ct - ct))
+                i = N - ii - 1
+
+            lab = labels[i]
+            if not mask[i]:
+                indexer[i] = i
+                if lab >= 0:
+                    last[lab] = i
+                    run[lab] = 0
+            elif lab < 0:
+                indexer[i] = -1
+            else:
+                run[lab] += 1
+                if run[lab] > lim:
+                    indexer[i] = -1
+                else:
+                    indexer[i] = last[lab]
+
+    return indexer
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+@cython.cdivision(True)
+def group_rank(ndarray[float64_t, ndim=2] out,
+               ndarray[float64_t, ndim=2] values,
+               ndarray[int64_t] labels, bint ascending=True):
+    '''
+    Rank (1 through n) of the values within each group. Equal values get
+    the average of their ranks, NaN stays NaN
+    '''
+    cdef:
+        Py_ssize_t i, j, k, N, K, start, lab, idx, nidx, rank
+        float64_t val, sum_ranks
+        ndarray[int64_t] sorter
+
+    N, K = (<object> values).shape
+
+    for j in range(K):
+        # by group, then by value with NaN last
+        if ascending:
+            sorter = np.lexsort((values[:, j], labels)).astype(np.int64)
+        else:
+            sorter = np.lexsort((-values[:, j], labels)).astype(np.int64)
+
+        with nogil:
+            i = 0
+            while i < N:
+                idx = sorter[i]
+                lab = labels[idx]
+                val = values[idx, j]
+
+                if lab < 0:
+                    out[idx, j] = nan
+                    i += 1
+                    continue
+
+                if i == 0 or labels[sorter[i - 1]] != lab:
+                    rank = 0
+
+                if val != val:
+                    out[idx, j] = nan
+                    i += 1
+                    continue
+
+                # run of ties
+                start = i
+                while i + 1 < N:
+                    nidx = sorter[i + 1]
+                    if labels[nidx] != lab or values[nidx, j] != val:
+                        break
+                    i += 1
+
+                sum_ranks = 0
+                for k in range(start, i + 1):
+                    rank += 1
+                    sum_ranks += rank
+
+                for k in range(start, i + 1):
+                    out[sorter[k], j] = sum_ranks / (i - start + 1)
 
+                i += 1
 
 
 @cython.boundscheck(False)
@@ -1392,6 +2031,33 @@ def duplicated(ndarray[object] values, take_last=False):
 
     return result.view(np.bool_)
 
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def duplicated_int64(ndarray[int64_t] labels, Py_ssize_t ngroups,
+                     take_last=False):
+    '''
+    Mark the repeated occurrences of labels in [0, ngroups), all but the
+    first one (the last one if take_last)
+    '''
+    cdef:
+        Py_ssize_t i, j, n = len(labels)
+        int64_t lab
+        bint last = take_last
+        ndarray[uint8_t] seen = np.zeros(ngroups, dtype=np.uint8)
+        ndarray[uint8_t] result = np.zeros(n, dtype=np.uint8)
+
+    with nogil:
+        for i in range(n):
+            j = n - i - 1 if last else i
+            lab = labels[j]
+
+            if seen[lab]:
+                result[j] = 1
+            else:
+                seen[lab] = 1
+
+    return result.view(np.bool_)
+
 def generate_slices(ndarray[int64_t] labels, Py_ssize_t ngroups):
     cdef:
         Py_ssize_t i, group_size, n, lab, start
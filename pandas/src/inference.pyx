@@ -397,6 +397,10 @@ def try_parse_dates(ndarray[object] values, parser=None,
     cdef:
         Py_ssize_t i, n
         ndarray[object] result
+        object val, parsed
+        bint use_iso = not dayfirst
+        dict seen = {}
+        pandas_datetimestruct dts
 
     from datetime import datetime
 
@@ -416,7 +420,17 @@ def try_parse_dates(ndarray[object] values, parser=None,
         # EAFP here
         try:
             for i from 0 <= i < n:
-                result[i] = parse_date(values[i])
+                val = values[i]
+                parsed = seen.get(val)
+                if parsed is None:
+                    if (util.is_string_object(val) and use_iso and
+                        _try_iso_8601(val, &dts)):
+                        parsed = datetime(dts.year, dts.month, dts.day,
+                                          dts.hour, dts.min, dts.sec, dts.us)
+                    else:
+                        parsed = parse_date(val)
+                    seen[val] = parsed
+                result[i] = parsed
         except Exception:
             # failed
             return values
@@ -669,6 +683,68 @@ def to_object_array_tuples(list rows):
     return result
 
 
+def sql_column_from_rows(list rows, Py_ssize_t j, object dtype=None):
+    """
+    Column j of a list of fetched rows as a 1-d array. If dtype is int64,
+    float64 or bool the values are written straight into an array of that
+    dtype, with None as NaN for float64; if any value does not fit, or for
+    any other dtype, the column comes back as object
+    """
+    cdef:
+        Py_ssize_t i, n = len(rows)
+        ndarray[int64_t] ints
+        ndarray[float64_t] floats
+        ndarray[uint8_t] bools
+        ndarray[object] result
+        object val
+
+    if dtype is not None:
+        dtype = np.dtype(dtype)
+
+    if dtype == np.int64:
+        ints = np.empty(n, dtype=np.int64)
+        for i in range(n):
+            val = rows[i][j]
+            if not util.is_integer_object(val):
+                break
+            try:
+                ints[i] = val
+            except OverflowError:
+                break
+        else:
+            return ints
+    elif dtype == np.float64:
+        floats = np.empty(n, dtype=np.float64)
+        for i in range(n):
+            val = rows[i][j]
+            if val is None:
+                floats[i] = NaN
+            elif util.is_float_object(val) or util.is_integer_object(val):
+                try:
+                    floats[i] = val
+                except OverflowError:
+                    break
+            else:
+                break
+        else:
+            return floats
+    elif dtype == np.bool_:
+        bools = np.empty(n, dtype=np.uint8)
+        for i in range(n):
+            val = rows[i][j]
+            if not util.is_bool_object(val):
+                break
+            bools[i] = val
+        else:
+            return bools.view(np.bool_)
+
+    result = np.empty(n, dtype=object)
+    for i in range(n):
+        result[i] = rows[i][j]
+    return result
+
+
+
 def fast_multiget(dict mapping, ndarray keys, default=np.nan):
     cdef:
         Py_ssize_t i, n = len(keys)
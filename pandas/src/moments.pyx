@@ -25,13 +25,12 @@
 #               Series: Prentice-Hall Series in Automatic Computation
 
 
-def kth_smallest(ndarray[double_t] a, Py_ssize_t k):
+cdef inline double_t kth_smallest_c(double_t* a, Py_ssize_t k,
+                                    Py_ssize_t n) nogil:
     cdef:
-        Py_ssize_t i,j,l,m,n
+        Py_ssize_t i,j,l,m
         double_t x, t
 
-    n = len(a)
-
     l = 0
     m = n-1
     while (l<m):
@@ -55,6 +54,12 @@ def kth_smallest(ndarray[double_t] a, Py_ssize_t k):
     return a[k]
 
 
+def kth_smallest(ndarray[double_t] a, Py_ssize_t k):
+    if not util.is_contiguous(a):
+        a = a.copy()
+    return kth_smallest_c(<double_t*> a.data, k, len(a))
+
+
 def median(ndarray arr):
     '''
     A faster median
@@ -114,6 +119,8 @@ def min_subseq(ndarray[double_t] arr):
 #-------------------------------------------------------------------------------
 # Rolling sum
 
+@cython.boundscheck(False)
+@cython.wraparound(False)
 def roll_sum(ndarray[double_t] input, int win, int minp):
     cdef double val, prev, sum_x = 0
     cdef int nobs = 0, i
@@ -123,39 +130,43 @@ def roll_sum(ndarray[double_t] input, int win, int minp):
 
     minp = _check_minp(minp, N)
 
-    for i from 0 <= i < minp - 1:
-        val = input[i]
+    with nogil:
+        for i from 0 <= i < minp - 1:
+            val = input[i]
 
-        # Not NaN
-        if val == val:
-            nobs += 1
-            sum_x += val
+            # Not NaN
+            if val == val:
+                nobs += 1
+                sum_x += val
 
-        output[i] = NaN
+            output[i] = NaN
 
-    for i from minp - 1 <= i < N:
-        val = input[i]
+        for i from minp - 1 <= i < N:
+            val = input[i]
 
-        if i > win - 1:
-            prev = input[i - win]
-            if prev == prev:
-                sum_x -= prev
-                nobs -= 1
+            if i > win - 1:
+                prev = input[i - win]
+                if prev == prev:
+                    sum_x -= prev
+                    nobs -= 1
 
-        if val == val:
-            nobs += 1
-            sum_x += val
+            if val == val:
+                nobs += 1
+                sum_x += val
 
-        if nobs >= minp:
-            output[i] = sum_x
-        else:
-            output[i] = NaN
+            if nobs >= minp:
+                output[i] = sum_x
+            else:
+                output[i] = NaN
 
     return output
 
 #-------------------------------------------------------------------------------
 # Rolling mean
 
+@cython.boundscheck(False)
+@cython.wraparound(False)
+@cython.cdivision(True)
 def roll_mean(ndarray[double_t] input,
                int win, int minp):
     cdef double val, prev, sum_x = 0
@@ -166,39 +177,43 @@ def roll_mean(ndarray[double_t] input,
 
     minp = _check_minp(minp, N)
 
-    for i from 0 <= i < minp - 1:
-        val = input[i]
+    with nogil:
+        for i from 0 <= i < minp - 1:
+            val = input[i]
 
-        # Not NaN
-        if val == val:
-            nobs += 1
-            sum_x += val
+            # Not NaN
+            if val == val:
+                nobs += 1
+                sum_x += val
 
-        output[i] = NaN
+            output[i] = NaN
 
-    for i from minp - 1 <= i < N:
-        val = input[i]
+        for i from minp - 1 <= i < N:
+            val = input[i]
 
-        if i > win - 1:
-            prev = input[i - win]
-            if prev == prev:
-                sum_x -= prev
-                nobs -= 1
+            if i > win - 1:
+                prev = input[i - win]
+                if prev == prev:
+                    sum_x -= prev
+                    nobs -= 1
 
-        if val == val:
-            nobs += 1
-            sum_x += val
+            if val == val:
+                nobs += 1
+                sum_x += val
 
-        if nobs >= minp:
-            output[i] = sum_x / nobs
-        else:
-            output[i] = NaN
+            if nobs >= minp:
+                output[i] = sum_x / nobs
+            else:
+                output[i] = NaN
 
     return output
 
 #-------------------------------------------------------------------------------
 # Exponentially weighted moving average
 
+@cython.boundscheck(False)
+@cython.wraparound(False)
+@cython.cdivision(True)
 def ewma(ndarray[double_t] input, double_t com):
     '''
     Compute exponentially-weighted moving average using center-of-mass.
@@ -220,30 +235,34 @@ def ewma(ndarray[double_t] input, double_t com):
     cdef ndarray[double_t] output = np.empty(N, dtype=float)
 
 
+    if N == 0:
+        return output
+
     neww = 1. / (1. + com)
     oldw = 1. - neww
     adj = oldw
 
-    output[0] = neww * input[0]
+    with nogil:
+        output[0] = neww * input[0]
 
-    for i from 1 <= i < N:
-        cur = input[i]
-        prev = output[i - 1]
+        for i from 1 <= i < N:
+            cur = input[i]
+            prev = output[i - 1]
 
-        if cur == cur:
-            if prev == prev:
-                output[i] = oldw * prev + neww * cur
+            if cur == cur:
+                if prev == prev:
+                    output[i] = oldw * prev + neww * cur
+                else:
+                    output[i] = neww * cur
             else:
-                output[i] = neww * cur
-        else:
-            output[i] = prev
+                output[i] = prev
 
-    for i from 0 <= i < N:
-        cur = input[i]
-        output[i] = output[i] / (1. - adj)
+        for i from 0 <= i < N:
+            cur = input[i]
+            output[i] = output[i] / (1. - adj)
 
-        if cur == cur:
-            adj *= oldw
+            if cur == cur:
+                adj *= oldw
 
     return output
 
@@ -259,6 +278,9 @@ def _check_minp(minp, N):
         raise ValueError('min_periods must be >= 0')
     return minp
 
+@cython.boundscheck(False)
+@cython.wraparound(False)
+@cython.cdivision(True)
 def roll_var(ndarray[double_t] input, int win, int minp):
     cdef double val, prev, sum_x = 0, sum_xx = 0, nobs = 0
     cdef Py_ssize_t i
@@ -268,42 +290,46 @@ def roll_var(ndarray[double_t] input, int win, int minp):
 
     minp = _check_minp(minp, N)
 
-    for i from 0 <= i < minp - 1:
-        val = input[i]
+    with nogil:
+        for i from 0 <= i < minp - 1:
+            val = input[i]
 
-        # Not NaN
-        if val == val:
-            nobs += 1
-            sum_x += val
-            sum_xx += val * val
+            # Not NaN
+            if val == val:
+                nobs += 1
+                sum_x += val
+                sum_xx += val * val
 
-        output[i] = NaN
+            output[i] = NaN
 
-    for i from minp - 1 <= i < N:
-        val = input[i]
+        for i from minp - 1 <= i < N:
+            val = input[i]
 
-        if i > win - 1:
-            prev = input[i - win]
-            if prev == prev:
-                sum_x -= prev
-                sum_xx -= prev * prev
-                nobs -= 1
+            if i > win - 1:
+                prev = input[i - win]
+                if prev == prev:
+                    sum_x -= prev
+                    sum_xx -= prev * prev
+                    nobs -= 1
 
-        if val == val:
-            nobs += 1
-            sum_x += val
-            sum_xx += val * val
+            if val == val:
+                nobs += 1
+                sum_x += val
+                sum_xx += val * val
 
-        if nobs >= minp:
-            output[i] = (nobs * sum_xx - sum_x * sum_x) / (nobs * nobs - nobs)
-        else:
-            output[i] = NaN
+            if nobs >= minp:
+                output[i] = (nobs * sum_xx - sum_x * sum_x) / (nobs * nobs - nobs)
+            else:
+                output[i] = NaN
 
     return output
 
 #-------------------------------------------------------------------------------
 # Rolling skewness
 
+@cython.boundscheck(False)
+@cython.wraparound(False)
+@cython.cdivision(True)
 def roll_skew(ndarray[double_t] input, int win, int minp):
     cdef double val, prev
     cdef double x = 0, xx = 0, xxx = 0
@@ -317,47 +343,48 @@ def roll_skew(ndarray[double_t] input, int win, int minp):
 
     minp = _check_minp(minp, N)
 
-    for i from 0 <= i < minp - 1:
-        val = input[i]
+    with nogil:
+        for i from 0 <= i < minp - 1:
+            val = input[i]
 
-        # Not NaN
-        if val == val:
-            nobs += 1
-            x += val
-            xx += val * val
-            xxx += val * val * val
+            # Not NaN
+            if val == val:
+                nobs += 1
+                x += val
+                xx += val * val
+                xxx += val * val * val
 
-        output[i] = NaN
+            output[i] = NaN
 
-    for i from minp - 1 <= i < N:
-        val = input[i]
+        for i from minp - 1 <= i < N:
+            val = input[i]
 
-        if i > win - 1:
-            prev = input[i - win]
-            if prev == prev:
-                x -= prev
-                xx -= prev * prev
-                xxx -= prev * prev * prev
+            if i > win - 1:
+                prev = input[i - win]
+                if prev == prev:
+                    x -= prev
+                    xx -= prev * prev
+                    xxx -= prev * prev * prev
 
-                nobs -= 1
+                    nobs -= 1
 
-        if val == val:
-            nobs += 1
-            x += val
-            xx += val * val
-            xxx += val * val * val
+            if val == val:
+                nobs += 1
+                x += val
+                xx += val * val
+                xxx += val * val * val
 
-        if nobs >= minp:
-            A = x / nobs
-            B = xx / nobs - A * A
-            C = xxx / nobs - A * A * A - 3 * A * B
+            if nobs >= minp:
+                A = x / nobs
+                B = xx / nobs - A * A
+                C = xxx / nobs - A * A * A - 3 * A * B
 
-            R = sqrt(B)
+                R = sqrt(B)
 
-            output[i] = ((sqrt(nobs * (nobs - 1.)) * C) /
-                         ((nobs-2) * R * R * R))
-        else:
-            output[i] = NaN
+                output[i] = ((sqrt(nobs * (nobs - 1.)) * C) /
+                             ((nobs-2) * R * R * R))
+            else:
+                output[i] = NaN
 
     return output
 
@@ -365,6 +392,9 @@ def roll_skew(ndarray[double_t] input, int win, int minp):
 # Rolling kurtosis
 
 
+@cython.boundscheck(False)
+@cython.wraparound(False)
+@cython.cdivision(True)
 def roll_kurt(ndarray[double_t] input,
                int win, int minp):
     cdef double val, prev
@@ -379,57 +409,58 @@ def roll_kurt(ndarray[double_t] input,
 
     minp = _check_minp(minp, N)
 
-    for i from 0 <= i < minp - 1:
-        val = input[i]
+    with nogil:
+        for i from 0 <= i < minp - 1:
+            val = input[i]
 
-        # Not NaN
-        if val == val:
-            nobs += 1
-
-            # seriously don't ask me why this is faster
-            x += val
-            xx += val * val
-            xxx += val * val * val
-            xxxx += val * val * val * val
-
-        output[i] = NaN
+            # Not NaN
+            if val == val:
+                nobs += 1
 
-    for i from minp - 1 <= i < N:
-        val = input[i]
-
-        if i > win - 1:
-            prev = input[i - win]
-            if prev == prev:
-                x -= prev
-                xx -= prev * prev
-                xxx -= prev * prev * prev
-                xxxx -= prev * prev * prev * prev
-
-                nobs -= 1
+                # seriously don't ask me why this is faster
+                x += val
+                xx += val * val
+                xxx += val * val * val
+                xxxx += val * val * val * val
 
-        if val == val:
-            nobs += 1
-            x += val
-            xx += val * val
-            xxx += val * val * val
-            xxxx += val * val * val * val
-
-        if nobs >= minp:
-            A = x / nobs
-            R = A * A
-            B = xx / nobs - R
-            R = R * A
-            C = xxx / nobs - R - 3 * A * B
-            R = R * A
-            D = xxxx / nobs - R - 6*B*A*A - 4*C*A
-
-            K = (nobs * nobs - 1.)*D/(B*B) - 3*((nobs-1.)**2)
-            K = K / ((nobs - 2.)*(nobs-3.))
-
-            output[i] = K
-        else:
             output[i] = NaN
 
+        for i from minp - 1 <= i < N:
+            val = input[i]
+
+            if i > win - 1:
+                prev = input[i - win]
+                if prev == prev:
+                    x -= prev
+                    xx -= prev * prev
+                    xxx -= prev * prev * prev
+                    xxxx -= prev * prev * prev * prev
+
+                    nobs -= 1
+
+            if val == val:
+                nobs += 1
+                x += val
+                xx += val * val
+                xxx += val * val * val
+                xxxx += val * val * val * val
+
+            if nobs >= minp:
+                A = x / nobs
+                R = A * A
+                B = xx / nobs - R
+                R = R * A
+                C = xxx / nobs - R - 3 * A * B
+                R = R * A
+                D = xxxx / nobs - R - 6*B*A*A - 4*C*A
+
+                K = (nobs * nobs - 1.)*D/(B*B) - 3*((nobs-1.)**2)
+                K = K / ((nobs - 2.)*(nobs-3.))
+
+                output[i] = K
+            else:
+                output[i] = NaN
+
     return output
 
 #-------------------------------------------------------------------------------
@@ -581,87 +612,628 @@ cdef double_t _get_min(object skiplist, int nobs, int minp):
     else:
         return NaN
 
+@cython.boundscheck(False)
+@cython.wraparound(False)
 def roll_quantile(ndarray[float64_t, cast=True] input, int win,
                   int minp, double quantile):
     '''
     O(N log(window)) implementation using skip list
     '''
-    cdef double val, prev, midpoint
-    cdef IndexableSkiplist skiplist
-    cdef Py_ssize_t nobs = 0, i
-    cdef Py_ssize_t N = len(input)
-    cdef ndarray[double_t] output = np.empty(N, dtype=float)
+    cdef double val, prev
+    cdef:
+        int ret = 0
+        skiplist_t *sl
+        Py_ssize_t idx, nobs = 0, i
+        Py_ssize_t N = len(input)
+        ndarray[double_t] output = np.empty(N, dtype=float)
 
-    skiplist = IndexableSkiplist(win)
+    if quantile < 0 or quantile > 1:
+        raise ValueError('quantile must be between 0 and 1')
+
+    # the skiplist needs at least one level, i.e. expected size >= 2
+    sl = skiplist_init(int_max(win, 2))
 
     minp = _check_minp(minp, N)
 
-    for i from 0 <= i < minp - 1:
-        val = input[i]
+    with nogil:
+        for i from 0 <= i < minp - 1:
+            val = input[i]
 
-        # Not NaN
-        if val == val:
-            nobs += 1
-            skiplist.insert(val)
+            # Not NaN
+            if val == val:
+                nobs += 1
+                skiplist_insert(sl, val)
 
-        output[i] = NaN
+            output[i] = NaN
 
-    for i from minp - 1 <= i < N:
-        val = input[i]
+        for i from minp - 1 <= i < N:
+            val = input[i]
 
-        if i > win - 1:
-            prev = input[i - win]
+            if i > win - 1:
+                prev = input[i - win]
 
-            if prev == prev:
-                skiplist.remove(prev)
-                nobs -= 1
+                if prev == prev:
+                    skiplist_remove(sl, prev)
+                    nobs -= 1
 
-        if val == val:
-            nobs += 1
-            skiplist.insert(val)
+            if val == val:
+                nobs += 1
+                skiplist_insert(sl, val)
 
-        if nobs >= minp:
-            idx = int((quantile / 1.) * (nobs - 1))
-            output[i] = skiplist.get(idx)
-        else:
-            output[i] = NaN
+            if nobs >= minp:
+                idx = <Py_ssize_t> (quantile * (nobs - 1))
+                output[i] = skiplist_get(sl, idx, &ret)
+            else:
+                output[i] = NaN
+
+    skiplist_destroy(sl)
 
     return output
 
 def roll_generic(ndarray[float64_t, cast=True] input, int win,
                  int minp, object func):
-    cdef ndarray[double_t] output, counts, bufarr
-    cdef Py_ssize_t i, n
-    cdef float64_t *buf, *oldbuf
+    '''
+    Apply func to each window of input. Every window is handed to func as
+    the same ndarray, whose data pointer and length are moved along input
+    (as Slider does in reduce.pyx), so no array is created per window
+    '''
+    cdef ndarray[double_t] output, counts
+    cdef ndarray bufarr
+    cdef Py_ssize_t i, n, start, orig_len
+    cdef char *orig_data
 
     if not input.flags.c_contiguous:
         input = input.copy('C')
 
-    buf = <float64_t*> input.data
-
     n = len(input)
     minp = _check_minp(minp, n)
     output = np.empty(n, dtype=float)
     counts = roll_sum(np.isfinite(input).astype(float), win, minp)
 
-    bufarr = np.empty(win, dtype=float)
-    oldbuf = <float64_t*> bufarr.data
+    bufarr = np.empty(int_max(win, 1), dtype=float)
+    orig_data = bufarr.data
+    orig_len = bufarr.shape[0]
+
+    try:
+        for i from 0 <= i < n:
+            if counts[i] >= minp:
+                start = int_max(i - win + 1, 0)
+                bufarr.data = input.data + start * sizeof(float64_t)
+                bufarr.shape[0] = i + 1 - start
+                output[i] = func(bufarr)
+            else:
+                output[i] = NaN
+    finally:
+        # so we don't free the wrong memory
+        bufarr.data = orig_data
+        bufarr.shape[0] = orig_len
 
-    n = len(input)
-    for i from 0 <= i < win:
-        if counts[i] >= minp:
-            output[i] = func(input[int_max(i - win + 1, 0) : i + 1])
+    return output
+
+#-------------------------------------------------------------------------------
+# Pairwise rolling / exponentially weighted covariance and correlation
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+@cython.cdivision(True)
+def roll_cov_pairwise(ndarray[float64_t, ndim=2] values, int win, int minp,
+                      bint corr=False):
+    '''
+    Rolling unbiased covariance, or correlation, of every pair of columns of
+    values over the observations where both are not NaN. The running sums of
+    each pair are updated once per row, rather than computing the moving
+    means of each pair separately
+
+    Returns
+    -------
+    y : ndarray (N x K x K)
+    '''
+    cdef:
+        Py_ssize_t i, j, k, N, K
+        double vx, vy, n, num, denom, result
+        ndarray[float64_t, ndim=2] nobs, sx, sy, sxx, syy, sxy
+        ndarray[float64_t, ndim=3] output
+
+    N, K = (<object> values).shape
+
+    minp = _check_minp(minp, N)
+
+    nobs = np.zeros((K, K), dtype=np.float64)
+    sx = np.zeros((K, K), dtype=np.float64)
+    sy = np.zeros((K, K), dtype=np.float64)
+    sxx = np.zeros((K, K), dtype=np.float64)
+    syy = np.zeros((K, K), dtype=np.float64)
+    sxy = np.zeros((K, K), dtype=np.float64)
+    output = np.empty((N, K, K), dtype=np.float64)
+
+    with nogil:
+        for i from 0 <= i < N:
+            for j from 0 <= j < K:
+                for k from j <= k < K:
+                    if i > win - 1:
+                        vx = values[i - win, j]
+                        vy = values[i - win, k]
+                        if vx == vx and vy == vy:
+                            nobs[j, k] -= 1
+                            sx[j, k] -= vx
+                            sy[j, k] -= vy
+                            sxx[j, k] -= vx * vx
+                            syy[j, k] -= vy * vy
+                            sxy[j, k] -= vx * vy
+
+                    vx = values[i, j]
+                    vy = values[i, k]
+                    if vx == vx and vy == vy:
+                        nobs[j, k] += 1
+                        sx[j, k] += vx
+                        sy[j, k] += vy
+                        sxx[j, k] += vx * vx
+                        syy[j, k] += vy * vy
+                        sxy[j, k] += vx * vy
+
+                    n = nobs[j, k]
+                    if n >= minp and n > 1:
+                        num = n * sxy[j, k] - sx[j, k] * sy[j, k]
+                        if corr:
+                            denom = ((n * sxx[j, k] - sx[j, k] * sx[j, k]) *
+                                     (n * syy[j, k] - sy[j, k] * sy[j, k]))
+                            if denom > 0:
+                                result = num / sqrt(denom)
+                            else:
+                                result = NaN
+                        else:
+                            result = num / (n * n - n)
+                    else:
+                        result = NaN
+
+                    output[i, j, k] = result
+                    output[i, k, j] = result
+
+    return output
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+@cython.cdivision(True)
+def ewm_cov_pairwise(ndarray[float64_t, ndim=2] values, double com, int minp,
+                     bint bias=False, bint corr=False):
+    '''
+    Exponentially-weighted covariance, or correlation, of every pair of
+    columns of values over the observations where both are not NaN, as
+    ewmcov / ewmcorr would compute for each pair
+
+    Returns
+    -------
+    y : ndarray (N x K x K)
+    '''
+    cdef:
+        Py_ssize_t i, j, k, N, K
+        double vx, vy, neww, oldw, bias_adj, d, ax, ay, cov, denom, result
+        bint valid
+        ndarray[float64_t, ndim=2] mx, my, mxx, myy, mxy, adj
+        ndarray[int64_t, ndim=2] first
+        ndarray[float64_t, ndim=3] output
+
+    N, K = (<object> values).shape
+
+    neww = 1. / (1. + com)
+    oldw = 1. - neww
+    bias_adj = (1.0 + 2.0 * com) / (2.0 * com)
+
+    # unadjusted moving averages of x, y, x * x, y * y and x * y
+    mx = np.empty((K, K), dtype=np.float64)
+    mx.fill(NaN)
+    my = mx.copy()
+    mxx = mx.copy()
+    myy = mx.copy()
+    mxy = mx.copy()
+
+    adj = np.empty((K, K), dtype=np.float64)
+    adj.fill(oldw)
+
+    # position of the first observation of each pair
+    first = np.empty((K, K), dtype=np.int64)
+    first.fill(-1)
+
+    output = np.empty((N, K, K), dtype=np.float64)
+
+    with nogil:
+        for i from 0 <= i < N:
+            for j from 0 <= j < K:
+                for k from j <= k < K:
+                    vx = values[i, j]
+                    vy = values[i, k]
+                    valid = vx == vx and vy == vy
+
+                    if valid:
+                        if first[j, k] < 0:
+                            first[j, k] = i
+                            mx[j, k] = neww * vx
+                            my[j, k] = neww * vy
+                            mxx[j, k] = neww * (vx * vx)
+                            myy[j, k] = neww * (vy * vy)
+                            mxy[j, k] = neww * (vx * vy)
+                        else:
+                            mx[j, k] = oldw * mx[j, k] + neww * vx
+                            my[j, k] = oldw * my[j, k] + neww * vy
+                            mxx[j, k] = oldw * mxx[j, k] + neww * (vx * vx)
+                            myy[j, k] = oldw * myy[j, k] + neww * (vy * vy)
+                            mxy[j, k] = oldw * mxy[j, k] + neww * (vx * vy)
+
+                    if first[j, k] < 0 or i < first[j, k] + minp:
+                        result = NaN
+                    else:
+                        d = 1. - adj[j, k]
+                        ax = mx[j, k] / d
+                        ay = my[j, k] / d
+                        cov = mxy[j, k] / d - ax * ay
+
+                        if corr:
+                            denom = ((mxx[j, k] / d - ax * ax) *
+                                     (myy[j, k] / d - ay * ay))
+                            if denom > 0:
+                                result = cov / sqrt(denom)
+                            else:
+                                result = NaN
+                        elif bias:
+                            result = cov
+                        else:
+                            result = cov * bias_adj
+
+                    if valid:
+                        adj[j, k] *= oldw
+
+                    output[i, j, k] = result
+                    output[i, k, j] = result
+
+    return output
+
+#-------------------------------------------------------------------------------
+# Online (incremental) moments
+#
+# Stateful counterparts of the kernels above: observations are pushed in
+# chunks through update() and the moment is returned for each of them, equal
+# to what the batch function would give at the same position of the
+# concatenated input. The last win observations are kept in a ring buffer so
+# that they can be removed from the running state when they leave the window.
+
+cdef class OnlineRolling:
+    '''
+    Base class for the online rolling moments. Subclasses maintain their
+    state in _add / _remove and compute the statistic in _result
+    '''
+    cdef readonly:
+        int win, minp
+        Py_ssize_t nobs, nseen
+
+    cdef ndarray ring
+
+    def __init__(self, int win, int minp=0):
+        if win < 1:
+            raise ValueError('window must be > 0')
+        if minp < 0:
+            raise ValueError('min_periods must be >= 0')
+
+        self.win = win
+        self.minp = int_max(minp, 1)
+        self.nobs = 0
+        self.nseen = 0
+        self.ring = np.empty(win, dtype=np.float64)
+
+    cdef void _add(self, double val):
+        pass
+
+    cdef void _remove(self, double val):
+        pass
+
+    cdef double _result(self) except *:
+        return NaN
+
+    @cython.boundscheck(False)
+    @cython.wraparound(False)
+    def update(self, ndarray[double_t] input):
+        '''
+        Push new observations, returning the moment at each of them
+        '''
+        cdef:
+            Py_ssize_t i, loc, N = len(input)
+            double val, prev
+            ndarray[double_t] ring = self.ring
+            ndarray[double_t] output = np.empty(N, dtype=float)
+
+        for i from 0 <= i < N:
+            val = input[i]
+            loc = self.nseen % self.win
+
+            if self.nseen >= self.win:
+                prev = ring[loc]
+                if prev == prev:
+                    self._remove(prev)
+                    self.nobs -= 1
+
+            ring[loc] = val
+            self.nseen += 1
+
+            if val == val:
+                self.nobs += 1
+                self._add(val)
+
+            if self.nobs >= self.minp:
+                output[i] = self._result()
+            else:
+                output[i] = NaN
+
+        return output
+
+
+cdef class OnlineRollingSum(OnlineRolling):
+    cdef double x
+
+    cdef void _add(self, double val):
+        self.x += val
+
+    cdef void _remove(self, double val):
+        self.x -= val
+
+    cdef double _result(self) except *:
+        return self.x
+
+
+cdef class OnlineRollingMean(OnlineRollingSum):
+
+    cdef double _result(self) except *:
+        return self.x / self.nobs
+
+
+cdef class OnlineRollingVar(OnlineRolling):
+    cdef double x, xx
+
+    cdef void _add(self, double val):
+        self.x += val
+        self.xx += val * val
+
+    cdef void _remove(self, double val):
+        self.x -= val
+        self.xx -= val * val
+
+    cdef double _result(self) except *:
+        cdef double nobs = self.nobs
+        if nobs < 2:
+            return NaN
+        return (nobs * self.xx - self.x * self.x) / (nobs * nobs - nobs)
+
+
+cdef class OnlineRollingSkew(OnlineRolling):
+    cdef double x, xx, xxx
+
+    cdef void _add(self, double val):
+        self.x += val
+        self.xx += val * val
+        self.xxx += val * val * val
+
+    cdef void _remove(self, double val):
+        self.x -= val
+        self.xx -= val * val
+        self.xxx -= val * val * val
+
+    cdef double _result(self) except *:
+        cdef:
+            Py_ssize_t nobs = self.nobs
+            double A, B, C, R
+
+        if nobs < 3:
+            return NaN
+
+        A = self.x / nobs
+        B = self.xx / nobs - A * A
+        C = self.xxx / nobs - A * A * A - 3 * A * B
+
+        R = sqrt(B)
+
+        return ((sqrt(nobs * (nobs - 1.)) * C) /
+                ((nobs-2) * R * R * R))
+
+
+cdef class OnlineRollingKurt(OnlineRolling):
+    cdef double x, xx, xxx, xxxx
+
+    cdef void _add(self, double val):
+        self.x += val
+        self.xx += val * val
+        self.xxx += val * val * val
+        self.xxxx += val * val * val * val
+
+    cdef void _remove(self, double val):
+        self.x -= val
+        self.xx -= val * val
+        self.xxx -= val * val * val
+        self.xxxx -= val * val * val * val
+
+    cdef double _result(self) except *:
+        cdef:
+            Py_ssize_t nobs = self.nobs
+            double A, B, C, D, R, K
+
+        if nobs < 4:
+            return NaN
+
+        A = self.x / nobs
+        R = A * A
+        B = self.xx / nobs - R
+        R = R * A
+        C = self.xxx / nobs - R - 3 * A * B
+        R = R * A
+        D = self.xxxx / nobs - R - 6*B*A*A - 4*C*A
+
+        K = (nobs * nobs - 1.)*D/(B*B) - 3*((nobs-1.)**2)
+        return K / ((nobs - 2.)*(nobs-3.))
+
+
+cdef class OnlineRollingOrder(OnlineRolling):
+    '''
+    Base for the order statistics, kept sorted in a skiplist
+    '''
+    cdef skiplist_t *sl
+
+    def __cinit__(self, int win, int minp=0):
+        # the skiplist needs at least one level, i.e. expected size >= 2
+        self.sl = skiplist_init(int_max(win, 2))
+
+    def __dealloc__(self):
+        if self.sl != NULL:
+            skiplist_destroy(self.sl)
+
+    cdef void _add(self, double val):
+        skiplist_insert(self.sl, val)
+
+    cdef void _remove(self, double val):
+        skiplist_remove(self.sl, val)
+
+
+cdef class OnlineRollingMedian(OnlineRollingOrder):
+
+    cdef double _result(self) except *:
+        cdef:
+            int ret = 0
+            Py_ssize_t midpoint = self.nobs / 2
+
+        if self.nobs % 2:
+            return skiplist_get(self.sl, midpoint, &ret)
         else:
-            output[i] = NaN
+            return (skiplist_get(self.sl, midpoint, &ret) +
+                    skiplist_get(self.sl, midpoint - 1, &ret)) / 2
 
-    for i from win <= i < n:
-        buf = buf + 1
-        bufarr.data = <char*> buf
-        if counts[i] >= minp:
-            output[i] = func(bufarr)
+
+cdef class OnlineRollingMax(OnlineRollingOrder):
+
+    cdef double _result(self) except *:
+        cdef int ret = 0
+        return skiplist_get(self.sl, self.nobs - 1, &ret)
+
+
+cdef class OnlineRollingMin(OnlineRollingOrder):
+
+    cdef double _result(self) except *:
+        cdef int ret = 0
+        return skiplist_get(self.sl, 0, &ret)
+
+
+cdef class OnlineEWMA:
+    '''
+    Online counterpart of ewma. The first minp values from the first
+    non-NaN observation on are masked, as in pandas.stats.moments.ewma
+    '''
+    cdef readonly:
+        double com
+        int minp
+        Py_ssize_t nseen, first_valid
+
+    cdef double neww, oldw, adj, prev
+
+    def __init__(self, double com, int minp=0):
+        self.com = com
+        self.minp = minp
+        self.neww = 1. / (1. + com)
+        self.oldw = 1. - self.neww
+        self.adj = self.oldw
+        self.prev = NaN
+        self.nseen = 0
+        self.first_valid = -1
+
+    @cython.boundscheck(False)
+    @cython.wraparound(False)
+    def update(self, ndarray[double_t] input):
+        '''
+        Push new observations, returning the moving average at each of them
+        '''
+        cdef:
+            Py_ssize_t i, N = len(input)
+            double cur, result
+            ndarray[double_t] output = np.empty(N, dtype=float)
+
+        for i from 0 <= i < N:
+            cur = input[i]
+
+            if cur == cur:
+                if self.prev == self.prev:
+                    self.prev = self.oldw * self.prev + self.neww * cur
+                else:
+                    self.prev = self.neww * cur
+
+                if self.first_valid < 0:
+                    self.first_valid = self.nseen
+
+            result = self.prev / (1. - self.adj)
+            if cur == cur:
+                self.adj *= self.oldw
+
+            if (self.first_valid >= 0 and
+                self.nseen < self.first_valid + self.minp):
+                result = NaN
+
+            output[i] = result
+            self.nseen += 1
+
+        return output
+
+#-------------------------------------------------------------------------------
+# Variable-width (time based) windows
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def roll_window_starts(ndarray[int64_t] index, int64_t win):
+    '''
+    For each position i of the sorted i8 values in index, the position of
+    the first value in the half-open interval (index[i] - win, index[i]]
+
+    Returns
+    -------
+    start : ndarray (int64)
+    '''
+    cdef:
+        Py_ssize_t i, j = 0, N = len(index)
+        ndarray[int64_t] start = np.empty(N, dtype=np.int64)
+
+    if win <= 0:
+        raise ValueError('window must be > 0')
+
+    with nogil:
+        for i from 0 <= i < N:
+            while j < i and index[j] <= index[i] - win:
+                j += 1
+            start[i] = j
+
+    return start
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def roll_variable(OnlineRolling state, ndarray[double_t] input,
+                  ndarray[int64_t] start):
+    '''
+    Compute a moving statistic over windows input[start[i]:i + 1], given the
+    accumulator for it. Both ends of the window only ever move forward, so
+    each observation is added and removed once
+    '''
+    cdef:
+        Py_ssize_t i, j = 0, N = len(input)
+        double val, prev
+        ndarray[double_t] output = np.empty(N, dtype=float)
+
+    for i from 0 <= i < N:
+        while j < start[i]:
+            prev = input[j]
+            if prev == prev:
+                state._remove(prev)
+                state.nobs -= 1
+            j += 1
+
+        val = input[i]
+        if val == val:
+            state.nobs += 1
+            state._add(val)
+
+        if state.nobs >= state.minp:
+            output[i] = state._result()
         else:
             output[i] = NaN
 
-    bufarr.data = <char*> oldbuf
-
     return output
@@ -775,11 +775,11 @@ parse_iso_8601_datetime(char *str, int len,
 
 parse_timezone:
     if (sublen == 0) {
-        if (convert_datetimestruct_local_to_utc(out, out) < 0) {
-            goto error;
-        }
-
-        /* Since neither "Z" nor a time-zone was specified, it's local */
+        /*
+         * Unlike NumPy, a string without a time zone is left naive
+         * rather than converted from the machine's local time, which
+         * is how dateutil (and datetime) interpret it
+         */
         if (out_local != NULL) {
             *out_local = 1;
         }
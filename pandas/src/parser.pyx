@@ -0,0 +1,875 @@
+"""
+Column-oriented delimited text tokenizer backing the ``engine='c'`` option of
+read_csv / read_table.
+
+The input is tokenized in one pass into a flat, NUL-separated character stream
+plus an array of word offsets; columns are then converted straight from the
+character stream into typed int64 / float64 / bool buffers (with NA detection
+done on the raw bytes) so no intermediate Python string is created for numeric
+data. File input is read in fixed-size blocks as rows are requested, so
+reading in chunks keeps only the rows of the current chunk in memory.
+"""
+
+cimport numpy as np
+cimport cython
+import numpy as np
+
+from numpy cimport ndarray, int64_t, float64_t, uint8_t
+
+from libc.stdlib cimport malloc, realloc, free
+from libc.string cimport memmove, memcmp, strlen
+
+cdef extern from "stdlib.h":
+    double strtod(char *nptr, char **endptr)
+
+cdef extern from "Python.h":
+    object PyBytes_FromStringAndSize(char *v, Py_ssize_t len)
+    object PyUnicode_Decode(char *s, Py_ssize_t size, char *encoding,
+                            char *errors)
+
+cdef extern from "limits.h":
+    long long LLONG_MAX
+
+import sys
+cdef bint PY3 = sys.version_info[0] >= 3
+
+cdef double NaN = <double> np.NaN
+
+np.import_array()
+
+# tokenizer states
+cdef enum TokenizerState:
+    START_RECORD
+    START_FIELD
+    IN_FIELD
+    IN_QUOTED_FIELD
+    QUOTE_IN_QUOTED_FIELD
+    EAT_COMMENT
+
+# column types, in order of preference
+cdef enum ColumnType:
+    COL_INT64
+    COL_FLOAT64
+    COL_BOOL
+    COL_OBJECT
+
+
+cdef inline bint _is_space(char c):
+    return c == ' ' or c == '\t'
+
+
+cdef inline bint _to_int64(char *p, char tsep, int64_t *out):
+    """
+    Parse a whole word as a (possibly signed) integer, skipping thousands
+    separators between digits. Returns 0 on failure or overflow.
+    """
+    cdef:
+        bint neg = 0
+        int ndigits = 0
+        unsigned long long number = 0
+        unsigned long long limit
+        int digit
+
+    while _is_space(p[0]):
+        p += 1
+
+    if p[0] == '-':
+        neg = 1
+        p += 1
+    elif p[0] == '+':
+        p += 1
+
+    if neg:
+        limit = (<unsigned long long> LLONG_MAX) + 1
+    else:
+        limit = <unsigned long long> LLONG_MAX
+
+    while True:
+        if p[0] >= '0' and p[0] <= '9':
+            digit = p[0] - c'0'
+            if number > (limit - digit) / 10:
+                return 0
+            number = number * 10 + digit
+            ndigits += 1
+        elif p[0] == tsep and tsep != 0 and ndigits > 0:
+            pass
+        else:
+            break
+        p += 1
+
+    while _is_space(p[0]):
+        p += 1
+
+    if ndigits == 0 or p[0] != 0:
+        return 0
+
+    if neg:
+        out[0] = -(<int64_t> (number - 1)) - 1
+    else:
+        out[0] = <int64_t> number
+    return 1
+
+
+# powers of ten that are exactly representable as doubles
+cdef double _pow10[23]
+cdef int _k
+_pow10[0] = 1.
+for _k in range(1, 23):
+    _pow10[_k] = _pow10[_k - 1] * 10.
+
+
+cdef inline bint _to_float64_fast(char *p, float64_t *out):
+    """
+    Exact conversion of plain decimals such as '-12.345' whose digits fit in
+    the 53-bit mantissa: a single correctly rounded multiply or divide by an
+    exactly representable power of ten. Returns 0 if the word needs the
+    general path.
+    """
+    cdef:
+        bint neg = 0
+        int ndigits = 0, nfrac = 0
+        unsigned long long mantissa = 0
+
+    while _is_space(p[0]):
+        p += 1
+
+    if p[0] == '-':
+        neg = 1
+        p += 1
+    elif p[0] == '+':
+        p += 1
+
+    while p[0] >= '0' and p[0] <= '9':
+        mantissa = mantissa * 10 + (p[0] - c'0')
+        ndigits += 1
+        p += 1
+
+    if p[0] == '.':
+        p += 1
+        while p[0] >= '0' and p[0] <= '9':
+            mantissa = mantissa * 10 + (p[0] - c'0')
+            ndigits += 1
+            nfrac += 1
+            p += 1
+
+    while _is_space(p[0]):
+        p += 1
+
+    # at most 15 digits keeps the mantissa below 2 ** 53
+    if p[0] != 0 or ndigits == 0 or ndigits > 15:
+        return 0
+
+    out[0] = (<double> mantissa) / _pow10[nfrac]
+    if neg:
+        out[0] = -out[0]
+    return 1
+
+
+cdef inline bint _to_float64(char *p, char tsep, char *scratch,
+                             float64_t *out):
+    """
+    Parse a whole word as a double. Hex notation is rejected to match
+    Python's float(). Returns 0 on failure.
+    """
+    cdef:
+        char *q
+        char *end
+
+    if tsep != 0:
+        q = scratch
+        while p[0] != 0:
+            if p[0] != tsep:
+                q[0] = p[0]
+                q += 1
+            p += 1
+        q[0] = 0
+        p = scratch
+
+    if _to_float64_fast(p, out):
+        return 1
+
+    q = p
+    while q[0] != 0:
+        if q[0] == 'x' or q[0] == 'X':
+            return 0
+        q += 1
+
+    out[0] = strtod(p, &end)
+    if end == p:
+        return 0
+    while _is_space(end[0]):
+        end += 1
+    return end[0] == 0
+
+
+cdef class TextReader:
+    """
+    Tokenize delimited text and convert it column by column.
+
+    Parameters
+    ----------
+    source : str, unicode or file-like object
+        Text to parse, or an object whose read(size) method returns it in
+        blocks
+    delimiter : str, default ','
+        Single-character field separator
+    quotechar : str, default '"'
+    comment : str, default None
+        Single character marking the remainder of a line as a comment
+    thousands : str, default None
+        Thousands separator skipped when parsing numbers
+    skiprows : set, default None
+        Row numbers (0-indexed, counting every line) to skip
+    skip_footer : int, default 0
+        Number of rows at the bottom of the file to skip
+    encoding : str, default None
+        Encoding used to decode string columns, and to encode unicode input
+    block_size : int, default 262144
+        Number of characters requested from a file-like source at a time
+    """
+
+    cdef:
+        # file-like source, None for text input
+        object source
+        Py_ssize_t block_size
+
+        # the block being tokenized, and whether it is the last one
+        object block
+        char *data
+        Py_ssize_t datalen, datapos
+        bint exhausted
+
+        char delimiter, quotechar, commentchar, tsep
+        TokenizerState state
+
+        # the last character was a \r, so skip a following \n
+        bint skip_lf
+
+        # NUL-separated words
+        char *stream
+        Py_ssize_t stream_len, stream_cap
+
+        # word offsets into stream
+        Py_ssize_t *words
+        Py_ssize_t words_len, words_cap
+
+        # per line: index of first word, number of words
+        Py_ssize_t *line_start
+        Py_ssize_t *line_fields
+        Py_ssize_t lines, lines_cap
+
+        Py_ssize_t file_lines, cursor, max_fields
+        bint eof
+
+        set skiprows
+        object encoding
+
+    cdef public:
+        int skip_footer
+        object na_values, col_na_values, raw_columns
+
+    def __cinit__(self, source, delimiter=',', quotechar='"', comment=None,
+                  thousands=None, skiprows=None, skip_footer=0,
+                  encoding=None, block_size=262144):
+        if block_size <= 0:
+            raise ValueError('block_size must be positive')
+
+        self.encoding = encoding
+        self.block_size = block_size
+
+        if hasattr(source, 'read'):
+            self.source = source
+            self._set_block(b'')
+            self.exhausted = 0
+        else:
+            self.source = None
+            self._set_block(source)
+            self.exhausted = 1
+
+        self.delimiter = self._get_char(delimiter, 'delimiter')
+        self.quotechar = self._get_char(quotechar, 'quotechar')
+        self.commentchar = self._get_char(comment, 'comment')
+        self.tsep = self._get_char(thousands, 'thousands')
+        self.state = START_RECORD
+        self.skip_lf = 0
+
+        self.skiprows = set() if skiprows is None else set(skiprows)
+        self.skip_footer = skip_footer
+
+        self.stream_cap = max(self.datalen + 1, 64)
+        self.stream = <char*> malloc(self.stream_cap)
+        self.stream_len = 0
+
+        self.words_cap = 1024
+        self.words = <Py_ssize_t*> malloc((self.words_cap + 1) *
+                                          sizeof(Py_ssize_t))
+        self.words_len = 0
+        self.words[0] = 0
+
+        self.lines_cap = 256
+        self.line_start = <Py_ssize_t*> malloc(self.lines_cap *
+                                               sizeof(Py_ssize_t))
+        self.line_fields = <Py_ssize_t*> malloc(self.lines_cap *
+                                                sizeof(Py_ssize_t))
+        self.lines = 0
+
+        if (self.stream == NULL or self.words == NULL or
+            self.line_start == NULL or self.line_fields == NULL):
+            raise MemoryError
+
+        self.file_lines = 0
+        self.cursor = 0
+        self.max_fields = 0
+        self.eof = 0
+
+        self.na_values = set()
+        self.col_na_values = {}
+        self.raw_columns = set()
+
+    def __dealloc__(self):
+        free(self.stream)
+        free(self.words)
+        free(self.line_start)
+        free(self.line_fields)
+
+    cdef char _get_char(self, object value, object name) except? 0:
+        if value is None:
+            return 0
+        if isinstance(value, unicode):
+            value = value.encode('utf-8')
+        if len(value) != 1:
+            raise ValueError('%s must be a single character' % name)
+        return (<char*> value)[0]
+
+    #----------------------------------------------------------------------
+    # Input
+
+    cdef _set_block(self, object block):
+        if isinstance(block, unicode):
+            if self.encoding is None:
+                self.encoding = 'utf-8'
+            block = block.encode(self.encoding)
+        elif not isinstance(block, bytes):
+            raise TypeError('Expected text, got %s' % type(block).__name__)
+
+        self.block = block
+        self.data = <char*> block
+        self.datalen = len(block)
+        self.datapos = 0
+
+    cdef bint _next_block(self) except -1:
+        """
+        Read the next block of the source. Returns False at the end of the
+        input
+        """
+        if self.exhausted:
+            return 0
+
+        block = self.source.read(self.block_size)
+        if len(block) == 0:
+            self.exhausted = 1
+            return 0
+
+        self._set_block(block)
+        return 1
+
+    #----------------------------------------------------------------------
+    # Tokenization
+
+    cdef int _reserve_stream(self, Py_ssize_t nchars) except -1:
+        cdef char *tmp
+        if self.stream_len + nchars > self.stream_cap:
+            self.stream_cap = max(2 * self.stream_cap, self.stream_len + nchars)
+            tmp = <char*> realloc(self.stream, self.stream_cap)
+            if tmp == NULL:
+                raise MemoryError
+            self.stream = tmp
+        return 0
+
+    cdef inline void _push_char(self, char c):
+        # capacity is reserved up front in _tokenize_rows
+        self.stream[self.stream_len] = c
+        self.stream_len += 1
+
+    cdef int _end_field(self) except -1:
+        cdef Py_ssize_t *tmp
+        self._push_char(0)
+        if self.words_len >= self.words_cap:
+            self.words_cap *= 2
+            tmp = <Py_ssize_t*> realloc(self.words, (self.words_cap + 1) *
+                                        sizeof(Py_ssize_t))
+            if tmp == NULL:
+                raise MemoryError
+            self.words = tmp
+        # words[words_len] always holds the start of the word being filled
+        self.words_len += 1
+        self.words[self.words_len] = self.stream_len
+        return 0
+
+    cdef int _end_line(self) except -1:
+        cdef:
+            Py_ssize_t start, nfields
+            Py_ssize_t *tmp
+
+        start = self._current_line_start()
+        nfields = self.words_len - start
+
+        if nfields > 0 and self.file_lines in self.skiprows:
+            # discard the words of a skipped row
+            self.words_len = start
+            self.stream_len = self.words[start]
+            nfields = 0
+
+        self.file_lines += 1
+
+        if nfields == 0:
+            return 0
+
+        if self.lines >= self.lines_cap:
+            self.lines_cap *= 2
+            tmp = <Py_ssize_t*> realloc(self.line_start, self.lines_cap *
+                                        sizeof(Py_ssize_t))
+            if tmp == NULL:
+                raise MemoryError
+            self.line_start = tmp
+            tmp = <Py_ssize_t*> realloc(self.line_fields, self.lines_cap *
+                                        sizeof(Py_ssize_t))
+            if tmp == NULL:
+                raise MemoryError
+            self.line_fields = tmp
+
+        self.line_start[self.lines] = start
+        self.line_fields[self.lines] = nfields
+        self.lines += 1
+
+        if nfields > self.max_fields:
+            self.max_fields = nfields
+        return 0
+
+    cdef inline Py_ssize_t _current_line_start(self):
+        if self.lines == 0:
+            return 0
+        return (self.line_start[self.lines - 1] +
+                self.line_fields[self.lines - 1])
+
+    cdef int _tokenize_rows(self, Py_ssize_t nrows) except -1:
+        """
+        Tokenize until at least nrows complete lines are buffered or the end
+        of the input is reached, reading further blocks of the source as
+        needed
+        """
+        cdef:
+            char c
+            char *data = self.data
+            Py_ssize_t pos = self.datapos
+            Py_ssize_t datalen = self.datalen
+            char delimiter = self.delimiter
+            char quotechar = self.quotechar
+            char commentchar = self.commentchar
+            TokenizerState state = self.state
+            bint skip_lf = self.skip_lf
+
+        # every input character yields at most one output character, plus
+        # the terminator of a final unterminated field
+        self._reserve_stream(datalen - pos + 1)
+
+        while self.lines < nrows:
+            if pos >= datalen:
+                if not self._next_block():
+                    break
+                data = self.data
+                pos = 0
+                datalen = self.datalen
+                self._reserve_stream(datalen + 1)
+
+            c = data[pos]
+            pos += 1
+
+            # treat \r\n and a lone \r as a single line terminator. The
+            # \n may start the next block
+            if skip_lf:
+                skip_lf = 0
+                if c == '\n':
+                    continue
+            if c == '\r':
+                skip_lf = 1
+                c = '\n'
+
+            if state == START_RECORD:
+                if c == '\n':
+                    self.file_lines += 1
+                    continue
+                elif c == commentchar and commentchar != 0:
+                    state = EAT_COMMENT
+                    continue
+                state = START_FIELD
+
+            if state == START_FIELD:
+                if c == quotechar and quotechar != 0:
+                    state = IN_QUOTED_FIELD
+                elif c == delimiter:
+                    self._end_field()
+                elif c == '\n':
+                    self._end_field()
+                    self._end_line()
+                    state = START_RECORD
+                elif c == commentchar and commentchar != 0:
+                    state = EAT_COMMENT
+                else:
+                    self._push_char(c)
+                    state = IN_FIELD
+            elif state == IN_FIELD:
+                if c == delimiter:
+                    self._end_field()
+                    state = START_FIELD
+                elif c == '\n':
+                    self._end_field()
+                    self._end_line()
+                    state = START_RECORD
+                elif c == commentchar and commentchar != 0:
+                    self._end_field()
+                    state = EAT_COMMENT
+                else:
+                    self._push_char(c)
+            elif state == IN_QUOTED_FIELD:
+                if c == quotechar:
+                    state = QUOTE_IN_QUOTED_FIELD
+                else:
+                    self._push_char(c)
+            elif state == QUOTE_IN_QUOTED_FIELD:
+                if c == quotechar:
+                    # doubled quote
+                    self._push_char(c)
+                    state = IN_QUOTED_FIELD
+                elif c == delimiter:
+                    self._end_field()
+                    state = START_FIELD
+                elif c == '\n':
+                    self._end_field()
+                    self._end_line()
+                    state = START_RECORD
+                else:
+                    self._push_char(c)
+                    state = IN_FIELD
+            elif state == EAT_COMMENT:
+                if c == '\n':
+                    self._end_line()
+                    state = START_RECORD
+
+        if pos >= datalen and self.exhausted and not self.eof:
+            # flush a final line without a terminator
+            if state == START_FIELD or state == IN_FIELD:
+                self._end_field()
+                self._end_line()
+            elif state == IN_QUOTED_FIELD or state == QUOTE_IN_QUOTED_FIELD:
+                self._end_field()
+                self._end_line()
+            elif state == EAT_COMMENT:
+                self._end_line()
+            state = START_RECORD
+            self.eof = 1
+
+        self.datapos = pos
+        self.state = state
+        self.skip_lf = skip_lf
+        return 0
+
+    cdef _compact(self):
+        """
+        Drop lines already handed out to free buffer space
+        """
+        cdef:
+            Py_ssize_t i, word_shift, char_shift, nlines
+
+        if self.cursor == 0:
+            return
+
+        nlines = self.lines - self.cursor
+        if nlines > 0:
+            word_shift = self.line_start[self.cursor]
+        else:
+            word_shift = self.words_len
+        char_shift = self.words[word_shift]
+
+        memmove(self.stream, self.stream + char_shift,
+                self.stream_len - char_shift)
+        self.stream_len -= char_shift
+
+        memmove(self.words, self.words + word_shift,
+                (self.words_len - word_shift + 1) * sizeof(Py_ssize_t))
+        self.words_len -= word_shift
+        for i in range(self.words_len + 1):
+            self.words[i] -= char_shift
+
+        memmove(self.line_start, self.line_start + self.cursor,
+                nlines * sizeof(Py_ssize_t))
+        memmove(self.line_fields, self.line_fields + self.cursor,
+                nlines * sizeof(Py_ssize_t))
+        for i in range(nlines):
+            self.line_start[i] -= word_shift
+
+        self.lines = nlines
+        self.cursor = 0
+
+    #----------------------------------------------------------------------
+    # Row-wise access, used for header and index inference
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        cdef:
+            Py_ssize_t j, start, nfields
+            list row
+
+        if self.cursor >= self.lines:
+            self._tokenize_rows(self.cursor + 1)
+            if self.cursor >= self.lines:
+                raise StopIteration
+
+        start = self.line_start[self.cursor]
+        nfields = self.line_fields[self.cursor]
+        row = []
+        for j in range(nfields):
+            row.append(self._word_to_string(self.words[start + j]))
+        self.cursor += 1
+        return row
+
+    def rewind(self, Py_ssize_t nrows):
+        """
+        Step back over rows already returned by next() so they are
+        re-read by the next call to read()
+        """
+        if nrows > self.cursor:
+            raise ValueError('Cannot rewind past the start of the buffer')
+        self.cursor -= nrows
+
+    cdef inline object _word_to_string(self, Py_ssize_t offset):
+        cdef:
+            char *word = self.stream + offset
+            Py_ssize_t n = strlen(word)
+        if self.encoding is not None:
+            return PyUnicode_Decode(word, n, self.encoding, 'strict')
+        elif PY3:
+            return PyUnicode_Decode(word, n, 'utf-8', 'strict')
+        return PyBytes_FromStringAndSize(word, n)
+
+    #----------------------------------------------------------------------
+    # Column-wise conversion
+
+    def read(self, rows=None):
+        """
+        Read and convert the next chunk of rows
+
+        Parameters
+        ----------
+        rows : int, default None
+            Number of rows to read, or None for all remaining rows
+
+        Returns
+        -------
+        columns : dict of int -> ndarray
+            Keyed by column position. Columns whose position is in
+            raw_columns are returned as object arrays of strings with no NA
+            handling
+        """
+        cdef:
+            Py_ssize_t i, nrows, start, end, width
+            dict result = {}
+
+        if rows is None:
+            self._tokenize_rows(<Py_ssize_t> sys.maxsize)
+            end = self.lines - self.skip_footer
+            if end < self.cursor:
+                end = self.cursor
+        else:
+            self._tokenize_rows(self.cursor + rows)
+            end = min(self.cursor + rows, self.lines)
+
+        start = self.cursor
+        nrows = end - start
+        if nrows == 0:
+            if rows is None:
+                # drop the footer
+                self.cursor = self.lines
+            raise StopIteration
+
+        width = 0
+        for i in range(start, end):
+            if self.line_fields[i] > width:
+                width = self.line_fields[i]
+
+        for i in range(width):
+            if i in self.raw_columns:
+                result[i] = self._string_column(i, start, end, None)
+            else:
+                result[i] = self._convert_column(i, start, end)
+
+        self.cursor = self.lines if rows is None else end
+        self._compact()
+        return result
+
+    cdef inline char *_get_word(self, Py_ssize_t line, Py_ssize_t col):
+        if col >= self.line_fields[line]:
+            return NULL
+        return self.stream + self.words[self.line_start[line] + col]
+
+    cdef list _get_na_list(self, Py_ssize_t col):
+        cdef list result = []
+        na_values = self.col_na_values.get(col, self.na_values)
+        for val in na_values:
+            if isinstance(val, unicode):
+                val = val.encode(self.encoding or 'utf-8')
+            elif not isinstance(val, bytes):
+                val = str(val)
+                if PY3:
+                    val = val.encode('utf-8')
+            result.append(val)
+        return result
+
+    @cython.boundscheck(False)
+    @cython.wraparound(False)
+    cdef _convert_column(self, Py_ssize_t col, Py_ssize_t start,
+                         Py_ssize_t end):
+        cdef:
+            Py_ssize_t i, k, n = end - start
+            Py_ssize_t nna, wlen, na_count = 0
+            char *word
+            char *scratch = NULL
+            list na_list
+            Py_ssize_t *na_lens
+            char **na_ptrs
+            ColumnType coltype = COL_INT64
+            bint is_na
+            ndarray[int64_t] ints
+            ndarray[float64_t] floats
+            ndarray[uint8_t] bools
+            ndarray[uint8_t] mask
+            int64_t ival
+            float64_t fval
+
+        na_list = self._get_na_list(col)
+        nna = len(na_list)
+        na_lens = <Py_ssize_t*> malloc((nna + 1) * sizeof(Py_ssize_t))
+        na_ptrs = <char**> malloc((nna + 1) * sizeof(char*))
+        if na_lens == NULL or na_ptrs == NULL:
+            free(na_lens)
+            free(na_ptrs)
+            raise MemoryError
+        for k in range(nna):
+            na_ptrs[k] = <char*> na_list[k]
+            na_lens[k] = len(na_list[k])
+
+        ints = np.empty(n, dtype=np.int64)
+        floats = np.empty(n, dtype=np.float64)
+        mask = np.zeros(n, dtype=np.uint8)
+
+        try:
+            # first pass: NA detection and numeric inference straight from
+            # the character buffer
+            for i in range(n):
+                word = self._get_word(start + i, col)
+                if word == NULL or word[0] == 0:
+                    mask[i] = 1
+                    na_count += 1
+                    continue
+
+                wlen = strlen(word)
+                is_na = 0
+                for k in range(nna):
+                    if (na_lens[k] == wlen and
+                        memcmp(na_ptrs[k], word, wlen) == 0):
+                        is_na = 1
+                        break
+                if is_na:
+                    mask[i] = 1
+                    na_count += 1
+                    continue
+
+                if coltype == COL_INT64:
+                    if _to_int64(word, self.tsep, &ival):
+                        ints[i] = ival
+                        floats[i] = <float64_t> ival
+                        continue
+                    coltype = COL_FLOAT64
+
+                if coltype == COL_FLOAT64:
+                    if scratch == NULL and self.tsep != 0:
+                        scratch = <char*> malloc(self.stream_len + 1)
+                        if scratch == NULL:
+                            raise MemoryError
+                    if _to_float64(word, self.tsep, scratch, &fval):
+                        floats[i] = fval
+                        continue
+                    coltype = COL_OBJECT
+                    break
+        finally:
+            free(na_lens)
+            free(na_ptrs)
+            free(scratch)
+
+        if coltype == COL_INT64 and na_count == 0:
+            return ints
+        elif coltype == COL_INT64 or coltype == COL_FLOAT64:
+            if na_count > 0:
+                floats[mask.view(np.bool_)] = NaN
+            return floats
+
+        bools = self._bool_column(col, start, end)
+        if bools is not None:
+            return bools.view(np.bool_)
+
+        return self._string_column(col, start, end, set(na_list))
+
+    @cython.boundscheck(False)
+    @cython.wraparound(False)
+    cdef _bool_column(self, Py_ssize_t col, Py_ssize_t start,
+                      Py_ssize_t end):
+        cdef:
+            Py_ssize_t i, n = end - start
+            char *word
+            ndarray[uint8_t] result = np.empty(n, dtype=np.uint8)
+
+        for i in range(n):
+            word = self._get_word(start + i, col)
+            if word == NULL:
+                return None
+            elif strlen(word) == 4 and memcmp(word, 'True', 4) == 0:
+                result[i] = 1
+            elif strlen(word) == 5 and memcmp(word, 'False', 5) == 0:
+                result[i] = 0
+            else:
+                return None
+        return result
+
+    @cython.boundscheck(False)
+    @cython.wraparound(False)
+    cdef _string_column(self, Py_ssize_t col, Py_ssize_t start,
+                        Py_ssize_t end, object na_set):
+        cdef:
+            Py_ssize_t i, n = end - start
+            char *word
+            ndarray[object] result = np.empty(n, dtype=object)
+            dict memo = {}
+            object onan = np.nan
+            object val, key
+
+        for i in range(n):
+            word = self._get_word(start + i, col)
+            if word == NULL:
+                result[i] = onan if na_set is not None else None
+                continue
+
+            key = PyBytes_FromStringAndSize(word, strlen(word))
+            if na_set is not None and (word[0] == 0 or key in na_set):
+                result[i] = onan
+                continue
+
+            # share one string object between repeated values
+            val = memo.get(key)
+            if val is None:
+                val = self._word_to_string(word - self.stream)
+                memo[key] = val
+            result[i] = val
+
+        return result
@@ -1,4 +1,4 @@
-cdef extern from "skiplist.h":
+cdef extern from "skiplist.h" nogil:
     ctypedef struct node_t:
         double value
         int is_nil
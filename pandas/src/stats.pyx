@@ -548,3 +548,148 @@ def rank_2d_generic(object in_arr, axis=0, ties_method='average',
 #         for j in range(K):
 #             result[i, j] = values[i, indexer[i, j]]
 #     return result
+
+#----------------------------------------------------------------------
+# Pairwise correlation / covariance
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def nancorr(ndarray[float64_t, ndim=2] mat, cov=False, minp=None):
+    """
+    Pearson correlation (or covariance if cov=True) of every pair of columns
+    of mat, each using the rows where both values are finite. Pairs with
+    fewer than minp such rows are NaN.
+    """
+    cdef:
+        Py_ssize_t i, xi, yi, N, K, nobs, min_periods
+        bint do_cov = cov
+        ndarray[float64_t, ndim=2] result, values
+        ndarray[uint8_t, ndim=2] mask
+        float64_t vx, vy, sumx, sumy, sumxx, sumyy, meanx, meany, divisor
+
+    N, K = (<object> mat).shape
+    min_periods = 1 if minp is None else max(minp, 1)
+
+    # work on contiguous columns
+    values = np.ascontiguousarray(mat.T)
+    mask = np.isfinite(values).view(np.uint8)
+    result = np.empty((K, K), dtype=np.float64)
+
+    for xi in range(K):
+        for yi in range(xi + 1):
+            nobs = 0
+            sumx = sumy = sumxx = sumyy = 0
+            for i in range(N):
+                if mask[xi, i] and mask[yi, i]:
+                    nobs += 1
+                    sumx += values[xi, i]
+                    sumy += values[yi, i]
+
+            if nobs < min_periods:
+                result[xi, yi] = result[yi, xi] = NaN
+                continue
+
+            meanx = sumx / nobs
+            meany = sumy / nobs
+
+            # second pass on the demeaned values for accuracy
+            sumx = 0
+            for i in range(N):
+                if mask[xi, i] and mask[yi, i]:
+                    vx = values[xi, i] - meanx
+                    vy = values[yi, i] - meany
+                    sumx += vx * vy
+                    sumxx += vx * vx
+                    sumyy += vy * vy
+
+            if do_cov:
+                divisor = nobs - 1.0
+            else:
+                divisor = sqrt(sumxx * sumyy)
+
+            if divisor != 0:
+                result[xi, yi] = result[yi, xi] = sumx / divisor
+            else:
+                result[xi, yi] = result[yi, xi] = NaN
+
+    return result
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+@cython.cdivision(True)
+def nancorr_spearman(ndarray[float64_t, ndim=2] mat, minp=None):
+    """
+    Spearman rank correlation of every pair of columns of mat, each using
+    the rows where both values are finite. Each column is sorted once; for
+    a pair, both columns are re-ranked (averaging ties) on the rows they have
+    in common by walking their sort orders, so a pair costs O(N) like the
+    Pearson correlation.
+    """
+    cdef:
+        Py_ssize_t i, k, t, e, xi, yi, N, K, nobs, min_periods
+        ndarray[float64_t, ndim=2] result, values, ranks
+        ndarray[int64_t, ndim=2] order
+        ndarray[uint8_t, ndim=2] mask
+        ndarray[int64_t] kept
+        float64_t vx, vy, sumxy, sumxx, sumyy, mean, divisor, rank
+
+    N, K = (<object> mat).shape
+    min_periods = 1 if minp is None else max(minp, 1)
+
+    values = np.ascontiguousarray(mat.T)
+    mask = np.isfinite(values).view(np.uint8)
+    order = values.argsort(axis=1, kind='mergesort').astype(np.int64)
+    result = np.empty((K, K), dtype=np.float64)
+
+    # ranks[0] and ranks[1] hold the ranks of the pair on their common rows
+    ranks = np.empty((2, N), dtype=np.float64)
+    kept = np.empty(N, dtype=np.int64)
+
+    with nogil:
+        for xi in range(K):
+            for yi in range(xi + 1):
+                for t in range(2):
+                    if t == 0:
+                        k = xi
+                    else:
+                        k = yi
+
+                    # rows of both columns, in the sort order of column k
+                    nobs = 0
+                    for i in range(N):
+                        if mask[xi, order[k, i]] and mask[yi, order[k, i]]:
+                            kept[nobs] = order[k, i]
+                            nobs += 1
+
+                    i = 0
+                    while i < nobs:
+                        e = i
+                        while (e + 1 < nobs and
+                               values[k, kept[e + 1]] == values[k, kept[i]]):
+                            e += 1
+                        rank = (i + e) / 2.0 + 1
+                        while i <= e:
+                            ranks[t, kept[i]] = rank
+                            i += 1
+
+                if nobs < min_periods:
+                    result[xi, yi] = result[yi, xi] = NaN
+                    continue
+
+                # both sets of ranks average (nobs + 1) / 2
+                mean = (nobs + 1) / 2.0
+                sumxy = sumxx = sumyy = 0
+                for i in range(nobs):
+                    vx = ranks[0, kept[i]] - mean
+                    vy = ranks[1, kept[i]] - mean
+                    sumxy += vx * vy
+                    sumxx += vx * vx
+                    sumyy += vy * vy
+
+                divisor = sqrt(sumxx * sumyy)
+                if divisor != 0:
+                    result[xi, yi] = result[yi, xi] = sumxy / divisor
+                else:
+                    result[xi, yi] = result[yi, xi] = NaN
+
+    return result
@@ -56,7 +56,7 @@ ctypedef unsigned char UChar
 cimport util
 from util cimport is_array, _checknull, _checknan
 
-cdef extern from "math.h":
+cdef extern from "math.h" nogil:
     double sqrt(double x)
     double fabs(double)
 
@@ -91,6 +91,7 @@ cpdef map_indices_list(list index):
 from libc.stdlib cimport malloc, free
 
 NaT = util.get_nat()
+cdef int64_t iNaT = NaT
 
 def ismember(ndarray arr, set values):
     '''
@@ -701,3 +702,4 @@ include "properties.pyx"
 include "inference.pyx"
 include "join.pyx"
 include "engines.pyx"
+include "writers.pyx"
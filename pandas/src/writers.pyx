@@ -0,0 +1,85 @@
+#----------------------------------------------------------------------
+# Vectorized value formatting for the delimited text writers
+
+from libc.stdio cimport snprintf
+from libc.string cimport strlen
+
+cdef int64_t _NAT_VALUE = util.get_nat()
+
+
+cdef inline object _format_float64(double val):
+    # same as repr of a numpy.float64 scalar, which is what csv.writer emits
+    cdef:
+        char buf[32]
+        Py_ssize_t i, n
+
+    snprintf(buf, 32, "%.17g", val)
+
+    n = strlen(buf)
+    i = 1 if buf[0] == c'-' else 0
+    while i < n:
+        if not (c'0' <= buf[i] <= c'9'):
+            break
+        i += 1
+
+    # numpy leaves negative zero as "-0"
+    if i == n and not (val == 0 and buf[0] == c'-'):
+        buf[n] = c'.'
+        buf[n + 1] = c'0'
+        buf[n + 2] = 0
+
+    return buf
+
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def format_float64_array(ndarray[float64_t] values, object na_rep):
+    '''
+    Format a float64 array as strings, substituting na_rep for NaN and
+    infinite values
+    '''
+    cdef:
+        Py_ssize_t i, n = len(values)
+        double val
+        ndarray[object] result = np.empty(n, dtype=object)
+
+    for i in range(n):
+        val = values[i]
+        if val != val or val == INF or val == NEGINF:
+            result[i] = na_rep
+        else:
+            result[i] = _format_float64(val)
+
+    return result
+
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def format_datetime64_array(ndarray[int64_t] values, object na_rep):
+    '''
+    Format nanosecond timestamps the way str(Timestamp) does, substituting
+    na_rep for NaT
+    '''
+    cdef:
+        Py_ssize_t i, n = len(values)
+        pandas_datetimestruct dts
+        char buf[32]
+        ndarray[object] result = np.empty(n, dtype=object)
+
+    for i in range(n):
+        if values[i] == _NAT_VALUE:
+            result[i] = na_rep
+            continue
+
+        pandas_datetime_to_datetimestruct(values[i], PANDAS_FR_ns, &dts)
+        if dts.us:
+            snprintf(buf, 32, "%04d-%02d-%02d %02d:%02d:%02d.%06d",
+                     <int> dts.year, dts.month, dts.day, dts.hour, dts.min,
+                     dts.sec, dts.us)
+        else:
+            snprintf(buf, 32, "%04d-%02d-%02d %02d:%02d:%02d",
+                     <int> dts.year, dts.month, dts.day, dts.hour, dts.min,
+                     dts.sec)
+        result[i] = buf
+
+    return result
@@ -27,6 +27,64 @@ def solve(a, b):
     except linalg.LinAlgError:
         return np.dot(linalg.pinv(a), b)
 
+def solve_stacked(a, b):
+    """
+    Returns the solutions of a stack of systems A[i] X[i] = B[i].
+
+    Gaussian elimination with partial pivoting is carried out for all the
+    systems at once, so the cost of the Python-level loop only depends on
+    the number of variables. Singular systems fall back to solve.
+
+    Parameters
+    ----------
+    a: (N x K x K)
+    b: (N x K)
+
+    Returns
+    -------
+    ndarray (N x K)
+    """
+    a_orig, b_orig = a, b
+    a = np.array(a, dtype=float)
+    b = np.array(b, dtype=float)
+
+    n, K = b.shape
+    if n == 0:
+        return b
+    rows = np.arange(n)
+    singular = np.zeros(n, dtype=bool)
+
+    for j in xrange(K):
+        # bring the largest remaining entry of column j on the diagonal
+        piv = np.abs(a[:, j:, j]).argmax(1) + j
+        tmp = a[rows, j].copy()
+        a[rows, j] = a[rows, piv]
+        a[rows, piv] = tmp
+        tmp = b[rows, j].copy()
+        b[rows, j] = b[rows, piv]
+        b[rows, piv] = tmp
+
+        pivot = a[:, j, j]
+        singular |= pivot == 0
+        pivot = np.where(pivot == 0, 1., pivot)
+
+        factors = a[:, j + 1:, j] / pivot[:, np.newaxis]
+        a[:, j + 1:, j:] -= factors[:, :, np.newaxis] * a[:, np.newaxis, j, j:]
+        b[:, j + 1:] -= factors * b[:, j:j + 1]
+
+    diag = a.diagonal(0, 1, 2).copy()
+    diag[singular] = 1.
+
+    x = np.empty((n, K))
+    for j in xrange(K - 1, -1, -1):
+        acc = b[:, j] - (a[:, j, j + 1:] * x[:, j + 1:]).sum(1)
+        x[:, j] = acc / diag[:, j]
+
+    for i in singular.nonzero()[0]:
+        x[i] = solve(a_orig[i], b_orig[i])
+
+    return x
+
 def inv(a):
     """Returns the inverse of A."""
     try:
@@ -4,12 +4,17 @@ statistics implemented in Cython
 """
 from __future__ import division
 
+from datetime import timedelta
 from functools import wraps
 
 from numpy import NaN
 import numpy as np
 
 from pandas.core.api import DataFrame, Series, notnull
+from pandas.core.common import _threaded_map
+from pandas.tseries.index import DatetimeIndex
+from pandas.tseries.frequencies import to_offset
+from pandas.tseries.offsets import DateOffset, Tick, _delta_to_nanoseconds
 import pandas._tseries as _tseries
 
 from pandas.util.decorators import Substitution, Appender
@@ -18,8 +23,12 @@ __all__ = ['rolling_count', 'rolling_max', 'rolling_min',
            'rolling_sum', 'rolling_mean', 'rolling_std', 'rolling_cov',
            'rolling_corr', 'rolling_var', 'rolling_skew', 'rolling_kurt',
            'rolling_quantile', 'rolling_median', 'rolling_apply',
-           'rolling_corr_pairwise',
-           'ewma', 'ewmvar', 'ewmstd', 'ewmvol', 'ewmcorr', 'ewmcov']
+           'rolling_corr_pairwise', 'rolling_cov_pairwise',
+           'ewma', 'ewmvar', 'ewmstd', 'ewmvol', 'ewmcorr', 'ewmcov',
+           'ewmcorr_pairwise', 'ewmcov_pairwise',
+           'RollingSum', 'RollingMean', 'RollingVar', 'RollingStd',
+           'RollingSkew', 'RollingKurt', 'RollingMedian', 'RollingMax',
+           'RollingMin', 'EWMA', 'EWMVar']
 
 #-------------------------------------------------------------------------------
 # Docs
@@ -30,18 +39,17 @@ _doc_template = """
 Parameters
 ----------
 %s
-window : Number of observations used for calculating statistic
+%s
 min_periods : int
     Minimum number of observations in window required to have a value
 freq : None or string alias / date offset object, default=None
     Frequency to conform to before computing statistic
-
+%s
 Returns
 -------
 %s
 """
 
-
 _ewm_doc = r"""%s
 
 Parameters
@@ -90,9 +98,21 @@ arg2 : Series, DataFrame, or ndarray"""
 _binary_arg = """arg1 : Series, DataFrame, or ndarray
 arg2 : Series, DataFrame, or ndarray"""
 
+_window_doc = "window : Number of observations used for calculating statistic"
+
+_time_window_doc = """window : int or time span
+    Number of observations used for calculating statistic, or for data with
+    a DatetimeIndex the time span (t - window, t] of the window ending at t,
+    given as a string alias, fixed frequency DateOffset or timedelta"""
+
 _bias_doc = r"""bias : boolean, default False
     Use a standard estimation bias correction
 """
+
+_n_jobs_doc = r"""n_jobs : int, default 1
+    Number of threads across which to spread the columns of a DataFrame
+"""
+
 def rolling_count(arg, window, freq=None, time_rule=None):
     """
     Rolling count of number of non-NaN observations inside provided window.
@@ -100,7 +120,8 @@ def rolling_count(arg, window, freq=None, time_rule=None):
     Parameters
     ----------
     arg :  DataFrame or numpy ndarray-like
-    window : Number of observations used for calculating statistic
+    window : Number of observations used for calculating statistic, or time
+        span for data with a DatetimeIndex (see rolling_sum)
     freq : None or string alias / date offset object, default=None
         Frequency to conform to before computing statistic
 
@@ -109,20 +130,26 @@ def rolling_count(arg, window, freq=None, time_rule=None):
     rolling_count : type of caller
     """
     arg = _conv_timerule(arg, freq, time_rule)
-    window = min(window, len(arg))
 
     return_hook, values = _process_data_structure(arg, kill_inf=False)
 
     converted = np.isfinite(values).astype(float)
-    result = rolling_sum(converted, window, min_periods=1,
-                         time_rule=time_rule)
+    if _is_time_window(window):
+        # the windows are defined by the index
+        result = rolling_sum(return_hook(converted), window,
+                             min_periods=1).values
+    else:
+        window = min(window, len(arg))
+        result = rolling_sum(converted, window, min_periods=1,
+                             time_rule=time_rule)
 
     # putmask here?
     result[np.isnan(result)] = 0
 
     return return_hook(result)
 
-@Substitution("Unbiased moving covariance", _binary_arg_flex, _flex_retval)
+@Substitution("Unbiased moving covariance", _binary_arg_flex, _window_doc, "",
+              _flex_retval)
 @Appender(_doc_template)
 def rolling_cov(arg1, arg2, window, min_periods=None, time_rule=None):
     def _get_cov(X, Y):
@@ -132,7 +159,8 @@ def rolling_cov(arg1, arg2, window, min_periods=None, time_rule=None):
         return (mean(X * Y) - mean(X) * mean(Y)) * bias_adj
     return _flex_binary_moment(arg1, arg2, _get_cov)
 
-@Substitution("Moving sample correlation", _binary_arg_flex, _flex_retval)
+@Substitution("Moving sample correlation", _binary_arg_flex, _window_doc, "",
+              _flex_retval)
 @Appender(_doc_template)
 def rolling_corr(arg1, arg2, window, min_periods=None, time_rule=None):
     def _get_corr(a, b):
@@ -183,22 +211,43 @@ def rolling_corr_pairwise(df, window, min_periods=None):
     -------
     correls : Panel
     """
-    from pandas import Panel
-    from collections import defaultdict
+    minp = _use_window(min_periods, window)
+    return _pairwise_panel(df, lambda values:
+                           _tseries.roll_cov_pairwise(values, window, minp,
+                                                      corr=True))
 
-    all_results = defaultdict(dict)
+def rolling_cov_pairwise(df, window, min_periods=None):
+    """
+    Computes pairwise unbiased rolling covariance matrices as Panel whose
+    items are dates
 
-    for i, k1 in enumerate(df.columns):
-        for k2 in df.columns[i:]:
-            corr = rolling_corr(df[k1], df[k2], window,
-                                min_periods=min_periods)
-            all_results[k1][k2] = corr
-            all_results[k2][k1] = corr
+    Parameters
+    ----------
+    df : DataFrame
+    window : int
+    min_periods : int, default None
+
+    Returns
+    -------
+    covs : Panel
+    """
+    minp = _use_window(min_periods, window)
+    return _pairwise_panel(df, lambda values:
+                           _tseries.roll_cov_pairwise(values, window, minp))
 
-    return Panel.from_dict(all_results).swapaxes('items', 'major')
+def _pairwise_panel(df, func):
+    """
+    Wrap the N x K x K result of a pairwise moment kernel, computed over all
+    the column pairs of df in one pass, as a Panel whose items are the dates
+    """
+    from pandas import Panel
+
+    values = _process_data_structure(df)[1]
+    return Panel(func(values), items=df.index, major_axis=df.columns,
+                 minor_axis=df.columns)
 
 def _rolling_moment(arg, window, func, minp, axis=0, freq=None,
-                    time_rule=None):
+                    time_rule=None, n_jobs=1):
     """
     Rolling statistical measure using supplied function. Designed to be
     used with passed-in Cython array-based functions.
@@ -213,6 +262,8 @@ def _rolling_moment(arg, window, func, minp, axis=0, freq=None,
     axis : int, default 0
     freq : None or string alias / date offset object, default=None
         Frequency to conform to before computing statistic
+    n_jobs : int, default 1
+        Number of threads across which to spread the columns
 
     Returns
     -------
@@ -222,10 +273,75 @@ def _rolling_moment(arg, window, func, minp, axis=0, freq=None,
     calc = lambda x: func(x, window, minp=minp)
     return_hook, values = _process_data_structure(arg)
     # actually calculate the moment. Faster way to do this?
-    result = np.apply_along_axis(calc, axis, values)
+    result = _apply_along_axis(calc, axis, values, n_jobs=n_jobs)
 
     return return_hook(result)
 
+def _apply_along_axis(func, axis, values, n_jobs=1):
+    """
+    np.apply_along_axis, optionally computing the 1-d slices of a 2-d array
+    with _threaded_map on n_jobs threads
+    """
+    if values.ndim != 2 or n_jobs is None or n_jobs <= 1:
+        return np.apply_along_axis(func, axis, values)
+
+    slices = values.T if axis == 0 else values
+    if len(slices) == 0:
+        return values.copy()
+
+    result = np.array(_threaded_map(func, slices, n_jobs))
+    return result.T if axis == 0 else result
+
+def _rolling_time_moment(arg, window, func, freq=None, time_rule=None,
+                         n_jobs=1):
+    """
+    Rolling statistic over windows spanning a fixed amount of time instead of
+    a fixed number of observations, computed directly on the (possibly
+    irregular) DatetimeIndex of arg
+
+    Parameters
+    ----------
+    arg : Series or DataFrame with a monotonic DatetimeIndex
+    window : string alias / fixed frequency DateOffset / timedelta
+    func : function
+        Called with the values, the start position of each window and the
+        largest number of observations in a window
+    """
+    arg = _conv_timerule(arg, freq, time_rule)
+
+    if not isinstance(getattr(arg, 'index', None), DatetimeIndex):
+        raise TypeError('Time-based windows require a DatetimeIndex')
+    stamps = arg.index.asi8
+    if not arg.index.is_monotonic:
+        raise ValueError('Time-based windows require a monotonic index')
+    if (stamps == _tseries.NaT).any():
+        raise ValueError('Time-based windows require an index without NaT')
+
+    start = _tseries.roll_window_starts(stamps, _window_nanos(window))
+    if len(start) > 0:
+        max_count = (np.arange(len(start)) - start + 1).max()
+    else:
+        max_count = 1
+
+    calc = lambda x: func(x, start, max_count)
+    return_hook, values = _process_data_structure(arg)
+    result = _apply_along_axis(calc, 0, values, n_jobs=n_jobs)
+
+    return return_hook(result)
+
+def _is_time_window(window):
+    return isinstance(window, (basestring, DateOffset, timedelta))
+
+def _window_nanos(window):
+    if isinstance(window, basestring):
+        window = to_offset(window)
+
+    if not isinstance(window, (Tick, timedelta)):
+        raise ValueError('Time-based windows must have a fixed frequency, '
+                         'got %s' % window)
+
+    return _delta_to_nanoseconds(window)
+
 def _process_data_structure(arg, kill_inf=True):
     if isinstance(arg, DataFrame):
         return_hook = lambda v: type(arg)(v, index=arg.index,
@@ -263,9 +379,11 @@ def _get_center_of_mass(com, span):
 
     return float(com)
 
-@Substitution("Exponentially-weighted moving average", _unary_arg, "")
+@Substitution("Exponentially-weighted moving average", _unary_arg,
+              _n_jobs_doc)
 @Appender(_ewm_doc)
-def ewma(arg, com=None, span=None, min_periods=0, freq=None, time_rule=None):
+def ewma(arg, com=None, span=None, min_periods=0, freq=None, time_rule=None,
+         n_jobs=1):
     com = _get_center_of_mass(com, span)
     arg = _conv_timerule(arg, freq, time_rule)
 
@@ -276,7 +394,7 @@ def ewma(arg, com=None, span=None, min_periods=0, freq=None, time_rule=None):
         return result
 
     return_hook, values = _process_data_structure(arg)
-    output = np.apply_along_axis(_ewma, 0, values)
+    output = _apply_along_axis(_ewma, 0, values, n_jobs=n_jobs)
     return return_hook(output)
 
 def _first_valid_index(arr):
@@ -340,6 +458,34 @@ def ewmcorr(arg1, arg2, com=None, span=None, min_periods=0,
                            bias=True)
     return (mean(X*Y) - mean(X)*mean(Y)) / np.sqrt(var(X) * var(Y))
 
+def ewmcov_pairwise(df, com=None, span=None, min_periods=0, bias=False):
+    """
+    Computes pairwise exponentially-weighted moving covariance matrices as
+    Panel whose items are dates. See ewmcov for the parameters
+
+    Returns
+    -------
+    covs : Panel
+    """
+    com = _get_center_of_mass(com, span)
+    return _pairwise_panel(df, lambda values:
+                           _tseries.ewm_cov_pairwise(values, com, min_periods,
+                                                     bias=bias))
+
+def ewmcorr_pairwise(df, com=None, span=None, min_periods=0):
+    """
+    Computes pairwise exponentially-weighted moving correlation matrices as
+    Panel whose items are dates. See ewmcorr for the parameters
+
+    Returns
+    -------
+    correls : Panel
+    """
+    com = _get_center_of_mass(com, span)
+    return _pairwise_panel(df, lambda values:
+                           _tseries.ewm_cov_pairwise(values, com, min_periods,
+                                                     corr=True))
+
 def _prep_binary(arg1, arg2):
     if not isinstance(arg2, type(arg1)):
         raise Exception('Input arrays must be of the same type!')
@@ -382,34 +528,63 @@ def _use_window(minp, window):
     else:
         return minp
 
-def _rolling_func(func, desc, check_minp=_use_window):
-    @Substitution(desc, _unary_arg, _type_of_input)
+def _rolling_func(func, desc, check_minp=_use_window, online=None,
+                  transform=None):
+    @Substitution(desc, _unary_arg, _time_window_doc, _n_jobs_doc,
+                  _type_of_input)
     @Appender(_doc_template)
     @wraps(func)
-    def f(arg, window, min_periods=None, freq=None, time_rule=None):
+    def f(arg, window, min_periods=None, freq=None, time_rule=None,
+          n_jobs=1):
+        if _is_time_window(window):
+            # a time span says nothing about the number of observations
+            if min_periods is None:
+                min_periods = 1
+            minp = check_minp(min_periods, window)
+
+            def call_variable(arg, start, max_count):
+                result = _tseries.roll_variable(online(max_count, minp),
+                                                arg, start)
+                if transform is not None:
+                    result = transform(result)
+                return result
+            return _rolling_time_moment(arg, window, call_variable,
+                                        freq=freq, time_rule=time_rule,
+                                        n_jobs=n_jobs)
+
         def call_cython(arg, window, minp):
             minp = check_minp(minp, window)
             return func(arg, window, minp)
         return _rolling_moment(arg, window, call_cython, min_periods,
-                               freq=freq, time_rule=time_rule)
+                               freq=freq, time_rule=time_rule, n_jobs=n_jobs)
 
     return f
 
-rolling_max = _rolling_func(_tseries.roll_max, 'Moving maximum')
-rolling_min = _rolling_func(_tseries.roll_min, 'Moving minimum')
-rolling_sum = _rolling_func(_tseries.roll_sum, 'Moving sum')
-rolling_mean = _rolling_func(_tseries.roll_mean, 'Moving mean')
-rolling_median = _rolling_func(_tseries.roll_median_cython, 'Moving median')
+rolling_max = _rolling_func(_tseries.roll_max, 'Moving maximum',
+                            online=_tseries.OnlineRollingMax)
+rolling_min = _rolling_func(_tseries.roll_min, 'Moving minimum',
+                            online=_tseries.OnlineRollingMin)
+rolling_sum = _rolling_func(_tseries.roll_sum, 'Moving sum',
+                            online=_tseries.OnlineRollingSum)
+rolling_mean = _rolling_func(_tseries.roll_mean, 'Moving mean',
+                             online=_tseries.OnlineRollingMean)
+rolling_median = _rolling_func(_tseries.roll_median_cython, 'Moving median',
+                               online=_tseries.OnlineRollingMedian)
 
 _ts_std = lambda *a, **kw: np.sqrt(_tseries.roll_var(*a, **kw))
 rolling_std = _rolling_func(_ts_std, 'Unbiased moving standard deviation',
-                            check_minp=_require_min_periods(2))
+                            check_minp=_require_min_periods(2),
+                            online=_tseries.OnlineRollingVar,
+                            transform=np.sqrt)
 rolling_var = _rolling_func(_tseries.roll_var, 'Unbiased moving variance',
-                            check_minp=_require_min_periods(2))
+                            check_minp=_require_min_periods(2),
+                            online=_tseries.OnlineRollingVar)
 rolling_skew = _rolling_func(_tseries.roll_skew, 'Unbiased moving skewness',
-                             check_minp=_require_min_periods(3))
+                             check_minp=_require_min_periods(3),
+                             online=_tseries.OnlineRollingSkew)
 rolling_kurt = _rolling_func(_tseries.roll_kurt, 'Unbiased moving kurtosis',
-                             check_minp=_require_min_periods(4))
+                             check_minp=_require_min_periods(4),
+                             online=_tseries.OnlineRollingKurt)
 
 def rolling_quantile(arg, window, quantile, min_periods=None, freq=None,
                      time_rule=None):
@@ -460,3 +635,187 @@ def rolling_apply(arg, window, func, min_periods=None, freq=None,
         return _tseries.roll_generic(arg, window, minp, func)
     return _rolling_moment(arg, window, call_cython, min_periods,
                            freq=freq, time_rule=time_rule)
+
+#-------------------------------------------------------------------------------
+# Online moments
+
+class _OnlineMoment(object):
+    """
+    Stateful moving statistic, updated incrementally as new observations
+    arrive. A separate Cython accumulator is kept per column so that the
+    same object can be fed ndarrays, Series or DataFrames
+    """
+    def __init__(self):
+        self._states = None
+
+    def _make_state(self):
+        raise NotImplementedError
+
+    def _calc(self, state, values):
+        return state.update(values)
+
+    def update(self, arg):
+        """
+        Push new observations, seeding the state with history on the first
+        call, and return the statistic at each of them. The result equals
+        that of the corresponding batch function at the same positions of
+        the concatenated input
+
+        Parameters
+        ----------
+        arg : scalar, ndarray, Series or DataFrame
+            DataFrames must have the same number of columns on every call
+
+        Returns
+        -------
+        y : type of input argument
+        """
+        if np.isscalar(arg):
+            return self.update(np.array([arg], dtype=float))[0]
+
+        return_hook, values = _process_data_structure(arg)
+        columns = [values] if values.ndim == 1 else list(values.T)
+
+        if self._states is None:
+            self._states = [self._make_state() for _ in columns]
+        elif len(self._states) != len(columns):
+            raise ValueError('Expected %d columns, got %d'
+                             % (len(self._states), len(columns)))
+
+        if values.ndim == 1:
+            result = self._calc(self._states[0], values)
+        elif len(columns) == 0:
+            result = values.copy()
+        else:
+            result = np.array([self._calc(state, col)
+                               for state, col in zip(self._states,
+                                                     columns)]).T
+
+        return return_hook(result)
+
+_online_rolling_doc = """
+%s, updated incrementally. Online counterpart of %s
+
+Parameters
+----------
+window : Number of observations used for calculating statistic
+min_periods : int
+    Minimum number of observations in window required to have a value
+"""
+
+class _OnlineRolling(_OnlineMoment):
+    _kernel = None
+    _check_minp = staticmethod(_use_window)
+
+    def __init__(self, window, min_periods=None):
+        _OnlineMoment.__init__(self)
+        self.window = window
+        self.min_periods = self._check_minp(min_periods, window)
+
+    def _make_state(self):
+        return self._kernel(self.window, self.min_periods)
+
+class RollingSum(_OnlineRolling):
+    __doc__ = _online_rolling_doc % ('Moving sum', 'rolling_sum')
+    _kernel = _tseries.OnlineRollingSum
+
+class RollingMean(_OnlineRolling):
+    __doc__ = _online_rolling_doc % ('Moving mean', 'rolling_mean')
+    _kernel = _tseries.OnlineRollingMean
+
+class RollingVar(_OnlineRolling):
+    __doc__ = _online_rolling_doc % ('Unbiased moving variance', 'rolling_var')
+    _kernel = _tseries.OnlineRollingVar
+    _check_minp = staticmethod(_require_min_periods(2))
+
+class RollingStd(RollingVar):
+    __doc__ = _online_rolling_doc % ('Unbiased moving standard deviation',
+                                     'rolling_std')
+
+    def _calc(self, state, values):
+        return np.sqrt(state.update(values))
+
+class RollingSkew(_OnlineRolling):
+    __doc__ = _online_rolling_doc % ('Unbiased moving skewness',
+                                     'rolling_skew')
+    _kernel = _tseries.OnlineRollingSkew
+    _check_minp = staticmethod(_require_min_periods(3))
+
+class RollingKurt(_OnlineRolling):
+    __doc__ = _online_rolling_doc % ('Unbiased moving kurtosis',
+                                     'rolling_kurt')
+    _kernel = _tseries.OnlineRollingKurt
+    _check_minp = staticmethod(_require_min_periods(4))
+
+class RollingMedian(_OnlineRolling):
+    __doc__ = _online_rolling_doc % ('Moving median', 'rolling_median')
+    _kernel = _tseries.OnlineRollingMedian
+
+class RollingMax(_OnlineRolling):
+    __doc__ = _online_rolling_doc % ('Moving maximum', 'rolling_max')
+    _kernel = _tseries.OnlineRollingMax
+
+class RollingMin(_OnlineRolling):
+    __doc__ = _online_rolling_doc % ('Moving minimum', 'rolling_min')
+    _kernel = _tseries.OnlineRollingMin
+
+class EWMA(_OnlineMoment):
+    """
+    Exponentially-weighted moving average, updated incrementally. Online
+    counterpart of ewma
+
+    Parameters
+    ----------
+    com : float. optional
+        Center of mass: \\alpha = com / (1 + com),
+    span : float, optional
+        Specify decay in terms of span, \\alpha = 2 / (span + 1)
+    min_periods : int, default 0
+        Number of observations in sample to require (only affects
+        beginning)
+    """
+    def __init__(self, com=None, span=None, min_periods=0):
+        _OnlineMoment.__init__(self)
+        self.com = _get_center_of_mass(com, span)
+        self.min_periods = min_periods
+
+    def _make_state(self):
+        return _tseries.OnlineEWMA(self.com, self.min_periods)
+
+class EWMVar(EWMA):
+    """
+    Exponentially-weighted moving variance, updated incrementally. Online
+    counterpart of ewmvar
+
+    Parameters
+    ----------
+    com : float. optional
+        Center of mass: \\alpha = com / (1 + com),
+    span : float, optional
+        Specify decay in terms of span, \\alpha = 2 / (span + 1)
+    min_periods : int, default 0
+        Number of observations in sample to require (only affects
+        beginning)
+    bias : boolean, default False
+        Use a standard estimation bias correction
+    """
+    def __init__(self, com=None, span=None, min_periods=0, bias=False):
+        EWMA.__init__(self, com=com, span=span, min_periods=min_periods)
+        self.bias = bias
+
+    def _make_state(self):
+        # first and second moments
+        return (EWMA._make_state(self), EWMA._make_state(self))
+
+    def _calc(self, state, values):
+        squares = values * values
+        squares[np.isinf(squares)] = NaN
+
+        moment1st = state[0].update(values)
+        moment2nd = state[1].update(squares)
+
+        result = moment2nd - moment1st ** 2
+        if not self.bias:
+            result *= (1.0 + 2.0 * self.com) / (2.0 * self.com)
+
+        return result
@@ -780,23 +780,14 @@ class MovingOLS(OLS):
 
         valid = self._time_has_obs
         enough = self._enough_obs
-        window = self._window
 
         # Use transformed (demeaned) Y, X variables
-        cum_xx = self._cum_xx(x)
-        cum_xy = self._cum_xy(x, y)
-
-        for i in xrange(N):
-            if not valid[i] or not enough[i]:
-                continue
-
-            xx = cum_xx[i]
-            xy = cum_xy[i]
-            if self._is_rolling and i >= window:
-                xx = xx - cum_xx[i - window]
-                xy = xy - cum_xy[i - window]
+        xx = self._window_sums(self._cum_xx(x))
+        xy = self._window_sums(self._cum_xy(x, y))
 
-            betas[i] = math.solve(xx, xy)
+        # solve the normal equations of all the windows in one go
+        todo = (valid & enough).nonzero()[0]
+        betas[todo] = math.solve_stacked(xx[todo], xy[todo])
 
         mask = -np.isnan(betas).any(axis=1)
         have_betas = np.arange(N)[mask]
@@ -804,88 +795,89 @@ class MovingOLS(OLS):
         return betas, have_betas, mask
 
     def _rolling_rank(self):
-        dates = self._index
-        window = self._window
+        starts, ends = self._window_bounds(self._x.index)
+        values = self._x.values
 
-        ranks = np.empty(len(dates), dtype=float)
+        ranks = np.empty(len(self._index), dtype=float)
         ranks[:] = np.NaN
-        for i, date in enumerate(dates):
-            if self._is_rolling and i >= window:
-                prior_date = dates[i - window + 1]
-            else:
-                prior_date = dates[0]
-
-            x_slice = self._x.truncate(before=prior_date, after=date).values
-
-            if len(x_slice) == 0:
+        for i in xrange(len(self._index)):
+            if starts[i] == ends[i]:
                 continue
 
-            ranks[i] = math.rank(x_slice)
+            ranks[i] = math.rank(values[starts[i]:ends[i]])
 
         return ranks
 
-    def _cum_xx(self, x):
-        dates = self._index
-        K = len(x.columns)
-        valid = self._time_has_obs
-        cum_xx = []
+    def _date_positions(self, index):
+        """
+        Returns the location in self._index of the date of each row
+        """
+        if isinstance(index, MultiIndex):
+            dates = self._index.get_indexer(index.levels[0])
+            return dates.take(index.labels[0])
+
+        return self._index.get_indexer(index)
 
-        slicer = lambda df, dt: df.truncate(dt, dt).values
-        if not self._panel_model:
-            _get_index = x.index.get_loc
-            def slicer(df, dt):
-                i = _get_index(dt)
-                return df.values[i:i+1, :]
+    def _window_bounds(self, index):
+        """
+        Returns the first and one past the last row of each window. The rows
+        must be sorted by date.
+        """
+        positions = self._date_positions(index)
+        dates = np.arange(len(self._index))
 
-        last = np.zeros((K, K))
+        if self._is_rolling:
+            first = np.maximum(dates - self._window + 1, 0)
+        else:
+            first = np.zeros(len(dates), dtype=int)
 
-        for i, date in enumerate(dates):
-            if not valid[i]:
-                cum_xx.append(last)
-                continue
+        starts = positions.searchsorted(first, side='left')
+        ends = positions.searchsorted(dates, side='right')
+        return starts, ends
 
-            x_slice = slicer(x, date)
-            xx = last = last + np.dot(x_slice.T, x_slice)
-            cum_xx.append(xx)
+    def _sum_by_date(self, values, index):
+        """
+        Sums values (one entry per row of index) over each date of self._index
+        """
+        positions = self._date_positions(index)
+        result = np.zeros((len(self._index),) + values.shape[1:])
 
-        return cum_xx
+        if len(positions) == 0:
+            return result
 
-    def _cum_xy(self, x, y):
-        dates = self._index
-        valid = self._time_has_obs
-        cum_xy = []
-
-        x_slicer = lambda df, dt: df.truncate(dt, dt).values
-        if not self._panel_model:
-            _get_index = x.index.get_loc
-            def x_slicer(df, dt):
-                i = _get_index(dt)
-                return df.values[i:i+1]
-
-        _y_get_index = y.index.get_loc
-        _values = y.values
-        if isinstance(y.index, MultiIndex):
-            def y_slicer(df, dt):
-                loc = _y_get_index(dt)
-                return _values[loc]
-        else:
-            def y_slicer(df, dt):
-                i = _y_get_index(dt)
-                return _values[i:i+1]
-
-        last = np.zeros(len(x.columns))
-        for i, date in enumerate(dates):
-            if not valid[i]:
-                cum_xy.append(last)
-                continue
+        if (np.diff(positions) < 0).any():
+            indexer = positions.argsort(kind='mergesort')
+            positions = positions.take(indexer)
+            values = values.take(indexer, axis=0)
 
-            x_slice = x_slicer(x, date)
-            y_slice = y_slicer(y, date)
+        starts = np.r_[0, (np.diff(positions) != 0).nonzero()[0] + 1]
+        result[positions[starts]] = np.add.reduceat(values, starts, axis=0)
 
-            xy = last = last + np.dot(x_slice.T, y_slice)
-            cum_xy.append(xy)
+        return result
 
-        return cum_xy
+    def _window_sums(self, cum):
+        """
+        Turns cumulative sums over the dates into sums over each window
+        """
+        if not self._is_rolling:
+            return cum
+
+        window = self._window
+        result = cum.copy()
+        result[window:] -= cum[:-window]
+        return result
+
+    def _cum_xx(self, x):
+        values = x.values
+        xx = values[:, :, np.newaxis] * values[:, np.newaxis, :]
+        return self._sum_by_date(xx, x.index).cumsum(0)
+
+    def _cum_xy(self, x, y):
+        if not y.index.equals(x.index):
+            y = y.reindex(x.index)
+
+        xy = x.values * np.asarray(y.values, dtype=float).reshape(-1, 1)
+        return self._sum_by_date(xy, x.index).cumsum(0)
 
     @cache_readonly
     def _rank_raw(self):
@@ -970,22 +962,15 @@ class MovingOLS(OLS):
         sst = []
         sse = []
 
-        Y = self._y_trans
-        X = self._x_trans
+        Y = _y_converter(self._y_trans)
+        X = self._x_trans.values
 
-        dates = self._index
-        window = self._window
+        starts, ends = self._window_bounds(self._x_trans.index)
         for n, index in enumerate(self._valid_indices):
-            if self._is_rolling and index >= window:
-                prior_date = dates[index - window + 1]
-            else:
-                prior_date = dates[0]
-
-            date = dates[index]
             beta = self._beta_raw[n]
 
-            X_slice = X.truncate(before=prior_date, after=date).values
-            Y_slice = _y_converter(Y.truncate(before=prior_date, after=date))
+            X_slice = X[starts[index]:ends[index]]
+            Y_slice = Y[starts[index]:ends[index]]
 
             resid = Y_slice - np.dot(X_slice, beta)
 
@@ -1046,36 +1031,24 @@ class MovingOLS(OLS):
     @cache_readonly
     def _var_beta_raw(self):
         """Returns the raw covariance of beta."""
-        x = self._x_trans
-        y = self._y_trans
-        dates = self._index
+        x = self._x_trans.values
+        y = np.asarray(self._y_trans)
         nobs = self._nobs
         rmse = self._rmse_raw
         beta = self._beta_raw
         df = self._df_raw
-        window = self._window
-        cum_xx = self._cum_xx(self._x)
+        window_xx = self._window_sums(self._cum_xx(self._x))
+        starts, ends = self._window_bounds(self._x_trans.index)
 
         results = []
         for n, i in enumerate(self._valid_indices):
-            xx = cum_xx[i]
-            date = dates[i]
-
-            if self._is_rolling and i >= window:
-                xx = xx - cum_xx[i - window]
-                prior_date = dates[i - window + 1]
-            else:
-                prior_date = dates[0]
-
-            x_slice = x.truncate(before=prior_date, after=date)
-            y_slice = y.truncate(before=prior_date, after=date)
-            xv = x_slice.values
-            yv = np.asarray(y_slice)
+            xx = window_xx[i]
 
             if self._nw_lags is None:
                 result = math.inv(xx) * (rmse[n] ** 2)
             else:
-                resid = yv - np.dot(xv, beta[n])
+                xv = x[starts[i]:ends[i]]
+                resid = y[starts[i]:ends[i]] - np.dot(xv, beta[n])
                 m = (xv.T * resid).T
 
                 xeps = math.newey_west(m, self._nw_lags, nobs[n], df[n],
@@ -1092,42 +1065,25 @@ class MovingOLS(OLS):
     def _forecast_mean_raw(self):
         """Returns the raw covariance of beta."""
         nobs = self._nobs
-        window = self._window
 
         # x should be ones
         dummy = DataFrame(index=self._y.index)
         dummy['y'] = 1
 
-        cum_xy = self._cum_xy(dummy, self._y)
-
-        results = []
-        for n, i in enumerate(self._valid_indices):
-            sumy = cum_xy[i]
-
-            if self._is_rolling and i >= window:
-                sumy = sumy - cum_xy[i - window]
+        sumy = self._window_sums(self._cum_xy(dummy, self._y))
 
-            results.append(sumy[0] / nobs[n])
-
-        return np.array(results)
+        return sumy[self._valid_indices, 0] / nobs
 
     @cache_readonly
     def _forecast_vol_raw(self):
         """Returns the raw covariance of beta."""
         beta = self._beta_raw
-        window = self._window
-        dates = self._index
-        x = self._x
+        x = self._x.values
+        starts, ends = self._window_bounds(self._x.index)
 
         results = []
         for n, i in enumerate(self._valid_indices):
-            date = dates[i]
-            if self._is_rolling and i >= window:
-                prior_date = dates[i - window + 1]
-            else:
-                prior_date = dates[0]
-
-            x_slice = x.truncate(prior_date, date).values
+            x_slice = x[starts[i]:ends[i]]
             x_demeaned = x_slice - x_slice.mean(0)
             x_cov = np.dot(x_demeaned.T, x_demeaned) / (len(x_slice) - 1)
 
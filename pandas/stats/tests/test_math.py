@@ -55,6 +55,21 @@ class TestMath(unittest.TestCase):
         expected = ols(y=b, x=self.frame, intercept=False).beta
         self.assert_(np.allclose(result, expected))
 
+    def test_solve_stacked(self):
+        a = randn(50, K, K)
+        b = randn(50, K)
+
+        # singular systems go through the pseudoinverse
+        a[3] = 0
+        a[7, :, 0] = 0
+
+        result = pmath.solve_stacked(a, b)
+        expected = np.array([pmath.solve(x, y) for x, y in zip(a, b)])
+        self.assert_(np.allclose(result, expected))
+
+        result = pmath.solve_stacked(np.empty((0, K, K)), np.empty((0, K)))
+        self.assertEqual(result.shape, (0, K))
+
     def test_inv_illformed(self):
         singular = DataFrame(np.array([[1, 1], [2, 2]]))
         rs = pmath.inv(singular)
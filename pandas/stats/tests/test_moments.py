@@ -2,14 +2,15 @@ import unittest
 import nose
 import sys
 
-from datetime import datetime
+from datetime import datetime, timedelta
 from numpy.random import randn
 import numpy as np
 
-from pandas import Series, DataFrame, bdate_range
+from pandas import Series, DataFrame, DatetimeIndex, bdate_range
 from pandas.util.testing import assert_almost_equal
 import pandas.core.datetools as datetools
 import pandas.stats.moments as mom
+import pandas._tseries as lib
 import pandas.util.testing as tm
 
 N, K = 100, 10
@@ -71,6 +72,16 @@ class TestMoments(unittest.TestCase):
 
             self._check_moment_func(f, alt)
 
+        # extremes and a window with a single observation
+        assert_almost_equal(mom.rolling_quantile(self.arr, 10, 0.),
+                            mom.rolling_min(self.arr, 10))
+        assert_almost_equal(mom.rolling_quantile(self.arr, 10, 1.),
+                            mom.rolling_max(self.arr, 10))
+        assert_almost_equal(mom.rolling_quantile(self.arr, 1, 0.5),
+                            self.arr)
+
+        self.assertRaises(ValueError, mom.rolling_quantile, self.arr, 10, 1.5)
+
     def test_rolling_apply(self):
         def roll_mean(x, window, min_periods=None, freq=None):
             return mom.rolling_apply(x, window,
@@ -79,6 +90,19 @@ class TestMoments(unittest.TestCase):
                                          freq=freq)
         self._check_moment_func(roll_mean, np.mean)
 
+        # the windows before the first full one and windows longer than
+        # the data
+        result = mom.rolling_apply(self.arr[:10], 5, len, min_periods=1)
+        assert_almost_equal(result, [1, 2, 3, 4, 5, 5, 5, 5, 5, 5])
+
+        result = mom.rolling_apply(self.arr[:10], 20, len, min_periods=1)
+        assert_almost_equal(result, np.arange(1, 11))
+
+        # strided input
+        arr = randn(200)[::2]
+        assert_almost_equal(mom.rolling_apply(arr, 10, np.mean),
+                            mom.rolling_mean(arr, 10))
+
     def test_rolling_std(self):
         self._check_moment_func(mom.rolling_std,
                                 lambda x: np.std(x, ddof=1))
@@ -217,6 +241,133 @@ class TestMoments(unittest.TestCase):
     def test_ewmvol(self):
         self._check_ew(mom.ewmvol)
 
+    def test_threaded_frame_moments(self):
+        frame = self.frame.copy()
+        frame.values[self._nan_locs, 1] = np.NaN
+
+        for func in [mom.rolling_sum, mom.rolling_mean, mom.rolling_std,
+                     mom.rolling_kurt, mom.rolling_max]:
+            result = func(frame, 20, min_periods=5, n_jobs=4)
+            expected = func(frame, 20, min_periods=5)
+            tm.assert_frame_equal(result, expected)
+
+        result = mom.ewma(frame, com=10, n_jobs=4)
+        tm.assert_frame_equal(result, mom.ewma(frame, com=10))
+
+        # no columns
+        empty = frame.ix[:, []]
+        result = mom.rolling_mean(empty, 20, n_jobs=4)
+        tm.assert_frame_equal(result, empty)
+
+    def test_rolling_time_window(self):
+        # irregular ticks, a few seconds apart
+        np.random.seed(12345)
+        seconds = np.random.randint(1, 20, 500).cumsum()
+        index = DatetimeIndex([datetime(2012, 1, 2) +
+                               timedelta(seconds=int(x)) for x in seconds])
+        ts = Series(randn(500), index=index)
+        ts[50:60] = np.NaN
+
+        def _check(func, static_comp, minp):
+            result = func(ts, '1min', min_periods=minp)
+            self.assert_(isinstance(result, Series))
+
+            expected = []
+            for t in seconds:
+                window = ts[(seconds > t - 60) & (seconds <= t)].dropna()
+                if len(window) >= minp:
+                    expected.append(static_comp(window.values))
+                else:
+                    expected.append(np.NaN)
+            assert_almost_equal(result, expected)
+
+        _check(mom.rolling_sum, np.sum, 1)
+        _check(mom.rolling_mean, np.mean, 3)
+        _check(mom.rolling_std, lambda x: np.std(x, ddof=1), 2)
+        _check(mom.rolling_max, np.max, 1)
+        _check(mom.rolling_min, np.min, 1)
+        _check(mom.rolling_median, np.median, 1)
+        _check(lambda x, w, min_periods: mom.rolling_count(x, w), len, 0)
+
+        # DateOffset and timedelta windows, DataFrame input
+        frame = DataFrame({'A': ts, 'B': ts * 2})
+        result = mom.rolling_mean(frame, datetools.Minute(1))
+        tm.assert_series_equal(result['A'], mom.rolling_mean(ts, '1min'))
+
+        result = mom.rolling_mean(ts, timedelta(minutes=1))
+        tm.assert_series_equal(result, mom.rolling_mean(ts, '1min'))
+
+        self.assertRaises(ValueError, mom.rolling_mean, ts, datetools.BDay())
+        self.assertRaises(ValueError, mom.rolling_mean, ts[::-1], '1min')
+        self.assertRaises(TypeError, mom.rolling_mean, ts.values, '1min')
+
+        # NaT sorts first but has no place in a time window
+        stamps = index.asi8.copy()
+        stamps[0] = lib.NaT
+        with_nat = Series(randn(500), index=DatetimeIndex(stamps))
+        self.assertRaises(ValueError, mom.rolling_mean, with_nat, '2s')
+
+    def test_online_rolling(self):
+        pairs = [(mom.RollingSum, mom.rolling_sum),
+                 (mom.RollingMean, mom.rolling_mean),
+                 (mom.RollingVar, mom.rolling_var),
+                 (mom.RollingStd, mom.rolling_std),
+                 (mom.RollingSkew, mom.rolling_skew),
+                 (mom.RollingKurt, mom.rolling_kurt),
+                 (mom.RollingMedian, mom.rolling_median),
+                 (mom.RollingMax, mom.rolling_max),
+                 (mom.RollingMin, mom.rolling_min)]
+
+        for klass, func in pairs:
+            for window, minp in [(20, None), (20, 5), (1, 0), (1, None),
+                                 (200, 10)]:
+                expected = func(self.arr, window, min_periods=minp)
+
+                # seed with history, then feed chunks and single values
+                online = klass(window, min_periods=minp)
+                result = np.concatenate([online.update(self.arr[:30]),
+                                         online.update(self.arr[30:31]),
+                                         [online.update(x)
+                                          for x in self.arr[31:35]],
+                                         online.update(self.arr[35:])])
+                assert_almost_equal(result, expected)
+
+        online = mom.RollingMean(20, min_periods=5)
+        result = online.update(self.series[:50])
+        self.assert_(isinstance(result, Series))
+        self.assert_(result.index.equals(self.series.index[:50]))
+
+        expected = mom.rolling_mean(self.frame, 20, min_periods=5)
+        online = mom.RollingMean(20, min_periods=5)
+        result = online.update(self.frame[:40]).append(
+            online.update(self.frame[40:]))
+        tm.assert_frame_equal(result, expected)
+
+        self.assertRaises(ValueError, online.update, self.frame.ix[:, :3])
+
+        # exported with the batch functions
+        import pandas.stats.api as api
+        for name in ['RollingMean', 'RollingMin', 'EWMA', 'EWMVar']:
+            self.assert_(getattr(api, name) is getattr(mom, name))
+
+    def test_online_ewm(self):
+        for klass, func in [(mom.EWMA, mom.ewma), (mom.EWMVar, mom.ewmvar)]:
+            expected = func(self.arr, com=10, min_periods=5)
+            online = klass(com=10, min_periods=5)
+            result = np.concatenate([online.update(self.arr[:30]),
+                                     online.update(self.arr[30:])])
+            assert_almost_equal(result, expected)
+
+            expected = func(self.frame, span=20)
+            online = klass(span=20)
+            result = online.update(self.frame[:50]).append(
+                online.update(self.frame[50:]))
+            tm.assert_frame_equal(result, expected)
+
+        online = mom.EWMVar(com=10, bias=True)
+        result = [online.update(x) for x in self.arr]
+        assert_almost_equal(result, mom.ewmvar(self.arr, com=10, bias=True))
+
     def test_ewma_span_com_args(self):
         A = mom.ewma(self.arr, com=9.5)
         B = mom.ewma(self.arr, span=20)
@@ -283,6 +434,32 @@ class TestMoments(unittest.TestCase):
                                10, min_periods=5)
         tm.assert_series_equal(correl, exp)
 
+    def test_pairwise_moments(self):
+        frame = self.frame.ix[:, :4].copy()
+        frame.values[20:30, 1] = np.NaN
+        frame.values[::7, 2] = np.NaN
+
+        pairs = [(mom.rolling_corr_pairwise(frame, 10, min_periods=5),
+                  lambda a, b: mom.rolling_corr(a, b, 10, min_periods=5)),
+                 (mom.rolling_cov_pairwise(frame, 10, min_periods=5),
+                  lambda a, b: mom.rolling_cov(a, b, 10, min_periods=5)),
+                 (mom.ewmcorr_pairwise(frame, com=5, min_periods=3),
+                  lambda a, b: mom.ewmcorr(a, b, com=5, min_periods=3)),
+                 (mom.ewmcov_pairwise(frame, span=10),
+                  lambda a, b: mom.ewmcov(a, b, span=10))]
+
+        for panel, func in pairs:
+            self.assert_(panel.items.equals(frame.index))
+            self.assert_(panel.major_axis.equals(frame.columns))
+            self.assert_(panel.minor_axis.equals(frame.columns))
+
+            for c1 in frame.columns:
+                for c2 in frame.columns:
+                    if c1 == c2:
+                        continue
+                    assert_almost_equal(panel.ix[:, c1, c2],
+                                        func(frame[c1], frame[c2]))
+
     def test_flex_binary_frame(self):
         def _check(method):
             series = self.frame[1]
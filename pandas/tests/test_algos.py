@@ -25,6 +25,44 @@ class TestMatch(unittest.TestCase):
         expected = np.array([1, 0, -1, 0, 1, 2, -1])
         self.assert_(np.array_equal(result, expected))
 
+class TestDuplicated(unittest.TestCase):
+
+    def test_factorize_multiple(self):
+        a = np.array([1, 2, 1, 2, 1])
+        b = np.array(['x', 'y', 'x', 'x', 'x'], dtype=object)
+        c = np.array([0.5, np.nan, 0.5, np.nan, np.nan])
+
+        ids, ngroups = algos.factorize_multiple([a, b, c])
+        self.assertEqual(ngroups, 4)
+        self.assertEqual(ids[0], ids[2])
+        self.assertEqual(len(set(ids[[0, 1, 3, 4]])), 4)
+
+    def test_duplicated(self):
+        keys = [np.random.randint(0, 5, 1000),
+                np.random.randint(0, 3, 1000).astype(float),
+                np.array(['a', 'b'], dtype=object).repeat(500)]
+        keys[1][::7] = np.nan
+
+        tuples = zip(*[np.where(k != k, None, k) for k in keys])
+        for take_last in [False, True]:
+            seen = set()
+            expected = np.zeros(len(tuples), dtype=bool)
+            order = range(len(tuples))
+            if take_last:
+                order = order[::-1]
+            for i in order:
+                expected[i] = tuples[i] in seen
+                seen.add(tuples[i])
+
+            result = algos.duplicated(keys, take_last=take_last)
+            self.assert_(np.array_equal(result, expected))
+
+    def test_duplicated_overflow(self):
+        n = 100000
+        keys = [np.arange(n).repeat(2)[::-1] for _ in range(4)]
+        result = algos.duplicated(keys)
+        self.assert_(np.array_equal(result, np.tile([False, True], n)))
+
 if __name__ == '__main__':
     import nose
     nose.runmodule(argv=[__file__,'-vvs','-x','--pdb', '--pdb-failure'],
@@ -2962,6 +2962,17 @@ class TestDataFrame(unittest.TestCase, CheckIndexing,
         exp.index = []
         assert_frame_equal(recons, exp)
 
+        # NA labels are written as na_rep, not as the last level value
+        index = MultiIndex.from_tuples([('a', 1), ('b', np.nan), ('c', 3)])
+        df = DataFrame({'A' : [1, 2, 3]}, index=index)
+        buf = StringIO()
+        df.to_csv(buf, header=False)
+        self.assertEqual(buf.getvalue(), 'a,1,1\nb,,2\nc,3,3\n')
+
+        buf = StringIO()
+        df.to_csv(buf, header=False, na_rep='NA')
+        self.assertEqual(buf.getvalue().splitlines()[1], 'b,NA,2')
+
     def test_to_csv_float32_nanrep(self):
         df = DataFrame(np.random.randn(1, 4).astype(np.float32))
         df[1] = np.nan
@@ -3017,6 +3028,47 @@ class TestDataFrame(unittest.TestCase, CheckIndexing,
         recons = pan.read_csv(buf, index_col=0)
         assert_frame_equal(recons, self.frame)
 
+    def test_to_csv_chunking(self):
+        df = DataFrame(np.random.randn(100, 3), columns=['a', 'b', 'c'])
+        df['d'] = 'foo'
+        df.ix[::3, 'a'] = np.nan
+
+        buf = StringIO()
+        df.to_csv(buf)
+        expected = buf.getvalue()
+
+        for chunksize in [1, 7, 100, 1000]:
+            buf = StringIO()
+            df.to_csv(buf, chunksize=chunksize)
+            self.assertEqual(buf.getvalue(), expected)
+
+        buf.seek(0)
+        recons = pan.read_csv(buf, index_col=0)
+        assert_frame_equal(recons, df)
+
+    def test_to_csv_formatting(self):
+        df = DataFrame({'a' : [0.1, np.nan, np.inf, 2., -0.],
+                        'b' : ['x,y', None, np.nan, 'z', 'w'],
+                        'c' : [True, False, True, True, False]},
+                       index=[datetime(2000, 1, 1), datetime(2000, 1, 2, 12),
+                              datetime(2000, 1, 3, 0, 0, 0, 5),
+                              datetime(2000, 1, 4), datetime(2000, 1, 5)])
+        stamps = df.index.values.copy()
+        stamps.view('i8')[1] = lib.NaT
+        df['d'] = stamps
+
+        buf = StringIO()
+        df.to_csv(buf, na_rep='NA')
+        expected = (',a,b,c,d\n'
+                    '2000-01-01 00:00:00,0.10000000000000001,"x,y",True,'
+                    '2000-01-01 00:00:00\n'
+                    '2000-01-02 12:00:00,NA,NA,False,NA\n'
+                    '2000-01-03 00:00:00.000005,NA,NA,True,'
+                    '2000-01-03 00:00:00.000005\n'
+                    '2000-01-04 00:00:00,2.0,z,True,2000-01-04 00:00:00\n'
+                    '2000-01-05 00:00:00,-0,w,False,2000-01-05 00:00:00\n')
+        self.assertEqual(buf.getvalue(), expected)
+
     def test_to_excel_from_excel(self):
         try:
             import xlwt
@@ -3363,6 +3415,41 @@ class TestDataFrame(unittest.TestCase, CheckIndexing,
         expected = self.mixed_frame.ix[:, ['A', 'B', 'C', 'D']].corr()
         assert_frame_equal(result, expected)
 
+    def test_corr_pairwise_nans(self):
+        self.frame['A'][:5] = nan
+        self.frame['B'][:10] = nan
+        self.frame['C'][-20:] = nan
+
+        correls = self.frame.corr()
+        for a in self.frame.columns:
+            for b in self.frame.columns:
+                assert_almost_equal(correls[a][b],
+                                    self.frame[a].corr(self.frame[b]))
+
+        # spearman is pearson on the ranks of the common observations
+        correls = self.frame.corr(method='spearman')
+        common = self.frame.ix[:, ['A', 'C']].dropna().rank()
+        assert_almost_equal(correls['A']['C'], common['A'].corr(common['C']))
+        assert_almost_equal(correls['D']['D'], 1.)
+
+    def test_corr_min_periods(self):
+        self.frame['A'][:len(self.frame) - 3] = nan
+        self.frame['B'][:] = nan
+
+        for method in ['pearson', 'spearman']:
+            result = self.frame.corr(method=method)
+            self.assert_(notnull(result['A']['C']))
+            self.assert_(isnull(result['B']).all())
+
+            result = self.frame.corr(method=method, min_periods=5)
+            self.assert_(isnull(result['A']).all())
+            self.assert_(notnull(result['C']['D']))
+
+        result = self.frame.cov(min_periods=5)
+        self.assert_(isnull(result['A']).all())
+        assert_almost_equal(result['C']['D'],
+                            self.frame['C'].cov(self.frame['D']))
+
     def test_cov(self):
         self.frame['A'][:5] = nan
         self.frame['B'][:10] = nan
@@ -5912,6 +5999,37 @@ class TestDataFrame(unittest.TestCase, CheckIndexing,
         expected = self.mixed_frame.ix[:, ['foo', 'B', 'C', 'A', 'D']]
         assert_frame_equal(result, expected)
 
+        # blocks taken on several threads
+        result = self.mixed_frame.take(order, axis=0, n_jobs=4)
+        expected = self.mixed_frame.take(order, axis=0)
+        assert_frame_equal(result, expected)
+
+        result = self.mixed_frame.take(order, axis=1, n_jobs=4)
+        expected = self.mixed_frame.take(order, axis=1)
+        assert_frame_equal(result, expected)
+
+    def test_reindex_n_jobs(self):
+        frame = self.mixed_frame.copy()
+        frame['E'] = frame['A'].astype(int)
+        frame['F'] = frame['A'] > 0
+
+        new_index = list(frame.index[::-2]) + ['missing']
+        new_columns = ['F', 'foo', 'missing', 'A', 'E']
+
+        for kwds in [dict(index=new_index), dict(columns=new_columns),
+                     dict(index=new_index, columns=new_columns)]:
+            result = frame.reindex(n_jobs=4, **kwds)
+            expected = frame.reindex(**kwds)
+            assert_frame_equal(result, expected)
+
+        result = frame.reindex_axis(new_columns, axis=1, n_jobs=4)
+        expected = frame.reindex_axis(new_columns, axis=1)
+        assert_frame_equal(result, expected)
+
+        result = frame.reindex(columns=new_columns, fill_value=0, n_jobs=4)
+        self.assert_((result['missing'] == 0).all())
+        self.assert_(result['E'].dtype == np.int64)
+
     def test_iterkv_names(self):
         for k, v in self.mixed_frame.iterkv():
             self.assertEqual(v.name, k)
@@ -95,9 +95,7 @@ class TestGroupBy(unittest.TestCase):
         assert_series_equal(agged, grouped.agg(np.mean)) # shorthand
         assert_series_equal(agged, grouped.mean())
 
-        # Cython only returning floating point for now...
-        assert_series_equal(grouped.agg(np.sum).astype(float),
-                            grouped.sum())
+        assert_series_equal(grouped.agg(np.sum), grouped.sum())
 
         transformed = grouped.transform(lambda x: x * x.sum())
         self.assertEqual(transformed[7], 12)
@@ -1024,6 +1022,212 @@ class TestGroupBy(unittest.TestCase):
 
         assert_series_equal(result, expected)
 
+    def test_cython_agg_int64_exact(self):
+        # would lose precision if passed through float64
+        big = 2 ** 53
+        s = Series([big + 1, big + 3, big + 5, big + 7])
+        grouped = s.groupby([0, 0, 1, 1])
+
+        for how, expected in [('min', [big + 1, big + 5]),
+                              ('max', [big + 3, big + 7]),
+                              ('first', [big + 1, big + 5]),
+                              ('last', [big + 3, big + 7])]:
+            result = getattr(grouped, how)()
+            self.assert_(result.dtype == np.int64)
+            self.assert_((result.values == expected).all())
+
+        result = s.groupby([0, 0, 0, 0]).sum()
+        self.assert_(result.dtype == np.int64)
+        self.assertEqual(result[0], 4 * big + 16)
+
+        # the minimum of the type is a value like any other
+        for dtype in [np.int64, np.int32]:
+            low = np.iinfo(dtype).min
+            s = Series(np.array([low, 5], dtype=dtype))
+            grouped = s.groupby([1, 1])
+            self.assertEqual(grouped.min()[1], low)
+            self.assertEqual(grouped.first()[1], low)
+            self.assertEqual(grouped.sum()[1], long(low) + 5)
+
+    def test_cython_agg_int32_sum(self):
+        s = Series(np.array([2 ** 30, 2 ** 30, 2 ** 30], dtype=np.int32))
+        result = s.groupby([0, 0, 0]).sum()
+        self.assert_(result.dtype == np.int64)
+        self.assertEqual(result[0], 3 * 2 ** 30)
+
+    def test_cython_agg_datetime64(self):
+        # nanosecond resolution, NaT in group 'b'
+        base = 1325376000000000000
+        iNaT = np.iinfo(np.int64).min
+        stamps = np.array([base + 1, base + 3, iNaT, base + 172800 * 10**9],
+                          dtype=np.int64).view('M8[ns]')
+        df = DataFrame({'key' : ['a', 'a', 'b', 'b'],
+                        'stamp' : stamps})
+
+        grouped = df.groupby('key')
+        for how, expected in [('min', stamps[[0, 3]]),
+                              ('max', stamps[[1, 3]]),
+                              ('first', stamps[[0, 3]]),
+                              ('last', stamps[[1, 3]])]:
+            result = getattr(grouped, how)()['stamp']
+            self.assert_(result.dtype == 'M8[ns]')
+            self.assert_((result.values == expected).all())
+
+            result = getattr(grouped['stamp'], how)()
+            self.assert_(result.dtype == 'M8[ns]')
+            self.assert_((result.values == expected).all())
+
+    def test_cython_agg_float32(self):
+        keys = np.random.randint(0, 5, 50)
+        values = Series(np.random.randn(50).astype('f4'))
+        values[::7] = nan
+        grouped = values.groupby(keys)
+
+        for how in ['sum', 'prod', 'mean', 'var', 'std', 'min', 'max',
+                    'first', 'last']:
+            result = getattr(grouped, how)()
+            self.assert_(result.dtype == np.float32)
+
+            expected = getattr(values.astype('f8').groupby(keys), how)()
+            self.assert_(np.allclose(result.values, expected.values,
+                                     rtol=1e-5))
+
+    def test_cython_median_quantile(self):
+        from pandas.compat.scipy import scoreatpercentile
+
+        df = DataFrame(np.random.randn(1000, 3))
+        df.ix[::3, 1] = nan
+        df['key'] = np.random.randint(0, 50, 1000)
+        grouped = df.groupby('key')
+
+        result = grouped.median()
+        for c in [0, 1, 2]:
+            f = lambda x: np.median(x.dropna().values)
+            assert_series_equal(result[c], grouped[c].agg(f))
+        assert_frame_equal(grouped.agg(np.median), result)
+        assert_series_equal(grouped[1].median(), result[1])
+
+        for q in [0, 0.1, 0.75, 1]:
+            result = grouped.quantile(q)
+            for c in [0, 1, 2]:
+                f = lambda x: scoreatpercentile(x.dropna().values, q * 100)
+                assert_series_equal(result[c], grouped[c].agg(f))
+
+    def test_cython_nunique(self):
+        df = DataFrame({'key' : np.random.randint(0, 20, 500),
+                        'ints' : np.random.randint(0, 10, 500),
+                        'floats' : np.random.randint(0, 10, 500) / 2.,
+                        'strings' : np.array(list('abcdefg'))[
+                            np.random.randint(0, 7, 500)]})
+        df['floats'][::4] = nan
+        grouped = df.groupby('key')
+
+        f = lambda x: len(x.dropna().unique())
+        result = grouped.nunique()
+        for c in ['ints', 'floats', 'strings']:
+            assert_series_equal(result[c], grouped[c].agg(f))
+
+        result = grouped['strings'].nunique()
+        assert_series_equal(result, grouped['strings'].agg(f))
+
+    def test_cython_transform_cumulative(self):
+        df = DataFrame({'key' : np.random.randint(0, 10, 200).astype(float),
+                        'floats' : np.random.randn(200),
+                        'ints' : np.random.randint(0, 5, 200)})
+        df['floats'][::3] = nan
+
+        grouped = df.groupby('key')
+        for name in ['cumsum', 'cumprod', 'cummax', 'cummin']:
+            f = lambda x: getattr(x, name)()
+            result = getattr(grouped, name)()
+            self.assert_(result.index.equals(df.index))
+            for c in ['floats', 'ints']:
+                expected = grouped[c].transform(f)
+                assert_almost_equal(result[c], expected)
+
+            assert_frame_equal(grouped.transform(name), result)
+
+        # integers are exact
+        self.assert_(grouped.cumsum()['ints'].dtype == np.int64)
+        s = Series([2**53 + 1, 1, 1])
+        result = s.groupby([0, 0, 0]).cumsum()
+        self.assert_(np.array_equal(result.values, s.cumsum().values))
+        result = s.groupby([0, 0, 0]).cummax()
+        self.assert_(np.array_equal(result.values, [2**53 + 1] * 3))
+
+        # rows with NA keys are NA
+        df['key'][::7] = nan
+        result = df.groupby('key').cumsum()
+        self.assert_(com.isnull(result['ints'][::7]).all())
+        self.assert_(com.isnull(result['floats'][::7]).all())
+
+    def test_cython_transform_shift_fillna(self):
+        s = Series([1., nan, 3., nan, 5., 6., nan, 8.])
+        keys = np.array(['a', 'b', 'a', 'b', 'a', 'b', 'a', 'b'])
+        grouped = s.groupby(keys)
+
+        result = grouped.shift()
+        expected = Series([nan, nan, 1., nan, 3., nan, 5., 6.])
+        assert_series_equal(result, expected)
+
+        result = grouped.shift(-1)
+        expected = Series([3., nan, 5., 6., nan, 8., nan, nan])
+        assert_series_equal(result, expected)
+
+        result = grouped.fillna(method='pad')
+        expected = Series([1., nan, 3., nan, 5., 6., 5., 8.])
+        assert_series_equal(result, expected)
+
+        result = grouped.fillna(method='bfill')
+        expected = Series([1., 6., 3., 6., 5., 6., nan, 8.])
+        assert_series_equal(result, expected)
+
+        df = DataFrame({'A' : s, 'B' : np.arange(8.), 'key' : keys})
+        df['B'][[1, 3]] = nan
+        grouped = df.groupby('key')
+        result = grouped.fillna(method='pad', limit=1)
+        expected = grouped.transform(lambda x: x.fillna(method='pad',
+                                                        limit=1))
+        assert_frame_equal(result, expected)
+
+        result = grouped.shift(2)
+        expected = grouped.transform(lambda x: x.shift(2))
+        assert_frame_equal(result, expected)
+
+    def test_cython_transform_rank(self):
+        df = DataFrame({'key' : np.random.randint(0, 10, 200),
+                        'values' : np.random.randint(0, 20, 200) / 2.})
+        df['values'][::5] = nan
+        grouped = df.groupby('key')['values']
+
+        assert_series_equal(grouped.rank(),
+                            grouped.transform(lambda x: x.rank()))
+        assert_series_equal(grouped.rank(ascending=False),
+                            grouped.transform(
+                                lambda x: x.rank(ascending=False)))
+
+    def test_transform_broadcast_aggregation(self):
+        df = DataFrame({'key' : ['a', 'b', 'c', 'a', 'b', 'a'],
+                        'values' : [1., 2., 3., 4., nan, 5.]})
+        df['key'][2] = nan
+        grouped = df.groupby('key')
+
+        result = grouped['values'].transform('mean')
+        # rows with NA keys keep their values, as in the slow path
+        expected = Series([10 / 3., 2., 3., 10 / 3., 2., 10 / 3.],
+                          name='values')
+        assert_series_equal(result, expected)
+        assert_series_equal(grouped['values'].transform(np.mean), expected)
+
+        result = grouped.transform('sum')
+        expected = DataFrame({'values' : [10., 2., nan, 10., 2., 10.]})
+        assert_frame_equal(result, expected)
+
+        mask = df['key'].notnull()
+        demeaned = df['values'] - grouped['values'].transform('mean')
+        expected = grouped['values'].transform(lambda x: x - x.mean())
+        assert_almost_equal(demeaned[mask].values, expected[mask].values)
+
     def test_cython_agg_nothing_to_agg(self):
         frame = DataFrame({'a': np.random.randint(0, 5, 50),
                            'b': ['foo', 'bar'] * 25})
@@ -1033,6 +1237,39 @@ class TestGroupBy(unittest.TestCase):
                            'b': ['foo', 'bar'] * 25})
         self.assertRaises(GroupByError, frame[['b']].groupby(frame['a']).mean)
 
+    def test_cython_agg_n_jobs(self):
+        df = DataFrame(np.random.randn(1000, 7))
+        df.ix[::3, 2] = nan
+        df['key'] = np.random.randint(0, 50, 1000).astype(float)
+        df['key'][::10] = nan
+
+        single = df.groupby('key')
+        threaded = df.groupby('key', n_jobs=3)
+        for how in ['sum', 'prod', 'mean', 'var', 'std', 'min', 'max',
+                    'first', 'last']:
+            assert_frame_equal(getattr(threaded, how)(),
+                               getattr(single, how)())
+
+        result = threaded[[0, 1, 2]].mean()
+        assert_frame_equal(result, single[[0, 1, 2]].mean())
+
+        # more threads than columns
+        result = df[[0, 'key']].groupby('key', n_jobs=4).mean()
+        assert_frame_equal(result, df[[0, 'key']].groupby('key').mean())
+
+    def test_bin_grouper_n_jobs(self):
+        from pandas.core.groupby import BinGrouper
+
+        values = np.random.randn(100, 5)
+        values[::7, 1] = nan
+        bins = np.array([10, 25, 40, 80], dtype=np.int64)
+        grouper = BinGrouper(bins, np.arange(5))
+
+        for how in ['add', 'mean', 'var', 'min', 'max']:
+            expected, _ = grouper.aggregate(values, how)
+            result, _ = grouper.aggregate(values, how, n_jobs=3)
+            assert_almost_equal(result, expected)
+
     def test_wrap_aggregated_output_multindex(self):
         df = self.mframe.T
         df['baz', 'two'] = 'peekaboo'
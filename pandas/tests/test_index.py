@@ -1093,6 +1093,12 @@ class TestMultiIndex(unittest.TestCase):
         r1 = idx1.get_indexer([1,2,3])
         self.assert_( (r1 == [-1, -1, -1]).all() )
 
+        # NA labels in the target never match
+        target = MultiIndex(levels=[major_axis, minor_axis],
+                            labels=[[0, -1, 3], [1, 1, -1]])
+        r1 = index.get_indexer(target)
+        assert_almost_equal(r1, [1, -1, -1])
+
         # self.assertRaises(Exception, idx1.get_indexer,
         #                   list(list(zip(*idx2.get_tuple_index()))[0]))
 
@@ -1463,6 +1469,73 @@ class TestMultiIndex(unittest.TestCase):
                                    [0, 1, 2, 0, 0, 1, 2]])
         self.assert_(index.has_duplicates)
 
+    def test_int64_keys_lookup(self):
+        index = MultiIndex(levels=[['a', 'b', 'c'], [1, 2, 3]],
+                           labels=[[0, 0, 1, 2, 2], [0, 2, 1, 0, 2]])
+        self.assert_(index._int64_keys is not None)
+
+        self.assertEqual(index.get_loc(('b', 2)), 2)
+        self.assert_(('c', 3) in index)
+        self.assert_(('b', 3) not in index)
+        self.assert_(('d', 1) not in index)
+        self.assert_('a' not in index)
+        self.assertRaises(KeyError, index.get_loc, ('b', 3))
+
+        # target has level values this index does not have
+        target = MultiIndex(levels=[['c', 'b', 'd'], [3, 2, 1]],
+                            labels=[[0, 2, 1, 0], [0, 0, 1, 2]])
+        result = index.get_indexer(target)
+        expected = [index.get_tuple_index().get_loc(t)
+                    if t in index else -1 for t in target]
+        self.assert_(np.array_equal(result, expected))
+        self.assert_(np.array_equal(result,
+                                    index.get_indexer(target.values)))
+
+        # non-unique
+        dups = index.append(index[:2])
+        self.assert_(not dups.is_unique)
+        self.assert_(np.array_equal(dups.get_loc(('a', 3)),
+                                    [False, True, False, False, False,
+                                     False, True]))
+
+    def test_int64_keys_setops(self):
+        index = MultiIndex(levels=[['a', 'b', 'c'], [1, 2, 3]],
+                           labels=[[0, 0, 1, 2, 2], [0, 2, 1, 0, 2]])
+        other = MultiIndex(levels=[['b', 'c', 'd'], [2, 3, 4]],
+                           labels=[[0, 1, 2, 2], [0, 1, 2, 0]])
+
+        tups = set(index.values)
+        otups = set(other.values)
+
+        result = index | other
+        self.assert_(result.equals(MultiIndex.from_tuples(sorted(tups |
+                                                                 otups))))
+        self.assert_(result.is_lexsorted())
+
+        result = index & other
+        self.assert_(result.equals(MultiIndex.from_tuples(sorted(tups &
+                                                                 otups))))
+        self.assertEqual(list(result.levels[0]), ['b', 'c'])
+
+        result = index - other
+        self.assert_(result.equals(MultiIndex.from_tuples(sorted(tups -
+                                                                 otups))))
+
+        self.assertEqual(len(index[:2] & other), 0)
+
+    def test_int64_keys_overflow(self):
+        n = 100000
+        levels = [Index(np.arange(n))] * 4
+        labels = [np.array([0, n - 1, 5]), np.array([1, 2, n - 1]),
+                  np.array([n - 1, 0, 0]), np.array([3, 2, 1])]
+        index = MultiIndex(levels=levels, labels=labels)
+
+        self.assert_(index._int64_keys is None)
+        self.assertEqual(index.get_loc((n - 1, 2, 0, 2)), 1)
+        self.assert_(not index.has_duplicates)
+        self.assert_(np.array_equal(index.get_indexer(index[::-1]),
+                                    [2, 1, 0]))
+
 class TestFactor(unittest.TestCase):
 
     def setUp(self):
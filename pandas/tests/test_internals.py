@@ -327,6 +327,21 @@ class TestBlockManager(unittest.TestCase):
         assert_almost_equal(reindexed.get('g'), vals.squeeze())
         _check_cols(self.mgr, reindexed, ['c', 'a', 'd'])
 
+    def test_reindex_indexer_threaded(self):
+        new_axis = Index(np.arange(N)[::-2])
+        indexer = np.arange(N, dtype=np.int64)[::-2]
+
+        result = self.mgr.reindex_indexer(new_axis, indexer, axis=1,
+                                          n_jobs=4)
+        expected = self.mgr.reindex_indexer(new_axis, indexer, axis=1)
+        self.assert_(result.axes[1].equals(new_axis))
+        for item in self.mgr.items:
+            assert_almost_equal(result.get(item), expected.get(item))
+
+        result = self.mgr.take(indexer, axis=1, n_jobs=4)
+        for item in self.mgr.items:
+            assert_almost_equal(result.get(item), expected.get(item))
+
     def test_xs(self):
         index = MultiIndex(levels=[['foo', 'bar', 'baz', 'qux'],
                                    ['one', 'two', 'three']],
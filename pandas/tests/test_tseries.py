@@ -407,6 +407,50 @@ def test_group_ohlc():
     expected[0] = nan
     assert_almost_equal(out, expected)
 
+def test_group_ohlc_columns():
+    obj = np.random.randn(20, 3)
+    obj[::4, 1] = nan
+    obj[12:, 2] = nan
+
+    # the last bin is empty
+    bins = np.array([6, 12, 20, 20], dtype=np.int64)
+    out = np.zeros((4, 12), np.float64)
+    counts = np.zeros(len(out), dtype=np.int64)
+    lib.group_ohlc(out, counts, obj, bins)
+
+    for j in range(3):
+        expected = np.zeros((4, 4), np.float64)
+        lib.group_ohlc(expected, np.zeros(4, dtype=np.int64),
+                       obj[:, j:j + 1].copy(), bins)
+        assert_almost_equal(out[:, 4 * j:4 * j + 4], expected)
+
+    assert(isnull(out[2, 8:]).all())
+    assert(isnull(out[3]).all())
+    assert_almost_equal(counts, [6, 6, 8, 0])
+
+def test_group_count_bin():
+    obj = np.random.randn(10, 2)
+    obj[::3, 0] = nan
+
+    bins = np.array([3, 9, 10], dtype=np.int64)
+    out = np.empty((3, 2), dtype=np.int64)
+    counts = np.zeros(3, dtype=np.int64)
+    lib.group_count_bin(out, counts, obj, bins)
+
+    assert_almost_equal(out, [[2, 3], [4, 6], [0, 1]])
+    assert_almost_equal(counts, [3, 6, 1])
+
+def test_upsample_interpolate():
+    index = np.array([0, 10, 20, 40], dtype=np.int64)
+    values = np.array([[0., 1.], [10., 1.], [nan, 1.], [40., 3.]])
+    target = np.array([-5, 0, 5, 10, 15, 30, 40, 45], dtype=np.int64)
+
+    result = lib.upsample_interpolate(index, values, target)
+    # each column interpolates between its own non-NaN observations
+    expected = [[nan, nan], [0, 1], [5, 1], [10, 1], [15, 1], [30, 2],
+                [40, 3], [nan, nan]]
+    assert_almost_equal(result, expected)
+
 def test_try_parse_dates():
     from dateutil.parser import parse
 
@@ -416,6 +460,12 @@ def test_try_parse_dates():
     expected = [parse(d, dayfirst=True) for d in arr]
     assert(np.array_equal(result, expected))
 
+    arr = np.array(['2000-05-01', '2000-05-01 10:00:00.25', '5/1/2000',
+                    '2000-05-01'], dtype=object)
+    result = lib.try_parse_dates(arr)
+    expected = [parse(d) for d in arr]
+    assert(np.array_equal(result, expected))
+
 
 class TestTypeInference(unittest.TestCase):
 
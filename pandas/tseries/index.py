@@ -7,7 +7,8 @@ import numpy as np
 
 from pandas.core.index import Index, Int64Index
 from pandas.tseries.frequencies import infer_freq, to_offset
-from pandas.tseries.offsets import DateOffset, generate_range, Tick
+from pandas.tseries.offsets import (DateOffset, generate_range, Tick,
+                                    generate_range_i8)
 from pandas.tseries.tools import parse_time_string, normalize_date
 from pandas.util.decorators import cache_readonly
 import pandas.core.common as com
@@ -250,8 +251,7 @@ class DatetimeIndex(Int64Index):
             tz = tools._maybe_get_tz(tz)
             # Convert local to UTC
             ints = subarr.view('i8')
-            lib.tz_localize_check(ints, tz)
-            subarr = lib.tz_convert(ints, tz, _utc())
+            subarr = lib.tz_localize_to_utc(ints, tz)
             subarr = subarr.view('M8[ns]')
 
         subarr = subarr.view(cls)
@@ -315,8 +315,7 @@ class DatetimeIndex(Int64Index):
         if tz is not None:
             # Convert local to UTC
             ints = index.view('i8')
-            lib.tz_localize_check(ints, tz)
-            index = lib.tz_convert(ints, tz, _utc())
+            index = lib.tz_localize_to_utc(ints, tz)
             index = index.view('M8[ns]')
 
         index = index.view(cls)
@@ -355,11 +354,8 @@ class DatetimeIndex(Int64Index):
 
         drc = _daterange_cache
         if offset not in _daterange_cache:
-            xdr = generate_range(offset=offset, start=_CACHE_START,
-                                 end=_CACHE_END)
-
-            arr = np.array(_to_m8_array(list(xdr)),
-                           dtype='M8[ns]', copy=False)
+            arr = _generate_regular_range(_CACHE_START, _CACHE_END, None,
+                                          offset)
 
             cachedRange = arr.view(DatetimeIndex)
             cachedRange.offset = offset
@@ -491,9 +487,19 @@ class DatetimeIndex(Int64Index):
             inc = offsets._delta_to_nanoseconds(delta)
             new_values = (self.asi8 + inc).view('M8[ns]')
         else:
-            new_values = self.astype('O') + delta
+            try:
+                new_values = delta.apply_index(self._local_timestamps())
+                new_values = new_values.view('M8[ns]')
+            except NotImplementedError:
+                new_values = self.astype('O') + delta
         return DatetimeIndex(new_values, tz=self.tz, freq='infer')
 
+    def _local_timestamps(self):
+        # wall-clock i8 values, what offsets are applied to
+        if self.tz is None:
+            return self.asi8
+        return lib.tz_convert(self.asi8, _utc(), self.tz)
+
     def summary(self, name=None):
         if len(self) > 0:
             index_summary = ', %s to %s' % (str(self[0]), str(self[-1]))
@@ -1115,10 +1121,22 @@ class DatetimeIndex(Int64Index):
         # No conversion since timestamps are all UTC to begin with
         return self._simple_new(self.values, self.name, self.offset, tz)
 
-    def tz_localize(self, tz):
+    def tz_localize(self, tz, ambiguous='raise', nonexistent='raise'):
         """
         Localize tz-naive DatetimeIndex to given time zone (using pytz)
 
+        Parameters
+        ----------
+        tz : string or pytz.timezone object
+        ambiguous : {'raise', 'NaT'} or boolean array, default 'raise'
+            Times repeated when the clocks go back: raise AmbiguousTimeError,
+            set to NaT, or for each time True to take the first (DST)
+            occurrence and False to take the second
+        nonexistent : {'raise', 'NaT', 'shift_forward'}, default 'raise'
+            Times skipped when the clocks go forward: raise
+            NonExistentTimeError, set to NaT, or move forward by the size of
+            the gap
+
         Returns
         -------
         localized : DatetimeIndex
@@ -1128,10 +1146,9 @@ class DatetimeIndex(Int64Index):
                              "use tz_convert to convert.")
         tz = tools._maybe_get_tz(tz)
 
-        lib.tz_localize_check(self.asi8, tz)
-
         # Convert to UTC
-        new_dates = lib.tz_convert(self.asi8, tz, _utc())
+        new_dates = lib.tz_localize_to_utc(self.asi8, tz, ambiguous,
+                                           nonexistent)
         new_dates = new_dates.view('M8[ns]')
         return self._simple_new(new_dates, self.name, self.offset, tz)
 
@@ -1167,7 +1184,8 @@ def _generate_regular_range(start, end, periods, offset):
         if periods is None:
             b = Timestamp(start).value
             e = Timestamp(end).value
-            e += stride - e % stride
+            # one past the last point on the grid anchored at start
+            e = b + ((e - b) // stride + 1) * stride
         elif start is not None:
             b = Timestamp(start).value
             e = b + periods * stride
@@ -1177,13 +1195,20 @@ def _generate_regular_range(start, end, periods, offset):
         else:
             raise NotImplementedError
 
-        data = np.arange(b, e, stride, dtype=np.int64)
+        # np.arange sizes the result in floating point, which can be off by
+        # one for the spans of a couple of centuries
+        data = b + np.arange((e - b) // stride, dtype=np.int64) * stride
         data = data.view('M8[ns]')
     else:
-        xdr = generate_range(start=start, end=end,
-            periods=periods, offset=offset)
+        try:
+            data = generate_range_i8(start=start, end=end, periods=periods,
+                                     offset=offset)
+            data = data.view('M8[ns]')
+        except NotImplementedError:
+            xdr = generate_range(start=start, end=end,
+                periods=periods, offset=offset)
 
-        data = np.array(list(xdr), dtype='M8[ns]')
+            data = np.array(list(xdr), dtype='M8[ns]')
 
     return data
 
@@ -1255,12 +1280,6 @@ def _to_m8(key):
     return np.int64(lib.pydt_to_i8(key)).view('M8[ns]')
 
 
-def _to_m8_array(arr):
-    if arr is None:
-        return arr
-    return np.frompyfunc(_to_m8, 1, 1)(arr)
-
-
 def _str_to_dt_array(arr, offset=None):
     def parser(x):
         result = parse_time_string(x, offset)
@@ -87,6 +87,35 @@ class DateOffset(object):
         else:
             return other + timedelta(self.n)
 
+    def apply_index(self, i8):
+        """
+        Vectorized apply: add the offset to an array of int64 nanosecond
+        timestamps, returning a new int64 array. Raises NotImplementedError
+        for offsets that can only be applied to one date at a time
+        """
+        if type(self) != DateOffset:
+            raise NotImplementedError
+
+        if len(self.kwds) > 0:
+            months, nanos = _relativedelta_parts(self._offset)
+        else:
+            months, nanos = 0, _delta_to_nanoseconds(timedelta(1))
+        return lib.shift_relative(i8, self.n, months, nanos)
+
+    def _repeatable(self):
+        # whether k * self applied to a date on offset lands where applying
+        # self k times does, so that ranges can be built with apply_index
+        if type(self) == DateOffset:
+            if len(self.kwds) == 0:
+                return True
+            try:
+                months, _ = _relativedelta_parts(self._offset)
+            except NotImplementedError:
+                return False
+            # relativedelta clips the day at each step
+            return months == 0
+        return isinstance(self, CacheableOffset)
+
     def isAnchored(self):
         return (self.n == 1)
 
@@ -181,18 +210,46 @@ class DateOffset(object):
 
     def rollback(self, someDate):
         """Roll provided date backward to next offset only if not on offset"""
+        if isinstance(someDate, np.ndarray):
+            return self._roll_index(someDate, -1)
         if not self.onOffset(someDate):
             someDate = someDate - self.__class__(1, **self.kwds)
         return someDate
 
     def rollforward(self, dt):
         """Roll provided date forward to next offset only if not on offset"""
+        if isinstance(dt, np.ndarray):
+            return self._roll_index(dt, 1)
         if isinstance(dt, np.datetime64):
             dt = Timestamp(dt)
         if not self.onOffset(dt):
             dt = dt + self.__class__(1, **self.kwds)
         return dt
 
+    def _roll_index(self, index, n):
+        from pandas.tseries.index import DatetimeIndex
+        if not isinstance(index, DatetimeIndex):
+            index = DatetimeIndex(index)
+
+        i8 = index._local_timestamps()
+        try:
+            rolled = self.__class__(n, **self.kwds).apply_index(i8)
+            result = np.where(self._onOffset_index(i8), i8, rolled)
+        except NotImplementedError:
+            if n > 0:
+                result = [self.rollforward(x) for x in index.asobject]
+            else:
+                result = [self.rollback(x) for x in index.asobject]
+            return DatetimeIndex(result, tz=index.tz)
+
+        return DatetimeIndex(result.view('M8[ns]'), tz=index.tz)
+
+    def _onOffset_index(self, i8):
+        # vectorized onOffset for the default definition below
+        if type(self) == DateOffset:
+            return np.ones(len(i8), dtype=bool)
+        return (-self).apply_index(self.apply_index(i8)) == i8
+
     def onOffset(self, dt):
         if type(self) == DateOffset:
             return True
@@ -288,6 +345,18 @@ class BusinessDay(DateOffset, CacheableOffset):
         else:
             raise Exception('Only know how to combine business day with '
                             'datetime or timedelta!')
+
+    def apply_index(self, i8):
+        return lib.shift_bdays(i8, self.n, self.normalize,
+                               _delta_to_nanoseconds(self.offset))
+
+    def _repeatable(self):
+        # the offset is added once per application
+        return not self.offset
+
+    def _onOffset_index(self, i8):
+        return lib.fast_field_accessor(i8, 'dow') < 5
+
     @classmethod
     def onOffset(cls, dt):
         if isinstance(dt, np.datetime64):
@@ -308,6 +377,9 @@ class MonthEnd(DateOffset, CacheableOffset):
         other = other + relativedelta(months=n, day=31)
         return other
 
+    def apply_index(self, i8):
+        return lib.shift_anchored(i8, self.n, 1, 1, 'end')
+
     @classmethod
     def onOffset(cls, dt):
         __junk, days_in_month = lib.monthrange(dt.year, dt.month)
@@ -330,10 +402,12 @@ class MonthBegin(DateOffset, CacheableOffset):
         other = other + relativedelta(months=n, day=1)
         return other
 
+    def apply_index(self, i8):
+        return lib.shift_anchored(i8, self.n, 1, 1, 'start')
+
     @classmethod
     def onOffset(cls, dt):
-        firstDay, _ = lib.monthrange(dt.year, dt.month)
-        return dt.day == (firstDay + 1)
+        return dt.day == 1
 
     @property
     def rule_code(self):
@@ -362,6 +436,9 @@ class BusinessMonthEnd(DateOffset, CacheableOffset):
             other = other - BDay()
         return other
 
+    def apply_index(self, i8):
+        return lib.shift_anchored(i8, self.n, 1, 1, 'business_end')
+
     @property
     def rule_code(self):
         return 'BM'
@@ -386,6 +463,11 @@ class BusinessMonthBegin(DateOffset, CacheableOffset):
         result = datetime(other.year, other.month, first)
         return result
 
+    def apply_index(self, i8):
+        # apply doesn't roll back a date before the first business day
+        return lib.shift_anchored(i8, self.n, 1, 1, 'business_start',
+                                  roll_before=False, normalize=True)
+
     @property
     def rule_code(self):
         return 'BMS'
@@ -436,9 +518,16 @@ class Week(DateOffset, CacheableOffset):
                 other = other - self._inc
         return other
 
+    def apply_index(self, i8):
+        weekday = -1 if self.weekday is None else self.weekday
+        return lib.shift_weekday(i8, self.n, weekday)
+
     def onOffset(self, dt):
         return dt.weekday() == self.weekday
 
+    def _onOffset_index(self, i8):
+        return lib.fast_field_accessor(i8, 'dow') == self.weekday
+
     @property
     def rule_code(self):
         suffix = ''
@@ -509,6 +598,9 @@ class WeekOfMonth(DateOffset, CacheableOffset):
 
         return self.getOffsetOfMonth(other + relativedelta(months=months, day=1))
 
+    def apply_index(self, i8):
+        return lib.shift_week_of_month(i8, self.n, self.week, self.weekday)
+
     def getOffsetOfMonth(self, dt):
         w = Week(weekday=self.weekday)
         d = datetime(dt.year, dt.month, 1)
@@ -569,6 +661,10 @@ class BQuarterEnd(DateOffset, CacheableOffset):
 
         return other
 
+    def apply_index(self, i8):
+        return lib.shift_anchored(i8, self.n, 3, self.startingMonth,
+                                  'business_end')
+
     def onOffset(self, dt):
         modMonth = (dt.month - self.startingMonth) % 3
         return BMonthEnd().onOffset(dt) and modMonth == 0
@@ -638,6 +734,10 @@ class BQuarterBegin(DateOffset, CacheableOffset):
                           other.microsecond)
         return result
 
+    def apply_index(self, i8):
+        return lib.shift_anchored(i8, self.n, 3, self.startingMonth,
+                                  'business_start')
+
     @property
     def rule_code(self):
         suffix = '-%s' % _month_dict[self.startingMonth]
@@ -678,6 +778,9 @@ class QuarterEnd(DateOffset, CacheableOffset):
 
         return other
 
+    def apply_index(self, i8):
+        return lib.shift_anchored(i8, self.n, 3, self.startingMonth, 'end')
+
     def onOffset(self, dt):
         modMonth = (dt.month - self.startingMonth) % 3
         return MonthEnd().onOffset(dt) and modMonth == 0
@@ -722,6 +825,11 @@ class QuarterBegin(DateOffset, CacheableOffset):
         other = other + relativedelta(months=3*n - monthsSince, day=1)
         return other
 
+    def apply_index(self, i8):
+        # apply with n == 0 rolls back within the quarter's first month
+        return lib.shift_anchored(i8, self.n, 3, self.startingMonth, 'start',
+                                  roll_zero=False)
+
     @property
     def rule_code(self):
         suffix = '-%s' % _month_dict[self.startingMonth]
@@ -769,6 +877,9 @@ class BYearEnd(DateOffset, CacheableOffset):
 
         return result
 
+    def apply_index(self, i8):
+        return lib.shift_anchored(i8, self.n, 12, self.month, 'business_end')
+
     @property
     def rule_code(self):
         suffix = '-%s' % _month_dict[self.month]
@@ -812,6 +923,10 @@ class BYearBegin(DateOffset, CacheableOffset):
         first = _get_firstbday(wkday)
         return datetime(other.year, self.month, first)
 
+    def apply_index(self, i8):
+        return lib.shift_anchored(i8, self.n, 12, self.month,
+                                  'business_start', normalize=True)
+
     @property
     def rule_code(self):
         suffix = '-%s' % _month_dict[self.month]
@@ -874,6 +989,9 @@ class YearEnd(DateOffset, CacheableOffset):
 
         return result
 
+    def apply_index(self, i8):
+        return lib.shift_anchored(i8, self.n, 12, self.month, 'end')
+
     def onOffset(self, dt):
         wkday, days_in_month = lib.monthrange(dt.year, self.month)
         return self.month == dt.month and dt.day == days_in_month
@@ -906,6 +1024,10 @@ class YearBegin(DateOffset, CacheableOffset):
         other = other + relativedelta(years = n, day=1)
         return other
 
+    def apply_index(self, i8):
+        # always anchored on January, whatever self.month is
+        return lib.shift_anchored(i8, self.n, 12, 1, 'start')
+
     @classmethod
     def onOffset(cls, dt):
         return dt.month == 1 and dt.day == 1
@@ -969,6 +1091,9 @@ class Tick(DateOffset):
         elif isinstance(other, type(self)):
             return type(self)(self.n + other.n)
 
+    def apply_index(self, i8):
+        return lib.shift_relative(i8, 1, 0, self.nanos)
+
     _rule_base = 'undefined'
     @property
     def rule_code(self):
@@ -1002,6 +1127,29 @@ def _delta_to_nanoseconds(delta):
             + delta.seconds * 1000000
             + delta.microseconds) * 1000
 
+_relative_attrs = ['years', 'months', 'days', 'hours', 'minutes', 'seconds',
+                   'microseconds']
+
+def _relativedelta_parts(rd):
+    """
+    Split a relativedelta into whole months plus fixed nanoseconds; raises
+    NotImplementedError if it sets absolute fields (day=, weekday=, ...)
+    """
+    for attr in ['year', 'month', 'day', 'weekday', 'hour', 'minute',
+                 'second', 'microsecond']:
+        if getattr(rd, attr) is not None:
+            raise NotImplementedError
+    if rd.leapdays:
+        raise NotImplementedError
+    for attr in _relative_attrs:
+        if getattr(rd, attr) != int(getattr(rd, attr)):
+            raise NotImplementedError
+
+    months = int(rd.years) * 12 + int(rd.months)
+    delta = timedelta(days=rd.days, hours=rd.hours, minutes=rd.minutes,
+                      seconds=rd.seconds, microseconds=rd.microseconds)
+    return months, _delta_to_nanoseconds(delta)
+
 class Day(Tick, CacheableOffset):
     _inc = timedelta(1)
     _rule_base = 'D'
@@ -1108,6 +1256,26 @@ def generate_range(start=None, end=None, periods=None,
         from pandas.tseries.frequencies import get_offset
         offset = get_offset(time_rule)
 
+    start, end = _range_bounds(start, end, periods, offset)
+
+    cur = start
+
+    next_date = cur
+    while cur <= end:
+        yield cur
+
+        # faster than cur + offset
+        next_date = offset.apply(cur)
+        if next_date <= cur:
+            raise ValueError('Offset %s did not increment date' % offset)
+        cur = next_date
+
+
+def _range_bounds(start, end, periods, offset):
+    """
+    First and last dates of the range generate_range produces: start and
+    end rolled onto the offset, or derived from periods
+    """
     start = to_datetime(start)
     end = to_datetime(end)
 
@@ -1130,14 +1298,41 @@ def generate_range(start=None, end=None, periods=None,
     if start is None:
         start = end - (periods - 1) * offset
 
-    cur = start
+    return start, end
 
-    next_date = cur
-    while cur <= end:
-        yield cur
 
-        # faster than cur + offset
-        next_date = offset.apply(cur)
-        if next_date <= cur:
+def generate_range_i8(start=None, end=None, periods=None, offset=BDay()):
+    """
+    Vectorized generate_range, returning the dates as an int64 (nanosecond)
+    array. The range is built by doubling, applying len(values) * offset to
+    the dates so far with apply_index, so it takes about log2(len(range))
+    passes.
+
+    Raises NotImplementedError for offsets that have to be applied one date
+    at a time; use generate_range for those.
+    """
+    if offset.n <= 0 or not offset._repeatable():
+        raise NotImplementedError
+
+    start, end = _range_bounds(start, end, periods, offset)
+    first = Timestamp(start).value
+    last = Timestamp(end).value
+
+    values = np.array([first], dtype=np.int64)
+    if last < first:
+        return values[:0]
+
+    while values[-1] <= last:
+        n = len(values)
+        size = n
+        if n > 1:
+            # don't overshoot the end by much (nor past the int64 range):
+            # extend by about as many dates as are left at the mean spacing
+            spacing = (float(values[-1]) - float(values[0])) / (n - 1)
+            size = min(n, int((last - float(values[-1])) / spacing * 1.1) + 2)
+        block = (offset * n).apply_index(values[:size])
+        if block[0] <= values[-1]:
             raise ValueError('Offset %s did not increment date' % offset)
-        cur = next_date
+        values = np.concatenate((values, block))
+
+    return values[:values.searchsorted(last, side='right')]
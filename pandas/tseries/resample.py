@@ -3,6 +3,7 @@ from datetime import timedelta
 import numpy as np
 
 from pandas.core.groupby import BinGrouper, CustomGrouper
+from pandas.core.index import MultiIndex
 from pandas.tseries.frequencies import to_offset, is_subperiod, is_superperiod
 from pandas.tseries.index import DatetimeIndex, date_range
 from pandas.tseries.offsets import DateOffset
@@ -142,14 +143,21 @@ class TimeGrouper(CustomGrouper):
 
         # downsamples
         if len(grouper.binlabels) < len(axlabels):
-            grouped  = obj.groupby(grouper, axis=self.axis)
-            result = grouped.aggregate(self.how)
+            result = _aggregate_bins(obj, grouper.bins, grouper.binlabels,
+                                     self.how, axis=self.axis)
+            if result is None:
+                grouped  = obj.groupby(grouper, axis=self.axis)
+                result = grouped.aggregate(self.how)
         else:
             assert(self.axis == 0)
             # upsampling
 
-            # this is sort of a hack
-            result = obj.reindex(binner[1:], method=self.fill_method)
+            if self.fill_method == 'interpolate':
+                result = _interpolate(obj, binner[1:])
+            else:
+                # this is sort of a hack
+                result = obj.reindex(binner[1:], method=self.fill_method,
+                                     limit=self.limit)
 
         loffset = self.loffset
         if isinstance(loffset, basestring):
@@ -185,6 +193,11 @@ class TimeGrouper(CustomGrouper):
             else:
                 bins = np.array([], dtype=np.int32)
 
+            result = _aggregate_bins(obj, bins, new_index, self.how,
+                                     axis=self.axis)
+            if result is not None:
+                return result
+
             grouper = BinGrouper(bins, new_index)
 
             grouped = obj.groupby(grouper, axis=self.axis)
@@ -200,6 +213,111 @@ class TimeGrouper(CustomGrouper):
                              % (axlabels.freq, self.freq))
 
 
+# Cython kernels for the methods _aggregate_bins handles, taking bin edges
+_bin_functions = {
+    'sum' : 'group_add_bin',
+    'mean' : 'group_mean_bin',
+    'min' : 'group_min_bin',
+    'max' : 'group_max_bin',
+    'first' : ('group_nth_bin', 1),
+    'last' : 'group_last_bin',
+    'count' : 'group_count_bin',
+    'ohlc' : 'group_ohlc'
+}
+
+_ohlc_names = ['open', 'high', 'low', 'close']
+
+
+def _aggregate_bins(obj, bins, labels, how, axis=0):
+    """
+    Downsample float64 data with the Cython kernel for how, straight from the
+    bin edges and over all columns of a frame in one pass, skipping the
+    groupby machinery and its transposed copy of the frame. Returns None for
+    other methods and dtypes, which are left to groupby
+    """
+    from pandas.core.api import Series, DataFrame
+
+    if (axis != 0 or not isinstance(how, basestring)
+        or how not in _bin_functions or len(bins) == 0):
+        return None
+
+    if isinstance(obj, Series):
+        if obj.dtype != np.float64:
+            return None
+        values = obj.values[:, None]
+    elif isinstance(obj, DataFrame):
+        data = obj._data.consolidate()
+        if len(data.blocks) != 1 or data.blocks[0].dtype != np.float64:
+            return None
+        block = data.blocks[0]
+
+        # the block holds the columns as rows
+        values = block.values.T
+        if not block.items.equals(obj.columns):
+            values = values.take(block.items.get_indexer(obj.columns), axis=1)
+    else:
+        return None
+
+    bins = com._ensure_int64(bins)
+    nvalues, ncols = values.shape
+
+    # the kernels put the values past the last edge in a final bin
+    if bins[-1] == nvalues:
+        ngroups = len(bins)
+    else:
+        ngroups = len(bins) + 1
+
+    if ngroups != len(labels):
+        return None
+
+    fname, args = _bin_functions[how], ()
+    if isinstance(fname, tuple):
+        fname, args = fname[0], fname[1:]
+
+    if how == 'count':
+        result = np.empty((ngroups, ncols), dtype=np.int64)
+    elif how == 'ohlc':
+        result = np.empty((ngroups, 4 * ncols), dtype=np.float64)
+    else:
+        result = np.empty((ngroups, ncols), dtype=np.float64)
+    counts = np.zeros(ngroups, dtype=np.int64)
+
+    getattr(lib, fname)(result, counts, values, bins, *args)
+
+    if isinstance(obj, Series):
+        if how == 'ohlc':
+            return DataFrame(result, index=labels, columns=_ohlc_names)
+        return Series(result[:, 0], index=labels, name=obj.name)
+
+    columns = obj.columns
+    if how == 'ohlc':
+        columns = MultiIndex.from_tuples([(col, name) for col in columns
+                                          for name in _ohlc_names])
+    return DataFrame(result, index=labels, columns=columns)
+
+
+def _interpolate(obj, new_index):
+    """
+    Upsample by linear interpolation in time between the observations
+    """
+    from pandas.core.api import Series, DataFrame
+
+    index = obj.index.asi8
+    values = obj.values
+    if not issubclass(values.dtype.type, (np.number, np.bool_)):
+        raise TypeError("fill_method='interpolate' requires numeric data, "
+                        "got %s" % values.dtype)
+    values = com._ensure_float64(values)
+
+    if isinstance(obj, Series):
+        result = lib.upsample_interpolate(index, values[:, None],
+                                          new_index.asi8)
+        return Series(result[:, 0], index=new_index, name=obj.name)
+    else:
+        result = lib.upsample_interpolate(index, values, new_index.asi8)
+        return DataFrame(result, index=new_index, columns=obj.columns)
+
+
 def _take_new_index(obj, indexer, new_index, axis=0):
     from pandas.core.api import Series, DataFrame
     from pandas.core.internals import BlockManager
@@ -288,6 +288,24 @@ class TestDateRange(unittest.TestCase):
         exp_values = [start + i * offset for i in range(5)]
         self.assert_(np.array_equal(result, DatetimeIndex(exp_values)))
 
+    def test_range_outside_cache(self):
+        # generated with apply_index rather than date by date
+        for freq in ['BM', 'W-WED', 'WOM-3FRI', 'BQS-MAR', 'B', '2D']:
+            offset = datetools.to_offset(freq)
+            result = date_range('1/1/1900', '6/30/2100', freq=freq)
+            expected = list(generate_range('1/1/1900', '6/30/2100',
+                                           offset=offset))
+            self.assert_(np.array_equal(result, DatetimeIndex(expected)))
+            self.assert_(result.offset == offset)
+
+    def test_tick_end_anchored_at_start(self):
+        result = date_range('1/1/2000 00:30', '1/1/2000 05:00', freq='H')
+        self.assertEquals(len(result), 5)
+        self.assertEquals(result[-1], datetime(2000, 1, 1, 4, 30))
+
+        result = date_range('1/1/2000', '1/8/2000', freq='2D')
+        self.assertEquals(result[-1], datetime(2000, 1, 7))
+
 
 
 if __name__ == '__main__':
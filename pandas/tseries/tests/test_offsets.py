@@ -527,6 +527,15 @@ class TestMonthBegin(unittest.TestCase):
             for base, expected in cases.iteritems():
                 assertEq(offset, base, expected)
 
+    def test_onOffset(self):
+        tests = [(MonthBegin(), datetime(2008, 1, 1), True),
+                 (MonthBegin(), datetime(2008, 1, 2), False),
+                 # day matched the weekday of the 1st, plus one
+                 (MonthBegin(), datetime(1999, 1, 5), False)]
+
+        for offset, date, expected in tests:
+            assertOnOffset(offset, date, expected)
+
 class TestMonthEnd(unittest.TestCase):
 
     def test_offset(self):
@@ -1329,7 +1338,102 @@ def test_rule_code():
             assert alias == _offset_map[alias].rule_code
             assert alias == (_offset_map[alias] * 5).rule_code
 
-
+def _apply_index_dates():
+    from pandas.tseries.index import date_range
+    dates = list(date_range('12/1/1999', '3/1/2002', freq='D'))
+    dates += [datetime(2000, 1, 1, 10, 30), datetime(2000, 3, 31, 23, 59),
+              datetime(2001, 12, 31, 1), datetime(1960, 2, 29, 5),
+              datetime(2000, 4, 2, 0, 0, 1), datetime(2000, 4, 3, 5)]
+    return dates
+
+def test_apply_index():
+    dates = _apply_index_dates()
+    i8 = np.array(dates, dtype='M8[ns]').view('i8')
+
+    klasses = [lambda n: MonthEnd(n), lambda n: MonthBegin(n),
+               lambda n: BMonthEnd(n), lambda n: BMonthBegin(n),
+               lambda n: Week(n), lambda n: Week(n, weekday=4),
+               lambda n: BQuarterEnd(n, startingMonth=1),
+               lambda n: BQuarterBegin(n, startingMonth=2),
+               lambda n: QuarterEnd(n), lambda n: QuarterBegin(n),
+               lambda n: BYearEnd(n, month=6), lambda n: BYearBegin(n),
+               lambda n: YearEnd(n, month=2), lambda n: YearBegin(n),
+               lambda n: BDay(n), lambda n: BDay(n, normalize=True),
+               lambda n: BDay(n, offset=timedelta(hours=2)),
+               lambda n: DateOffset(n), lambda n: DateOffset(n, months=1),
+               lambda n: DateOffset(n, years=1, days=2, hours=3),
+               lambda n: Hour(n)]
+    klasses += [lambda n, week=week: WeekOfMonth(n, week=week, weekday=1)
+                for week in range(4)]
+
+    for klass in klasses:
+        for n in [-2, -1, 0, 1, 3]:
+            try:
+                offset = klass(n)
+            except Exception: # WeekOfMonth(0)
+                continue
+            result = offset.apply_index(i8)
+            expected = np.array([offset.apply(d) for d in dates],
+                                dtype='M8[ns]').view('i8')
+            if not (result == expected).all():
+                i = (result != expected).argmax()
+                raise AssertionError('%s at %s: got %s, expected %s'
+                                     % (offset, dates[i],
+                                        Timestamp(result[i]),
+                                        Timestamp(expected[i])))
+
+    # NaT passes through
+    nat = np.array([lib.NaT, i8[0]], dtype='i8')
+    assert(BMonthEnd().apply_index(nat)[0] == lib.NaT)
+
+    # only relative relativedelta fields vectorize
+    assert_raises(NotImplementedError, DateOffset(day=31).apply_index, i8)
+
+def test_roll_index():
+    from pandas.tseries.index import DatetimeIndex
+    dates = _apply_index_dates()
+    index = DatetimeIndex(dates)
+
+    for offset in [BMonthEnd(), QuarterBegin(startingMonth=1), BDay(),
+                   Week(weekday=2), WeekOfMonth(week=1, weekday=3),
+                   MonthBegin()]:
+        result = offset.rollforward(index)
+        expected = DatetimeIndex([offset.rollforward(d) for d in dates])
+        assert(result.equals(expected))
+
+        result = offset.rollback(index)
+        expected = DatetimeIndex([offset.rollback(d) for d in dates])
+        assert(result.equals(expected))
+
+def test_generate_range_i8():
+    from pandas.tseries.offsets import generate_range, generate_range_i8
+
+    offsets = [MonthEnd(), MonthBegin(2), BMonthEnd(), BMonthBegin(),
+               Week(), Week(2, weekday=0), WeekOfMonth(week=2, weekday=3),
+               BQuarterEnd(), QuarterBegin(startingMonth=2), BYearBegin(),
+               YearEnd(), BDay(), BDay(4), DateOffset(), DateOffset(days=3),
+               DateOffset(2, weeks=1)]
+    bounds = [(datetime(2000, 1, 15, 10), datetime(2003, 6, 7), None),
+              (datetime(2000, 1, 1), None, 37),
+              (None, datetime(2005, 3, 31, 12), 50),
+              (datetime(2001, 2, 3), datetime(2001, 2, 4), None),
+              (datetime(2001, 2, 5), datetime(2001, 1, 4), None),
+              (datetime(1900, 1, 1), datetime(2200, 1, 1), None)]
+
+    for offset in offsets:
+        for start, end, periods in bounds:
+            result = generate_range_i8(start, end, periods, offset)
+            expected = list(generate_range(start, end, periods, offset))
+            expected = np.array(expected, dtype='M8[ns]').view('i8')
+            assert(len(result) == len(expected))
+            assert((result == expected).all())
+
+    # applied one date at a time
+    for offset in [BDay(offset=timedelta(hours=1)), DateOffset(months=1),
+                   MonthEnd(-1)]:
+        assert_raises(NotImplementedError, generate_range_i8,
+                      datetime(2000, 1, 1), datetime(2001, 1, 1), None,
+                      offset)
 
 
 if __name__ == '__main__':
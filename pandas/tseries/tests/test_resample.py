@@ -57,9 +57,8 @@ class TestResample(unittest.TestCase):
         idx = idx.append(dti[-1:])
         expect = Series(arr, index=idx)
 
-        # cython returns float for now
         result = g.agg(np.sum)
-        assert_series_equal(result, expect.astype(float))
+        assert_series_equal(result, expect)
 
         data = np.random.rand(len(dti), 10)
         df = DataFrame(data, index=dti)
@@ -205,6 +204,102 @@ class TestResample(unittest.TestCase):
         self.assertEquals(result[0], s[0])
         self.assertEquals(result[-1], s[-1])
 
+    def test_resample_upsample_limit(self):
+        dti = DatetimeIndex(start=datetime(2005,1,1), end=datetime(2005,1,10),
+                            freq='D')
+        s = Series(np.random.rand(len(dti)), dti)
+
+        result = s.resample('H', fill_method='ffill', limit=2)
+        expected = s.reindex(result.index, method='ffill', limit=2)
+        assert_series_equal(result, expected)
+        self.assertEquals(result[:24].count(), 3)
+
+    def test_resample_upsample_interpolate(self):
+        dti = DatetimeIndex(start=datetime(2005,1,1), end=datetime(2005,1,10),
+                            freq='D')
+        s = Series(np.arange(len(dti), dtype=float) * 24, dti)
+        s[3] = np.nan
+
+        result = s.resample('H', fill_method='interpolate')
+        self.assertEquals(len(result), 217)
+        self.assertEquals(result[0], 0)
+        self.assertEquals(result[5], 5)
+        self.assertEquals(result[-1], s[-1])
+
+        # the NaN is passed over, interpolating between its neighbours
+        assert_almost_equal(result.values, np.arange(217.))
+
+        df = DataFrame({'A' : s, 'B' : -s})
+        result = df.resample('H', fill_method='interpolate')
+        assert_series_equal(result['B'], -result['A'])
+
+        # NaNs at different places in each column
+        df['B'][:2] = np.nan
+        df['B'][3] = -72
+        result = df.resample('H', fill_method='interpolate')
+        assert_almost_equal(result['A'].values, np.arange(217.))
+        self.assert_(isnull(result['B'][:48]).all())
+        assert_almost_equal(result['B'][48:].values, -np.arange(48., 217.))
+
+        s = Series([0, np.nan, 2, 6],
+                   index=DatetimeIndex(start=datetime(2005,1,1), periods=4,
+                                       freq='H'))
+        result = s.resample('20T', fill_method='interpolate')
+        assert_almost_equal(result.values[:7],
+                            [0, 1./3, 2./3, 1, 4./3, 5./3, 2])
+
+        s = Series(['a', 'b'], index=dti[:2])
+        self.assertRaises(TypeError, s.resample, 'H',
+                          fill_method='interpolate')
+
+    def test_resample_frame_bin_kernels(self):
+        # frames are downsampled over all columns at once
+        df = DataFrame(np.random.randn(len(self.series), 3),
+                       index=self.series.index, columns=['A', 'B', 'C'])
+        df['B'][3::7] = np.nan
+        grouper = TimeGrouper(Minute(5), closed='right', label='right')
+
+        funcs = {'sum' : lambda x: x.sum(),
+                 'mean' : lambda x: x.mean(),
+                 'min' : lambda x: x.min(),
+                 'max' : lambda x: x.max(),
+                 'first' : lambda x: x.dropna()[0],
+                 'last' : lambda x: x.dropna()[-1],
+                 'count' : lambda x: x.count()}
+
+        for how, f in funcs.iteritems():
+            result = df.resample('5Min', how=how)
+            for col in df.columns:
+                expected = df[col].groupby(grouper).agg(f)
+                assert_almost_equal(result[col], expected)
+                assert_series_equal(result[col],
+                                    df[col].resample('5Min', how=how))
+
+        result = df.resample('5Min', how='ohlc')
+        self.assertEquals(len(result.columns), 12)
+        for col in df.columns:
+            expected = df[col].resample('5Min', how='ohlc')
+            self.assert_(np.array_equal(result[col].values, expected.values))
+
+        xs = result.irow(1)
+        self.assertEquals(xs['B', 'open'], df['B'][1])
+        self.assertEquals(xs['B', 'high'], df['B'][1:6].max())
+        self.assertEquals(xs['B', 'low'], df['B'][1:6].min())
+        self.assertEquals(xs['B', 'close'], df['B'][5])
+
+    def test_resample_median_nunique(self):
+        s = self.series
+        s[::7] = np.nan
+        grouper = TimeGrouper(Minute(5), closed='right', label='right')
+
+        result = s.resample('5Min', how='median')
+        expect = s.groupby(grouper).agg(lambda x: np.median(x.dropna().values))
+        assert_series_equal(result, expect)
+
+        result = s.groupby(grouper).nunique()
+        expect = s.groupby(grouper).agg(lambda x: len(x.dropna().unique()))
+        assert_series_equal(result, expect)
+
     def test_resample_ohlc(self):
         s = self.series
 
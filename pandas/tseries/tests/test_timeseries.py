@@ -441,6 +441,62 @@ class TestTimeSeries(unittest.TestCase):
         result = to_datetime(['', ''])
         self.assert_(isnull(result).all())
 
+    def test_string_to_datetime_iso8601(self):
+        from dateutil.parser import parse
+
+        strings = np.array(['2012-01-01', '2012-03-04 10:11:12',
+                            '2012-03-04T10:11:12.123456', '20120304',
+                            u'2012-02-29 00:00:00.5', np.nan, '1/2/2000',
+                            '2012-01-01'], dtype=object)
+        result = lib.string_to_datetime(strings)
+
+        expected = np.empty(len(strings), dtype='M8[ns]')
+        for i, val in enumerate(strings):
+            if isnull(val):
+                expected[i] = NaT
+            else:
+                expected[i] = parse(val)
+        assert_almost_equal(result, expected)
+
+        # not a valid date, left for dateutil to reject
+        malformed = np.array(['2012-01-01', '2012-13-01'], dtype=object)
+        result = to_datetime(malformed)
+        assert_almost_equal(result, malformed)
+        self.assertRaises(ValueError, to_datetime, malformed,
+                          errors='raise')
+
+    def test_to_datetime_format(self):
+        values = np.array(['03/04/2012', '3/5/2012', '03/04/2012', np.nan],
+                          dtype=object)
+        result = lib.string_to_datetime(values, format='%m/%d/%Y')
+        stamps = [Timestamp(x).value
+                  for x in ['2012-03-04', '2012-03-05', '2012-03-04']]
+        expected = np.array(stamps + [lib.NaT], dtype=np.int64)
+        assert_almost_equal(result, expected.view('M8[ns]'))
+
+        # day first, which dateutil would get wrong
+        series = Series(['04/03/2012 10:11:12.5', '13/03/2012 00:00:00.0'])
+        result = to_datetime(series, format='%d/%m/%Y %H:%M:%S.%f')
+        self.assertEqual(result[0], datetime(2012, 3, 4, 10, 11, 12, 500000))
+        self.assertEqual(result[1], datetime(2012, 3, 13))
+
+        # formats the regex matcher doesn't handle go through strptime
+        result = to_datetime(['04Mar2012', '05Mar2012'], format='%d%b%Y')
+        expected = DatetimeIndex([datetime(2012, 3, 4), datetime(2012, 3, 5)])
+        self.assert_(result.equals(expected))
+
+        self.assertEqual(to_datetime('120304', format='%y%m%d'),
+                         datetime(2012, 3, 4))
+
+        # mismatches
+        bad = np.array(['2012-02-30', '2012-02-28'], dtype=object)
+        result = to_datetime(bad, format='%Y-%m-%d')
+        self.assert_(result is bad)
+        self.assertRaises(ValueError, to_datetime, bad, format='%Y-%m-%d',
+                          errors='raise')
+        self.assertRaises(ValueError, to_datetime, ['2012/01/01'],
+                          format='%Y-%m-%d', errors='raise')
+
     def test_index_to_datetime(self):
         idx = Index(['1/1/2000', '1/2/2000', '1/3/2000'])
 
@@ -547,6 +603,20 @@ class TestTimeSeries(unittest.TestCase):
         expected = date_range('1/1/2000 02:00', '2/1/2000 02:00')
         self.assert_(result.equals(expected))
 
+    def test_add_anchored_offset(self):
+        rng = date_range('1/1/2000 09:30', periods=500, freq='D')
+
+        for offset in [offsets.BMonthEnd(), offsets.QuarterBegin(-2),
+                       offsets.Week(weekday=2), offsets.BDay(3),
+                       offsets.DateOffset(months=1)]:
+            result = rng + offset
+            expected = DatetimeIndex([d + offset for d in rng])
+            self.assert_(result.equals(expected))
+
+            result = rng - offset
+            expected = DatetimeIndex([d - offset for d in rng])
+            self.assert_(result.equals(expected))
+
     def test_format_pre_1900_dates(self):
         rng = date_range('1/1/1850', '1/1/1950', freq='A-DEC')
         rng.format()
@@ -99,7 +99,7 @@ class TestTimeZoneSupport(unittest.TestCase):
 
         dti = DatetimeIndex(start='3/13/2011 1:59', end='3/13/2011 2:00',
                             freq='L')
-        self.assertRaises(pytz.AmbiguousTimeError, dti.tz_localize,
+        self.assertRaises(pytz.NonExistentTimeError, dti.tz_localize,
                           'US/Eastern')
 
     def test_utc_box_timestamp_and_localize(self):
@@ -143,6 +143,78 @@ class TestTimeZoneSupport(unittest.TestCase):
         rng = DatetimeIndex(strdates, tz='US/Eastern')
         self.assert_((rng.hour == 0).all())
 
+    def test_add_offset_local_time(self):
+        # offsets move the wall clock time across the DST change
+        rng = date_range('3/1/2012 09:00', periods=5, freq='D',
+                         tz='US/Eastern')
+        result = rng + offsets.MonthEnd()
+        self.assert_(result.tz is rng.tz)
+        self.assert_((result.hour == 9).all())
+        self.assert_((result.day == 31).all())
+
+        result = offsets.BMonthEnd().rollback(rng)
+        self.assert_((result.hour == 9).all())
+        self.assert_((result.month == 2).all())
+
+    def test_tz_localize_ambiguous_nonexistent(self):
+        tz = pytz.timezone('US/Eastern')
+
+        # November 6, 2011, fall back, 1:30 AM happens twice
+        dr = date_range(datetime(2011, 11, 6, 0, 30), periods=3,
+                        freq=datetools.Hour())
+        result = dr.tz_localize(tz, ambiguous='NaT')
+        self.assert_(result.asi8[1] == NaT)
+        self.assert_(result.asi8[0] == Timestamp('2011-11-06 04:30').value)
+        self.assert_(result.asi8[2] == Timestamp('2011-11-06 07:30').value)
+
+        result = dr.tz_localize(tz, ambiguous=[False, True, False])
+        self.assert_(result.asi8[1] == Timestamp('2011-11-06 05:30').value)
+        result = dr.tz_localize(tz, ambiguous=[False, False, False])
+        self.assert_(result.asi8[1] == Timestamp('2011-11-06 06:30').value)
+
+        self.assertRaises(ValueError, dr.tz_localize, tz, ambiguous=[True])
+        self.assertRaises(ValueError, dr.tz_localize, tz, ambiguous='foo')
+
+        # March 13, 2011, spring forward, 2:30 AM never happens
+        dr = date_range(datetime(2011, 3, 13, 1, 30), periods=3,
+                        freq=datetools.Hour())
+        result = dr.tz_localize(tz, nonexistent='NaT')
+        self.assert_(result.asi8[1] == NaT)
+        self.assert_(result.asi8[2] == Timestamp('2011-03-13 07:30').value)
+
+        result = dr.tz_localize(tz, nonexistent='shift_forward')
+        self.assert_(result.asi8[1] == Timestamp('2011-03-13 07:30').value)
+
+        self.assertRaises(ValueError, dr.tz_localize, tz,
+                          nonexistent='foo')
+
+    def test_tz_convert_unsorted(self):
+        # positions in the transition table are searched per value
+        tz = pytz.timezone('Europe/London')
+        utc_dates = np.array([datetime(2012, 7, 1), datetime(1990, 1, 1),
+                              datetime(2012, 3, 25, 1), datetime(2005, 6, 1),
+                              datetime(2012, 3, 25, 0, 59)], dtype='M8[ns]')
+        utc_dates = np.concatenate([utc_dates.view('i8'), [NaT]])
+
+        result = lib.tz_convert(utc_dates, pytz.utc, tz)
+        expected = utc_dates[:-1] + np.array([1, 0, 1, 1, 0]) * 3600 * 10**9
+        self.assert_(np.array_equal(result[:-1], expected))
+        self.assert_(result[-1] == NaT)
+
+        # and back
+        back = lib.tz_localize_to_utc(result, tz)
+        self.assert_(np.array_equal(back, utc_dates))
+
+        result = DatetimeIndex(utc_dates[:-1], tz='UTC').tz_convert(tz)
+        self.assert_(np.array_equal(result.hour, [1, 0, 2, 1, 0]))
+
+    def test_fixed_offset(self):
+        tz = pytz.FixedOffset(-300)
+        rng = date_range('1/1/2012', periods=5, freq='H')
+        result = rng.tz_localize(tz)
+        self.assert_(np.array_equal(result.asi8, (rng + offsets.Hour(5)).asi8))
+        self.assert_(np.array_equal(result.hour, rng.hour))
+
     def test_with_tz(self):
         tz = pytz.timezone('US/Central')
 
@@ -185,7 +257,7 @@ class TestTimeZoneSupport(unittest.TestCase):
         # March 13, 2011, spring forward, skip from 2 AM to 3 AM
         dr = date_range(datetime(2011, 3, 13, 1, 30), periods=3,
                         freq=datetools.Hour())
-        self.assertRaises(pytz.AmbiguousTimeError, dr.tz_localize, tz)
+        self.assertRaises(pytz.NonExistentTimeError, dr.tz_localize, tz)
 
         # after dst transition, it works
         dr = date_range(datetime(2011, 3, 13, 3, 30), periods=3,
@@ -63,7 +63,7 @@ def _figure_out_timezone(start, end, tzinfo):
     return start, end, tz
 
 
-def to_datetime(arg, errors='ignore', dayfirst=False):
+def to_datetime(arg, errors='ignore', dayfirst=False, format=None):
     """
     Convert argument to datetime
 
@@ -72,6 +72,11 @@ def to_datetime(arg, errors='ignore', dayfirst=False):
     arg : string, datetime, array of strings (with possible NAs)
     errors : {'ignore', 'raise'}, default 'ignore'
         Errors are ignored by default (values left untouched)
+    dayfirst : boolean, default False
+        Parse ambiguous dates like 10/11/12 with the day first
+    format : string, default None
+        strptime format to parse the strings with, e.g. "%d/%m/%Y". Much
+        faster than inferring the format of each string
 
     Returns
     -------
@@ -86,20 +91,22 @@ def to_datetime(arg, errors='ignore', dayfirst=False):
     elif isinstance(arg, Series):
         values = lib.string_to_datetime(com._ensure_object(arg.values),
                                         raise_=errors == 'raise',
-                                        dayfirst=dayfirst)
+                                        dayfirst=dayfirst, format=format)
         return Series(values, index=arg.index, name=arg.name)
     elif isinstance(arg, (np.ndarray, list)):
         if isinstance(arg, list):
             arg = np.array(arg, dtype='O')
         result = lib.string_to_datetime(com._ensure_object(arg),
                                         raise_=errors == 'raise',
-                                        dayfirst=dayfirst)
+                                        dayfirst=dayfirst, format=format)
         if com.is_datetime64_dtype(result):
             result = DatetimeIndex(result)
         return result
     try:
         if not arg:
             return arg
+        if format is not None:
+            return datetime.strptime(arg, format)
         return _dtparser.parse(arg, dayfirst=dayfirst)
     except Exception:
         if errors == 'raise':
@@ -345,7 +345,8 @@ else:
 
 tseries_depends = ['reindex', 'groupby', 'skiplist', 'moments',
                    'reduce', 'stats', 'datetime',
-                   'hashtable', 'inference', 'properties', 'join', 'engines']
+                   'hashtable', 'inference', 'properties', 'join', 'engines',
+                   'writers']
 
 def srcpath(name=None, suffix='.pyx', subdir='src'):
     return pjoin('pandas', subdir, name+suffix)
@@ -386,6 +387,10 @@ sparse_ext = Extension('pandas._sparse',
                        sources=[srcpath('sparse', suffix=suffix)],
                        include_dirs=[np.get_include()])
 
+parser_ext = Extension('pandas._parser',
+                       sources=[srcpath('parser', suffix=suffix)],
+                       include_dirs=[np.get_include()])
+
 npymath_info = get_info('npymath')
                        
 npymath_libdir = npymath_info['library_dirs'][0]
@@ -417,7 +422,7 @@ cppsandbox_ext = Extension('pandas._cppsandbox',
                            sources=[srcpath('cppsandbox', suffix=suffix)],
                            include_dirs=[np.get_include()])
 
-extensions = [algos_ext, tseries_ext, sparse_ext, ujson_ext]
+extensions = [algos_ext, tseries_ext, sparse_ext, parser_ext, ujson_ext]
 
 if not ISRELEASED:
     extensions.extend([sandbox_ext])
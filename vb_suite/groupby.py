@@ -192,3 +192,83 @@ ts = Series(np.random.randn(len(rng)), index=rng)
 
 groupby_indices = Benchmark('len(ts.groupby([year, month, day]))',
                             setup, start_date=datetime(2012, 1, 1))
+
+#----------------------------------------------------------------------
+# multithreaded column-wise aggregation
+
+setup = common_setup + """
+N = 1000000
+df = DataFrame(np.random.randn(N, 10))
+df['key'] = np.random.randint(0, 1000, size=N)
+"""
+
+groupby_frame_mean = Benchmark("df.groupby('key').mean()", setup,
+                               start_date=datetime(2012, 6, 1))
+
+groupby_frame_mean_threaded = \
+    Benchmark("df.groupby('key', n_jobs=4).mean()", setup,
+              start_date=datetime(2012, 6, 1))
+
+#----------------------------------------------------------------------
+# dtype-preserving kernels
+
+setup = common_setup + """
+N = 1000000
+labels = np.random.randint(0, 1000, size=N)
+df = DataFrame({'ints' : np.random.randint(0, 2 ** 40, size=N),
+                'floats' : np.random.randn(N).astype('f4')})
+stamps = Series(np.random.randint(0, 2 ** 60, size=N).view('M8[ns]'))
+"""
+
+groupby_int64_min = Benchmark("df['ints'].groupby(labels).min()", setup,
+                              start_date=datetime(2012, 6, 1))
+
+groupby_float32_sum = Benchmark("df['floats'].groupby(labels).sum()", setup,
+                                start_date=datetime(2012, 6, 1))
+
+groupby_datetime64_last = Benchmark("stamps.groupby(labels).last()", setup,
+                                    start_date=datetime(2012, 6, 1))
+
+#----------------------------------------------------------------------
+# sort-based median, quantile and nunique
+
+setup = common_setup + """
+N = 1000000
+labels = np.random.randint(0, 100000, size=N)
+df = DataFrame({'key' : labels,
+                'value' : np.random.randn(N),
+                'ints' : np.random.randint(0, 100, size=N)})
+"""
+
+groupby_median = Benchmark("df.groupby('key')['value'].median()", setup,
+                           start_date=datetime(2012, 6, 1))
+
+groupby_quantile = Benchmark("df.groupby('key')['value'].quantile(0.9)",
+                             setup, start_date=datetime(2012, 6, 1))
+
+groupby_nunique = Benchmark("df.groupby('key')['ints'].nunique()", setup,
+                            start_date=datetime(2012, 6, 1))
+
+#----------------------------------------------------------------------
+# vectorized transforms
+
+setup = common_setup + """
+N = 100000
+labels = np.random.randint(0, 1000, size=N)
+df = DataFrame({'key' : labels,
+                'value' : np.random.randn(N)})
+df['value'][::10] = np.nan
+"""
+
+groupby_transform_cumsum = Benchmark("df.groupby('key').cumsum()", setup,
+                                     start_date=datetime(2012, 6, 1))
+
+groupby_transform_shift = Benchmark("df.groupby('key').shift()", setup,
+                                    start_date=datetime(2012, 6, 1))
+
+groupby_transform_fillna = Benchmark("df.groupby('key').fillna()", setup,
+                                     start_date=datetime(2012, 6, 1))
+
+groupby_transform_demean = \
+    Benchmark("df['value'] - df.groupby('key')['value'].transform('mean')",
+              setup, start_date=datetime(2012, 6, 1))
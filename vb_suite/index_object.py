@@ -33,3 +33,28 @@ index_int64_union = Benchmark('left.union(right)', setup,
 
 index_int64_intersection = Benchmark('left.intersection(right)', setup,
                                      start_date=datetime(2011, 1, 1))
+
+#----------------------------------------------------------------------
+# MultiIndex set operations and lookups on the level labels
+
+setup = common_setup + """
+N = 1000
+K = 100
+level1 = np.array([tm.rands(10) for _ in xrange(N)], dtype='O').repeat(K)
+level2 = np.tile(np.arange(K), N)
+index = MultiIndex.from_arrays([level1, level2])
+left = index[::2]
+right = index[::3]
+"""
+
+multiindex_union = Benchmark('left.union(right)', setup,
+                             start_date=datetime(2012, 6, 1))
+
+multiindex_intersection = Benchmark('left.intersection(right)', setup,
+                                    start_date=datetime(2012, 6, 1))
+
+multiindex_get_indexer = Benchmark('left.get_indexer(right)', setup,
+                                   start_date=datetime(2012, 6, 1))
+
+multiindex_has_duplicates = Benchmark('index[:-1].has_duplicates', setup,
+                                      start_date=datetime(2012, 6, 1))
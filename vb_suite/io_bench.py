@@ -38,3 +38,72 @@ df = DataFrame({'float1' : randn(10000),
 write_csv_standard = Benchmark("df.to_csv('__test__.csv')", setup2,
                                start_date=datetime(2011, 9, 15))
 
+setup = common_setup + """
+df = DataFrame(np.random.randn(1000000, 10),
+               index=date_range('1/1/2000', periods=1000000, freq='s'))
+df['string'] = 'foo'
+df['date'] = df.index.values
+df.ix[::7, 0] = np.nan
+"""
+
+write_csv_large = Benchmark("df.to_csv('__test__.csv')", setup,
+                            start_date=datetime(2012, 6, 1))
+
+
+#----------------------------------------------------------------------
+# HDFStore table append
+
+setup3 = common_setup + """
+import os
+from pandas.io.pytables import HDFStore
+values = np.random.randn(100000, 10)
+values[::7] = np.nan
+df = DataFrame(values,
+               index=date_range('1/1/2000', periods=100000, freq='s'))
+
+def remove(f):
+    try:
+        os.remove(f)
+    except:
+        pass
+
+remove('__test__.h5')
+store = HDFStore('__test__.h5')
+"""
+
+cmd = "store.put('df', df, table=True)"
+cleanup = "store.close(); remove('__test__.h5')"
+hdfstore_write_frame_table = Benchmark(cmd, setup3, cleanup=cleanup,
+                                       start_date=datetime(2012, 6, 1))
+
+setup3_read = setup3 + """
+store.put('df', df, table=True)
+"""
+
+hdfstore_read_frame_table = Benchmark("store.select('df')", setup3_read,
+                                      cleanup=cleanup,
+                                      start_date=datetime(2012, 6, 1))
+
+cmd = "for chunk in store.select('df', chunksize=2): pass"
+hdfstore_read_frame_table_chunked = Benchmark(cmd, setup3_read,
+                                              cleanup=cleanup,
+                                              start_date=datetime(2012, 6, 1))
+
+#----------------------------------------------------------------------
+# binary save / load
+
+setup4 = common_setup + """
+import os
+df = DataFrame(np.random.randn(100000, 20))
+df['obj'] = 'foo'
+df.save('__test_binary__', format='binary')
+"""
+
+cleanup = "os.remove('__test_binary__')"
+frame_save_binary = Benchmark("df.save('__test_binary__', format='binary')",
+                              setup4, cleanup=cleanup,
+                              start_date=datetime(2012, 6, 1))
+
+frame_load_binary = Benchmark("load('__test_binary__')", setup4,
+                              cleanup=cleanup,
+                              start_date=datetime(2012, 6, 1))
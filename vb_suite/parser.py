@@ -89,3 +89,33 @@ data = data * 2000
 cmd = "read_table(StringIO(data), sep=',', header=None, parse_dates=[1])"
 sdate = datetime(2012, 5, 7)
 read_table_multiple_date_baseline = Benchmark(cmd, setup, start_date=sdate)
+
+setup = common_setup + """
+from pandas import read_csv
+import os
+N = 10000
+K = 8
+df = DataFrame(np.random.randn(N, K) * np.random.randint(100, 10000, (N, K)))
+df.to_csv('test.csv', sep='|')
+"""
+
+read_csv_c_engine_vb = Benchmark("read_csv('test.csv', sep='|', engine='c')",
+                                 setup,
+                                 cleanup="os.remove('test.csv')",
+                                 start_date=datetime(2012, 6, 1))
+
+setup = common_setup + """
+from pandas import read_csv
+import os
+N = 10000
+K = 8
+format = lambda x: '{:,}'.format(x)
+df = DataFrame(np.random.randn(N, K) * np.random.randint(100, 10000, (N, K)))
+df = df.applymap(format)
+df.to_csv('test.csv', sep='|')
+"""
+
+cmd = "read_csv('test.csv', sep='|', thousands=',', engine='c')"
+read_csv_thou_c_engine_vb = Benchmark(cmd, setup,
+                                      cleanup="os.remove('test.csv')",
+                                      start_date=datetime(2012, 6, 1))
@@ -164,6 +164,20 @@ frame_drop_dup_na_inplace = Benchmark(statement2, setup,
                                   name='frame_drop_dup_na_inplace',
                                   start_date=datetime(2012, 5, 16))
 
+# numeric keys
+
+setup = common_setup + """
+N = 1000000
+df = DataFrame({'a' : np.random.randint(0, 1000, N),
+                'b' : np.random.randint(0, 1000, N),
+                'c' : np.random.randint(0, 100, N) / 4.,
+                'd' : np.random.randn(N).round(1)})
+"""
+frame_drop_duplicates_numeric = \
+    Benchmark("df.drop_duplicates()", setup,
+              name='frame_drop_duplicates_numeric',
+              start_date=datetime(2012, 6, 1))
+
 #----------------------------------------------------------------------
 # fillna, many columns
 
@@ -177,3 +191,21 @@ df = DataFrame(values)
 frame_fillna_many_columns_pad = Benchmark("df.fillna(method='pad')",
                                           setup,
                                           start_date=datetime(2011, 3, 1))
+
+#----------------------------------------------------------------------
+# take across the blocks of a mixed-type frame on several threads
+
+setup = common_setup + """
+df = DataFrame(dict(('f%d' % i, np.random.randn(100000)) for i in range(4)))
+for i in range(4):
+    df['i%d' % i] = np.random.randint(0, 100, 100000)
+    df['b%d' % i] = np.random.randn(100000) > 0
+df = df.consolidate()
+indexer = np.random.permutation(100000)
+"""
+
+frame_take_mixed = Benchmark("df.take(indexer)", setup,
+                             start_date=datetime(2012, 7, 1))
+
+frame_take_mixed_threaded = Benchmark("df.take(indexer, n_jobs=4)", setup,
+                                      start_date=datetime(2012, 7, 1))
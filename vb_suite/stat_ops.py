@@ -73,3 +73,110 @@ stats_rank2d_axis1_average = Benchmark('df.rank(1)', setup,
 
 stats_rank2d_axis0_average = Benchmark('df.rank()', setup,
                                        start_date=datetime(2011, 12, 12))
+
+#----------------------------------------------------------------------
+# pairwise correlation
+
+setup = common_setup + """
+df = DataFrame(np.random.randn(1000, 100))
+df.values[::7, ::3] = np.nan
+"""
+
+stats_corr_pearson = Benchmark('df.corr()', setup,
+                               start_date=datetime(2012, 6, 1))
+
+stats_corr_spearman = Benchmark("df.corr(method='spearman')", setup,
+                                start_date=datetime(2012, 6, 1))
+
+stats_cov = Benchmark('df.cov()', setup,
+                      start_date=datetime(2012, 6, 1))
+
+#----------------------------------------------------------------------
+# threaded rolling moments
+
+setup = common_setup + """
+import pandas.stats.moments as mom
+df = DataFrame(np.random.randn(100000, 16))
+"""
+
+stats_rolling_mean_frame = \
+    Benchmark('mom.rolling_mean(df, 50)', setup,
+              start_date=datetime(2012, 7, 1))
+
+stats_rolling_mean_frame_threaded = \
+    Benchmark('mom.rolling_mean(df, 50, n_jobs=4)', setup,
+              start_date=datetime(2012, 7, 1))
+
+stats_ewma_frame_threaded = \
+    Benchmark('mom.ewma(df, com=10, n_jobs=4)', setup,
+              start_date=datetime(2012, 7, 1))
+
+#----------------------------------------------------------------------
+# online moments: push one new observation vs. recomputing from scratch
+
+setup = common_setup + """
+import pandas.stats.moments as mom
+arr = np.random.randn(100000)
+online = mom.RollingMean(50)
+online.update(arr)
+"""
+
+stats_rolling_mean_recompute = \
+    Benchmark('mom.rolling_mean(arr, 50)', setup,
+              start_date=datetime(2012, 7, 1))
+
+stats_rolling_mean_online_update = \
+    Benchmark('online.update(arr[-1])', setup,
+              start_date=datetime(2012, 7, 1))
+
+#----------------------------------------------------------------------
+# time-based windows on irregular ticks
+
+setup = common_setup + """
+import pandas.stats.moments as mom
+seconds = np.random.randint(1, 5, 100000).cumsum()
+index = date_range('1/2/2012', periods=500000, freq='S').take(seconds)
+ts = Series(np.random.randn(100000), index=index)
+"""
+
+stats_rolling_mean_time_window = \
+    Benchmark("mom.rolling_mean(ts, '5min')", setup,
+              start_date=datetime(2012, 7, 1))
+
+stats_rolling_median_time_window = \
+    Benchmark("mom.rolling_median(ts, '5min')", setup,
+              start_date=datetime(2012, 7, 1))
+
+#----------------------------------------------------------------------
+# rolling quantile / apply
+
+setup = common_setup + """
+import pandas.stats.moments as mom
+arr = np.random.randn(100000)
+"""
+
+stats_rolling_quantile = \
+    Benchmark('mom.rolling_quantile(arr, 100, 0.3)', setup,
+              start_date=datetime(2012, 7, 1))
+
+stats_rolling_apply = \
+    Benchmark('mom.rolling_apply(arr, 100, len)', setup,
+              start_date=datetime(2012, 7, 1))
+
+#----------------------------------------------------------------------
+# pairwise rolling / ewm correlation matrices
+
+setup = common_setup + """
+import pandas.stats.moments as mom
+df = DataFrame(np.random.randn(1000, 50),
+               index=date_range('1/1/2000', periods=1000))
+df.values[::7, ::3] = np.nan
+"""
+
+stats_rolling_corr_pairwise = \
+    Benchmark('mom.rolling_corr_pairwise(df, 50)', setup,
+              start_date=datetime(2012, 7, 1))
+
+stats_ewmcorr_pairwise = \
+    Benchmark('mom.ewmcorr_pairwise(df, com=20)', setup,
+              start_date=datetime(2012, 7, 1))
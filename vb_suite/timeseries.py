@@ -112,6 +112,21 @@ rng = date_range('1/1/2000', '3/1/2000', tz='US/Eastern')
 timeseries_timestamp_tzinfo_cons = \
     Benchmark('rng[0]', setup, start_date=datetime(2012, 5, 5))
 
+setup = common_setup + """
+rng = date_range('1/1/2000', periods=1000000, freq='T')
+shuffled = rng.values.copy()
+np.random.shuffle(shuffled)
+shuffled = DatetimeIndex(shuffled, tz='UTC')
+"""
+
+timeseries_tz_localize = \
+    Benchmark("rng.tz_localize('US/Eastern', nonexistent='NaT')", setup,
+              start_date=datetime(2012, 7, 11))
+
+timeseries_tz_convert_unsorted = \
+    Benchmark("shuffled.tz_convert('US/Eastern').hour", setup,
+              start_date=datetime(2012, 7, 11))
+
 #----------------------------------------------------------------------
 # Resampling period
 
@@ -132,3 +147,77 @@ ts = Series(np.random.randn(len(rng)), index=rng)
 timeseries_timestamp_downsample_mean = \
     Benchmark("ts.resample('D', how='mean')", setup,
               start_date=datetime(2012, 4, 25))
+
+# tick data to 1-minute bars to hourly bars
+setup = common_setup + """
+rng = date_range('1/1/2000', periods=2000000, freq='250L')
+ticks = DataFrame(np.random.randn(len(rng), 4), index=rng,
+                  columns=['bid', 'ask', 'last', 'size'])
+bars = ticks.resample('min', how='last')
+"""
+
+timeseries_resample_frame_ohlc = \
+    Benchmark("ticks.resample('min', how='ohlc')", setup,
+              start_date=datetime(2012, 7, 11))
+
+timeseries_resample_cascade = \
+    Benchmark("ticks.resample('min', how='last').resample('H', how='sum')",
+              setup, start_date=datetime(2012, 7, 11))
+
+timeseries_resample_count = \
+    Benchmark("bars.resample('H', how='count')", setup,
+              start_date=datetime(2012, 7, 11))
+
+timeseries_upsample_interpolate = \
+    Benchmark("bars.resample('5s', fill_method='interpolate')", setup,
+              start_date=datetime(2012, 7, 11))
+
+#----------------------------------------------------------------------
+# Parsing datetime strings
+
+setup = common_setup + """
+rng = date_range('1/1/2000', periods=20000, freq='H')
+strings = [x.strftime('%Y-%m-%d %H:%M:%S') for x in rng]
+us_strings = [x.strftime('%m/%d/%Y %H:%M:%S') for x in rng]
+"""
+
+timeseries_to_datetime_iso8601 = \
+    Benchmark('to_datetime(strings)', setup,
+              start_date=datetime(2012, 7, 11))
+
+timeseries_to_datetime_format = \
+    Benchmark("to_datetime(us_strings, format='%m/%d/%Y %H:%M:%S')", setup,
+              start_date=datetime(2012, 7, 11))
+
+#----------------------------------------------------------------------
+# Vectorized DateOffset arithmetic
+
+setup = common_setup + """
+import pandas.tseries.offsets as offsets
+rng = date_range('1/1/2000', periods=100000, freq='H')
+"""
+
+timeseries_add_bmonthend = \
+    Benchmark('rng + offsets.BMonthEnd()', setup,
+              start_date=datetime(2012, 7, 11))
+
+timeseries_add_bday = \
+    Benchmark('rng + offsets.BDay(3)', setup,
+              start_date=datetime(2012, 7, 11))
+
+timeseries_rollforward_quarterend = \
+    Benchmark('offsets.QuarterEnd().rollforward(rng)', setup,
+              start_date=datetime(2012, 7, 11))
+
+#----------------------------------------------------------------------
+# Generating ranges outside the cached window
+
+setup = common_setup
+
+timeseries_date_range_bmonthend = \
+    Benchmark("date_range('1/1/1800', '1/1/2200', freq='BM')", setup,
+              start_date=datetime(2012, 7, 11))
+
+timeseries_date_range_week_of_month = \
+    Benchmark("date_range('1/1/1800', '1/1/2200', freq='WOM-3FRI')", setup,
+              start_date=datetime(2012, 7, 11))